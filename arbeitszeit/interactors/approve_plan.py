@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Tuple
 from uuid import UUID
 
 from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.records import Company, Plan, SocialAccounting
 from arbeitszeit.repositories import DatabaseGateway
-from arbeitszeit.transfers import TransferType
+from arbeitszeit.transfers import NewTransfer, TransferType
 
 
 @dataclass
@@ -33,6 +34,7 @@ class ApprovePlanInteractor:
             return self.Response(is_plan_approved=False)
 
         self._create_transfers_for_plan(planner, plan, is_public=plan.is_public_service)
+        self.database_gateway.invalidate_payout_factor_cache()
         return self.Response()
 
     def _create_transfers_for_plan(
@@ -44,64 +46,68 @@ class ApprovePlanInteractor:
             self._create_transfers_for_productive_plan(planner, plan)
 
     def _create_transfers_for_public_plan(self, planner: Company, plan: Plan) -> None:
-        # psf -> p
-        transfer_of_credit_p = self.database_gateway.create_transfer(
-            date=self.datetime_service.now(),
-            debit_account=self.social_accounting.account_psf,
-            credit_account=planner.means_account,
-            value=plan.production_costs.means_cost,
-            type=TransferType.credit_public_p,
-        )
-        # psf -> r
-        transfer_of_credit_r = self.database_gateway.create_transfer(
-            date=self.datetime_service.now(),
+        self._create_credit_transfers(
+            planner,
+            plan,
             debit_account=self.social_accounting.account_psf,
-            credit_account=planner.raw_material_account,
-            value=plan.production_costs.resource_cost,
-            type=TransferType.credit_public_r,
-        )
-        # psf -> a
-        transfer_of_credit_a = self.database_gateway.create_transfer(
-            date=self.datetime_service.now(),
-            debit_account=self.social_accounting.account_psf,
-            credit_account=planner.work_account,
-            value=plan.production_costs.labour_cost,
-            type=TransferType.credit_public_a,
-        )
-        self.database_gateway.create_plan_approval(
-            plan_id=plan.id,
-            date=self.datetime_service.now(),
-            transfer_of_credit_p=transfer_of_credit_p.id,
-            transfer_of_credit_r=transfer_of_credit_r.id,
-            transfer_of_credit_a=transfer_of_credit_a.id,
+            transfer_types=(
+                TransferType.credit_public_p,
+                TransferType.credit_public_r,
+                TransferType.credit_public_a,
+            ),
         )
 
     def _create_transfers_for_productive_plan(
         self, planner: Company, plan: Plan
     ) -> None:
-        # prd -> p
-        transfer_of_credit_p = self.database_gateway.create_transfer(
-            date=self.datetime_service.now(),
+        self._create_credit_transfers(
+            planner,
+            plan,
             debit_account=planner.product_account,
-            credit_account=planner.means_account,
-            value=plan.production_costs.means_cost,
-            type=TransferType.credit_p,
+            transfer_types=(
+                TransferType.credit_p,
+                TransferType.credit_r,
+                TransferType.credit_a,
+            ),
         )
-        # prd -> r
-        transfer_of_credit_r = self.database_gateway.create_transfer(
-            date=self.datetime_service.now(),
-            debit_account=planner.product_account,
-            credit_account=planner.raw_material_account,
-            value=plan.production_costs.resource_cost,
-            type=TransferType.credit_r,
-        )
-        # prd -> a
-        transfer_of_credit_a = self.database_gateway.create_transfer(
-            date=self.datetime_service.now(),
-            debit_account=planner.product_account,
-            credit_account=planner.work_account,
-            value=plan.production_costs.labour_cost,
-            type=TransferType.credit_a,
+
+    def _create_credit_transfers(
+        self,
+        planner: Company,
+        plan: Plan,
+        debit_account: UUID,
+        transfer_types: Tuple[TransferType, TransferType, TransferType],
+    ) -> None:
+        credit_p, credit_r, credit_a = transfer_types
+        transfer_of_credit_p, transfer_of_credit_r, transfer_of_credit_a = (
+            self.database_gateway.create_transfers(
+                [
+                    # -> p
+                    NewTransfer(
+                        date=self.datetime_service.now(),
+                        debit_account=debit_account,
+                        credit_account=planner.means_account,
+                        value=plan.production_costs.means_cost,
+                        type=credit_p,
+                    ),
+                    # -> r
+                    NewTransfer(
+                        date=self.datetime_service.now(),
+                        debit_account=debit_account,
+                        credit_account=planner.raw_material_account,
+                        value=plan.production_costs.resource_cost,
+                        type=credit_r,
+                    ),
+                    # -> a
+                    NewTransfer(
+                        date=self.datetime_service.now(),
+                        debit_account=debit_account,
+                        credit_account=planner.work_account,
+                        value=plan.production_costs.labour_cost,
+                        type=credit_a,
+                    ),
+                ]
+            )
         )
         self.database_gateway.create_plan_approval(
             plan_id=plan.id,
@@ -7,7 +7,7 @@ from uuid import UUID
 
 from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.decimal import decimal_sum
-from arbeitszeit.records import Company, Plan, SocialAccounting, Transfer
+from arbeitszeit.records import Company, Plan, SocialAccounting
 from arbeitszeit.repositories import DatabaseGateway
 from arbeitszeit.transfers import TransferType
 
@@ -83,10 +83,9 @@ class GetCompanySummaryInteractor:
             .ordered_by_creation_date(ascending=False)
         )
         supply = self._get_suppliers_and_supply_volume(
-            (transfer, company)
-            for _, transfer, company in self.database_gateway.get_productive_consumptions()
+            self.database_gateway.get_productive_consumptions()
             .where_consumer_is_company(company=company_id)
-            .joined_with_transfer_and_provider()
+            .grouped_by_provider()
         )
         expectations = self._get_expectations(company)
         account_balances = self._get_account_balances(company)
@@ -138,38 +137,29 @@ class GetCompanySummaryInteractor:
         Companies are expected to spend as much for p, r and a as they plan.
         They are expected to sell as much product as they plan productively.
         """
-        credits = [
-            decimal_sum(
-                map(
-                    lambda t: t.value,
-                    self.database_gateway.get_transfers().where_account_is_creditor(
-                        account
-                    ),
-                )
-            )
-            for account in company.accounts()[:3]
+        credits: Dict[UUID, Decimal] = defaultdict(Decimal)
+        for account, _, value in (
+            self.database_gateway.get_transfers()
+            .where_account_is_creditor(*company.accounts()[:3])
+            .summed_by_creditor_and_type()
+        ):
+            credits[account] += value
+        credit_types = [
+            TransferType.credit_p,
+            TransferType.credit_r,
+            TransferType.credit_a,
         ]
         expected_sales = decimal_sum(
-            map(
-                lambda t: (
-                    t.value
-                    if t.type
-                    in [
-                        TransferType.credit_p,
-                        TransferType.credit_r,
-                        TransferType.credit_a,
-                    ]
-                    else Decimal(0)
-                ),
-                self.database_gateway.get_transfers().where_account_is_debtor(
-                    company.product_account
-                ),
-            )
+            value
+            for _, transfer_type, value in self.database_gateway.get_transfers()
+            .where_account_is_debtor(company.product_account)
+            .summed_by_debtor_and_type()
+            if transfer_type in credit_types
         )
         return Expectations(
-            means=credits[0],
-            raw_material=credits[1],
-            work=credits[2],
+            means=credits[company.means_account],
+            raw_material=credits[company.raw_material_account],
+            work=credits[company.work_account],
             product=-expected_sales,
         )
 
@@ -202,16 +192,11 @@ class GetCompanySummaryInteractor:
             return abs(account_balance / expectation) * 100
 
     def _get_suppliers_and_supply_volume(
-        self, supply: Iterable[Tuple[Transfer, Company]]
+        self, supply: Iterable[Tuple[Company, Decimal]]
     ) -> Generator[Supplier, None, None]:
-        volume_by_company_id: Dict[UUID, Decimal] = defaultdict(lambda: Decimal(0))
-        suppliers_by_id: Dict[UUID, Company] = dict()
-        for transfer, company in supply:
-            suppliers_by_id[company.id] = company
-            volume_by_company_id[company.id] += transfer.value
-        for company_id, volume in volume_by_company_id.items():
+        for company, volume in supply:
             yield Supplier(
-                company_id=company_id,
-                company_name=suppliers_by_id[company_id].name,
+                company_id=company.id,
+                company_name=company.name,
                 volume_of_sales=volume,
             )
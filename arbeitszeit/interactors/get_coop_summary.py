@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from arbeitszeit.datetime_service import DatetimeService
-from arbeitszeit.records import Plan
+from arbeitszeit.records import Company, Plan
 from arbeitszeit.repositories import DatabaseGateway
 from arbeitszeit.services.price_calculator import PriceCalculator
 
@@ -61,7 +61,11 @@ class GetCoopSummaryInteractor:
             .that_are_part_of_cooperation(request.coop_id)
             .that_will_expire_after(now)
         )
-        plans = list(plan_result)
+        plans_and_planners = [
+            (plan, planner)
+            for plan, planner, _ in plan_result.joined_with_planner_and_cooperation()
+        ]
+        plans = [plan for plan, _ in plans_and_planners]
         return GetCoopSummaryResponse(
             requester_is_coordinator=coordinator.id == request.requester_id,
             coop_id=coop.id,
@@ -70,21 +74,16 @@ class GetCoopSummaryInteractor:
             current_coordinator=coordinator.id,
             current_coordinator_name=coordinator.name,
             coop_price=self._get_cooperative_price(plans),
-            plans=self._get_associated_plans(plans, request.requester_id),
+            plans=self._get_associated_plans(plans_and_planners, request.requester_id),
         )
 
-    def _get_planner_name(self, planner_id: UUID) -> str:
-        planner = self.database_gateway.get_companies().with_id(planner_id).first()
-        assert planner
-        return planner.name
-
     def _get_cooperative_price(self, plans: list[Plan]) -> Optional[Decimal]:
         if not plans:
             return None
         return self.price_calculator.calculate_price(plans[0].id)
 
     def _get_associated_plans(
-        self, plans: list[Plan], requester: UUID
+        self, plans_and_planners: list[Tuple[Plan, Company]], requester: UUID
     ) -> list[AssociatedPlan]:
         return [
             AssociatedPlan(
@@ -92,8 +91,8 @@ class GetCoopSummaryInteractor:
                 plan_name=plan.prd_name,
                 plan_individual_price=plan.cost_per_unit(),
                 planner_id=plan.planner,
-                planner_name=self._get_planner_name(plan.planner),
+                planner_name=planner.name,
                 requester_is_planner=plan.planner == requester,
             )
-            for plan in plans
+            for plan, planner in plans_and_planners
         ]
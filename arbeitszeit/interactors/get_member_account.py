@@ -24,6 +24,6 @@ class GetMemberAccountInteractor:
         transfers = self.account_details_service.get_account_transfers(account)
         account_balance = self.account_details_service.get_account_balance(account)
         return GetMemberAccountResponse(
-            transfers=sorted(transfers, key=lambda t: t.date, reverse=True),
+            transfers=list(transfers),
             balance=account_balance,
         )
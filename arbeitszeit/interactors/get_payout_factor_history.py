@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import List
+
+from arbeitszeit.repositories import DatabaseGateway
+
+
+@dataclass
+class GetPayoutFactorHistoryInteractor:
+    @dataclass
+    class PayoutFactorChange:
+        timestamp: datetime
+        payout_factor: Decimal
+
+    @dataclass
+    class Response:
+        changes: List[GetPayoutFactorHistoryInteractor.PayoutFactorChange]
+
+    database_gateway: DatabaseGateway
+
+    def get_payout_factor_history(self) -> Response:
+        changes = (
+            self.database_gateway.get_payout_factor_changes().ordered_by_timestamp()
+        )
+        return self.Response(
+            changes=[
+                self.PayoutFactorChange(
+                    timestamp=change.timestamp,
+                    payout_factor=change.payout_factor,
+                )
+                for change in changes
+            ]
+        )
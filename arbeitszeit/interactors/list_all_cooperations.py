@@ -1,12 +1,17 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from arbeitszeit.datetime_service import DatetimeService
-from arbeitszeit.records import Cooperation
 from arbeitszeit.repositories import DatabaseGateway
 
 
+@dataclass
+class ListAllCooperationsRequest:
+    offset: Optional[int] = None
+    limit: Optional[int] = None
+
+
 @dataclass
 class ListedCooperation:
     id: UUID
@@ -17,6 +22,7 @@ class ListedCooperation:
 @dataclass
 class ListAllCooperationsResponse:
     cooperations: List[ListedCooperation]
+    total_results: int
 
 
 @dataclass
@@ -24,18 +30,22 @@ class ListAllCooperationsInteractor:
     database_gateway: DatabaseGateway
     datetime_service: DatetimeService
 
-    def execute(self) -> ListAllCooperationsResponse:
-        all_cooperations = self.database_gateway.get_cooperations()
-        if not all_cooperations:
-            return ListAllCooperationsResponse(cooperations=[])
-        cooperations = [self._coop_to_response_model(coop) for coop in all_cooperations]
-        return ListAllCooperationsResponse(cooperations=cooperations)
-
-    def _coop_to_response_model(self, coop: Cooperation) -> ListedCooperation:
+    def execute(
+        self, request: Optional[ListAllCooperationsRequest] = None
+    ) -> ListAllCooperationsResponse:
+        if request is None:
+            request = ListAllCooperationsRequest()
         now = self.datetime_service.now()
-        plan_count = len(
-            self.database_gateway.get_plans()
-            .that_are_part_of_cooperation(coop.id)
-            .that_will_expire_after(now)
+        page = (
+            self.database_gateway.get_cooperations()
+            .ordered_by_name()
+            .joined_with_active_plan_count(now)
+            .page(offset=request.offset, limit=request.limit)
+        )
+        cooperations = [
+            ListedCooperation(id=coop.id, name=coop.name, plan_count=plan_count)
+            for coop, plan_count in page.items
+        ]
+        return ListAllCooperationsResponse(
+            cooperations=cooperations, total_results=page.total
         )
-        return ListedCooperation(id=coop.id, name=coop.name, plan_count=plan_count)
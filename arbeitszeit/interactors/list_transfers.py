@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, TypeVar
+from typing import Optional, Tuple, TypeVar
 from uuid import UUID
 
 from arbeitszeit.records import (
@@ -10,11 +10,15 @@ from arbeitszeit.records import (
     Company,
     Member,
     SocialAccounting,
+    Transfer,
 )
 from arbeitszeit.repositories import DatabaseGateway, QueryResult
 from arbeitszeit.transfers import TransferType
 
-QueryT = TypeVar("QueryT", bound=QueryResult)
+T = TypeVar("T")
+
+TransferCursor = Tuple[datetime, UUID]
+"""Date and id of the last transfer on the previous page."""
 
 
 class AccountOwnerType(Enum):
@@ -28,6 +32,7 @@ class AccountOwnerType(Enum):
 class Request:
     limit: Optional[int]
     offset: Optional[int]
+    after: Optional[TransferCursor] = None
 
 
 @dataclass
@@ -49,6 +54,7 @@ class TransferEntry:
 class Response:
     total_results: int
     transfers: list[TransferEntry]
+    next_cursor: Optional[TransferCursor] = None
 
 
 @dataclass
@@ -59,7 +65,22 @@ class ListTransfersInteractor:
         transfers = self.database_gateway.get_transfers().ordered_by_date(
             ascending=False
         )
-        total_results = len(transfers)
+        rows: list[tuple[Transfer, AccountOwner, AccountOwner]]
+        if request.after is not None:
+            # The total of the first page is shown on every later page,
+            # so the rows behind the cursor are fetched without counting.
+            total_results = transfers.estimated_len()
+            rows = _fetch_slice(
+                transfers.after(request.after).joined_with_debtor_and_creditor(),
+                request.offset,
+                request.limit,
+            )
+        else:
+            page = transfers.joined_with_debtor_and_creditor().page(
+                offset=request.offset, limit=request.limit, estimate_total=True
+            )
+            total_results = page.total
+            rows = list(page.items)
         return Response(
             total_results=total_results,
             transfers=[
@@ -82,14 +103,21 @@ class ListTransfersInteractor:
                     value=transfer.value,
                     transfer_type=transfer.type,
                 )
-                for transfer, debtor, creditor in _limit_results(
-                    transfers.joined_with_debtor_and_creditor(),
-                    limit=request.limit,
-                    offset=request.offset,
-                )
+                for transfer, debtor, creditor in rows
             ],
+            next_cursor=self._get_next_cursor(rows, request.limit),
         )
 
+    def _get_next_cursor(
+        self,
+        rows: list[tuple[Transfer, AccountOwner, AccountOwner]],
+        limit: Optional[int],
+    ) -> Optional[TransferCursor]:
+        if limit is None or not rows or len(rows) < limit:
+            return None
+        last_transfer = rows[-1][0]
+        return last_transfer.date, last_transfer.id
+
     def _get_account_owner_name(self, account_owner: AccountOwner) -> str | None:
         if isinstance(account_owner, Member):
             return None
@@ -108,11 +136,13 @@ class ListTransfersInteractor:
             return AccountOwnerType.cooperation
 
 
-def _limit_results(
-    transfers: QueryT, *, limit: Optional[int] = None, offset: Optional[int] = None
-) -> QueryT:
+def _fetch_slice(
+    result: QueryResult[T], offset: Optional[int], limit: Optional[int]
+) -> list[T]:
     if offset is not None:
-        transfers = transfers.offset(n=offset)
+        result = result.offset(offset)
     if limit is not None:
-        transfers = transfers.limit(n=limit)
-    return transfers
+        result = result.limit(limit)
+    # list(result) would ask the result for its length first, which
+    # costs a COUNT query.
+    return list(iter(result))
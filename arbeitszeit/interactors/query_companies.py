@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import enum
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, TypeVar
+from typing import Iterable, List, Optional, Tuple, TypeVar
 from uuid import UUID
 
 from arbeitszeit.records import Company, EmailAddress
 from arbeitszeit.repositories import CompanyResult, DatabaseGateway, QueryResult
 
-QueryT = TypeVar("QueryT", bound=QueryResult)
+T = TypeVar("T")
+
+CompanyCursor = Tuple[str, UUID]
+"""Name and id of the last company on the previous page."""
 
 
 class CompanyFilter(enum.Enum):
@@ -21,6 +24,7 @@ class CompanyQueryResponse:
     results: List[QueriedCompany]
     total_results: int
     request: QueryCompaniesRequest
+    next_cursor: Optional[CompanyCursor] = None
 
 
 @dataclass
@@ -36,6 +40,7 @@ class QueryCompaniesRequest:
     filter_category: CompanyFilter
     offset: Optional[int]
     limit: Optional[int]
+    after: Optional[CompanyCursor] = None
 
 
 @dataclass
@@ -47,19 +52,50 @@ class QueryCompaniesInteractor:
         query = request.query_string
         filter_by = request.filter_category
         companies = _filter_companies(self.database.get_companies(), query, filter_by)
-        total_results = len(companies)
-        results = [
-            self._create_response_model(company, mail)
-            for company, mail in _limit_results(
-                companies.joined_with_email_address(),
-                limit=request.limit,
-                offset=request.offset,
+        rows: List[Tuple[Company, EmailAddress]]
+        if request.after is not None:
+            # The total of the first page is shown on every later page,
+            # so the rows behind the cursor are fetched without counting.
+            total_results = companies.estimated_len()
+            rows = _fetch_slice(
+                companies.ordered_by_name()
+                .after(request.after)
+                .joined_with_email_address(),
+                request.offset,
+                request.limit,
+            )
+        else:
+            page = (
+                _rank_companies(companies, query, filter_by)
+                .ordered_by_name()
+                .joined_with_email_address()
+                .page(offset=request.offset, limit=request.limit, estimate_total=True)
             )
-        ]
+            total_results = page.total
+            rows = list(page.items)
+        results = [self._create_response_model(company, mail) for company, mail in rows]
         return CompanyQueryResponse(
-            results=results, total_results=total_results, request=request
+            results=results,
+            total_results=total_results,
+            request=request,
+            next_cursor=(
+                None
+                if _is_ranked(query, filter_by)
+                else self._get_next_cursor(results, request.limit)
+            ),
         )
 
+    def _get_next_cursor(
+        self, results: List[QueriedCompany], limit: Optional[int]
+    ) -> Optional[CompanyCursor]:
+        """Cursors address pages of companies ordered by name. Ranked
+        search results are paginated by offset only.
+        """
+        if limit is None or not results or len(results) < limit:
+            return None
+        last_company = results[-1]
+        return last_company.company_name, last_company.company_id
+
     def _create_response_model(
         self, company: Company, email: EmailAddress
     ) -> QueriedCompany:
@@ -81,11 +117,25 @@ def _filter_companies(
     return companies
 
 
-def _limit_results(
-    companies: QueryT, *, limit: Optional[int] = None, offset: Optional[int] = None
-) -> QueryT:
+def _rank_companies(
+    companies: CompanyResult, query: Optional[str], filter_by: CompanyFilter
+) -> CompanyResult:
+    if query and _is_ranked(query, filter_by):
+        companies = companies.ordered_by_name_relevance(query)
+    return companies
+
+
+def _is_ranked(query: Optional[str], filter_by: CompanyFilter) -> bool:
+    return bool(query) and filter_by == CompanyFilter.by_name
+
+
+def _fetch_slice(
+    result: QueryResult[T], offset: Optional[int], limit: Optional[int]
+) -> List[T]:
     if offset is not None:
-        companies = companies.offset(n=offset)
+        result = result.offset(offset)
     if limit is not None:
-        companies = companies.limit(n=limit)
-    return companies
+        result = result.limit(limit)
+    # list(result) would ask the result for its length first, which
+    # costs a COUNT query.
+    return list(iter(result))
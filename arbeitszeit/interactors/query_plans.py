@@ -67,19 +67,22 @@ class QueryPlansInteractor:
         if not request.include_expired_plans:
             plans = plans.that_will_expire_after(now)
         plans = self._apply_filter(plans, request.query_string, request.filter_category)
-        total_results = len(plans)
         plans = self._apply_sorting(plans, request.sorting_category)
-        planning_info = plans.joined_with_planner_and_cooperation()
-        if request.offset is not None:
-            planning_info = planning_info.offset(n=request.offset)
-        if request.limit is not None:
-            planning_info = planning_info.limit(n=request.limit)
+        plans = self._apply_ranking(
+            plans, request.query_string, request.filter_category
+        )
+        page = plans.joined_with_planner_and_cooperation().page(
+            offset=request.offset, limit=request.limit
+        )
+        prices = self.price_calculator.calculate_prices(
+            plan.id for plan, _, _ in page.items
+        )
         results = [
-            self._plan_to_response_model(plan, planner, cooperation)
-            for plan, planner, cooperation in planning_info
+            self._plan_to_response_model(plan, planner, cooperation, prices[plan.id])
+            for plan, planner, cooperation in page.items
         ]
         return PlanQueryResponse(
-            results=results, total_results=total_results, request=request
+            results=results, total_results=page.total, request=request
         )
 
     def _apply_filter(
@@ -93,6 +96,13 @@ class QueryPlansInteractor:
             plans = plans.with_product_name_containing(query)
         return plans
 
+    def _apply_ranking(
+        self, plans: PlanResult, query: Optional[str], filter_by: PlanFilter
+    ) -> PlanResult:
+        if query and filter_by == PlanFilter.by_product_name:
+            plans = plans.ordered_by_product_name_relevance(query)
+        return plans
+
     def _apply_sorting(self, plans: PlanResult, sort_by: PlanSorting) -> PlanResult:
         if sort_by == PlanSorting.by_company_name:
             plans = plans.ordered_by_planner_name()
@@ -105,8 +115,8 @@ class QueryPlansInteractor:
         plan: records.Plan,
         planner: records.Company,
         cooperation: Optional[records.Cooperation],
+        price_per_unit: Decimal,
     ) -> QueriedPlan:
-        price_per_unit = self.price_calculator.calculate_price(plan.id)
         assert plan.approval_date
         return QueriedPlan(
             plan_id=plan.id,
@@ -7,7 +7,7 @@ from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.records import SocialAccounting
 from arbeitszeit.repositories import DatabaseGateway
 from arbeitszeit.services.payout_factor import PayoutFactorService
-from arbeitszeit.transfers import TransferType
+from arbeitszeit.transfers import NewTransfer, TransferType
 
 
 @dataclass
@@ -67,19 +67,25 @@ class RegisterHoursWorkedInteractor:
                 registered_hours_worked_id=None,
             )
         fic = self.fic_service.get_current_payout_factor()
-        transfer_of_work_certificates = self.database_gateway.create_transfer(
-            date=self.datetime_service.now(),
-            debit_account=company.work_account,
-            credit_account=worker.account,
-            value=interactor_request.hours_worked,
-            type=TransferType.work_certificates,
-        )
-        transfer_of_taxes = self.database_gateway.create_transfer(
-            date=self.datetime_service.now(),
-            debit_account=worker.account,
-            credit_account=self.social_accounting.account_psf,
-            value=interactor_request.hours_worked * (1 - fic),
-            type=TransferType.taxes,
+        transfer_of_work_certificates, transfer_of_taxes = (
+            self.database_gateway.create_transfers(
+                [
+                    NewTransfer(
+                        date=self.datetime_service.now(),
+                        debit_account=company.work_account,
+                        credit_account=worker.account,
+                        value=interactor_request.hours_worked,
+                        type=TransferType.work_certificates,
+                    ),
+                    NewTransfer(
+                        date=self.datetime_service.now(),
+                        debit_account=worker.account,
+                        credit_account=self.social_accounting.account_psf,
+                        value=interactor_request.hours_worked * (1 - fic),
+                        type=TransferType.taxes,
+                    ),
+                ]
+            )
         )
         registered_hours_worked = self.database_gateway.create_registered_hours_worked(
             company=company.id,
@@ -7,7 +7,6 @@ from arbeitszeit.services.account_details import (
     AccountDetailsService,
     AccountTransfer,
     PlotDetails,
-    construct_plot_data,
 )
 
 
@@ -30,14 +29,21 @@ class ShowAAccountDetailsInteractor:
     account_details_service: AccountDetailsService
 
     def show_details(self, request: Request) -> Response:
-        company = self.database.get_companies().with_id(request.company).first()
-        assert company
-        account = company.work_account
+        account = self._get_account(request.company)
         transfers = self.account_details_service.get_account_transfers(account)
         account_balance = self.account_details_service.get_account_balance(account)
         return Response(
             company_id=request.company,
-            transfers=sorted(transfers, key=lambda t: t.date, reverse=True),
+            transfers=list(transfers),
             account_balance=account_balance,
-            plot=construct_plot_data(transfers),
+            plot=self.account_details_service.get_plot_details(account),
         )
+
+    def show_plot(self, request: Request) -> PlotDetails:
+        account = self._get_account(request.company)
+        return self.account_details_service.get_plot_details(account)
+
+    def _get_account(self, company_id: UUID) -> UUID:
+        company = self.database.get_companies().with_id(company_id).first()
+        assert company
+        return company.work_account
@@ -54,6 +54,9 @@ class ShowMyPlansInteractor:
             .that_are_not_hidden()
             .joined_with_cooperation()
         )
+        prices = self.price_calculator.calculate_prices(
+            plan.id for plan, _ in all_plans_of_company
+        )
         drafts = list(
             map(
                 self._create_plan_info_from_draft,
@@ -63,7 +66,7 @@ class ShowMyPlansInteractor:
         drafts.sort(key=lambda x: x.plan_creation_date, reverse=True)
         count_all_plans = len(all_plans_of_company) + len(drafts)
         non_active_plans = [
-            self._create_plan_info_from_plan(plan, cooperation)
+            self._create_plan_info_from_plan(plan, cooperation, prices[plan.id])
             for plan, cooperation in all_plans_of_company
             if (
                 not plan.is_approved
@@ -73,7 +76,7 @@ class ShowMyPlansInteractor:
             )
         ]
         active_plans = [
-            self._create_plan_info_from_plan(plan, cooperation)
+            self._create_plan_info_from_plan(plan, cooperation, prices[plan.id])
             for plan, cooperation in all_plans_of_company
             if (
                 plan.is_approved
@@ -82,12 +85,12 @@ class ShowMyPlansInteractor:
             )
         ]
         expired_plans = [
-            self._create_plan_info_from_plan(plan, cooperation)
+            self._create_plan_info_from_plan(plan, cooperation, prices[plan.id])
             for plan, cooperation in all_plans_of_company
             if plan.is_expired_as_of(now)
         ]
         rejected_plans = [
-            self._create_plan_info_from_plan(plan, cooperation)
+            self._create_plan_info_from_plan(plan, cooperation, prices[plan.id])
             for plan, cooperation in all_plans_of_company
             if plan.is_rejected
         ]
@@ -101,9 +104,11 @@ class ShowMyPlansInteractor:
         )
 
     def _create_plan_info_from_plan(
-        self, plan: records.Plan, cooperation: Optional[records.Cooperation]
+        self,
+        plan: records.Plan,
+        cooperation: Optional[records.Cooperation],
+        price_per_unit: Decimal,
     ) -> PlanInfo:
-        price_per_unit = self.price_calculator.calculate_price(plan.id)
         return PlanInfo(
             id=plan.id,
             prd_name=plan.prd_name,
@@ -7,7 +7,6 @@ from arbeitszeit.services.account_details import (
     AccountDetailsService,
     AccountTransfer,
     PlotDetails,
-    construct_plot_data,
 )
 
 
@@ -30,16 +29,21 @@ class ShowPRDAccountDetailsInteractor:
     account_details_service: AccountDetailsService
 
     def show_details(self, request: Request) -> Response:
-        company = (
-            self.database_gateway.get_companies().with_id(request.company_id).first()
-        )
-        assert company
-        account = company.product_account
+        account = self._get_account(request.company_id)
         transfers = self.account_details_service.get_account_transfers(account)
         account_balance = self.account_details_service.get_account_balance(account)
         return Response(
             company_id=request.company_id,
-            transfers=sorted(transfers, key=lambda t: t.date, reverse=True),
+            transfers=list(transfers),
             account_balance=account_balance,
-            plot=construct_plot_data(transfers),
+            plot=self.account_details_service.get_plot_details(account),
         )
+
+    def show_plot(self, request: Request) -> PlotDetails:
+        account = self._get_account(request.company_id)
+        return self.account_details_service.get_plot_details(account)
+
+    def _get_account(self, company_id: UUID) -> UUID:
+        company = self.database_gateway.get_companies().with_id(company_id).first()
+        assert company
+        return company.product_account
@@ -287,6 +287,34 @@ class PlanningStatistics:
     total_planned_costs: ProductionCosts
 
 
+@dataclass
+class PayoutFactorCosts:
+    productive_labour: Decimal
+    public_labour: Decimal
+    public_means_and_resources: Decimal
+
+
+@dataclass
+class PayoutFactorCache:
+    version: int
+    payout_factor: Optional[Decimal]
+    computed_at: Optional[datetime]
+    valid_until: Optional[datetime]
+
+    def is_valid_at(self, timestamp: datetime) -> bool:
+        if self.payout_factor is None or self.computed_at is None:
+            return False
+        if timestamp < self.computed_at:
+            return False
+        return self.valid_until is None or timestamp < self.valid_until
+
+
+@dataclass(frozen=True)
+class PayoutFactorChange:
+    timestamp: datetime
+    payout_factor: Decimal
+
+
 @dataclass(frozen=True)
 class PrivateConsumption:
     id: UUID
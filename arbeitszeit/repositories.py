@@ -1,16 +1,36 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Generic, Iterable, Iterator, Optional, Protocol, Self, Tuple, TypeVar
+from typing import (
+    Any,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Self,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 from uuid import UUID
 
 from arbeitszeit import records
-from arbeitszeit.transfers import TransferType
+from arbeitszeit.transfers import NewTransfer, TransferType
 
 T = TypeVar("T", covariant=True)
 
 
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    items: Sequence[T]
+    total: int
+    is_total_estimated: bool = False
+
+
 class QueryResult(Protocol, Generic[T]):
     def __iter__(self) -> Iterator[T]: ...
 
@@ -18,8 +38,39 @@ class QueryResult(Protocol, Generic[T]):
 
     def offset(self, n: int) -> Self: ...
 
+    def after(self, cursor: Sequence[Any]) -> Self:
+        """Keyset pagination: Only include elements that come after
+        `cursor` in the current ordering of the result. The cursor
+        holds the values of the ordering keys of the last element of
+        the previous page, e.g. date and id for transfers ordered by
+        date.
+        """
+
     def first(self) -> Optional[T]: ...
 
+    def page(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        *,
+        estimate_total: bool = False,
+    ) -> Page[T]:
+        """Fetch a page of the result together with the total number of
+        elements in the result. With `estimate_total` the total of a
+        large, unfiltered result may be estimated instead of counted.
+        """
+
+    def estimated_len(self) -> int:
+        """The number of elements in the result. Like the total of a
+        page with `estimate_total`, it may be estimated for a large,
+        unfiltered result.
+        """
+
+    def stream(self, chunk_size: int = ...) -> Iterator[T]:
+        """Iterate over the result while fetching it in chunks of
+        `chunk_size` elements instead of loading it all at once.
+        """
+
     def __len__(self) -> int: ...
 
 
@@ -43,6 +94,11 @@ class PlanResult(QueryResult[records.Plan], Protocol):
 
     def with_product_name_containing(self, query: str) -> Self: ...
 
+    def ordered_by_product_name_relevance(self, query: str) -> Self:
+        """Order plans by how well their product name matches
+        `query`, best matches first.
+        """
+
     def that_are_approved(self) -> Self: ...
 
     def that_are_rejected(self) -> Self: ...
@@ -52,6 +108,11 @@ class PlanResult(QueryResult[records.Plan], Protocol):
         be included in the result.
         """
 
+    def that_were_approved_after(self, timestamp: datetime) -> Self:
+        """Plans that were approved exactly at `timestamp` should not
+        be included in the result.
+        """
+
     def that_will_expire_after(self, timestamp: datetime) -> Self:
         """Plans that will expire exactly on the specified timestamp
         should not be included in the result.
@@ -99,6 +160,18 @@ class PlanResult(QueryResult[records.Plan], Protocol):
         included in a result set.
         """
 
+    def get_payout_factor_costs(self) -> records.PayoutFactorCosts:
+        """Return the sums of the costs of all plans included in a
+        result set that determine the payout factor: the labour of
+        productive plans, the labour of public plans and the means of
+        production and raw materials of public plans.
+        """
+
+    def get_earliest_expiration_date(self) -> Optional[datetime]:
+        """Return the earliest expiration date of all approved plans
+        included in a result set or None if there are none.
+        """
+
     def that_are_not_hidden(self) -> Self:
         """Filter out those plans which are hidden. The result will
         only contain plans that are not hidden.
@@ -116,6 +189,13 @@ class PlanResult(QueryResult[records.Plan], Protocol):
         self,
     ) -> QueryResult[Tuple[records.Plan, Optional[records.Cooperation]]]: ...
 
+    def joined_with_requested_cooperation_and_planner(
+        self,
+    ) -> QueryResult[Tuple[records.Plan, records.Cooperation, records.Company]]:
+        """Plans that do not request a cooperation are not included in
+        the result.
+        """
+
     def joined_with_provided_product_amount(
         self,
     ) -> QueryResult[Tuple[records.Plan, int]]: ...
@@ -193,6 +273,12 @@ class PlanDraftUpdate(DatabaseUpdate, Protocol):
 class PlanApprovalResult(QueryResult[records.PlanApproval], Protocol): ...
 
 
+class PayoutFactorChangeResult(QueryResult[records.PayoutFactorChange], Protocol):
+    def ordered_by_timestamp(self, *, ascending: bool = ...) -> Self: ...
+
+    def that_occurred_after(self, timestamp: datetime) -> Self: ...
+
+
 class CooperationResult(QueryResult[records.Cooperation], Protocol):
     def with_id(self, id_: UUID) -> Self: ...
 
@@ -202,10 +288,20 @@ class CooperationResult(QueryResult[records.Cooperation], Protocol):
 
     def of_plan(self, plan_id: UUID) -> Self: ...
 
+    def ordered_by_name(self, *, ascending: bool = ...) -> Self:
+        """Cooperations with the same name are ordered by their id."""
+
     def joined_with_current_coordinator(
         self,
     ) -> QueryResult[Tuple[records.Cooperation, records.Company]]: ...
 
+    def joined_with_active_plan_count(
+        self, timestamp: datetime
+    ) -> QueryResult[Tuple[records.Cooperation, int]]:
+        """Yield every cooperation together with the number of its
+        plans that will expire after `timestamp`.
+        """
+
 
 class CoordinationTenureResult(QueryResult[records.CoordinationTenure], Protocol):
     def with_id(self, id_: UUID) -> Self: ...
@@ -304,6 +400,11 @@ class ProductiveConsumptionResult(QueryResult[records.ProductiveConsumption], Pr
         ]
     ]: ...
 
+    def grouped_by_provider(self) -> QueryResult[Tuple[records.Company, Decimal]]:
+        """Yield every providing company once together with the summed
+        value of the transfers of its consumptions.
+        """
+
 
 class CompanyResult(QueryResult[records.Company], Protocol):
     def with_id(self, id_: UUID) -> Self: ...
@@ -322,6 +423,14 @@ class CompanyResult(QueryResult[records.Company], Protocol):
 
     def with_email_containing(self, query: str) -> Self: ...
 
+    def ordered_by_name_relevance(self, query: str) -> Self:
+        """Order companies by how well their name matches `query`,
+        best matches first.
+        """
+
+    def ordered_by_name(self, *, ascending: bool = ...) -> Self:
+        """Companies with the same name are ordered by their id."""
+
     def joined_with_email_address(
         self,
     ) -> QueryResult[Tuple[records.Company, records.EmailAddress]]: ...
@@ -358,7 +467,36 @@ class TransferResult(QueryResult[records.Transfer], Protocol):
         Tuple[records.Transfer, records.AccountOwner, records.AccountOwner]
     ]: ...
 
-    def ordered_by_date(self, *, ascending: bool = ...) -> Self: ...
+    def ordered_by_date(self, *, ascending: bool = ...) -> Self:
+        """Transfers with the same date are ordered by their id."""
+
+    def running_balances_of(
+        self, account: UUID
+    ) -> QueryResult[Tuple[datetime, Decimal]]:
+        """Yield every date at which transfers from or to the given
+        account took place together with the balance of the account
+        after the transfers of that date, in ascending order. Transfers
+        that debit and credit the account at the same time count as
+        debit transfers.
+
+        Days covered by balance checkpoints are summarized as the start
+        of the following day together with the balance at the end of
+        the day, so that only later transfers need to be summed up.
+        """
+
+    def summed_by_creditor_and_type(
+        self,
+    ) -> QueryResult[Tuple[UUID, TransferType, Decimal]]:
+        """Yield the summed value of the transfers for every
+        combination of credit account and transfer type.
+        """
+
+    def summed_by_debtor_and_type(
+        self,
+    ) -> QueryResult[Tuple[UUID, TransferType, Decimal]]:
+        """Yield the summed value of the transfers for every
+        combination of debit account and transfer type.
+        """
 
 
 class AccountResult(QueryResult[records.Account], Protocol):
@@ -575,6 +713,13 @@ class DatabaseGateway(Protocol):
         type: TransferType,
     ) -> records.Transfer: ...
 
+    def create_transfers(
+        self, transfers: Sequence[NewTransfer]
+    ) -> List[records.Transfer]:
+        """Create all given transfers at once. The created transfers
+        are returned in the same order as they were given.
+        """
+
     def get_transfers(self) -> TransferResult: ...
 
     def create_company_work_invite(
@@ -671,3 +816,28 @@ class DatabaseGateway(Protocol):
     ) -> records.PlanApproval: ...
 
     def get_plan_approvals(self) -> PlanApprovalResult: ...
+
+    def get_payout_factor_cache(self) -> records.PayoutFactorCache: ...
+
+    def store_payout_factor(
+        self,
+        *,
+        version: int,
+        payout_factor: Decimal,
+        computed_at: datetime,
+        valid_until: Optional[datetime],
+    ) -> bool:
+        """Cache the payout factor unless the cache was invalidated
+        since `version` was read. Return whether it was stored. Unless
+        the current transaction has already written, the payout factor
+        is stored in a transaction of its own, so that it stays cached
+        even if the current transaction is rolled back.
+        """
+
+    def invalidate_payout_factor_cache(self) -> None: ...
+
+    def get_payout_factor_changes(self) -> PayoutFactorChangeResult: ...
+
+    def create_payout_factor_changes(
+        self, changes: Iterable[records.PayoutFactorChange]
+    ) -> None: ...
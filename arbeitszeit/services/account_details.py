@@ -2,7 +2,7 @@ import enum
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from itertools import accumulate
+from typing import Iterator
 from uuid import UUID
 
 from arbeitszeit.anonymization import (
@@ -56,12 +56,16 @@ class PlotDetails:
 class AccountDetailsService:
     database_gateway: DatabaseGateway
 
-    def get_account_transfers(self, account: UUID) -> list[AccountTransfer]:
-        transfers: list[AccountTransfer] = []
+    def get_account_transfers(self, account: UUID) -> Iterator[AccountTransfer]:
+        """Yield the transfers from and to the account, newest first.
+        The transfers are read lazily from the database.
+        """
         for transfer, debtor, creditor in (
             self.database_gateway.get_transfers()
             .where_account_is_debtor_or_creditor(account)
+            .ordered_by_date(ascending=False)
             .joined_with_debtor_and_creditor()
+            .stream()
         ):
             is_debit_transfer = transfer.debit_account == account
             transfer_party = build_counterparty_transfer_party(
@@ -69,17 +73,14 @@ class AccountDetailsService:
                 creditor=creditor,
                 is_debit_transfer=is_debit_transfer,
             )
-            transfers.append(
-                AccountTransfer(
-                    type=transfer.type,
-                    date=transfer.date,
-                    volume=-transfer.value if is_debit_transfer else transfer.value,
-                    is_debit_transfer=is_debit_transfer,
-                    transfer_party=transfer_party,
-                    debtor_equals_creditor=debtor.id == creditor.id,
-                )
+            yield AccountTransfer(
+                type=transfer.type,
+                date=transfer.date,
+                volume=-transfer.value if is_debit_transfer else transfer.value,
+                is_debit_transfer=is_debit_transfer,
+                transfer_party=transfer_party,
+                debtor_equals_creditor=debtor.id == creditor.id,
             )
-        return transfers
 
     def get_account_balance(self, account: UUID) -> Decimal:
         result = (
@@ -91,6 +92,19 @@ class AccountDetailsService:
         assert result
         return result[1]
 
+    def get_plot_details(self, account: UUID) -> PlotDetails:
+        timestamps: list[datetime] = []
+        accumulated_volumes: list[Decimal] = []
+        for timestamp, balance in (
+            self.database_gateway.get_transfers().running_balances_of(account).stream()
+        ):
+            timestamps.append(timestamp)
+            accumulated_volumes.append(balance)
+        return PlotDetails(
+            timestamps=timestamps,
+            accumulated_volumes=accumulated_volumes,
+        )
+
 
 def build_counterparty_transfer_party(
     debtor: AccountOwner,
@@ -130,11 +144,3 @@ def _transfer_party_type_from_owner(account_owner: AccountOwner) -> TransferPart
             return TransferPartyType.cooperation
         case SocialAccounting():
             return TransferPartyType.social_accounting
-
-
-def construct_plot_data(transfers: list[AccountTransfer]) -> PlotDetails:
-    transfers = sorted(transfers, key=lambda transfer: transfer.date)
-    return PlotDetails(
-        timestamps=[t.date for t in transfers],
-        accumulated_volumes=list(accumulate([t.volume for t in transfers])),
-    )
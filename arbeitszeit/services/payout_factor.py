@@ -4,8 +4,8 @@ from decimal import Decimal
 from typing import Iterable
 
 from arbeitszeit.datetime_service import DatetimeService
-from arbeitszeit.records import Plan
-from arbeitszeit.repositories import DatabaseGateway
+from arbeitszeit.records import PayoutFactorCosts, Plan
+from arbeitszeit.repositories import DatabaseGateway, PlanResult
 
 
 @dataclass
@@ -14,19 +14,56 @@ class PayoutFactorService:
     database_gateway: DatabaseGateway
 
     def calculate_payout_factor(self, timestamp: datetime) -> Decimal:
-        active_plans = (
+        active_plans = self._get_active_plans(timestamp)
+        return payout_factor_from_costs(active_plans.get_payout_factor_costs())
+
+    def get_current_payout_factor(self) -> Decimal:
+        """The payout factor only changes when a plan is approved or
+        expires. It is cached until the next expiration of an active
+        plan. ApprovePlanInteractor invalidates the cache.
+        """
+        now = self.datetime_service.now()
+        cache = self.database_gateway.get_payout_factor_cache()
+        if cache.is_valid_at(now):
+            assert cache.payout_factor is not None
+            return cache.payout_factor
+        active_plans = self._get_active_plans(now)
+        payout_factor = payout_factor_from_costs(active_plans.get_payout_factor_costs())
+        self.database_gateway.store_payout_factor(
+            version=cache.version,
+            payout_factor=payout_factor,
+            computed_at=now,
+            valid_until=active_plans.get_earliest_expiration_date(),
+        )
+        return payout_factor
+
+    def _get_active_plans(self, timestamp: datetime) -> PlanResult:
+        return (
             self.database_gateway.get_plans()
             .that_will_expire_after(timestamp)
             .that_were_approved_before(timestamp)
         )
-        return calculate_payout_factor(active_plans)
-
-    def get_current_payout_factor(self) -> Decimal:
-        now = self.datetime_service.now()
-        return self.calculate_payout_factor(now)
 
 
 def calculate_payout_factor(plans: Iterable[Plan]) -> Decimal:
+    costs = PayoutFactorCosts(
+        productive_labour=Decimal(0),
+        public_labour=Decimal(0),
+        public_means_and_resources=Decimal(0),
+    )
+    for plan in plans:
+        production_costs = plan.production_costs
+        if plan.is_public_service:
+            costs.public_labour += production_costs.labour_cost
+            costs.public_means_and_resources += (
+                production_costs.means_cost + production_costs.resource_cost
+            )
+        else:
+            costs.productive_labour += production_costs.labour_cost
+    return payout_factor_from_costs(costs)
+
+
+def payout_factor_from_costs(costs: PayoutFactorCosts) -> Decimal:
     # payout factor or factor of individual consumption (FIC)
     # = (l − ( p_o + r_o )) / (l + l_o)
     # where:
@@ -35,24 +72,13 @@ def calculate_payout_factor(plans: Iterable[Plan]) -> Decimal:
     # p_o = means of production in public plans
     # r_o = raw materials in public plans
 
-    if not plans:
-        return Decimal(1)
-
-    l: Decimal = Decimal(0)
-    l_o: Decimal = Decimal(0)
-    p_o_and_r_o = Decimal(0)
-
-    for plan in plans:
-        costs = plan.production_costs
-        if plan.is_public_service:
-            l_o += costs.labour_cost
-            p_o_and_r_o += costs.means_cost + costs.resource_cost
-        else:
-            l += costs.labour_cost
+    l: Decimal = costs.productive_labour
+    l_o: Decimal = costs.public_labour
+    p_o_and_r_o = costs.public_means_and_resources
     total_labour = l + l_o
 
     if not total_labour:
-        # prevent division by zero
+        # prevent division by zero, this includes the case without plans
         if p_o_and_r_o:
             return Decimal(0)
         return Decimal(1)
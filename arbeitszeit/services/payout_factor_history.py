@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from arbeitszeit.records import PayoutFactorChange, PayoutFactorCosts, Plan
+from arbeitszeit.repositories import DatabaseGateway
+from arbeitszeit.services.payout_factor import payout_factor_from_costs
+
+
+@dataclass
+class PayoutFactorHistoryService:
+    """The payout factor only changes when a plan is approved or
+    expires. The history of the payout factor is stored as the points
+    in time at which it changed, and is extended from the latest stored
+    change point on by replaying the approvals and expirations since.
+    """
+
+    database_gateway: DatabaseGateway
+
+    def extend_history(self, until: datetime) -> List[PayoutFactorChange]:
+        """Store the changes of the payout factor up to and including
+        `until` that are not stored yet and return them.
+        """
+        latest_change = (
+            self.database_gateway.get_payout_factor_changes()
+            .ordered_by_timestamp(ascending=False)
+            .first()
+        )
+        if latest_change is None:
+            since = None
+            costs = _zero_costs()
+            approved_plans = self.database_gateway.get_plans()
+            expired_plans = self.database_gateway.get_plans()
+        else:
+            since = latest_change.timestamp
+            costs = (
+                self.database_gateway.get_plans()
+                .that_will_expire_after(since)
+                .that_were_approved_before(since)
+                .get_payout_factor_costs()
+            )
+            approved_plans = self.database_gateway.get_plans().that_were_approved_after(
+                since
+            )
+            expired_plans = self.database_gateway.get_plans().that_will_expire_after(
+                since
+            )
+        deltas: Dict[datetime, PayoutFactorCosts] = dict()
+        for plan in approved_plans.that_were_approved_before(until):
+            assert plan.approval_date
+            _add_plan_costs(deltas, plan.approval_date, plan, sign=1)
+        for plan in expired_plans.that_are_expired_as_of(until):
+            assert plan.expiration_date
+            _add_plan_costs(deltas, plan.expiration_date, plan, sign=-1)
+        changes: List[PayoutFactorChange] = []
+        payout_factor: Optional[Decimal] = (
+            latest_change.payout_factor if latest_change else None
+        )
+        for timestamp in sorted(deltas):
+            delta = deltas[timestamp]
+            costs = PayoutFactorCosts(
+                productive_labour=costs.productive_labour + delta.productive_labour,
+                public_labour=costs.public_labour + delta.public_labour,
+                public_means_and_resources=costs.public_means_and_resources
+                + delta.public_means_and_resources,
+            )
+            new_payout_factor = payout_factor_from_costs(costs)
+            if new_payout_factor != payout_factor:
+                changes.append(
+                    PayoutFactorChange(
+                        timestamp=timestamp, payout_factor=new_payout_factor
+                    )
+                )
+                payout_factor = new_payout_factor
+        self.database_gateway.create_payout_factor_changes(changes)
+        return changes
+
+
+def _zero_costs() -> PayoutFactorCosts:
+    return PayoutFactorCosts(
+        productive_labour=Decimal(0),
+        public_labour=Decimal(0),
+        public_means_and_resources=Decimal(0),
+    )
+
+
+def _add_plan_costs(
+    deltas: Dict[datetime, PayoutFactorCosts],
+    timestamp: datetime,
+    plan: Plan,
+    sign: int,
+) -> None:
+    delta = deltas.setdefault(timestamp, _zero_costs())
+    costs = plan.production_costs
+    if plan.is_public_service:
+        delta.public_labour += sign * costs.labour_cost
+        delta.public_means_and_resources += sign * (
+            costs.means_cost + costs.resource_cost
+        )
+    else:
+        delta.productive_labour += sign * costs.labour_cost
@@ -1,5 +1,7 @@
+from collections import defaultdict
 from dataclasses import dataclass
 from decimal import Decimal
+from typing import Dict, Iterable, List
 from uuid import UUID
 
 from arbeitszeit import records
@@ -16,34 +18,68 @@ class PriceCalculator:
         """
         Calculate the price per unit for consumers.
         """
-        plan_record = self.database_gateway.get_plans().with_id(plan).first()
-        if plan_record is None:
-            return Decimal(0)
-        if plan_record.is_public_service:
-            return Decimal(0)
-        coop_price = self._calculate_cooperative_price(plan)
-        if coop_price is None:
-            return plan_record.cost_per_unit()
-        return coop_price
+        return self.calculate_prices([plan])[plan]
 
-    def _calculate_cooperative_price(self, plan: UUID) -> Decimal | None:
+    def calculate_prices(self, plans: Iterable[UUID]) -> Dict[UUID, Decimal]:
         """
-        Returns None if plan is not part of a cooperation.
+        Calculate the prices per unit for consumers of multiple plans
+        at once. The number of database queries does not depend on
+        the number of plans. Plans that do not exist have a price of
+        zero.
         """
+        plan_ids = set(plans)
+        prices: Dict[UUID, Decimal] = {plan: Decimal(0) for plan in plan_ids}
+        if not plan_ids:
+            return prices
+        plans_and_cooperations = list(
+            self.database_gateway.get_plans()
+            .with_id(*plan_ids)
+            .joined_with_cooperation()
+        )
+        cooperative_prices = self._calculate_cooperative_prices(
+            {
+                cooperation.id
+                for plan, cooperation in plans_and_cooperations
+                if cooperation is not None and not plan.is_public_service
+            }
+        )
+        for plan, cooperation in plans_and_cooperations:
+            if plan.is_public_service:
+                continue
+            coop_price = cooperative_prices.get(cooperation.id) if cooperation else None
+            if coop_price is None:
+                prices[plan.id] = plan.cost_per_unit()
+            else:
+                prices[plan.id] = coop_price
+        return prices
+
+    def _calculate_cooperative_prices(
+        self, cooperations: set[UUID]
+    ) -> Dict[UUID, Decimal]:
+        """
+        Cooperations without active plans are not part of the result.
+        """
+        if not cooperations:
+            return dict()
         now = self.datetime_service.now()
-        plans = list(
+        active_plans: Dict[UUID, List[records.Plan]] = defaultdict(list)
+        for plan, cooperation in (
             self.database_gateway.get_plans()
-            .that_are_in_same_cooperation_as(plan)
+            .that_are_part_of_cooperation(*cooperations)
             .that_will_expire_after(now)
-        )
-        if not plans:
-            return None
-        assert not any(p.is_public_service for p in plans)
-        if len(plans) == 1:
-            # The plan passed as argument is the sole member of a cooperation
-            return plans[0].cost_per_unit()
-        else:
-            return self._calculate_average_costs(plans)
+            .joined_with_cooperation()
+        ):
+            assert cooperation
+            active_plans[cooperation.id].append(plan)
+        prices: Dict[UUID, Decimal] = dict()
+        for cooperation_id, plans in active_plans.items():
+            assert not any(p.is_public_service for p in plans)
+            if len(plans) == 1:
+                # The plan is the sole active member of a cooperation
+                prices[cooperation_id] = plans[0].cost_per_unit()
+            else:
+                prices[cooperation_id] = self._calculate_average_costs(plans)
+        return prices
 
     def _calculate_average_costs(self, plans: list[records.Plan]) -> Decimal:
         return Decimal(sum(plan.cost_per_unit() for plan in plans)) / Decimal(
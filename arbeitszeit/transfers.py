@@ -1,4 +1,8 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
 from enum import Enum
+from uuid import UUID
 
 
 class TransferType(Enum):
@@ -20,3 +24,17 @@ class TransferType(Enum):
     compensation_for_company = "compensation_for_company"
     work_certificates = "work_certificates"
     taxes = "taxes"
+
+
+@dataclass(frozen=True)
+class NewTransfer:
+    """
+    The data of a transfer that is yet to be created, see
+    DatabaseGateway.create_transfers.
+    """
+
+    date: datetime
+    debit_account: UUID
+    credit_account: UUID
+    value: Decimal
+    type: TransferType
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+
+from arbeitszeit_db import models
+from arbeitszeit_db.db import Database
+
+
+@dataclass
+class AccountBalanceInconsistency:
+    account: UUID
+    stored_balance: Optional[Decimal]
+    calculated_balance: Decimal
+
+
+@dataclass
+class AccountBalanceChecker:
+    """Compare the balances stored in the account_balance table with
+    the balances calculated from the full transfer history.
+    """
+
+    db: Database
+
+    def get_inconsistencies(self) -> List[AccountBalanceInconsistency]:
+        credited = (
+            select(
+                models.Transfer.credit_account.label("account_id"),
+                func.sum(models.Transfer.value).label("credited"),
+            )
+            .group_by(models.Transfer.credit_account)
+            .subquery()
+        )
+        debited = (
+            select(
+                models.Transfer.debit_account.label("account_id"),
+                func.sum(models.Transfer.value).label("debited"),
+            )
+            .group_by(models.Transfer.debit_account)
+            .subquery()
+        )
+        query = (
+            select(
+                models.Account.id,
+                models.AccountBalance.balance,
+                (
+                    func.coalesce(credited.c.credited, 0)
+                    - func.coalesce(debited.c.debited, 0)
+                ).label("calculated_balance"),
+            )
+            .outerjoin(
+                models.AccountBalance,
+                models.AccountBalance.account == models.Account.id,
+            )
+            .outerjoin(credited, credited.c.account_id == models.Account.id)
+            .outerjoin(debited, debited.c.account_id == models.Account.id)
+        )
+        return [
+            AccountBalanceInconsistency(
+                account=account_id,
+                stored_balance=(
+                    Decimal(stored_balance) if stored_balance is not None else None
+                ),
+                calculated_balance=Decimal(calculated_balance),
+            )
+            for account_id, stored_balance, calculated_balance in self.db.session.execute(
+                query
+            )
+            if stored_balance is None
+            or Decimal(stored_balance) != Decimal(calculated_balance)
+        ]
+
+    def repair(self, inconsistencies: List[AccountBalanceInconsistency]) -> None:
+        for inconsistency in inconsistencies:
+            if inconsistency.stored_balance is None:
+                self.db.session.add(
+                    models.AccountBalance(
+                        account=inconsistency.account,
+                        balance=inconsistency.calculated_balance,
+                    )
+                )
+            else:
+                self.db.session.execute(
+                    update(models.AccountBalance)
+                    .where(models.AccountBalance.account == inconsistency.account)
+                    .values(balance=inconsistency.calculated_balance)
+                    .execution_options(synchronize_session=False)
+                )
+        self.db.session.flush()
@@ -0,0 +1,136 @@
+"""Daily balance checkpoints.
+
+The daily_account_balance table holds the balance of every account at
+the end of each day (UTC) on which its balance changed, up to the day
+recorded in balance_checkpoint_state. The balance of an account at any
+point in time is its latest checkpoint before that point plus the
+transfers made since the end of the checkpointed days, so the running
+balances of an account, see TransferQueryResult.running_balances_of,
+do not require a scan of its whole transfer history.
+
+Checkpoints are only written for completed days and are extended
+incrementally by BalanceCheckpointUpdater, e.g. via the
+``update-balance-checkpoints`` command. Transfers are never dated
+into the past, so completed days do not change anymore.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import Date, Select, func, insert, select, union_all
+from sqlalchemy.orm import aliased
+
+from arbeitszeit_db import models
+from arbeitszeit_db.db import Database
+
+STATE_ID = 1
+
+
+def get_checkpointed_until(db: Database) -> Optional[date]:
+    """The last day for which checkpoints have been written, if any."""
+    return db.session.scalar(
+        select(models.BalanceCheckpointState.checkpointed_until).where(
+            models.BalanceCheckpointState.id == STATE_ID
+        )
+    )
+
+
+def start_of_day(day: date) -> datetime:
+    return datetime.combine(day, time(), UTC)
+
+
+def latest_checkpoint_balance(account: Any, until: Optional[date]) -> Any:
+    """A scalar subquery for the balance of `account` at the end of the
+    last checkpointed day up to and including `until`.
+    """
+    checkpoint = aliased(models.DailyAccountBalance)
+    query = select(checkpoint.balance).where(checkpoint.account == account)
+    if until is not None:
+        query = query.where(checkpoint.day <= until)
+    return query.order_by(checkpoint.day.desc()).limit(1).scalar_subquery()
+
+
+def daily_balances_after(
+    checkpointed_until: Optional[date], before: Optional[date] = None
+) -> Select:
+    """Calculate (account, day, balance) rows for all days after
+    `checkpointed_until` and before `before` on which the balance of an
+    account changed. The running sum of the daily changes continues the
+    latest checkpoint of the account.
+    """
+    day = func.date(models.Transfer.date, type_=Date)
+    conditions = []
+    if checkpointed_until is not None:
+        conditions.append(
+            models.Transfer.date >= start_of_day(checkpointed_until + timedelta(days=1))
+        )
+    if before is not None:
+        conditions.append(models.Transfer.date < start_of_day(before))
+    changes = union_all(
+        select(
+            models.Transfer.credit_account.label("account"),
+            day.label("day"),
+            models.Transfer.value.label("amount"),
+        ).where(*conditions),
+        select(
+            models.Transfer.debit_account.label("account"),
+            day.label("day"),
+            (-models.Transfer.value).label("amount"),
+        ).where(*conditions),
+    ).subquery()
+    daily_changes = (
+        select(
+            changes.c.account,
+            changes.c.day,
+            func.sum(changes.c.amount).label("change"),
+        )
+        .group_by(changes.c.account, changes.c.day)
+        .subquery()
+    )
+    return select(
+        daily_changes.c.account,
+        daily_changes.c.day,
+        (
+            func.coalesce(
+                latest_checkpoint_balance(daily_changes.c.account, checkpointed_until),
+                0,
+            )
+            + func.sum(daily_changes.c.change).over(
+                partition_by=daily_changes.c.account, order_by=daily_changes.c.day
+            )
+        ).label("balance"),
+    )
+
+
+@dataclass
+class BalanceCheckpointUpdater:
+    db: Database
+
+    def update(self, now: datetime) -> date:
+        """Write the checkpoints of all days that were completed before
+        `now` and return the last checkpointed day.
+        """
+        session = self.db.session
+        checkpointed_until = get_checkpointed_until(self.db)
+        today = now.astimezone(UTC).date()
+        yesterday = today - timedelta(days=1)
+        if checkpointed_until is not None and checkpointed_until >= yesterday:
+            return checkpointed_until
+        session.execute(
+            insert(models.DailyAccountBalance).from_select(
+                ["account", "day", "balance"],
+                daily_balances_after(checkpointed_until, before=today),
+            )
+        )
+        state = session.get(models.BalanceCheckpointState, STATE_ID)
+        if state is None:
+            session.add(
+                models.BalanceCheckpointState(id=STATE_ID, checkpointed_until=yesterday)
+            )
+        else:
+            state.checkpointed_until = yesterday
+        session.flush()
+        return yesterday
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+
+from arbeitszeit_db import models
+from arbeitszeit_db.db import Database
+
+
+@dataclass
+class ConsumedAmountInconsistency:
+    plan: UUID
+    stored_amount: int
+    calculated_amount: int
+
+
+@dataclass
+class ConsumedAmountChecker:
+    """Compare the consumed amounts stored in the plan table with the
+    amounts calculated from all private and productive consumptions.
+    """
+
+    db: Database
+
+    def get_inconsistencies(self) -> List[ConsumedAmountInconsistency]:
+        productive = (
+            select(
+                models.ProductiveConsumption.plan_id.label("plan_id"),
+                func.sum(models.ProductiveConsumption.amount).label("amount"),
+            )
+            .group_by(models.ProductiveConsumption.plan_id)
+            .subquery()
+        )
+        private = (
+            select(
+                models.PrivateConsumption.plan_id.label("plan_id"),
+                func.sum(models.PrivateConsumption.amount).label("amount"),
+            )
+            .group_by(models.PrivateConsumption.plan_id)
+            .subquery()
+        )
+        query = (
+            select(
+                models.Plan.id,
+                models.Plan.consumed_amount,
+                (
+                    func.coalesce(productive.c.amount, 0)
+                    + func.coalesce(private.c.amount, 0)
+                ).label("calculated_amount"),
+            )
+            .outerjoin(productive, productive.c.plan_id == models.Plan.id)
+            .outerjoin(private, private.c.plan_id == models.Plan.id)
+        )
+        return [
+            ConsumedAmountInconsistency(
+                plan=plan_id,
+                stored_amount=stored_amount,
+                calculated_amount=calculated_amount,
+            )
+            for plan_id, stored_amount, calculated_amount in self.db.session.execute(
+                query
+            )
+            if stored_amount != calculated_amount
+        ]
+
+    def repair(self, inconsistencies: List[ConsumedAmountInconsistency]) -> None:
+        for inconsistency in inconsistencies:
+            self.db.session.execute(
+                update(models.Plan)
+                .where(models.Plan.id == inconsistency.plan)
+                .values(consumed_amount=inconsistency.calculated_amount)
+                .execution_options(synchronize_session=False)
+            )
+        self.db.session.flush()
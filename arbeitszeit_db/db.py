@@ -1,7 +1,140 @@
-from typing import Optional
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Iterator, Optional
 
-from sqlalchemy import URL, Engine, create_engine, make_url
-from sqlalchemy.orm import DeclarativeBase, scoped_session, sessionmaker
+from sqlalchemy import (
+    URL,
+    Connection,
+    Engine,
+    QueuePool,
+    Select,
+    create_engine,
+    event,
+    make_url,
+)
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    ORMExecuteState,
+    Session,
+    scoped_session,
+    sessionmaker,
+)
+
+from arbeitszeit_db.query_statistics import (
+    QueryStatistics,
+    instrument_engine,
+    recording_queries,
+)
+
+READS_FROM_REPLICA = "reads_from_replica"
+HAS_WRITTEN = "has_written"
+
+
+@dataclass
+class PoolConfiguration:
+    size: int = 5
+    max_overflow: int = 10
+    timeout: float = 30
+    recycle: int = -1
+    pre_ping: bool = False
+
+
+@dataclass
+class PoolStatistics:
+    size: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+class InstrumentedQueuePool(QueuePool):
+    """A QueuePool that records how long checkouts had to wait for a
+    connection.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._statistics_lock = Lock()
+        self.checkouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _do_get(self) -> Any:
+        started = monotonic()
+        try:
+            return super()._do_get()
+        finally:
+            waited = monotonic() - started
+            with self._statistics_lock:
+                self.checkouts += 1
+                self.total_wait_seconds += waited
+                self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def statistics(self) -> PoolStatistics:
+        with self._statistics_lock:
+            return PoolStatistics(
+                size=self.size(),
+                checked_out=self.checkedout(),
+                overflow=max(0, self.overflow()),
+                checkouts=self.checkouts,
+                total_wait_seconds=self.total_wait_seconds,
+                max_wait_seconds=self.max_wait_seconds,
+            )
+
+
+class RoutingSession(Session):
+    """A session that sends SELECT statements to a read replica while
+    reads from the replica are enabled via the session info. Everything
+    else, including all statements issued during a flush, goes to the
+    primary database. With `pin_reads_to_primary_after_write` reads go
+    to the primary again once the session has written anything, so that
+    they see their own writes.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        replica: Optional[Engine] = None,
+        pin_reads_to_primary_after_write: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.replica = replica
+        self.pin_reads_to_primary_after_write = pin_reads_to_primary_after_write
+
+    def get_bind(self, mapper: Any = None, *, clause: Any = None, **kwargs: Any) -> Any:
+        if self._reads_from_replica() and isinstance(clause, Select):
+            return self.replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    def _reads_from_replica(self) -> bool:
+        if self.replica is None or self._flushing:
+            return False
+        if not self.info.get(READS_FROM_REPLICA):
+            return False
+        if self.pin_reads_to_primary_after_write and self.info.get(HAS_WRITTEN):
+            return False
+        return True
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _remember_flush(session: Session, flush_context: Any) -> None:
+    session.info[HAS_WRITTEN] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _remember_write(orm_execute_state: ORMExecuteState) -> None:
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[HAS_WRITTEN] = True
 
 
 class Database:
@@ -9,22 +142,26 @@ class Database:
 
     _instance: Optional["Database"] = None
     _engine: Optional[Engine] = None
+    _replica_engine: Optional[Engine] = None
     _session: Optional[scoped_session] = None
     _uri: Optional[URL] = None
+    _replica_uri: Optional[URL] = None
+    _pin_reads_to_primary_after_write: bool = True
+    _pool_configuration: PoolConfiguration = PoolConfiguration()
 
     def __new__(cls) -> "Database":
         if cls._instance is None:
             cls._instance = super(Database, cls).__new__(cls)
         return cls._instance
 
-    def configure(self, uri: str) -> None:
-        supported_dialects = ["postgresql", "sqlite"]
-        sqlalchemy_uri = make_url(uri)
-        if sqlalchemy_uri.get_backend_name() not in supported_dialects:
-            raise ValueError(
-                f"Unsupported database dialect: {sqlalchemy_uri.get_backend_name()}. "
-                f"Supported dialects are: {', '.join(supported_dialects)}."
-            )
+    def configure(
+        self,
+        uri: str,
+        replica_uri: Optional[str] = None,
+        pin_reads_to_primary_after_write: bool = True,
+        pool_configuration: Optional[PoolConfiguration] = None,
+    ) -> None:
+        sqlalchemy_uri = self._parse_uri(uri)
         if self._uri == sqlalchemy_uri:
             # URI is already set to the same value
             pass
@@ -32,23 +169,136 @@ class Database:
             self._uri = sqlalchemy_uri
         else:
             raise ValueError("Database URI is already set to a different value.")
+        if replica_uri:
+            sqlalchemy_replica_uri = self._parse_uri(replica_uri)
+            if self._replica_uri not in (None, sqlalchemy_replica_uri):
+                raise ValueError(
+                    "Database replica URI is already set to a different value."
+                )
+            self._replica_uri = sqlalchemy_replica_uri
+        self._pin_reads_to_primary_after_write = pin_reads_to_primary_after_write
+        if pool_configuration is not None:
+            self._pool_configuration = pool_configuration
+
+    def _parse_uri(self, uri: str) -> URL:
+        supported_dialects = ["postgresql", "sqlite"]
+        sqlalchemy_uri = make_url(uri)
+        if sqlalchemy_uri.get_backend_name() not in supported_dialects:
+            raise ValueError(
+                f"Unsupported database dialect: {sqlalchemy_uri.get_backend_name()}. "
+                f"Supported dialects are: {', '.join(supported_dialects)}."
+            )
+        return sqlalchemy_uri
 
     @property
     def engine(self) -> Engine:
         if self._engine is None:
             if self._uri is None:
                 raise ValueError("Database URI is not set.")
-            self._engine = create_engine(self._uri)
+            self._engine = self._create_engine(self._uri)
         return self._engine
 
+    @property
+    def replica_engine(self) -> Optional[Engine]:
+        if self._replica_engine is None and self._replica_uri is not None:
+            self._replica_engine = self._create_engine(self._replica_uri)
+        return self._replica_engine
+
+    def _create_engine(self, uri: URL) -> Engine:
+        pool = self._pool_configuration
+        options: Dict[str, Any] = dict(
+            pool_pre_ping=pool.pre_ping,
+            pool_recycle=pool.recycle,
+        )
+        # In-memory SQLite databases use a pool that keeps a single
+        # connection per thread and does not accept these options.
+        dialect: Any = uri.get_dialect()
+        if issubclass(dialect.get_pool_class(uri), QueuePool):
+            options.update(
+                poolclass=InstrumentedQueuePool,
+                pool_size=pool.size,
+                max_overflow=pool.max_overflow,
+                pool_timeout=pool.timeout,
+            )
+        engine = create_engine(uri, **options)
+        instrument_engine(engine)
+        return engine
+
+    def pool_statistics(self) -> Dict[str, PoolStatistics]:
+        """Statistics of the connection pools of the engines created so
+        far, keyed by "primary" and "replica".
+        """
+        engines = dict(primary=self._engine, replica=self._replica_engine)
+        return {
+            name: engine.pool.statistics()
+            for name, engine in engines.items()
+            if engine is not None and isinstance(engine.pool, InstrumentedQueuePool)
+        }
+
+    @contextmanager
+    def recording_queries(self) -> Iterator[QueryStatistics]:
+        """Count the statements that the current thread or task sends
+        to the primary database or the replica until the context is
+        left.
+        """
+        with recording_queries() as statistics:
+            yield statistics
+
+    def dispose_after_fork(self) -> None:
+        """Give a forked process its own connection pools. The
+        connections inherited from the parent process are left open for
+        the parent to use.
+        """
+        for engine in (self._engine, self._replica_engine):
+            if engine is not None:
+                engine.dispose(close=False)
+
+    @contextmanager
+    def separate_transaction(self) -> Iterator[Connection]:
+        """Run statements in a short transaction of their own on the
+        primary database. It is committed when the context is left,
+        whether or not the session is committed later on.
+        """
+        with self.engine.begin() as connection:
+            yield connection
+
     @property
     def session(self) -> scoped_session:
         if self._session is None:
             engine = self.engine
-            session_factory = sessionmaker(bind=engine)
+            session_factory = sessionmaker(
+                bind=engine,
+                class_=RoutingSession,
+                replica=self.replica_engine,
+                pin_reads_to_primary_after_write=self._pin_reads_to_primary_after_write,
+            )
             self._session = scoped_session(session_factory)
         return self._session
 
+    @contextmanager
+    def reading_from_replica(self) -> Iterator[None]:
+        """Send the reads of the current session to the read replica, if
+        one is configured, until the context is left.
+        """
+        info = self.session.info
+        previous = info.get(READS_FROM_REPLICA, False)
+        info[READS_FROM_REPLICA] = True
+        try:
+            yield
+        finally:
+            info[READS_FROM_REPLICA] = previous
+
+
+def _dispose_engines_after_fork() -> None:
+    if Database._instance is not None:
+        Database._instance.dispose_after_fork()
+
+
+# Pre-fork servers like gunicorn with --preload create the database
+# engine in the parent process. Sharing pooled connections between
+# processes corrupts them.
+os.register_at_fork(after_in_child=_dispose_engines_after_fork)
+
 
 class Base(DeclarativeBase):
     pass
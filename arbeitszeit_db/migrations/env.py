@@ -1,13 +1,14 @@
 import logging
 import os
 from logging.config import fileConfig
+from typing import Any
 
 from alembic import context
 from alembic.migration import MigrationContext
 from alembic.script import ScriptDirectory
 from sqlalchemy import URL, Connection, create_engine, inspect, make_url
 
-from arbeitszeit_db.models import Base
+from arbeitszeit_db.models import SEARCH_INDEXES, Base
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -63,10 +64,24 @@ def get_db_uri() -> URL:
     )
 
 
+def include_object(
+    object: Any, name: str | None, type_: str, reflected: bool, compare_to: Any
+) -> bool:
+    # The FTS5 tables used for searching on SQLite are maintained by
+    # triggers and are not part of the declarative models.
+    if type_ == "table" and name is not None:
+        return not any(
+            name.startswith(search_index.fts_table_name)
+            for search_index in SEARCH_INDEXES
+        )
+    return True
+
+
 def run_migrations(connection: Connection) -> None:
     context.configure(
         connection=connection,
         target_metadata=target_metadata,
+        include_object=include_object,
     )
     upgrade_to_head_if_database_is_fresh(connection)
     with context.begin_transaction():
@@ -0,0 +1,52 @@
+"""Add account balance table
+
+Revision ID: 27ec2236f803
+Revises: 4fd90069eb82
+Create Date: 2025-08-20 18:02:11.734182
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '27ec2236f803'
+down_revision: Union[str, None] = '4fd90069eb82'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'account_balance',
+        sa.Column('account', sa.String(), nullable=False),
+        sa.Column('balance', sa.Numeric(), nullable=False),
+        sa.ForeignKeyConstraint(['account'], ['account.id'], name='account_balance_account_fkey'),
+        sa.PrimaryKeyConstraint('account', name='account_balance_pkey'),
+    )
+    # Backfill the balances of all existing accounts from the transfer history.
+    op.execute(
+        """
+        INSERT INTO account_balance (account, balance)
+        SELECT
+            account.id,
+            COALESCE(credited.total, 0) - COALESCE(debited.total, 0)
+        FROM account
+        LEFT OUTER JOIN (
+            SELECT credit_account AS account_id, SUM(value) AS total
+            FROM transfer
+            GROUP BY credit_account
+        ) AS credited ON credited.account_id = account.id
+        LEFT OUTER JOIN (
+            SELECT debit_account AS account_id, SUM(value) AS total
+            FROM transfer
+            GROUP BY debit_account
+        ) AS debited ON debited.account_id = account.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('account_balance')
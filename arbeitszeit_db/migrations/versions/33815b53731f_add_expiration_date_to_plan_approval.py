@@ -0,0 +1,70 @@
+"""Add expiration date to plan approval
+
+Revision ID: 33815b53731f
+Revises: 27ec2236f803
+Create Date: 2025-08-24 11:47:36.201554
+
+"""
+from datetime import timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.sql import column, table
+
+
+# revision identifiers, used by Alembic.
+revision: str = '33815b53731f'
+down_revision: Union[str, None] = '27ec2236f803'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('plan_approval', sa.Column('expiration_date', sa.DateTime(), nullable=True))
+    backfill_expiration_dates()
+    with op.batch_alter_table('plan_approval') as batch_op:
+        batch_op.alter_column('expiration_date', existing_type=sa.DateTime(), nullable=False)
+    op.create_index('ix_plan_approval_expiration_date_date', 'plan_approval', ['expiration_date', 'date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_plan_approval_expiration_date_date', table_name='plan_approval')
+    with op.batch_alter_table('plan_approval') as batch_op:
+        batch_op.drop_column('expiration_date')
+
+
+def backfill_expiration_dates() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name == 'postgresql':
+        op.execute(
+            """
+            UPDATE plan_approval
+            SET expiration_date = plan_approval.date + make_interval(days => CAST(plan.timeframe AS INTEGER))
+            FROM plan
+            WHERE plan.id = plan_approval.plan_id
+            """
+        )
+        return
+    # SQLite has no interval type. Its datetime() function would also
+    # drop the microseconds of the stored timestamps, so the expiration
+    # dates are calculated in Python instead.
+    plan_approval = table(
+        'plan_approval',
+        column('id', sa.String()),
+        column('plan_id', sa.String()),
+        column('date', sa.DateTime()),
+        column('expiration_date', sa.DateTime()),
+    )
+    plan = table('plan', column('id', sa.String()), column('timeframe', sa.Numeric()))
+    rows = conn.execute(
+        sa.select(plan_approval.c.id, plan_approval.c.date, plan.c.timeframe).join(
+            plan, plan.c.id == plan_approval.c.plan_id
+        )
+    ).all()
+    for approval_id, approval_date, timeframe in rows:
+        conn.execute(
+            plan_approval.update()
+            .where(plan_approval.c.id == approval_id)
+            .values(expiration_date=approval_date + timedelta(days=int(timeframe)))
+        )
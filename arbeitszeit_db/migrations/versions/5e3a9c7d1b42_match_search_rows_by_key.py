@@ -0,0 +1,82 @@
+"""Match search rows by key
+
+Revision ID: 5e3a9c7d1b42
+Revises: b2f7e4c9a816
+Create Date: 2025-10-17 09:26:14.381052
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e3a9c7d1b42'
+down_revision: Union[str, None] = 'b2f7e4c9a816'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, key column, searched column)
+SEARCHABLE_COLUMNS = [
+    ('plan', 'id', 'prd_name'),
+    ('company', 'id', 'name'),
+    ('user', 'id', 'email_address'),
+]
+
+
+def upgrade() -> None:
+    # VACUUM may renumber the rowids of tables without an INTEGER
+    # PRIMARY KEY, so the triggers match the rows of the FTS5 tables by
+    # the key of the base table instead.
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table, key, column in SEARCHABLE_COLUMNS:
+        fts = f'{table}_{column}_search'
+        drop_triggers(fts)
+        op.execute(
+            f'CREATE TRIGGER "{fts}_insert" AFTER INSERT ON "{table}" BEGIN '
+            f'INSERT INTO "{fts}" (item_id, search_text) '
+            f'VALUES (new."{key}", new."{column}"); END'
+        )
+        op.execute(
+            f'CREATE TRIGGER "{fts}_update" AFTER UPDATE OF "{column}" ON "{table}" BEGIN '
+            f'UPDATE "{fts}" SET search_text = new."{column}" WHERE item_id = old."{key}"; END'
+        )
+        op.execute(
+            f'CREATE TRIGGER "{fts}_delete" AFTER DELETE ON "{table}" BEGIN '
+            f'DELETE FROM "{fts}" WHERE item_id = old."{key}"; END'
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table, key, column in SEARCHABLE_COLUMNS:
+        fts = f'{table}_{column}_search'
+        drop_triggers(fts)
+        op.execute(
+            f'CREATE TRIGGER "{fts}_insert" AFTER INSERT ON "{table}" BEGIN '
+            f'INSERT INTO "{fts}" (rowid, item_id, search_text) '
+            f'VALUES (new.rowid, new."{key}", new."{column}"); END'
+        )
+        op.execute(
+            f'CREATE TRIGGER "{fts}_update" AFTER UPDATE OF "{column}" ON "{table}" BEGIN '
+            f'UPDATE "{fts}" SET search_text = new."{column}" WHERE rowid = old.rowid; END'
+        )
+        op.execute(
+            f'CREATE TRIGGER "{fts}_delete" AFTER DELETE ON "{table}" BEGIN '
+            f'DELETE FROM "{fts}" WHERE rowid = old.rowid; END'
+        )
+        # The rows inserted since the upgrade got their own rowids.
+        op.execute(f'DELETE FROM "{fts}"')
+        op.execute(
+            f'INSERT INTO "{fts}" (rowid, item_id, search_text) '
+            f'SELECT rowid, "{key}", "{column}" FROM "{table}"'
+        )
+
+
+def drop_triggers(fts: str) -> None:
+    op.execute(f'DROP TRIGGER "{fts}_insert"')
+    op.execute(f'DROP TRIGGER "{fts}_update"')
+    op.execute(f'DROP TRIGGER "{fts}_delete"')
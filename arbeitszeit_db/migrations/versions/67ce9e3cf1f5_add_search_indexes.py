@@ -0,0 +1,76 @@
+"""Add search indexes
+
+Revision ID: 67ce9e3cf1f5
+Revises: 33815b53731f
+Create Date: 2025-08-27 09:12:40.518227
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '67ce9e3cf1f5'
+down_revision: Union[str, None] = '33815b53731f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, key column, searched column)
+SEARCHABLE_COLUMNS = [
+    ('plan', 'id', 'prd_name'),
+    ('company', 'id', 'name'),
+    ('user', 'id', 'email_address'),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for table, _, column in SEARCHABLE_COLUMNS:
+            op.create_index(
+                f'ix_{table}_{column}_trgm',
+                table,
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+            )
+        return
+    for table, key, column in SEARCHABLE_COLUMNS:
+        fts = f'{table}_{column}_search'
+        op.execute(
+            f'CREATE VIRTUAL TABLE "{fts}" '
+            "USING fts5(item_id UNINDEXED, search_text, tokenize='trigram')"
+        )
+        op.execute(
+            f'CREATE TRIGGER "{fts}_insert" AFTER INSERT ON "{table}" BEGIN '
+            f'INSERT INTO "{fts}" (rowid, item_id, search_text) '
+            f'VALUES (new.rowid, new."{key}", new."{column}"); END'
+        )
+        op.execute(
+            f'CREATE TRIGGER "{fts}_update" AFTER UPDATE OF "{column}" ON "{table}" BEGIN '
+            f'UPDATE "{fts}" SET search_text = new."{column}" WHERE rowid = old.rowid; END'
+        )
+        op.execute(
+            f'CREATE TRIGGER "{fts}_delete" AFTER DELETE ON "{table}" BEGIN '
+            f'DELETE FROM "{fts}" WHERE rowid = old.rowid; END'
+        )
+        op.execute(
+            f'INSERT INTO "{fts}" (rowid, item_id, search_text) '
+            f'SELECT rowid, "{key}", "{column}" FROM "{table}"'
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        for table, _, column in SEARCHABLE_COLUMNS:
+            op.drop_index(f'ix_{table}_{column}_trgm', table_name=table)
+        return
+    for table, _, column in SEARCHABLE_COLUMNS:
+        fts = f'{table}_{column}_search'
+        op.execute(f'DROP TRIGGER "{fts}_insert"')
+        op.execute(f'DROP TRIGGER "{fts}_update"')
+        op.execute(f'DROP TRIGGER "{fts}_delete"')
+        op.execute(f'DROP TABLE "{fts}"')
@@ -0,0 +1,31 @@
+"""Add payout factor change table
+
+Revision ID: 7c1e4b9d2f85
+Revises: d6f28c94b1a3
+Create Date: 2025-10-13 16:08:27.513094
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4b9d2f85'
+down_revision: Union[str, None] = 'd6f28c94b1a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'payout_factor_change',
+        sa.Column('timestamp', sa.DateTime(), nullable=False),
+        sa.Column('payout_factor', sa.Numeric(), nullable=False),
+        sa.PrimaryKeyConstraint('timestamp', name='payout_factor_change_pkey'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('payout_factor_change')
@@ -0,0 +1,69 @@
+"""Add account owner table
+
+Revision ID: 9b3e1d7c4a52
+Revises: 67ce9e3cf1f5
+Create Date: 2025-08-29 14:37:05.912604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3e1d7c4a52'
+down_revision: Union[str, None] = '67ce9e3cf1f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+account_owner_type = sa.Enum(
+    'member', 'company', 'social_accounting', 'cooperation', name='accountownertype'
+)
+account_types = sa.Enum(
+    'p', 'r', 'a', 'prd', 'member', 'accounting', 'psf', 'cooperation', name='accounttypes'
+)
+
+# (owner table, owner type, account column, account role)
+OWNED_ACCOUNTS = [
+    ('member', 'member', 'account', 'member'),
+    ('company', 'company', 'p_account', 'p'),
+    ('company', 'company', 'r_account', 'r'),
+    ('company', 'company', 'a_account', 'a'),
+    ('company', 'company', 'prd_account', 'prd'),
+    ('social_accounting', 'social_accounting', 'account_psf', 'psf'),
+    ('cooperation', 'cooperation', 'account', 'cooperation'),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'account_owner',
+        sa.Column('account', sa.String(), nullable=False),
+        sa.Column('owner_type', account_owner_type, nullable=False),
+        sa.Column('owner_id', sa.String(), nullable=False),
+        sa.Column('account_role', account_types, nullable=False),
+        sa.ForeignKeyConstraint(['account'], ['account.id'], name='account_owner_account_fkey'),
+        sa.PrimaryKeyConstraint('account', name='account_owner_pkey'),
+    )
+    op.create_index(
+        op.f('ix_account_owner_owner_id'), 'account_owner', ['owner_id'], unique=False
+    )
+    # Backfill the owners of all existing accounts.
+    for table, owner_type, account_column, account_role in OWNED_ACCOUNTS:
+        op.execute(
+            f"""
+            INSERT INTO account_owner (account, owner_type, owner_id, account_role)
+            SELECT "{account_column}", '{owner_type}', id, '{account_role}'
+            FROM "{table}"
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_account_owner_owner_id'), table_name='account_owner')
+    op.drop_table('account_owner')
+    if op.get_bind().dialect.name == 'postgresql':
+        account_types.drop(op.get_bind())
+        account_owner_type.drop(op.get_bind())
@@ -0,0 +1,49 @@
+"""Add indexes on filtered foreign keys
+
+Revision ID: a83d5f1c0e27
+Revises: f41b7c2e9a63
+Create Date: 2025-09-30 10:04:18.227315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a83d5f1c0e27'
+down_revision: Union[str, None] = 'f41b7c2e9a63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Columns that queries of arbeitszeit_db.repositories filter or join
+# on and that tests/db/test_query_plans.py found to be read with full
+# table scans.
+INDEXED_COLUMNS = [
+    ('jobs', 'company_id'),
+    ('plan', 'planner'),
+    ('plan', 'requested_cooperation'),
+    ('plan_cooperation', 'cooperation'),
+    ('plan_review', 'plan_id'),
+    ('plan_approval', 'plan_id'),
+    ('private_consumption', 'plan_id'),
+    ('private_consumption', 'transfer_of_private_consumption'),
+    ('productive_consumption', 'plan_id'),
+    ('productive_consumption', 'transfer_of_productive_consumption'),
+    ('registered_hours_worked', 'company'),
+    ('company_work_invite', 'company'),
+    ('company_work_invite', 'member'),
+    ('coordination_tenure', 'cooperation'),
+    ('coordination_transfer_request', 'requesting_coordination_tenure'),
+]
+
+
+def upgrade() -> None:
+    for table, column in INDEXED_COLUMNS:
+        op.create_index(f'ix_{table}_{column}', table, [column], unique=False)
+
+
+def downgrade() -> None:
+    for table, column in reversed(INDEXED_COLUMNS):
+        op.drop_index(f'ix_{table}_{column}', table_name=table)
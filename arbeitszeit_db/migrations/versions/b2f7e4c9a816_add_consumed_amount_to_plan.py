@@ -0,0 +1,53 @@
+"""Add consumed amount to plan
+
+Revision ID: b2f7e4c9a816
+Revises: 7c1e4b9d2f85
+Create Date: 2025-10-16 10:42:53.208417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2f7e4c9a816'
+down_revision: Union[str, None] = '7c1e4b9d2f85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'plan',
+        sa.Column('consumed_amount', sa.Integer(), server_default='0', nullable=False),
+    )
+    # Backfill the consumed amounts of all existing plans from the consumptions.
+    op.execute(
+        """
+        UPDATE plan
+        SET consumed_amount = COALESCE(
+            (
+                SELECT SUM(productive_consumption.amount)
+                FROM productive_consumption
+                WHERE productive_consumption.plan_id = plan.id
+            ),
+            0
+        ) + COALESCE(
+            (
+                SELECT SUM(private_consumption.amount)
+                FROM private_consumption
+                WHERE private_consumption.plan_id = plan.id
+            ),
+            0
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    # A batch operation would rebuild the plan table on SQLite and drop
+    # the triggers of the plan search along the way. SQLite supports
+    # dropping columns directly.
+    op.drop_column('plan', 'consumed_amount')
@@ -0,0 +1,152 @@
+"""Store ids as uuids
+
+Revision ID: c5a8e1f3b217
+Revises: 9b3e1d7c4a52
+Create Date: 2025-09-12 10:31:07.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a8e1f3b217'
+down_revision: Union[str, None] = '9b3e1d7c4a52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# All columns holding ids, by table.
+UUID_COLUMNS = {
+    'user': ['id'],
+    'social_accounting': ['id', 'account_psf'],
+    'jobs': ['member_id', 'company_id'],
+    'member': ['id', 'user_id', 'account'],
+    'company': ['id', 'user_id', 'p_account', 'r_account', 'a_account', 'prd_account'],
+    'accountant': ['id', 'user_id'],
+    'plan_draft': ['id', 'planner'],
+    'plan': ['id', 'planner', 'requested_cooperation'],
+    'plan_cooperation': ['plan', 'cooperation'],
+    'plan_review': ['id', 'plan_id'],
+    'plan_approval': [
+        'id',
+        'plan_id',
+        'transfer_of_credit_p',
+        'transfer_of_credit_r',
+        'transfer_of_credit_a',
+    ],
+    'account': ['id'],
+    'account_balance': ['account'],
+    'account_owner': ['account', 'owner_id'],
+    'transfer': ['id', 'debit_account', 'credit_account'],
+    'private_consumption': [
+        'id',
+        'plan_id',
+        'transfer_of_private_consumption',
+        'transfer_of_compensation',
+    ],
+    'productive_consumption': [
+        'id',
+        'plan_id',
+        'transfer_of_productive_consumption',
+        'transfer_of_compensation',
+    ],
+    'registered_hours_worked': [
+        'id',
+        'company',
+        'worker',
+        'transfer_of_work_certificates',
+        'transfer_of_taxes',
+    ],
+    'company_work_invite': ['id', 'company', 'member'],
+    'cooperation': ['id', 'account'],
+    'coordination_tenure': ['id', 'company', 'cooperation'],
+    'coordination_transfer_request': [
+        'id',
+        'requesting_coordination_tenure',
+        'candidate',
+    ],
+    'password_reset_request': ['id'],
+}
+
+# FTS5 tables mirroring ids on SQLite, see arbeitszeit_db.search
+SQLITE_SEARCH_TABLES = [
+    'plan_prd_name_search',
+    'company_name_search',
+    'user_email_address_search',
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        alter_column_types(postgresql.UUID(), 'uuid')
+        return
+    # SQLite stores uuids as 32 character hex strings. The declared
+    # column type only determines the affinity, which stays TEXT, so the
+    # tables do not have to be recreated.
+    op.execute('PRAGMA defer_foreign_keys = ON')
+    for table, columns in UUID_COLUMNS.items():
+        for column in columns:
+            op.execute(
+                f'UPDATE "{table}" SET "{column}" = lower(replace("{column}", \'-\', \'\'))'
+            )
+    for table in SQLITE_SEARCH_TABLES:
+        op.execute(f'UPDATE "{table}" SET item_id = lower(replace(item_id, \'-\', \'\'))')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        alter_column_types(sa.String(), 'text')
+        return
+    op.execute('PRAGMA defer_foreign_keys = ON')
+    for table, columns in UUID_COLUMNS.items():
+        for column in columns:
+            op.execute(
+                f'UPDATE "{table}" SET "{column}" = {hyphenated(column)} '
+                f'WHERE length("{column}") = 32'
+            )
+    for table in SQLITE_SEARCH_TABLES:
+        op.execute(
+            f'UPDATE "{table}" SET item_id = {hyphenated("item_id")} '
+            'WHERE length(item_id) = 32'
+        )
+
+
+def alter_column_types(type_: sa.types.TypeEngine, cast_to: str) -> None:
+    # Foreign keys cannot reference a column of a different type, so
+    # they are dropped while the columns are converted.
+    inspector = sa.inspect(op.get_bind())
+    foreign_keys = {
+        table: inspector.get_foreign_keys(table) for table in UUID_COLUMNS
+    }
+    for table, keys in foreign_keys.items():
+        for key in keys:
+            op.drop_constraint(key['name'], table, type_='foreignkey')
+    for table, columns in UUID_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=type_,
+                postgresql_using=f'"{column}"::{cast_to}',
+            )
+    for table, keys in foreign_keys.items():
+        for key in keys:
+            op.create_foreign_key(
+                key['name'],
+                table,
+                key['referred_table'],
+                key['constrained_columns'],
+                key['referred_columns'],
+                **key['options'],
+            )
+
+
+def hyphenated(column: str) -> str:
+    parts = [(1, 8), (9, 4), (13, 4), (17, 4), (21, 12)]
+    return " || '-' || ".join(
+        f'substr("{column}", {start}, {length})' for start, length in parts
+    )
@@ -0,0 +1,35 @@
+"""Add payout factor cache table
+
+Revision ID: d6f28c94b1a3
+Revises: a83d5f1c0e27
+Create Date: 2025-10-07 14:31:52.904611
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6f28c94b1a3'
+down_revision: Union[str, None] = 'a83d5f1c0e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    payout_factor_cache = op.create_table(
+        'payout_factor_cache',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('payout_factor', sa.Numeric(), nullable=True),
+        sa.Column('computed_at', sa.DateTime(), nullable=True),
+        sa.Column('valid_until', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id', name='payout_factor_cache_pkey'),
+    )
+    op.bulk_insert(payout_factor_cache, [{'id': 1, 'version': 0}])
+
+
+def downgrade() -> None:
+    op.drop_table('payout_factor_cache')
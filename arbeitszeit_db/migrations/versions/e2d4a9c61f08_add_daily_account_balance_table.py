@@ -0,0 +1,42 @@
+"""Add daily account balance table
+
+Revision ID: e2d4a9c61f08
+Revises: c5a8e1f3b217
+Create Date: 2025-09-16 09:12:44.631902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2d4a9c61f08'
+down_revision: Union[str, None] = 'c5a8e1f3b217'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'daily_account_balance',
+        sa.Column('account', sa.Uuid(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('balance', sa.Numeric(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['account'], ['account.id'], name='daily_account_balance_account_fkey'
+        ),
+        sa.PrimaryKeyConstraint('account', 'day', name='daily_account_balance_pkey'),
+    )
+    op.create_table(
+        'balance_checkpoint_state',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('checkpointed_until', sa.Date(), nullable=False),
+        sa.PrimaryKeyConstraint('id', name='balance_checkpoint_state_pkey'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('balance_checkpoint_state')
+    op.drop_table('daily_account_balance')
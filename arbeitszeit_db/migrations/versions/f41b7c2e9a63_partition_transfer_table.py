@@ -0,0 +1,149 @@
+"""Partition transfer table
+
+Optionally turn the transfer table into a table partitioned by the month
+of the transfer date. This only happens on PostgreSQL and only if the
+environment variable ALEMBIC_PARTITION_TRANSFER_TABLE is set to "true".
+Otherwise this revision does nothing. Both directions check the current
+state of the table, so the revision can be downgraded and upgraded again
+to partition the table later.
+
+Foreign keys referencing a partitioned table have to include the
+partition key. The foreign keys referencing transfer.id are therefore
+dropped while the table is partitioned.
+
+Revision ID: f41b7c2e9a63
+Revises: e2d4a9c61f08
+Create Date: 2025-09-19 15:02:31.118734
+
+"""
+import os
+from datetime import UTC, date, datetime
+from typing import Iterator, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f41b7c2e9a63'
+down_revision: Union[str, None] = 'e2d4a9c61f08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+OPT_IN_VARIABLE = 'ALEMBIC_PARTITION_TRANSFER_TABLE'
+MONTHS_AHEAD = 3
+
+# (table, column) of all foreign keys referencing transfer.id
+TRANSFER_REFERENCES = [
+    ('plan_approval', 'transfer_of_credit_p'),
+    ('plan_approval', 'transfer_of_credit_r'),
+    ('plan_approval', 'transfer_of_credit_a'),
+    ('private_consumption', 'transfer_of_private_consumption'),
+    ('private_consumption', 'transfer_of_compensation'),
+    ('productive_consumption', 'transfer_of_productive_consumption'),
+    ('productive_consumption', 'transfer_of_compensation'),
+    ('registered_hours_worked', 'transfer_of_work_certificates'),
+    ('registered_hours_worked', 'transfer_of_taxes'),
+]
+
+INDEXED_COLUMNS = ['date', 'debit_account', 'credit_account']
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    if os.getenv(OPT_IN_VARIABLE, '').lower() not in ('true', '1'):
+        return
+    if is_partitioned():
+        return
+    inspector = sa.inspect(op.get_bind())
+    for table in {table for table, _ in TRANSFER_REFERENCES}:
+        for key in inspector.get_foreign_keys(table):
+            if key['referred_table'] == 'transfer':
+                op.drop_constraint(key['name'], table, type_='foreignkey')
+    move_to_old_table()
+    op.execute(
+        'CREATE TABLE transfer (LIKE transfer_old INCLUDING DEFAULTS) '
+        'PARTITION BY RANGE (date)'
+    )
+    op.create_primary_key('transfer_pkey', 'transfer', ['id', 'date'])
+    create_account_keys_and_indexes()
+    op.execute('CREATE TABLE transfer_default PARTITION OF transfer DEFAULT')
+    first_date = op.get_bind().scalar(sa.text('SELECT min(date) FROM transfer_old'))
+    today = datetime.now(UTC).date()
+    first_month = (first_date.date() if first_date else today).replace(day=1)
+    for start, end in months(first_month, today):
+        op.execute(
+            f'CREATE TABLE transfer_{start:%Y_%m} PARTITION OF transfer '
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    op.execute('INSERT INTO transfer SELECT * FROM transfer_old')
+    op.drop_table('transfer_old')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql' or not is_partitioned():
+        return
+    move_to_old_table()
+    op.execute('CREATE TABLE transfer (LIKE transfer_old INCLUDING DEFAULTS)')
+    op.create_primary_key('transfer_pkey', 'transfer', ['id'])
+    create_account_keys_and_indexes()
+    op.execute('INSERT INTO transfer SELECT * FROM transfer_old')
+    op.drop_table('transfer_old')
+    for table, column in TRANSFER_REFERENCES:
+        op.create_foreign_key(
+            f'{table}_{column}_fkey', table, 'transfer', [column], ['id']
+        )
+
+
+def is_partitioned() -> bool:
+    return bool(
+        op.get_bind().scalar(
+            sa.text(
+                'SELECT EXISTS (SELECT 1 FROM pg_partitioned_table '
+                "WHERE partrelid = 'transfer'::regclass)"
+            )
+        )
+    )
+
+
+def move_to_old_table() -> None:
+    # Index and constraint names have to be free for the new table.
+    op.rename_table('transfer', 'transfer_old')
+    op.execute('ALTER TABLE transfer_old DROP CONSTRAINT transfer_pkey')
+    for column in INDEXED_COLUMNS:
+        op.drop_index(f'ix_transfer_{column}', table_name='transfer_old')
+    for column in ['debit_account', 'credit_account']:
+        op.drop_constraint(
+            f'transfer_{column}_fkey', 'transfer_old', type_='foreignkey'
+        )
+
+
+def create_account_keys_and_indexes() -> None:
+    for column in ['debit_account', 'credit_account']:
+        op.create_foreign_key(
+            f'transfer_{column}_fkey', 'transfer', 'account', [column], ['id']
+        )
+    for column in INDEXED_COLUMNS:
+        op.create_index(f'ix_transfer_{column}', 'transfer', [column])
+
+
+def months(first: date, today: date) -> Iterator[tuple[date, date]]:
+    """Bounds of all months from `first` up to MONTHS_AHEAD months
+    after the month of `today`.
+    """
+    last = today.replace(day=1)
+    for _ in range(MONTHS_AHEAD):
+        last = next_month(last)
+    start = first
+    while start <= last:
+        end = next_month(start)
+        yield start, end
+        start = end
+
+
+def next_month(day: date) -> date:
+    if day.month == 12:
+        return date(day.year + 1, 1, 1)
+    return day.replace(month=day.month + 1)
@@ -1,33 +1,43 @@
 """
 Definition of database tables.
+
+Identifiers are mapped as `UUID` and stored with the `Uuid` type, i.e.
+as native ``uuid`` columns on PostgreSQL and as 32 character hex
+strings on SQLite.
 """
 
-import uuid
-from datetime import UTC, datetime
+import enum
+from datetime import UTC, date, datetime
 from decimal import Decimal
 from sqlite3 import Connection as SQLiteConnection
 from typing import Any
+from uuid import UUID, uuid4
 
 from sqlalchemy import (
+    DDL,
     Column,
     DateTime,
     Dialect,
     Engine,
     ForeignKey,
+    Index,
     String,
     Table,
     TypeDecorator,
+    Uuid,
     event,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.pool import ConnectionPoolEntry
 
+from arbeitszeit.records import AccountTypes
 from arbeitszeit.transfers import TransferType
 from arbeitszeit_db.db import Base
+from arbeitszeit_db.search import SearchIndex
 
 
-def generate_uuid() -> str:
-    return str(uuid.uuid4())
+def generate_uuid() -> UUID:
+    return uuid4()
 
 
 @event.listens_for(Engine, "connect")
@@ -79,7 +89,7 @@ class TZDateTime(TypeDecorator):
 class User(Base):
     __tablename__ = "user"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
     password: Mapped[str] = mapped_column(String(300))
     email_address: Mapped[str] = mapped_column(ForeignKey("email.address"), unique=True)
 
@@ -97,27 +107,28 @@ class Email(Base):
 class SocialAccounting(Base):
     __tablename__ = "social_accounting"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
-    account_psf: Mapped[str] = mapped_column(ForeignKey("account.id"))
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
+    account_psf: Mapped[UUID] = mapped_column(ForeignKey("account.id"))
 
 
 # Association table Company - Member
 jobs_table = Table(
     "jobs",
     Base.metadata,
-    Column("member_id", String, ForeignKey("member.id"), primary_key=True),
-    Column("company_id", String, ForeignKey("company.id"), primary_key=True),
+    Column("member_id", Uuid, ForeignKey("member.id"), primary_key=True),
+    Column("company_id", Uuid, ForeignKey("company.id"), primary_key=True),
+    Index("ix_jobs_company_id", "company_id"),
 )
 
 
 class Member(Base):
     __tablename__ = "member"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(ForeignKey("user.id"), unique=True)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"), unique=True)
     name: Mapped[str] = mapped_column(String(1000))
     registered_on: Mapped[datetime] = mapped_column(TZDateTime)
-    account: Mapped[str] = mapped_column(ForeignKey("account.id"))
+    account: Mapped[UUID] = mapped_column(ForeignKey("account.id"))
 
     workplaces = relationship(
         "Company",
@@ -129,14 +140,14 @@ class Member(Base):
 class Company(Base):
     __tablename__ = "company"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(ForeignKey("user.id"), unique=True)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"), unique=True)
     name: Mapped[str] = mapped_column(String(1000))
     registered_on: Mapped[datetime] = mapped_column(TZDateTime)
-    p_account: Mapped[str] = mapped_column(ForeignKey("account.id"))
-    r_account: Mapped[str] = mapped_column(ForeignKey("account.id"))
-    a_account: Mapped[str] = mapped_column(ForeignKey("account.id"))
-    prd_account: Mapped[str] = mapped_column(ForeignKey("account.id"))
+    p_account: Mapped[UUID] = mapped_column(ForeignKey("account.id"))
+    r_account: Mapped[UUID] = mapped_column(ForeignKey("account.id"))
+    a_account: Mapped[UUID] = mapped_column(ForeignKey("account.id"))
+    prd_account: Mapped[UUID] = mapped_column(ForeignKey("account.id"))
 
     def __repr__(self):
         return "<Company(name='%s')>" % (self.name,)
@@ -151,17 +162,17 @@ class Company(Base):
 class Accountant(Base):
     __tablename__ = "accountant"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(ForeignKey("user.id"), unique=True)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"), unique=True)
     name: Mapped[str] = mapped_column(String(1000))
 
 
 class PlanDraft(Base):
     __tablename__ = "plan_draft"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
     plan_creation_date: Mapped[datetime] = mapped_column(TZDateTime)
-    planner: Mapped[str] = mapped_column(ForeignKey("company.id"))
+    planner: Mapped[UUID] = mapped_column(ForeignKey("company.id"))
     costs_p: Mapped[Decimal]
     costs_r: Mapped[Decimal]
     costs_a: Mapped[Decimal]
@@ -176,9 +187,9 @@ class PlanDraft(Base):
 class Plan(Base):
     __tablename__ = "plan"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
     plan_creation_date: Mapped[datetime] = mapped_column(TZDateTime)
-    planner: Mapped[str] = mapped_column(ForeignKey("company.id"))
+    planner: Mapped[UUID] = mapped_column(ForeignKey("company.id"), index=True)
     costs_p: Mapped[Decimal]
     costs_r: Mapped[Decimal]
     costs_a: Mapped[Decimal]
@@ -188,10 +199,13 @@ class Plan(Base):
     description: Mapped[str] = mapped_column(String(5000))
     timeframe: Mapped[Decimal]
     is_public_service: Mapped[bool] = mapped_column(default=False)
-    requested_cooperation: Mapped[str | None] = mapped_column(
-        ForeignKey("cooperation.id")
+    requested_cooperation: Mapped[UUID | None] = mapped_column(
+        ForeignKey("cooperation.id"), index=True
     )
     hidden_by_user: Mapped[bool] = mapped_column(default=False)
+    # Sum of the amounts of all private and productive consumptions of
+    # the plan. It is kept in sync whenever a consumption is created.
+    consumed_amount: Mapped[int] = mapped_column(default=0, server_default="0")
 
     review: Mapped["PlanReview  | None"] = relationship(
         "PlanReview", back_populates="plan"
@@ -204,16 +218,18 @@ class Plan(Base):
 class PlanCooperation(Base):
     __tablename__ = "plan_cooperation"
 
-    plan: Mapped[str] = mapped_column(ForeignKey("plan.id"), primary_key=True)
-    cooperation: Mapped[str] = mapped_column(ForeignKey("cooperation.id"))
+    plan: Mapped[UUID] = mapped_column(ForeignKey("plan.id"), primary_key=True)
+    cooperation: Mapped[UUID] = mapped_column(ForeignKey("cooperation.id"), index=True)
 
 
 class PlanReview(Base):
     __tablename__ = "plan_review"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
     rejection_date: Mapped[datetime | None] = mapped_column(TZDateTime)
-    plan_id: Mapped[str] = mapped_column(ForeignKey("plan.id", ondelete="CASCADE"))
+    plan_id: Mapped[UUID] = mapped_column(
+        ForeignKey("plan.id", ondelete="CASCADE"), index=True
+    )
 
     plan: Mapped["Plan"] = relationship("Plan", back_populates="review")
 
@@ -223,13 +239,19 @@ class PlanReview(Base):
 
 class PlanApproval(Base):
     __tablename__ = "plan_approval"
+    __table_args__ = (
+        Index("ix_plan_approval_expiration_date_date", "expiration_date", "date"),
+    )
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
-    plan_id: Mapped[str] = mapped_column(ForeignKey("plan.id", ondelete="CASCADE"))
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
+    plan_id: Mapped[UUID] = mapped_column(
+        ForeignKey("plan.id", ondelete="CASCADE"), index=True
+    )
     date: Mapped[datetime] = mapped_column(TZDateTime)
-    transfer_of_credit_p: Mapped[str] = mapped_column(ForeignKey("transfer.id"))
-    transfer_of_credit_r: Mapped[str] = mapped_column(ForeignKey("transfer.id"))
-    transfer_of_credit_a: Mapped[str] = mapped_column(ForeignKey("transfer.id"))
+    expiration_date: Mapped[datetime] = mapped_column(TZDateTime)
+    transfer_of_credit_p: Mapped[UUID] = mapped_column(ForeignKey("transfer.id"))
+    transfer_of_credit_r: Mapped[UUID] = mapped_column(ForeignKey("transfer.id"))
+    transfer_of_credit_a: Mapped[UUID] = mapped_column(ForeignKey("transfer.id"))
 
     plan: Mapped["Plan"] = relationship("Plan", back_populates="approval")
 
@@ -237,16 +259,112 @@ class PlanApproval(Base):
 class Account(Base):
     __tablename__ = "account"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
+
+
+class AccountBalance(Base):
+    """Running balance of an account. It is kept in sync with the
+    transfer table whenever a transfer is created so that balances
+    can be read without aggregating the whole transfer history.
+    """
+
+    __tablename__ = "account_balance"
+
+    account: Mapped[UUID] = mapped_column(ForeignKey("account.id"), primary_key=True)
+    balance: Mapped[Decimal]
+
+
+class DailyAccountBalance(Base):
+    """Balance of an account at the end of a day (UTC), for every day
+    up to BalanceCheckpointState.checkpointed_until on which the balance
+    changed. See arbeitszeit_db.balance_checkpoints.
+    """
+
+    __tablename__ = "daily_account_balance"
+
+    account: Mapped[UUID] = mapped_column(ForeignKey("account.id"), primary_key=True)
+    day: Mapped[date] = mapped_column(primary_key=True)
+    balance: Mapped[Decimal]
+
+
+class BalanceCheckpointState(Base):
+    """A single row holding the last day for which the daily account
+    balances have been written.
+    """
+
+    __tablename__ = "balance_checkpoint_state"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    checkpointed_until: Mapped[date]
+
+
+PAYOUT_FACTOR_CACHE_ID = 1
+
+
+class PayoutFactorCache(Base):
+    """A single row holding the payout factor computed at computed_at,
+    which stays valid until the next plan approval or valid_until, the
+    earliest expiration of the plans active at that time. Every
+    invalidation increments the version, so that a payout factor
+    computed before an invalidation is not stored after it.
+    """
+
+    __tablename__ = "payout_factor_cache"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    version: Mapped[int]
+    payout_factor: Mapped[Decimal | None]
+    computed_at: Mapped[datetime | None] = mapped_column(TZDateTime)
+    valid_until: Mapped[datetime | None] = mapped_column(TZDateTime)
+
+
+event.listen(
+    PayoutFactorCache.__table__,
+    "after_create",
+    DDL(
+        "INSERT INTO payout_factor_cache (id, version) "
+        f"VALUES ({PAYOUT_FACTOR_CACHE_ID}, 0)"
+    ),
+)
+
+
+class PayoutFactorChange(Base):
+    """The payout factor from `timestamp` on until the next change."""
+
+    __tablename__ = "payout_factor_change"
+
+    timestamp: Mapped[datetime] = mapped_column(TZDateTime, primary_key=True)
+    payout_factor: Mapped[Decimal]
+
+
+class AccountOwnerType(enum.Enum):
+    member = "member"
+    company = "company"
+    social_accounting = "social_accounting"
+    cooperation = "cooperation"
+
+
+class AccountOwner(Base):
+    """Maps every account to the member, company, social accounting
+    or cooperation owning it, so that the owner of an account can be
+    found with equi-joins on primary keys.
+    """
+
+    __tablename__ = "account_owner"
+
+    account: Mapped[UUID] = mapped_column(ForeignKey("account.id"), primary_key=True)
+    owner_type: Mapped[AccountOwnerType]
+    owner_id: Mapped[UUID] = mapped_column(index=True)
+    account_role: Mapped[AccountTypes]
 
 
 class Transfer(Base):
     __tablename__ = "transfer"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
     date: Mapped[datetime] = mapped_column(TZDateTime, index=True)
-    debit_account: Mapped[str] = mapped_column(ForeignKey("account.id"), index=True)
-    credit_account: Mapped[str] = mapped_column(ForeignKey("account.id"), index=True)
+    debit_account: Mapped[UUID] = mapped_column(ForeignKey("account.id"), index=True)
+    credit_account: Mapped[UUID] = mapped_column(ForeignKey("account.id"), index=True)
     value: Mapped[Decimal]
     type: Mapped[TransferType]
 
@@ -267,12 +385,12 @@ class Transfer(Base):
 class PrivateConsumption(Base):
     __tablename__ = "private_consumption"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
-    plan_id: Mapped[str] = mapped_column(ForeignKey("plan.id"))
-    transfer_of_private_consumption: Mapped[str] = mapped_column(
-        ForeignKey("transfer.id")
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
+    plan_id: Mapped[UUID] = mapped_column(ForeignKey("plan.id"), index=True)
+    transfer_of_private_consumption: Mapped[UUID] = mapped_column(
+        ForeignKey("transfer.id"), index=True
     )
-    transfer_of_compensation: Mapped[str | None] = mapped_column(
+    transfer_of_compensation: Mapped[UUID | None] = mapped_column(
         ForeignKey("transfer.id")
     )
     amount: Mapped[int]
@@ -281,12 +399,12 @@ class PrivateConsumption(Base):
 class ProductiveConsumption(Base):
     __tablename__ = "productive_consumption"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
-    plan_id: Mapped[str] = mapped_column(ForeignKey("plan.id"))
-    transfer_of_productive_consumption: Mapped[str] = mapped_column(
-        ForeignKey("transfer.id")
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
+    plan_id: Mapped[UUID] = mapped_column(ForeignKey("plan.id"), index=True)
+    transfer_of_productive_consumption: Mapped[UUID] = mapped_column(
+        ForeignKey("transfer.id"), index=True
     )
-    transfer_of_compensation: Mapped[str | None] = mapped_column(
+    transfer_of_compensation: Mapped[UUID | None] = mapped_column(
         ForeignKey("transfer.id")
     )
     amount: Mapped[int]
@@ -295,60 +413,96 @@ class ProductiveConsumption(Base):
 class RegisteredHoursWorked(Base):
     __tablename__ = "registered_hours_worked"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
-    company: Mapped[str] = mapped_column(ForeignKey("company.id"))
-    worker: Mapped[str] = mapped_column(ForeignKey("member.id"))
-    transfer_of_work_certificates: Mapped[str] = mapped_column(
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
+    company: Mapped[UUID] = mapped_column(ForeignKey("company.id"), index=True)
+    worker: Mapped[UUID] = mapped_column(ForeignKey("member.id"))
+    transfer_of_work_certificates: Mapped[UUID] = mapped_column(
         ForeignKey("transfer.id")
     )
-    transfer_of_taxes: Mapped[str] = mapped_column(ForeignKey("transfer.id"))
+    transfer_of_taxes: Mapped[UUID] = mapped_column(ForeignKey("transfer.id"))
     registered_on: Mapped[datetime] = mapped_column(TZDateTime)
 
 
 class CompanyWorkInvite(Base):
     __tablename__ = "company_work_invite"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
-    company: Mapped[str] = mapped_column(ForeignKey("company.id"))
-    member: Mapped[str] = mapped_column(ForeignKey("member.id"))
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
+    company: Mapped[UUID] = mapped_column(ForeignKey("company.id"), index=True)
+    member: Mapped[UUID] = mapped_column(ForeignKey("member.id"), index=True)
 
 
 class Cooperation(Base):
     __tablename__ = "cooperation"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
     creation_date: Mapped[datetime] = mapped_column(TZDateTime)
     name: Mapped[str] = mapped_column(String(100))
     definition: Mapped[str] = mapped_column(String(5000))
-    account: Mapped[str] = mapped_column(ForeignKey("account.id"))
+    account: Mapped[UUID] = mapped_column(ForeignKey("account.id"))
 
 
 class CoordinationTenure(Base):
     __tablename__ = "coordination_tenure"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
-    company: Mapped[str] = mapped_column(ForeignKey("company.id"))
-    cooperation: Mapped[str] = mapped_column(ForeignKey("cooperation.id"))
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
+    company: Mapped[UUID] = mapped_column(ForeignKey("company.id"))
+    cooperation: Mapped[UUID] = mapped_column(ForeignKey("cooperation.id"), index=True)
     start_date: Mapped[datetime] = mapped_column(TZDateTime)
 
 
 class CoordinationTransferRequest(Base):
     __tablename__ = "coordination_transfer_request"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
-    requesting_coordination_tenure: Mapped[str] = mapped_column(
-        ForeignKey("coordination_tenure.id")
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
+    requesting_coordination_tenure: Mapped[UUID] = mapped_column(
+        ForeignKey("coordination_tenure.id"), index=True
     )
-    candidate: Mapped[str] = mapped_column(ForeignKey("company.id"))
+    candidate: Mapped[UUID] = mapped_column(ForeignKey("company.id"))
     request_date: Mapped[datetime] = mapped_column(TZDateTime)
 
 
 class PasswordResetRequest(Base):
     __tablename__ = "password_reset_request"
 
-    id: Mapped[str] = mapped_column(primary_key=True, default=generate_uuid)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=generate_uuid)
     email_address: Mapped[str] = mapped_column(
         ForeignKey("email.address"), unique=False
     )
     reset_token: Mapped[str] = mapped_column(String(300))
     created_at: Mapped[datetime] = mapped_column(TZDateTime)
+
+
+# Searchable columns, see arbeitszeit_db.search
+PLAN_PRODUCT_NAME_SEARCH = SearchIndex(key=Plan.id, column=Plan.prd_name)
+COMPANY_NAME_SEARCH = SearchIndex(key=Company.id, column=Company.name)
+USER_EMAIL_ADDRESS_SEARCH = SearchIndex(key=User.id, column=User.email_address)
+SEARCH_INDEXES = [
+    PLAN_PRODUCT_NAME_SEARCH,
+    COMPANY_NAME_SEARCH,
+    USER_EMAIL_ADDRESS_SEARCH,
+]
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+for search_index in SEARCH_INDEXES:
+    Index(
+        search_index.trigram_index_name,
+        search_index.column,
+        postgresql_using="gin",
+        postgresql_ops={search_index.column.key: "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql")
+    for statement in search_index.create_fts_table_statements():
+        event.listen(
+            Base.metadata,
+            "after_create",
+            DDL(statement).execute_if(dialect="sqlite"),
+        )
+    for statement in search_index.drop_fts_table_statements():
+        event.listen(
+            Base.metadata,
+            "before_drop",
+            DDL(statement).execute_if(dialect="sqlite"),
+        )
@@ -0,0 +1,179 @@
+"""Inspection of the query plans of the database.
+
+explain() asks the database how it would execute a query and reports
+the tables it would read completely. On SQLite this is based on
+``EXPLAIN QUERY PLAN``, on PostgreSQL on ``EXPLAIN (FORMAT JSON)``
+with sequential scans disabled, so that a sequential scan in the plan
+means that no index could be used, independent of the table
+statistics. Tables for which SQLite builds an automatic index at query
+time count as full scans as well.
+
+For every fully scanned table the columns that the query compares
+with other values and that are not the leading column of any index of
+the table are reported as missing indexes.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Set
+
+from sqlalchemy import Column, Compiled, Select, Table, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm.query import Query
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import BinaryExpression
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from sqlalchemy.sql.selectable import Alias
+
+from arbeitszeit_db.db import Base, Database
+
+COMPARISON_OPERATORS = {
+    operators.eq,
+    operators.in_op,
+    operators.lt,
+    operators.le,
+    operators.gt,
+    operators.ge,
+}
+
+# Older versions of SQLite print "SCAN TABLE plan AS plan_1" where
+# newer versions print "SCAN plan_1".
+_SQLITE_FULL_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$")
+_SQLITE_AUTOMATIC_INDEX = re.compile(
+    r"^SEARCH (?:TABLE )?(\w+)(?: AS \w+)? USING AUTOMATIC"
+)
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "sqlite")
+def _compile_explain_sqlite(element: _Explain, compiler: SQLCompiler, **kw: Any) -> str:
+    return "EXPLAIN QUERY PLAN " + compiler.process(element.statement, **kw)
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain_postgresql(
+    element: _Explain, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+@dataclass
+class MissingIndex:
+    table: str
+    columns: Set[str]
+
+    def __str__(self) -> str:
+        return f"{self.table}({', '.join(sorted(self.columns)) or '?'})"
+
+
+@dataclass
+class QueryPlan:
+    details: List[str]
+    full_scans: Set[str]
+    missing_indexes: List[MissingIndex] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return "\n".join(self.details)
+
+
+def explain(db: Database, query: Query | Select) -> QueryPlan:
+    statement = query.statement if isinstance(query, Query) else query
+    session = db.session
+    if db.engine.dialect.name == "postgresql":
+        session.execute(text("SET LOCAL enable_seqscan = off"))
+        try:
+            ((plan,),) = _execute_raw(db, _Explain(statement))
+        finally:
+            session.execute(text("SET LOCAL enable_seqscan = on"))
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        (plan,) = plan
+        details = json.dumps(plan, indent=2).splitlines()
+        full_scans = set(_postgresql_sequential_scans(plan["Plan"]))
+    else:
+        details = [row[-1] for row in _execute_raw(db, _Explain(statement))]
+        full_scans = set(_sqlite_full_scans(details))
+    compiled = statement.compile(session.connection())
+    return QueryPlan(
+        details=details,
+        full_scans=full_scans,
+        missing_indexes=[
+            MissingIndex(
+                table=table, columns=_unindexed_compared_columns(compiled, table)
+            )
+            for table in sorted(full_scans)
+        ],
+    )
+
+
+def _execute_raw(db: Database, explain_statement: _Explain) -> List[Any]:
+    # The result columns of the explained statement do not describe the
+    # rows returned by EXPLAIN, so the rows are read without the result
+    # processing of SQLAlchemy.
+    result = db.session.connection().execute(explain_statement)
+    return list(result.cursor.fetchall())
+
+
+def _postgresql_sequential_scans(node: Dict[str, Any]) -> Iterator[str]:
+    if node.get("Node Type") == "Seq Scan":
+        yield node["Relation Name"]
+    for child in node.get("Plans", []):
+        yield from _postgresql_sequential_scans(child)
+
+
+def _sqlite_full_scans(details: List[str]) -> Iterator[str]:
+    for detail in details:
+        for pattern in (_SQLITE_FULL_SCAN, _SQLITE_AUTOMATIC_INDEX):
+            if match := pattern.match(detail):
+                name = match.group(1)
+                # Aliases generated by SQLAlchemy append a number to the
+                # name of the table.
+                if name not in Base.metadata.tables:
+                    name = re.sub(r"_\d+$", "", name)
+                if name in Base.metadata.tables:
+                    yield name
+
+
+def _unindexed_compared_columns(compiled: Compiled, table_name: str) -> Set[str]:
+    table = Base.metadata.tables[table_name]
+    indexed = {list(index.columns)[0].name for index in table.indexes if index.columns}
+    indexed.update(column.name for column in list(table.primary_key.columns)[:1])
+    return {
+        column.name
+        for column in _compared_columns(compiled)
+        if _table_of(column) is table and column.name not in indexed
+    }
+
+
+def _compared_columns(compiled: Compiled) -> Iterator[Column]:
+    # Joins along relationships of the ORM only get their ON clause
+    # when the statement is compiled.
+    compile_state: Any = getattr(compiled, "compile_state", None)
+    elements: List[Any] = [compiled.statement]
+    if compile_state is not None:
+        elements.extend(compile_state.froms)
+    for root in elements:
+        for element in visitors.iterate(root):
+            if isinstance(element, BinaryExpression) and (
+                element.operator in COMPARISON_OPERATORS
+            ):
+                for side in (element.left, element.right):
+                    if isinstance(side, Column):
+                        yield side
+
+
+def _table_of(column: Column) -> Any:
+    table: Table | Alias = column.table
+    while isinstance(table, Alias) and isinstance(table.element, (Table, Alias)):
+        table = table.element
+    return table
@@ -0,0 +1,131 @@
+"""Count the statements that are sent to the database while a
+recording is active, together with the time the database spent on
+them. Statements are also counted by their fingerprint, the statement
+with all literals and parameters blanked out. A fingerprint that is
+sent over and over during a single request usually means that rows are
+loaded one by one in a loop instead of in a single query.
+
+Recordings are bound to the current thread or task via a context
+variable, so that concurrent requests do not count each others
+statements. Recordings can be nested, every active recording counts
+the statements.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Tuple
+
+from sqlalchemy import Engine, event
+
+_STARTED = "query_statistics_started"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PARAMETER = re.compile(r"%\(\w+\)s|%s|(?<!:):\w+|\$\d+")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+_active_recordings: ContextVar[Tuple[QueryStatistics, ...]] = ContextVar(
+    "active_query_recordings", default=()
+)
+
+
+@dataclass
+class QueryStatistics:
+    query_count: int = 0
+    total_seconds: float = 0.0
+    fingerprints: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement_fingerprint: str, seconds: float) -> None:
+        self.query_count += 1
+        self.total_seconds += seconds
+        self.fingerprints[statement_fingerprint] += 1
+
+    def repeated_statements(self, threshold: int) -> Dict[str, int]:
+        """The fingerprints that were sent at least `threshold` times,
+        most frequent first, with their number of executions.
+        """
+        return {
+            statement_fingerprint: count
+            for statement_fingerprint, count in self.fingerprints.most_common()
+            if count >= threshold
+        }
+
+
+def fingerprint(statement: str) -> str:
+    """Reduce a SQL statement to its shape. Statements that only
+    differ in their literals, their bound parameters or the length of
+    their IN lists have the same fingerprint.
+    """
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _PARAMETER.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return _PARAMETER_LIST.sub("(?)", statement)
+
+
+@contextmanager
+def recording_queries() -> Iterator[QueryStatistics]:
+    """Count the statements of the current thread or task that are
+    sent through an instrumented engine until the context is left.
+    """
+    statistics = QueryStatistics()
+    token = _active_recordings.set(_active_recordings.get() + (statistics,))
+    try:
+        yield statistics
+    finally:
+        _active_recordings.reset(token)
+
+
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _start_timer)
+    event.listen(engine, "after_cursor_execute", _record_statement)
+    event.listen(engine, "handle_error", _discard_timer)
+
+
+def _start_timer(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    if _active_recordings.get():
+        _timers(conn).append(perf_counter())
+
+
+def _record_statement(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    recordings = _active_recordings.get()
+    timers = _timers(conn)
+    if not recordings or not timers:
+        return
+    seconds = perf_counter() - timers.pop()
+    statement_fingerprint = fingerprint(statement)
+    for statistics in recordings:
+        statistics.record(statement_fingerprint, seconds)
+
+
+def _discard_timer(exception_context: Any) -> None:
+    connection = exception_context.connection
+    if connection is not None:
+        timers = _timers(connection)
+        if timers:
+            timers.pop()
+
+
+def _timers(conn: Any) -> List[float]:
+    return conn.info.setdefault(_STARTED, [])
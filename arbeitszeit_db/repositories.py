@@ -1,64 +1,149 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field, replace
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import (
     Any,
     Callable,
     Dict,
     Generic,
+    Iterable,
     Iterator,
+    List,
     Optional,
     Self,
+    Sequence,
     Tuple,
     TypeVar,
     cast,
 )
 from uuid import UUID, uuid4
 
-from sqlalchemy import Delete, Insert, String, Update
+from sqlalchemy import (
+    Date,
+    Delete,
+    Insert,
+    Join,
+    Select,
+    String,
+    Table,
+    Update,
+    text,
+)
 from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.engine import CursorResult
-from sqlalchemy.orm import InstrumentedAttribute, aliased, scoped_session
+from sqlalchemy.orm import aliased
 from sqlalchemy.orm.query import Query
-from sqlalchemy.sql.expression import ColumnElement, and_, delete, func, or_, update
-from sqlalchemy.sql.functions import concat
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.expression import (
+    UnaryExpression,
+    and_,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    null,
+    or_,
+    select,
+    tuple_,
+    type_coerce,
+    union_all,
+    update,
+)
 
 from arbeitszeit import records
-from arbeitszeit.transfers import TransferType
-from arbeitszeit_db import models
-from arbeitszeit_db.db import Database
+from arbeitszeit.repositories import Page
+from arbeitszeit.transfers import NewTransfer, TransferType
+from arbeitszeit_db import balance_checkpoints, models
+from arbeitszeit_db.db import HAS_WRITTEN, Database
 from arbeitszeit_db.models import (
     Account,
     Company,
     Member,
     PlanDraft,
     SocialAccounting,
+    TZDateTime,
 )
+from arbeitszeit_db.search import SearchBackend, get_search_backend
 
 T = TypeVar("T", covariant=True)
+R = TypeVar("R")
 
 
-def _add_days_to_date(
-    db_session: scoped_session,
-    date_column: InstrumentedAttribute[datetime],
-    days_column: InstrumentedAttribute[Decimal],
-) -> ColumnElement[datetime]:
-    bind = db_session.bind
-    assert bind is not None
-    engine_name = bind.engine.name
+DEFAULT_STREAM_CHUNK_SIZE = 1000
 
-    if engine_name == "sqlite":
-        return func.datetime(
-            date_column, "+" + func.cast(days_column, String) + " days"
-        )
-    else:
-        return (
-            func.cast(concat(days_column, " days"), postgresql.INTERVAL) + date_column
+ESTIMATED_COUNT_THRESHOLD = 10000
+"""Below this number of rows counting is cheap and table statistics
+are unreliable, so totals are always counted exactly."""
+
+
+def _slice_query(query: Query, offset: Optional[int], limit: Optional[int]) -> Query:
+    if offset is not None:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def _base_table_of_outer_joins(froms: Sequence[Any]) -> Optional[Table]:
+    """Return the table an unfiltered query selects from if the query
+    only extends that table by outer joins, which do not remove rows.
+    """
+    if len(froms) != 1:
+        return None
+    from_ = froms[0]
+    while isinstance(from_, Join):
+        if not from_.isouter:
+            return None
+        from_ = from_.left
+    return from_ if isinstance(from_, Table) else None
+
+
+@dataclass(frozen=True)
+class Projection(Generic[R]):
+    """The columns a record is built from. Queries that select
+    projections instead of ORM entities return plain rows, which skips
+    the construction of ORM objects, the identity map bookkeeping and
+    lazy loads of relationships. Only use them for reading.
+    """
+
+    columns: Tuple[Any, ...]
+    build: Callable[[Sequence[Any]], R]
+
+    def optional(self) -> Projection[Optional[R]]:
+        """Build None instead of a record when the first column, which
+        has to be the primary key, is NULL, e.g. after an outer join.
+        """
+        build = self.build
+        return Projection(
+            columns=self.columns,
+            build=lambda row: None if row[0] is None else build(row),
         )
 
 
+def _select_projections(
+    query: Query, *projections: Projection[Any]
+) -> Tuple[Query, Callable[[Sequence[Any]], Tuple[Any, ...]]]:
+    """Select the columns of `projections` instead of the entities of
+    `query`. Returns the new query together with a function that builds
+    one record per projection from a row of it.
+    """
+    slices = []
+    start = 0
+    for projection in projections:
+        end = start + len(projection.columns)
+        slices.append((projection.build, start, end))
+        start = end
+
+    def build(row: Sequence[Any]) -> Tuple[Any, ...]:
+        return tuple(build(row[start:end]) for build, start, end in slices)
+
+    columns = [column for projection in projections for column in projection.columns]
+    return query.with_entities(*columns), build
+
+
 class SqlQueryResult(Generic[T]):
     def __init__(self, query: Query, mapper: Callable[[Any], T], db: Database) -> None:
         self.query = query
@@ -71,12 +156,124 @@ class SqlQueryResult(Generic[T]):
     def offset(self, n: int) -> Self:
         return type(self)(query=self.query.offset(n), mapper=self.mapper, db=self.db)
 
+    def after(self, cursor: Sequence[Any]) -> Self:
+        """Restrict the result to the rows that come after `cursor`
+        with respect to the current ordering of the query (keyset
+        pagination). The cursor must contain one value per ordering
+        column, in the order in which the orderings were applied. All
+        ordering columns must be sorted in the same direction.
+        """
+        columns = []
+        directions = set()
+        for clause in self.query._order_by_clauses:
+            if isinstance(clause, UnaryExpression) and clause.modifier in (
+                operators.asc_op,
+                operators.desc_op,
+            ):
+                columns.append(clause.element)
+                directions.add(clause.modifier)
+            else:
+                columns.append(clause)
+                directions.add(operators.asc_op)
+        if not columns:
+            raise ValueError("Keyset pagination requires an ordered query.")
+        if len(directions) > 1:
+            raise ValueError("Keyset pagination requires a uniform sort direction.")
+        if len(cursor) != len(columns):
+            raise ValueError(
+                f"Cursor has {len(cursor)} values but the query is ordered by {len(columns)} columns."
+            )
+        values = [literal(value, column.type) for column, value in zip(columns, cursor)]
+        if directions == {operators.desc_op}:
+            condition = tuple_(*columns) < tuple_(*values)
+        else:
+            condition = tuple_(*columns) > tuple_(*values)
+        return self._with_modified_query(lambda query: query.filter(condition))
+
     def first(self) -> Optional[T]:
         element = self.query.first()
         if element is None:
             return None
         return self.mapper(element)
 
+    def page(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        *,
+        estimate_total: bool = False,
+    ) -> Page[T]:
+        """Fetch the rows of the page together with the total row count
+        in a single query via COUNT(*) OVER (). With `estimate_total`
+        the total of an unfiltered query is taken from the table
+        statistics on PostgreSQL, as long as the table holds at least
+        ESTIMATED_COUNT_THRESHOLD rows.
+        """
+        if estimate_total:
+            estimated_total = self._estimate_total()
+            if estimated_total is not None:
+                return Page(
+                    items=[
+                        self.mapper(row)
+                        for row in _slice_query(self.query, offset, limit)
+                    ],
+                    total=estimated_total,
+                    is_total_estimated=True,
+                )
+        is_single_entity = self.query.is_single_entity
+        rows = _slice_query(
+            self.query.add_columns(func.count().over().label("total_count")),
+            offset,
+            limit,
+        ).all()
+        if rows:
+            total = rows[0].total_count
+        elif offset:
+            # The page lies behind the last row, so no row carries the
+            # total.
+            total = len(self)
+        else:
+            total = 0
+        return Page(
+            items=[
+                self.mapper(row[0] if is_single_entity else tuple(row[:-1]))
+                for row in rows
+            ],
+            total=total,
+        )
+
+    def estimated_len(self) -> int:
+        """The number of rows in the result, taken from the table
+        statistics for the same unfiltered queries as the estimated
+        total of `page` and counted otherwise.
+        """
+        estimated_total = self._estimate_total()
+        if estimated_total is not None:
+            return estimated_total
+        return len(self)
+
+    def _estimate_total(self) -> Optional[int]:
+        if self.db.engine.dialect.name != "postgresql":
+            return None
+        if self.query.whereclause is not None:
+            return None
+        statement = self.query.statement
+        if not isinstance(statement, Select):
+            return None
+        table = _base_table_of_outer_joins(statement.get_final_froms())
+        if table is None:
+            return None
+        estimate = self.db.session.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+            dict(table=table.name),
+        ).scalar()
+        if estimate is None or estimate < ESTIMATED_COUNT_THRESHOLD:
+            return None
+        return int(estimate)
+
+    def _search_backend(self) -> SearchBackend:
+        return get_search_backend(self.db.engine.dialect.name)
+
     def _with_modified_query(self, modification: Callable[[Query], Any]) -> Self:
         return type(self)(
             query=modification(self.query), mapper=self.mapper, db=self.db
@@ -85,6 +282,13 @@ class SqlQueryResult(Generic[T]):
     def __iter__(self) -> Iterator[T]:
         return (self.mapper(item) for item in self.query)
 
+    def stream(self, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> Iterator[T]:
+        """Iterate over the result through a server side cursor that
+        fetches `chunk_size` rows at a time, so that only one chunk of
+        ORM objects is held in memory.
+        """
+        return (self.mapper(item) for item in self.query.yield_per(chunk_size))
+
     def __len__(self) -> int:
         return self.query.count()
 
@@ -126,13 +330,26 @@ class PlanQueryResult(SqlQueryResult[records.Plan]):
         return query
 
     def with_id_containing(self, query: str) -> Self:
+        # Ids are compared in their hex form without dashes, which is
+        # how they are stored on SQLite.
+        hex_id = func.replace(models.Plan.id.cast(String), "-", "")
+        hex_query = query.replace("-", "").lower()
         return self._with_modified_query(
-            lambda db_query: db_query.filter(models.Plan.id.contains(query))
+            lambda db_query: db_query.filter(hex_id.contains(hex_query))
         )
 
     def with_product_name_containing(self, query: str) -> Self:
+        condition = self._search_backend().matching(
+            models.PLAN_PRODUCT_NAME_SEARCH, query
+        )
+        return self._with_modified_query(lambda db_query: db_query.filter(condition))
+
+    def ordered_by_product_name_relevance(self, query: str) -> Self:
+        search_backend = self._search_backend()
         return self._with_modified_query(
-            lambda db_query: db_query.filter(models.Plan.prd_name.ilike(f"%{query}%"))
+            lambda db_query: search_backend.ordered_by_relevance(
+                db_query, models.PLAN_PRODUCT_NAME_SEARCH, query
+            )
         )
 
     def that_are_approved(self) -> Self:
@@ -156,22 +373,28 @@ class PlanQueryResult(SqlQueryResult[records.Plan]):
             )
         )
 
+    def that_were_approved_after(self, timestamp: datetime) -> Self:
+        plan_approval = aliased(models.PlanApproval)
+        return self._with_modified_query(
+            lambda query: query.join(plan_approval).filter(
+                plan_approval.date > timestamp
+            )
+        )
+
     def that_will_expire_after(self, timestamp: datetime) -> Self:
         approval = aliased(models.PlanApproval)
-        expiration_date = _add_days_to_date(
-            self.db.session, approval.date, models.Plan.timeframe
-        )
         return self._with_modified_query(
-            lambda query: query.join(approval).filter(expiration_date > timestamp)
+            lambda query: query.join(approval).filter(
+                approval.expiration_date > timestamp
+            )
         )
 
     def that_are_expired_as_of(self, timestamp: datetime) -> Self:
         approval = aliased(models.PlanApproval)
-        expiration_date = _add_days_to_date(
-            self.db.session, approval.date, models.Plan.timeframe
-        )
         return self._with_modified_query(
-            lambda query: query.join(approval).filter(expiration_date <= timestamp)
+            lambda query: query.join(approval).filter(
+                approval.expiration_date <= timestamp
+            )
         )
 
     def that_are_productive(self) -> Self:
@@ -193,15 +416,13 @@ class PlanQueryResult(SqlQueryResult[records.Plan]):
         )
 
     def planned_by(self, *company: UUID) -> Self:
-        companies = list(map(str, company))
         return self._with_modified_query(
-            lambda query: query.filter(models.Plan.planner.in_(companies))
+            lambda query: query.filter(models.Plan.planner.in_(company))
         )
 
     def with_id(self, *id_: UUID) -> Self:
-        ids = list(map(str, id_))
         return self._with_modified_query(
-            lambda query: query.filter(models.Plan.id.in_(ids))
+            lambda query: query.filter(models.Plan.id.in_(id_))
         )
 
     def without_completed_review(self) -> Self:
@@ -222,7 +443,7 @@ class PlanQueryResult(SqlQueryResult[records.Plan]):
     ) -> Self:
         return self._with_modified_query(
             lambda query: query.filter(
-                models.Plan.requested_cooperation == str(cooperation)
+                models.Plan.requested_cooperation == cooperation
                 if cooperation
                 else models.Plan.requested_cooperation != None
             )
@@ -233,7 +454,7 @@ class PlanQueryResult(SqlQueryResult[records.Plan]):
 
         cooperation_subquery = (
             self.db.session.query(models.PlanCooperation.cooperation)
-            .filter(models.PlanCooperation.plan == str(plan))
+            .filter(models.PlanCooperation.plan == plan)
             .scalar_subquery()
         )
 
@@ -244,7 +465,6 @@ class PlanQueryResult(SqlQueryResult[records.Plan]):
         )
 
     def that_are_part_of_cooperation(self, *cooperation: UUID) -> Self:
-        cooperations = list(map(str, cooperation))
         plan_cooperation = aliased(models.PlanCooperation)
         if not cooperation:
             return self._with_modified_query(
@@ -256,12 +476,10 @@ class PlanQueryResult(SqlQueryResult[records.Plan]):
             return self._with_modified_query(
                 lambda query: query.join(
                     plan_cooperation, plan_cooperation.plan == models.Plan.id
-                ).filter(plan_cooperation.cooperation.in_(cooperations))
+                ).filter(plan_cooperation.cooperation.in_(cooperation))
             )
 
     def that_request_cooperation_with_coordinator(self, *company: UUID) -> Self:
-        companies = list(map(str, company))
-
         cooperation = aliased(models.Cooperation)
         most_recent_tenure_holder = (
             self.db.session.query(models.CoordinationTenure)
@@ -271,12 +489,12 @@ class PlanQueryResult(SqlQueryResult[records.Plan]):
             .limit(1)
             .scalar_subquery()
         )
-        if companies:
+        if company:
             return self._with_modified_query(
                 lambda query: query.join(
                     cooperation,
                     models.Plan.requested_cooperation == cooperation.id,
-                ).filter(most_recent_tenure_holder.in_(companies))
+                ).filter(most_recent_tenure_holder.in_(company))
             )
         else:
             return self._with_modified_query(
@@ -310,6 +528,41 @@ class PlanQueryResult(SqlQueryResult[records.Plan]):
             ),
         )
 
+    def get_earliest_expiration_date(self) -> Optional[datetime]:
+        approval = aliased(models.PlanApproval)
+        return (
+            self.query.join(approval, approval.plan_id == models.Plan.id)
+            .with_entities(func.min(approval.expiration_date))
+            .order_by(None)
+            .scalar()
+        )
+
+    def get_payout_factor_costs(self) -> records.PayoutFactorCosts:
+        rows = (
+            self.query.with_entities(
+                models.Plan.is_public_service,
+                func.sum(models.Plan.costs_a).label("costs_a"),
+                func.sum(models.Plan.costs_p + models.Plan.costs_r).label(
+                    "costs_p_and_r"
+                ),
+            )
+            .group_by(models.Plan.is_public_service)
+            .order_by(None)
+            .all()
+        )
+        costs = records.PayoutFactorCosts(
+            productive_labour=Decimal(0),
+            public_labour=Decimal(0),
+            public_means_and_resources=Decimal(0),
+        )
+        for row in rows:
+            if row.is_public_service:
+                costs.public_labour = Decimal(row.costs_a or 0)
+                costs.public_means_and_resources = Decimal(row.costs_p_and_r or 0)
+            else:
+                costs.productive_labour = Decimal(row.costs_a or 0)
+        return costs
+
     def that_are_not_hidden(self) -> Self:
         return self._with_modified_query(
             lambda query: query.filter(models.Plan.hidden_by_user == False)
@@ -322,22 +575,10 @@ class PlanQueryResult(SqlQueryResult[records.Plan]):
             Optional[records.Cooperation],
         ]
     ]:
-        def mapper(orm: Any) -> Tuple[
-            records.Plan,
-            records.Company,
-            Optional[records.Cooperation],
-        ]:
-            return (
-                DatabaseGatewayImpl.plan_from_orm(orm[0]),
-                DatabaseGatewayImpl.company_from_orm(orm[1]),
-                DatabaseGatewayImpl.cooperation_from_orm(orm[2]) if orm[2] else None,
-            )
-
         planner = aliased(models.Company)
         cooperation = aliased(models.Cooperation)
         plan_cooperation = aliased(models.PlanCooperation)
-
-        query = (
+        query, build = _select_projections(
             self.query.join(planner, planner.id == models.Plan.planner)
             .outerjoin(
                 plan_cooperation,
@@ -346,69 +587,50 @@ class PlanQueryResult(SqlQueryResult[records.Plan]):
             .outerjoin(
                 cooperation,
                 cooperation.id == plan_cooperation.cooperation,
-            )
-            .with_entities(
-                models.Plan,
-                planner,
-                cooperation,
-            )
-        )
-
-        return SqlQueryResult(
-            db=self.db,
-            mapper=mapper,
-            query=query,
+            ),
+            DatabaseGatewayImpl.plan_projection(),
+            DatabaseGatewayImpl.company_projection(planner),
+            DatabaseGatewayImpl.cooperation_projection(cooperation).optional(),
         )
+        return SqlQueryResult(db=self.db, mapper=build, query=query)
 
     def joined_with_cooperation(
         self,
     ) -> SqlQueryResult[tuple[records.Plan, Optional[records.Cooperation]]]:
-        def mapper(orm: Any) -> tuple[records.Plan, Optional[records.Cooperation]]:
-            return (
-                DatabaseGatewayImpl.plan_from_orm(orm[0]),
-                DatabaseGatewayImpl.cooperation_from_orm(orm[1]) if orm[1] else None,
-            )
-
         plan_cooperation = aliased(models.PlanCooperation)
         cooperation = aliased(models.Cooperation)
-        query = (
-            self.query.join(
-                plan_cooperation, plan_cooperation.plan == models.Plan.id, isouter=True
-            )
-            .join(
+        query, build = _select_projections(
+            self.query.outerjoin(
+                plan_cooperation,
+                plan_cooperation.plan == models.Plan.id,
+            ).outerjoin(
                 cooperation,
                 cooperation.id == plan_cooperation.cooperation,
-                isouter=True,
-            )
-            .with_entities(models.Plan, cooperation)
+            ),
+            DatabaseGatewayImpl.plan_projection(),
+            DatabaseGatewayImpl.cooperation_projection(cooperation).optional(),
         )
+        return SqlQueryResult(db=self.db, mapper=build, query=query)
 
-        return SqlQueryResult(
-            db=self.db,
-            query=query,
-            mapper=mapper,
+    def joined_with_requested_cooperation_and_planner(
+        self,
+    ) -> SqlQueryResult[Tuple[records.Plan, records.Cooperation, records.Company]]:
+        cooperation = aliased(models.Cooperation)
+        planner = aliased(models.Company)
+        query, build = _select_projections(
+            self.query.join(
+                cooperation, cooperation.id == models.Plan.requested_cooperation
+            ).join(planner, planner.id == models.Plan.planner),
+            DatabaseGatewayImpl.plan_projection(),
+            DatabaseGatewayImpl.cooperation_projection(cooperation),
+            DatabaseGatewayImpl.company_projection(planner),
         )
+        return SqlQueryResult(db=self.db, mapper=build, query=query)
 
     def joined_with_provided_product_amount(
         self,
     ) -> SqlQueryResult[Tuple[records.Plan, int]]:
-        productive_consumptions = (
-            self.db.session.query(models.ProductiveConsumption)
-            .filter(models.ProductiveConsumption.plan_id == models.Plan.id)
-            .with_entities(func.sum(models.ProductiveConsumption.amount))
-            .scalar_subquery()
-        )
-        private_consumptions = (
-            self.db.session.query(models.PrivateConsumption)
-            .filter(models.PrivateConsumption.plan_id == models.Plan.id)
-            .with_entities(func.sum(models.PrivateConsumption.amount))
-            .scalar_subquery()
-        )
-        query = self.query.with_entities(
-            models.Plan,
-            func.coalesce(productive_consumptions, 0)
-            + func.coalesce(private_consumptions, 0),
-        )
+        query = self.query.with_entities(models.Plan, models.Plan.consumed_amount)
         return SqlQueryResult(
             query=query,
             db=self.db,
@@ -480,8 +702,7 @@ class PlanUpdate:
                     )
                 case self.SetCooperation(cooperation=coop_id):
                     values = [
-                        dict(plan=plan.id, cooperation=str(coop_id))
-                        for plan in self.query
+                        dict(plan=plan.id, cooperation=coop_id) for plan in self.query
                     ]
                     dialect = self.db.engine.dialect.name
                     if dialect == "postgresql":
@@ -490,7 +711,7 @@ class PlanUpdate:
                             .values(values)
                             .on_conflict_do_update(
                                 constraint="plan_cooperation_pkey",
-                                set_=dict(cooperation=str(coop_id)),
+                                set_=dict(cooperation=coop_id),
                             )
                         )
                     elif dialect == "sqlite":
@@ -499,7 +720,7 @@ class PlanUpdate:
                             .values(values)
                             .on_conflict_do_update(
                                 index_elements=[models.PlanCooperation.plan],
-                                set_=dict(cooperation=str(coop_id)),
+                                set_=dict(cooperation=coop_id),
                             )
                         )
                     else:
@@ -522,7 +743,7 @@ class PlanUpdate:
             self,
             plan_update_values=dict(
                 self.plan_update_values,
-                requested_cooperation=str(cooperation) if cooperation else None,
+                requested_cooperation=cooperation,
             ),
         )
 
@@ -547,14 +768,12 @@ class PlanUpdate:
 class PlanDraftResult(SqlQueryResult[records.PlanDraft]):
     def with_id(self, id_: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.PlanDraft.id == str(id_))
+            lambda query: query.filter(models.PlanDraft.id == id_)
         )
 
     def planned_by(self, *company: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(
-                models.PlanDraft.planner.in_([str(i) for i in company])
-            )
+            lambda query: query.filter(models.PlanDraft.planner.in_(company))
         )
 
     def delete(self) -> int:
@@ -653,15 +872,30 @@ class PlanDraftUpdate:
 class PlanApprovalResult(SqlQueryResult[records.PlanApproval]): ...
 
 
+class PayoutFactorChangeResult(SqlQueryResult[records.PayoutFactorChange]):
+    def ordered_by_timestamp(self, *, ascending: bool = True) -> Self:
+        ordering = (
+            models.PayoutFactorChange.timestamp.asc()
+            if ascending
+            else models.PayoutFactorChange.timestamp.desc()
+        )
+        return self._with_modified_query(lambda query: query.order_by(ordering))
+
+    def that_occurred_after(self, timestamp: datetime) -> Self:
+        return self._with_modified_query(
+            lambda query: query.filter(models.PayoutFactorChange.timestamp > timestamp)
+        )
+
+
 class MemberQueryResult(SqlQueryResult[records.Member]):
     def working_at_company(self, company: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.Member.workplaces.any(id=str(company)))
+            lambda query: query.filter(models.Member.workplaces.any(id=company))
         )
 
     def with_id(self, member: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.Member.id == str(member))
+            lambda query: query.filter(models.Member.id == member)
         )
 
     def with_email_address(self, email: str) -> Self:
@@ -696,7 +930,7 @@ class MemberQueryResult(SqlQueryResult[records.Member]):
 class CompanyQueryResult(SqlQueryResult[records.Company]):
     def with_id(self, id_: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.Company.id == str(id_))
+            lambda query: query.filter(models.Company.id == id_)
         )
 
     def with_email_address(self, email: str) -> Self:
@@ -709,7 +943,7 @@ class CompanyQueryResult(SqlQueryResult[records.Company]):
     def that_are_workplace_of_member(self, member: UUID) -> Self:
         return self._with_modified_query(
             lambda query: query.filter(
-                models.Company.workers.any(models.Member.id == str(member))
+                models.Company.workers.any(models.Member.id == member)
             )
         )
 
@@ -726,14 +960,14 @@ class CompanyQueryResult(SqlQueryResult[records.Company]):
         return self._with_modified_query(
             lambda query: query.join(
                 coop, most_recent_tenure_holder == models.Company.id
-            ).filter(coop.id == str(cooperation))
+            ).filter(coop.id == cooperation)
         )
 
     def add_worker(self, member: UUID) -> int:
         companies_changed = 0
         member_orm = (
             self.db.session.query(models.Member)
-            .filter(models.Member.id == str(member))
+            .filter(models.Member.id == member)
             .first()
         )
         assert member_orm
@@ -747,7 +981,7 @@ class CompanyQueryResult(SqlQueryResult[records.Company]):
         companies_changed = 0
         member_orm = (
             self.db.session.query(models.Member)
-            .filter(models.Member.id == str(member))
+            .filter(models.Member.id == member)
             .first()
         )
         assert member_orm
@@ -758,17 +992,35 @@ class CompanyQueryResult(SqlQueryResult[records.Company]):
         return companies_changed
 
     def with_name_containing(self, query: str) -> Self:
+        condition = self._search_backend().matching(models.COMPANY_NAME_SEARCH, query)
+        return self._with_modified_query(lambda db_query: db_query.filter(condition))
+
+    def with_email_containing(self, query: str) -> Self:
+        condition = self._search_backend().matching(
+            models.USER_EMAIL_ADDRESS_SEARCH, query
+        )
         return self._with_modified_query(
-            lambda db_query: db_query.filter(models.Company.name.ilike(f"%{query}%"))
+            lambda db_query: db_query.join(models.User).filter(condition)
         )
 
-    def with_email_containing(self, query: str) -> Self:
+    def ordered_by_name_relevance(self, query: str) -> Self:
+        search_backend = self._search_backend()
         return self._with_modified_query(
-            lambda db_query: db_query.join(models.User).filter(
-                models.User.email_address.ilike(f"%{query}%")
+            lambda db_query: search_backend.ordered_by_relevance(
+                db_query, models.COMPANY_NAME_SEARCH, query
             )
         )
 
+    def ordered_by_name(self, *, ascending: bool = True) -> Self:
+        if ascending:
+            orderings: List[UnaryExpression[Any]] = [
+                models.Company.name.asc(),
+                models.Company.id.asc(),
+            ]
+        else:
+            orderings = [models.Company.name.desc(), models.Company.id.desc()]
+        return self._with_modified_query(lambda query: query.order_by(*orderings))
+
     def joined_with_email_address(
         self,
     ) -> SqlQueryResult[Tuple[records.Company, records.EmailAddress]]:
@@ -801,7 +1053,7 @@ class AccountantResult(SqlQueryResult[records.Accountant]):
 
     def with_id(self, id_: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.Accountant.id == str(id_))
+            lambda query: query.filter(models.Accountant.id == id_)
         )
 
     def joined_with_email_address(
@@ -828,284 +1080,264 @@ class AccountantResult(SqlQueryResult[records.Accountant]):
         )
 
 
+class _AccountOwnerAliases:
+    """Aliases for resolving the owner of an account through the
+    account_owner table. Each owner table is joined on its primary key
+    only for the matching owner type.
+    """
+
+    def __init__(self) -> None:
+        self.account_owner = aliased(models.AccountOwner)
+        self.member = aliased(models.Member)
+        self.company = aliased(models.Company)
+        self.social_accounting = aliased(models.SocialAccounting)
+        self.cooperation = aliased(models.Cooperation)
+
+    def join(self, query: Query, account: Any) -> Query:
+        owner = self.account_owner
+        return (
+            query.join(owner, owner.account == account, isouter=True)
+            .join(
+                self.member,
+                and_(
+                    owner.owner_type == models.AccountOwnerType.member,
+                    self.member.id == owner.owner_id,
+                ),
+                isouter=True,
+            )
+            .join(
+                self.company,
+                and_(
+                    owner.owner_type == models.AccountOwnerType.company,
+                    self.company.id == owner.owner_id,
+                ),
+                isouter=True,
+            )
+            .join(
+                self.social_accounting,
+                and_(
+                    owner.owner_type == models.AccountOwnerType.social_accounting,
+                    self.social_accounting.id == owner.owner_id,
+                ),
+                isouter=True,
+            )
+            .join(
+                self.cooperation,
+                and_(
+                    owner.owner_type == models.AccountOwnerType.cooperation,
+                    self.cooperation.id == owner.owner_id,
+                ),
+                isouter=True,
+            )
+        )
+
+    def projections(self) -> Tuple[Projection[Any], ...]:
+        return (
+            DatabaseGatewayImpl.member_projection(self.member).optional(),
+            DatabaseGatewayImpl.company_projection(self.company).optional(),
+            AccountingRepository.social_accounting_projection(
+                self.social_accounting
+            ).optional(),
+            DatabaseGatewayImpl.cooperation_projection(self.cooperation).optional(),
+        )
+
+    @staticmethod
+    def pick_owner(
+        *candidates: Optional[records.AccountOwner],
+    ) -> records.AccountOwner:
+        """Pick the owner from the records built from `projections`,
+        all but one of which are None.
+        """
+        return next(candidate for candidate in candidates if candidate is not None)
+
+
 class TransferQueryResult(SqlQueryResult[records.Transfer]):
     def where_account_is_debtor(self, *account: UUID) -> Self:
-        accounts = list(map(str, account))
         return self._with_modified_query(
-            lambda query: query.filter(models.Transfer.debit_account.in_(accounts))
+            lambda query: query.filter(models.Transfer.debit_account.in_(account))
         )
 
     def where_account_is_creditor(self, *account: UUID) -> Self:
-        accounts = list(map(str, account))
         return self._with_modified_query(
-            lambda query: query.filter(models.Transfer.credit_account.in_(accounts))
+            lambda query: query.filter(models.Transfer.credit_account.in_(account))
         )
 
     def where_account_is_debtor_or_creditor(self, *account: UUID) -> Self:
-        accounts = list(map(str, account))
         return self._with_modified_query(
             lambda query: query.filter(
-                models.Transfer.debit_account.in_(accounts)
-                | models.Transfer.credit_account.in_(accounts)
+                models.Transfer.debit_account.in_(account)
+                | models.Transfer.credit_account.in_(account)
             )
         )
 
     def joined_with_debtor(
         self,
     ) -> SqlQueryResult[Tuple[records.Transfer, records.AccountOwner]]:
-        member = aliased(models.Member)
-        company = aliased(models.Company)
-        social_accounting = aliased(models.SocialAccounting)
-        cooperation = aliased(models.Cooperation)
-        query = (
-            self.query.join(
-                member, member.account == models.Transfer.debit_account, isouter=True
-            )
-            .join(
-                company,
-                or_(
-                    company.p_account == models.Transfer.debit_account,
-                    company.r_account == models.Transfer.debit_account,
-                    company.a_account == models.Transfer.debit_account,
-                    company.prd_account == models.Transfer.debit_account,
-                ),
-                isouter=True,
-            )
-            .join(
-                social_accounting,
-                social_accounting.account_psf == models.Transfer.debit_account,
-                isouter=True,
-            )
-            .join(
-                cooperation,
-                cooperation.account == models.Transfer.debit_account,
-                isouter=True,
-            )
-            .with_entities(
-                models.Transfer, member, company, social_accounting, cooperation
-            )
-        )
-        return SqlQueryResult(
-            query=query,
-            mapper=self.map_transfer_and_account_owner,
-            db=self.db,
-        )
+        return self._joined_with_account_owner(models.Transfer.debit_account)
 
     def joined_with_creditor(
         self,
     ) -> SqlQueryResult[Tuple[records.Transfer, records.AccountOwner]]:
-        member = aliased(models.Member)
-        company = aliased(models.Company)
-        social_accounting = aliased(models.SocialAccounting)
-        cooperation = aliased(models.Cooperation)
-        query = (
-            self.query.join(
-                member, member.account == models.Transfer.credit_account, isouter=True
-            )
-            .join(
-                company,
-                or_(
-                    company.p_account == models.Transfer.credit_account,
-                    company.r_account == models.Transfer.credit_account,
-                    company.a_account == models.Transfer.credit_account,
-                    company.prd_account == models.Transfer.credit_account,
-                ),
-                isouter=True,
-            )
-            .join(
-                social_accounting,
-                social_accounting.account_psf == models.Transfer.credit_account,
-                isouter=True,
-            )
-            .join(
-                cooperation,
-                cooperation.account == models.Transfer.credit_account,
-                isouter=True,
-            )
-            .with_entities(
-                models.Transfer, member, company, social_accounting, cooperation
-            )
-        )
-        return SqlQueryResult(
-            query=query,
-            mapper=self.map_transfer_and_account_owner,
-            db=self.db,
+        return self._joined_with_account_owner(models.Transfer.credit_account)
+
+    def _joined_with_account_owner(
+        self, account: Any
+    ) -> SqlQueryResult[Tuple[records.Transfer, records.AccountOwner]]:
+        owner = _AccountOwnerAliases()
+        query, build = _select_projections(
+            owner.join(self.query, account),
+            DatabaseGatewayImpl.transfer_projection(),
+            *owner.projections(),
         )
 
-    @classmethod
-    def map_transfer_and_account_owner(
-        cls, orm: Any
-    ) -> Tuple[records.Transfer, records.AccountOwner]:
-        transfer, member, company, social_accounting, cooperation = orm
-        account_owner: records.AccountOwner
-        if member:
-            account_owner = DatabaseGatewayImpl.member_from_orm(member)
-        elif company:
-            account_owner = DatabaseGatewayImpl.company_from_orm(company)
-        elif social_accounting:
-            account_owner = AccountingRepository.social_accounting_from_orm(
-                social_accounting
-            )
-        else:
-            account_owner = DatabaseGatewayImpl.cooperation_from_orm(cooperation)
-        return DatabaseGatewayImpl.transfer_from_orm(transfer), account_owner
+        def mapper(row: Any) -> Tuple[records.Transfer, records.AccountOwner]:
+            transfer, *candidates = build(row)
+            return transfer, owner.pick_owner(*candidates)
+
+        return SqlQueryResult(query=query, mapper=mapper, db=self.db)
 
     def joined_with_debtor_and_creditor(
         self,
     ) -> SqlQueryResult[
         Tuple[records.Transfer, records.AccountOwner, records.AccountOwner]
     ]:
-        debtor_aliases = self._create_account_owner_aliases()
-        creditor_aliases = self._create_account_owner_aliases()
+        debtor = _AccountOwnerAliases()
+        creditor = _AccountOwnerAliases()
+        query = debtor.join(self.query, models.Transfer.debit_account)
+        query, build = _select_projections(
+            creditor.join(query, models.Transfer.credit_account),
+            DatabaseGatewayImpl.transfer_projection(),
+            *debtor.projections(),
+            *creditor.projections(),
+        )
 
-        query = (
-            self.query
-            # Join debtor side
-            .join(
-                debtor_aliases.member,
-                debtor_aliases.member.account == models.Transfer.debit_account,
-                isouter=True,
-            )
-            .join(
-                debtor_aliases.company,
-                or_(
-                    debtor_aliases.company.p_account == models.Transfer.debit_account,
-                    debtor_aliases.company.r_account == models.Transfer.debit_account,
-                    debtor_aliases.company.a_account == models.Transfer.debit_account,
-                    debtor_aliases.company.prd_account == models.Transfer.debit_account,
-                ),
-                isouter=True,
-            )
-            .join(
-                debtor_aliases.social_accounting,
-                debtor_aliases.social_accounting.account_psf
-                == models.Transfer.debit_account,
-                isouter=True,
-            )
-            .join(
-                debtor_aliases.cooperation,
-                debtor_aliases.cooperation.account == models.Transfer.debit_account,
-                isouter=True,
-            )
-            # Join creditor side
-            .join(
-                creditor_aliases.member,
-                creditor_aliases.member.account == models.Transfer.credit_account,
-                isouter=True,
-            )
-            .join(
-                creditor_aliases.company,
-                or_(
-                    creditor_aliases.company.p_account
-                    == models.Transfer.credit_account,
-                    creditor_aliases.company.r_account
-                    == models.Transfer.credit_account,
-                    creditor_aliases.company.a_account
-                    == models.Transfer.credit_account,
-                    creditor_aliases.company.prd_account
-                    == models.Transfer.credit_account,
-                ),
-                isouter=True,
-            )
-            .join(
-                creditor_aliases.social_accounting,
-                creditor_aliases.social_accounting.account_psf
-                == models.Transfer.credit_account,
-                isouter=True,
+        def mapper(
+            row: Any,
+        ) -> Tuple[records.Transfer, records.AccountOwner, records.AccountOwner]:
+            transfer, *candidates = build(row)
+            return (
+                transfer,
+                debtor.pick_owner(*candidates[:4]),
+                creditor.pick_owner(*candidates[4:]),
             )
-            .join(
-                creditor_aliases.cooperation,
-                creditor_aliases.cooperation.account == models.Transfer.credit_account,
-                isouter=True,
+
+        return SqlQueryResult(query=query, mapper=mapper, db=self.db)
+
+    def ordered_by_date(self, *, ascending: bool = True) -> Self:
+        if ascending:
+            orderings = (models.Transfer.date.asc(), models.Transfer.id.asc())
+        else:
+            orderings = (models.Transfer.date.desc(), models.Transfer.id.desc())
+        return self._with_modified_query(lambda query: query.order_by(*orderings))
+
+    def running_balances_of(
+        self, account: UUID
+    ) -> SqlQueryResult[Tuple[datetime, Decimal]]:
+        checkpointed_until = balance_checkpoints.get_checkpointed_until(self.db)
+        signed_value = case(
+            (models.Transfer.debit_account == account, -models.Transfer.value),
+            else_=models.Transfer.value,
+        )
+        running_balance = func.sum(func.sum(signed_value)).over(
+            order_by=models.Transfer.date
+        )
+        transfers = self.query.filter(
+            (models.Transfer.debit_account == account)
+            | (models.Transfer.credit_account == account)
+        )
+        if checkpointed_until is None:
+            query = (
+                transfers.with_entities(
+                    models.Transfer.date, running_balance.label("balance")
+                )
+                .group_by(models.Transfer.date)
+                .order_by(None)
+                .order_by(models.Transfer.date)
+            )
+            return SqlQueryResult(
+                query=query,
+                db=self.db,
+                mapper=lambda row: (row[0], Decimal(row[1])),
+            )
+        # The checkpointed days contribute their end of day balances,
+        # only the later transfers are summed up.
+        checkpoint = aliased(models.DailyAccountBalance)
+        checkpoint_balances = select(
+            literal(0).label("part"),
+            checkpoint.day.label("day"),
+            type_coerce(null(), TZDateTime).label("date"),
+            checkpoint.balance.label("balance"),
+        ).where(checkpoint.account == account, checkpoint.day <= checkpointed_until)
+        later_balances = (
+            transfers.filter(
+                models.Transfer.date
+                >= balance_checkpoints.start_of_day(
+                    checkpointed_until + timedelta(days=1)
+                )
             )
             .with_entities(
-                models.Transfer,
-                debtor_aliases.member,
-                debtor_aliases.company,
-                debtor_aliases.social_accounting,
-                debtor_aliases.cooperation,
-                creditor_aliases.member,
-                creditor_aliases.company,
-                creditor_aliases.social_accounting,
-                creditor_aliases.cooperation,
+                literal(1),
+                type_coerce(null(), Date),
+                models.Transfer.date,
+                func.coalesce(
+                    balance_checkpoints.latest_checkpoint_balance(
+                        account, checkpointed_until
+                    ),
+                    0,
+                )
+                + running_balance,
             )
+            .group_by(models.Transfer.date)
+            .order_by(None)
         )
+        balances = union_all(checkpoint_balances, later_balances.statement).subquery()
+        query = self.db.session.query(
+            balances.c.day, balances.c.date, balances.c.balance
+        ).order_by(balances.c.part, balances.c.day, balances.c.date)
         return SqlQueryResult(
             query=query,
-            mapper=self.map_transfer_and_debtor_and_creditor,
             db=self.db,
+            mapper=lambda row: (
+                (
+                    row.date
+                    if row.day is None
+                    else balance_checkpoints.start_of_day(row.day + timedelta(days=1))
+                ),
+                Decimal(row.balance),
+            ),
         )
 
-    def _create_account_owner_aliases(self):
-        class AccountOwnerAliases:
-            def __init__(self):
-                self.member = aliased(models.Member)
-                self.company = aliased(models.Company)
-                self.social_accounting = aliased(models.SocialAccounting)
-                self.cooperation = aliased(models.Cooperation)
-
-        return AccountOwnerAliases()
+    def summed_by_creditor_and_type(
+        self,
+    ) -> SqlQueryResult[Tuple[UUID, TransferType, Decimal]]:
+        return self._summed_by_account_and_type(models.Transfer.credit_account)
 
-    @classmethod
-    def map_transfer_and_debtor_and_creditor(
-        cls, orm: Any
-    ) -> Tuple[records.Transfer, records.AccountOwner, records.AccountOwner]:
-        (
-            transfer,
-            debtor_member,
-            debtor_company,
-            debtor_social_accounting,
-            debtor_cooperation,
-            creditor_member,
-            creditor_company,
-            creditor_social_accounting,
-            creditor_cooperation,
-        ) = orm
-
-        debtor_owner = cls._determine_account_owner(
-            debtor_member, debtor_company, debtor_social_accounting, debtor_cooperation
-        )
-        creditor_owner = cls._determine_account_owner(
-            creditor_member,
-            creditor_company,
-            creditor_social_accounting,
-            creditor_cooperation,
-        )
+    def summed_by_debtor_and_type(
+        self,
+    ) -> SqlQueryResult[Tuple[UUID, TransferType, Decimal]]:
+        return self._summed_by_account_and_type(models.Transfer.debit_account)
 
-        return (
-            DatabaseGatewayImpl.transfer_from_orm(transfer),
-            debtor_owner,
-            creditor_owner,
+    def _summed_by_account_and_type(
+        self, account: Any
+    ) -> SqlQueryResult[Tuple[UUID, TransferType, Decimal]]:
+        query = (
+            self.query.with_entities(
+                account, models.Transfer.type, func.sum(models.Transfer.value)
+            )
+            .group_by(account, models.Transfer.type)
+            .order_by(None)
         )
-
-    @classmethod
-    def _determine_account_owner(
-        cls, member, company, social_accounting, cooperation
-    ) -> records.AccountOwner:
-        if member:
-            return DatabaseGatewayImpl.member_from_orm(member)
-        elif company:
-            return DatabaseGatewayImpl.company_from_orm(company)
-        elif social_accounting:
-            return AccountingRepository.social_accounting_from_orm(social_accounting)
-        else:
-            assert cooperation
-            return DatabaseGatewayImpl.cooperation_from_orm(cooperation)
-
-    def ordered_by_date(
-        self, *, ascending: bool = True
-    ) -> SqlQueryResult[records.Transfer]:
-        ordering = (
-            models.Transfer.date.asc() if ascending else models.Transfer.date.desc()
+        return SqlQueryResult(
+            query=query,
+            db=self.db,
+            mapper=lambda row: (row[0], row[1], Decimal(row[2])),
         )
-        return self._with_modified_query(lambda query: query.order_by(ordering))
 
 
 class AccountQueryResult(SqlQueryResult[records.Account]):
     def with_id(self, *id_: UUID) -> Self:
-        ids = list(map(str, id_))
         return self._with_modified_query(
-            lambda query: query.filter(models.Account.id.in_(ids))
+            lambda query: query.filter(models.Account.id.in_(id_))
         )
 
     def owned_by_member(self, *members: UUID) -> Self:
@@ -1113,21 +1345,18 @@ class AccountQueryResult(SqlQueryResult[records.Account]):
         return self._with_modified_query(
             lambda query: query.join(
                 member, member.account == models.Account.id
-            ).filter(member.id.in_([str(m) for m in members]))
+            ).filter(member.id.in_(members))
         )
 
     def owned_by_company(self, *companies: UUID) -> Self:
-        company = aliased(models.Company)
+        account_owner = aliased(models.AccountOwner)
         return self._with_modified_query(
             lambda query: query.join(
-                company,
-                or_(
-                    company.p_account == models.Account.id,
-                    company.r_account == models.Account.id,
-                    company.a_account == models.Account.id,
-                    company.prd_account == models.Account.id,
-                ),
-            ).filter(company.id.in_([str(c) for c in companies]))
+                account_owner, account_owner.account == models.Account.id
+            ).filter(
+                account_owner.owner_type == models.AccountOwnerType.company,
+                account_owner.owner_id.in_(companies),
+            )
         )
 
     def that_are_member_accounts(self) -> Self:
@@ -1149,40 +1378,13 @@ class AccountQueryResult(SqlQueryResult[records.Account]):
         )
 
     def joined_with_balance(self) -> SqlQueryResult[Tuple[records.Account, Decimal]]:
-        from sqlalchemy import func, select
-
-        tf_credited = (
-            select(
-                models.Transfer.credit_account.label("account_id"),
-                func.sum(models.Transfer.value).label("credited"),
-            )
-            .group_by(models.Transfer.credit_account)
-            .subquery()
+        account_balance = aliased(models.AccountBalance)
+        query = self.query.outerjoin(
+            account_balance, account_balance.account == models.Account.id
+        ).with_entities(
+            models.Account,
+            func.coalesce(account_balance.balance, 0).label("balance"),
         )
-
-        tf_debited = (
-            select(
-                models.Transfer.debit_account.label("account_id"),
-                func.sum(models.Transfer.value).label("debited"),
-            )
-            .group_by(models.Transfer.debit_account)
-            .subquery()
-        )
-
-        query = (
-            self.query.outerjoin(
-                tf_credited, models.Account.id == tf_credited.c.account_id
-            )
-            .outerjoin(tf_debited, models.Account.id == tf_debited.c.account_id)
-            .with_entities(
-                models.Account,
-                (
-                    func.coalesce(tf_credited.c.credited, 0)
-                    - func.coalesce(tf_debited.c.debited, 0)
-                ).label("balance"),
-            )
-        )
-
         return SqlQueryResult(
             query=query,
             db=self.db,
@@ -1213,7 +1415,7 @@ class ProductiveConsumptionResult(SqlQueryResult[records.ProductiveConsumption])
                     account.id == consuming_company.r_account,
                 ),
             )
-            .filter(consuming_company.id == str(company))
+            .filter(consuming_company.id == company)
         )
 
     def where_provider_is_company(self, company: UUID) -> Self:
@@ -1231,7 +1433,7 @@ class ProductiveConsumptionResult(SqlQueryResult[records.ProductiveConsumption])
                 providing_company,
                 account.id == providing_company.prd_account,
             )
-            .filter(providing_company.id == str(company))
+            .filter(providing_company.id == company)
         )
 
     def ordered_by_creation_date(self, *, ascending: bool = True) -> Self:
@@ -1338,30 +1540,12 @@ class ProductiveConsumptionResult(SqlQueryResult[records.ProductiveConsumption])
             records.Company,
         ]
     ]:
-        def mapper(
-            orm,
-        ) -> Tuple[
-            records.ProductiveConsumption,
-            records.Transfer,
-            records.Plan,
-            records.Company,
-        ]:
-            consumption_orm, transfer_orm, plan_orm, company_orm = orm
-            return (
-                DatabaseGatewayImpl.productive_consumption_from_orm(consumption_orm),
-                DatabaseGatewayImpl.transfer_from_orm(transfer_orm),
-                DatabaseGatewayImpl.plan_from_orm(plan_orm),
-                DatabaseGatewayImpl.company_from_orm(company_orm),
-            )
-
         transfer = aliased(models.Transfer)
         account = aliased(models.Account)
         plan = aliased(models.Plan)
         company = aliased(models.Company)
-        return SqlQueryResult(
-            db=self.db,
-            mapper=mapper,
-            query=self.query.join(
+        query, build = _select_projections(
+            self.query.join(
                 transfer,
                 models.ProductiveConsumption.transfer_of_productive_consumption
                 == transfer.id,
@@ -1374,8 +1558,43 @@ class ProductiveConsumptionResult(SqlQueryResult[records.ProductiveConsumption])
                     company.r_account == account.id,
                 ),
             )
+            .join(plan, models.ProductiveConsumption.plan_id == plan.id),
+            DatabaseGatewayImpl.productive_consumption_projection(),
+            DatabaseGatewayImpl.transfer_projection(transfer),
+            DatabaseGatewayImpl.plan_projection(plan),
+            DatabaseGatewayImpl.company_projection(company),
+        )
+        return SqlQueryResult(db=self.db, mapper=build, query=query)
+
+    def grouped_by_provider(
+        self,
+    ) -> SqlQueryResult[Tuple[records.Company, Decimal]]:
+        transfer = aliased(models.Transfer)
+        plan = aliased(models.Plan)
+        provider = aliased(models.Company)
+        volumes = (
+            self.query.join(
+                transfer,
+                models.ProductiveConsumption.transfer_of_productive_consumption
+                == transfer.id,
+            )
             .join(plan, models.ProductiveConsumption.plan_id == plan.id)
-            .with_entities(models.ProductiveConsumption, transfer, plan, company),
+            .with_entities(
+                plan.planner.label("provider"),
+                func.sum(transfer.value).label("volume"),
+            )
+            .group_by(plan.planner)
+            .order_by(None)
+            .subquery()
+        )
+        projection = DatabaseGatewayImpl.company_projection(provider)
+        query = self.db.session.query(*projection.columns, volumes.c.volume).join(
+            volumes, volumes.c.provider == provider.id
+        )
+        return SqlQueryResult(
+            db=self.db,
+            mapper=lambda row: (projection.build(row[:-1]), Decimal(row[-1])),
+            query=query,
         )
 
 
@@ -1395,7 +1614,7 @@ class PrivateConsumptionResult(SqlQueryResult[records.PrivateConsumption]):
                 consuming_member,
                 account.id == consuming_member.account,
             )
-            .filter(consuming_member.id == str(member))
+            .filter(consuming_member.id == member)
         )
 
     def ordered_by_creation_date(self, *, ascending: bool = True) -> Self:
@@ -1424,7 +1643,7 @@ class PrivateConsumptionResult(SqlQueryResult[records.PrivateConsumption]):
                 providing_company,
                 account.id == providing_company.prd_account,
             )
-            .filter(providing_company.id == str(company))
+            .filter(providing_company.id == company)
         )
 
     def joined_with_transfer_and_plan(
@@ -1466,30 +1685,12 @@ class PrivateConsumptionResult(SqlQueryResult[records.PrivateConsumption]):
             records.Member,
         ]
     ]:
-        def mapper(
-            orm,
-        ) -> Tuple[
-            records.PrivateConsumption,
-            records.Transfer,
-            records.Plan,
-            records.Member,
-        ]:
-            consumption_orm, transfer_orm, plan_orm, member_orm = orm
-            return (
-                DatabaseGatewayImpl.private_consumption_from_orm(consumption_orm),
-                DatabaseGatewayImpl.transfer_from_orm(transfer_orm),
-                DatabaseGatewayImpl.plan_from_orm(plan_orm),
-                DatabaseGatewayImpl.member_from_orm(member_orm),
-            )
-
         transfer = aliased(models.Transfer)
         account = aliased(models.Account)
         plan = aliased(models.Plan)
         member = aliased(models.Member)
-        return SqlQueryResult(
-            db=self.db,
-            mapper=mapper,
-            query=self.query.join(
+        query, build = _select_projections(
+            self.query.join(
                 transfer,
                 models.PrivateConsumption.transfer_of_private_consumption
                 == transfer.id,
@@ -1499,15 +1700,19 @@ class PrivateConsumptionResult(SqlQueryResult[records.PrivateConsumption]):
                 member,
                 account.id == member.account,
             )
-            .join(plan, models.PrivateConsumption.plan_id == plan.id)
-            .with_entities(models.PrivateConsumption, transfer, plan, member),
+            .join(plan, models.PrivateConsumption.plan_id == plan.id),
+            DatabaseGatewayImpl.private_consumption_projection(),
+            DatabaseGatewayImpl.transfer_projection(transfer),
+            DatabaseGatewayImpl.plan_projection(plan),
+            DatabaseGatewayImpl.member_projection(member),
         )
+        return SqlQueryResult(db=self.db, mapper=build, query=query)
 
 
 class CooperationResult(SqlQueryResult[records.Cooperation]):
     def with_id(self, id_: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.Cooperation.id == str(id_))
+            lambda query: query.filter(models.Cooperation.id == id_)
         )
 
     def with_name_ignoring_case(self, name: str) -> Self:
@@ -1526,7 +1731,7 @@ class CooperationResult(SqlQueryResult[records.Cooperation]):
             .limit(1)
             .scalar_subquery()
         )
-        query = self.query.filter(most_recent_tenure_holder == str(company_id))
+        query = self.query.filter(most_recent_tenure_holder == company_id)
         return self._with_modified_query(lambda _: query)
 
     def of_plan(self, plan_id: UUID) -> Self:
@@ -1535,9 +1740,19 @@ class CooperationResult(SqlQueryResult[records.Cooperation]):
             lambda query: query.join(
                 plan_cooperation,
                 plan_cooperation.cooperation == models.Cooperation.id,
-            ).filter(plan_cooperation.plan == str(plan_id))
+            ).filter(plan_cooperation.plan == plan_id)
         )
 
+    def ordered_by_name(self, *, ascending: bool = True) -> Self:
+        if ascending:
+            orderings: List[UnaryExpression[Any]] = [
+                models.Cooperation.name.asc(),
+                models.Cooperation.id.asc(),
+            ]
+        else:
+            orderings = [models.Cooperation.name.desc(), models.Cooperation.id.desc()]
+        return self._with_modified_query(lambda query: query.order_by(*orderings))
+
     def joined_with_current_coordinator(
         self,
     ) -> SqlQueryResult[Tuple[records.Cooperation, records.Company]]:
@@ -1570,17 +1785,47 @@ class CooperationResult(SqlQueryResult[records.Cooperation]):
             mapper=mapper,
         )
 
+    def joined_with_active_plan_count(
+        self, timestamp: datetime
+    ) -> SqlQueryResult[Tuple[records.Cooperation, int]]:
+        plan_cooperation = aliased(models.PlanCooperation)
+        approval = aliased(models.PlanApproval)
+        active_plan_counts = (
+            select(
+                plan_cooperation.cooperation.label("cooperation"),
+                func.count().label("plan_count"),
+            )
+            .select_from(plan_cooperation)
+            .join(approval, approval.plan_id == plan_cooperation.plan)
+            .where(approval.expiration_date > timestamp)
+            .group_by(plan_cooperation.cooperation)
+            .subquery()
+        )
+        projection = DatabaseGatewayImpl.cooperation_projection()
+        query = self.query.outerjoin(
+            active_plan_counts,
+            active_plan_counts.c.cooperation == models.Cooperation.id,
+        ).with_entities(
+            *projection.columns,
+            func.coalesce(active_plan_counts.c.plan_count, 0),
+        )
+        return SqlQueryResult(
+            db=self.db,
+            query=query,
+            mapper=lambda row: (projection.build(row[:-1]), row[-1]),
+        )
+
 
 class CoordinationTenureResult(SqlQueryResult[records.CoordinationTenure]):
     def with_id(self, id_: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.CoordinationTenure.id == str(id_))
+            lambda query: query.filter(models.CoordinationTenure.id == id_)
         )
 
     def of_cooperation(self, cooperation_id: UUID) -> Self:
         return self._with_modified_query(
             lambda query: query.filter(
-                models.CoordinationTenure.cooperation == str(cooperation_id)
+                models.CoordinationTenure.cooperation == cooperation_id
             )
         )
 
@@ -1621,16 +1866,14 @@ class CoordinationTransferRequestResult(
 ):
     def with_id(self, id_: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(
-                models.CoordinationTransferRequest.id == str(id_)
-            )
+            lambda query: query.filter(models.CoordinationTransferRequest.id == id_)
         )
 
     def requested_by(self, coordination_tenure: UUID) -> Self:
         return self._with_modified_query(
             lambda query: query.filter(
                 models.CoordinationTransferRequest.requesting_coordination_tenure
-                == str(coordination_tenure)
+                == coordination_tenure
             )
         )
 
@@ -1670,17 +1913,17 @@ class CoordinationTransferRequestResult(
 class CompanyWorkInviteResult(SqlQueryResult[records.CompanyWorkInvite]):
     def with_id(self, id: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.CompanyWorkInvite.id == str(id))
+            lambda query: query.filter(models.CompanyWorkInvite.id == id)
         )
 
     def issued_by(self, company: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.CompanyWorkInvite.company == str(company))
+            lambda query: query.filter(models.CompanyWorkInvite.company == company)
         )
 
     def addressing(self, member: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.CompanyWorkInvite.member == str(member))
+            lambda query: query.filter(models.CompanyWorkInvite.member == member)
         )
 
     def delete(self) -> None:
@@ -1721,7 +1964,7 @@ class EmailAddressResult(SqlQueryResult[records.EmailAddress]):
         return self._with_modified_query(
             lambda query: query.join(user, user.email_address == models.Email.address)
             .join(members, members.user_id == user.id)
-            .filter(members.id == str(member))
+            .filter(members.id == member)
         )
 
     def that_belong_to_company(self, company: UUID) -> Self:
@@ -1730,7 +1973,7 @@ class EmailAddressResult(SqlQueryResult[records.EmailAddress]):
         return self._with_modified_query(
             lambda query: query.join(user, user.email_address == models.Email.address)
             .join(companies, companies.user_id == user.id)
-            .filter(companies.id == str(company))
+            .filter(companies.id == company)
         )
 
     def delete(self) -> None:
@@ -1771,9 +2014,7 @@ class EmailAddressUpdate:
 class RegisteredHoursWorkedResult(SqlQueryResult[records.RegisteredHoursWorked]):
     def at_company(self, company: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(
-                models.RegisteredHoursWorked.company == str(company)
-            )
+            lambda query: query.filter(models.RegisteredHoursWorked.company == company)
         )
 
     def ordered_by_registration_time(self, *, is_ascending: bool = True) -> Self:
@@ -1875,7 +2116,6 @@ class RegisteredHoursWorkedResult(SqlQueryResult[records.RegisteredHoursWorked])
 
 class AccountCredentialsResult(SqlQueryResult[records.AccountCredentials]):
     def for_user_account_with_id(self, user_id: UUID) -> Self:
-        id_ = str(user_id)
         member = aliased(models.Member)
         company = aliased(models.Company)
         accountant = aliased(models.Accountant)
@@ -1885,7 +2125,13 @@ class AccountCredentialsResult(SqlQueryResult[records.AccountCredentials]):
             )
             .join(company, company.user_id == models.User.id, isouter=True)
             .join(accountant, accountant.user_id == models.User.id, isouter=True)
-            .filter(or_(member.id == id_, company.id == id_, accountant.id == id_))
+            .filter(
+                or_(
+                    member.id == user_id,
+                    company.id == user_id,
+                    accountant.id == user_id,
+                )
+            )
         )
 
     def with_email_address(self, address: str) -> Self:
@@ -2111,8 +2357,17 @@ class AccountingRepository:
         cls, accounting_orm: SocialAccounting
     ) -> records.SocialAccounting:
         return records.SocialAccounting(
-            id=UUID(accounting_orm.id),
-            account_psf=UUID(accounting_orm.account_psf),
+            id=accounting_orm.id,
+            account_psf=accounting_orm.account_psf,
+        )
+
+    @classmethod
+    def social_accounting_projection(
+        cls, social_accounting: Any = SocialAccounting
+    ) -> Projection[records.SocialAccounting]:
+        return Projection(
+            columns=(social_accounting.id, social_accounting.account_psf),
+            build=lambda row: records.SocialAccounting(id=row[0], account_psf=row[1]),
         )
 
     def get_or_create_social_accounting(self) -> records.SocialAccounting:
@@ -2124,17 +2379,22 @@ class AccountingRepository:
         social_accounting = self.db.session.query(models.SocialAccounting).first()
         if not social_accounting:
             social_accounting = SocialAccounting(
-                id=str(uuid4()),
+                id=uuid4(),
             )
             account_psf = self.database_gateway.create_account()
-            social_accounting.account_psf = str(account_psf.id)
+            social_accounting.account_psf = account_psf.id
             self.db.session.add(social_accounting)
+            self.database_gateway.add_account_owners(
+                models.AccountOwnerType.social_accounting,
+                social_accounting.id,
+                {records.AccountTypes.psf: social_accounting.account_psf},
+            )
             self.db.session.flush()
         return social_accounting
 
     def get_by_id(self, id: UUID) -> Optional[records.SocialAccounting]:
         accounting_orm = (
-            self.db.session.query(SocialAccounting).filter_by(id=str(id)).first()
+            self.db.session.query(SocialAccounting).filter_by(id=id).first()
         )
         if accounting_orm is None:
             return None
@@ -2169,14 +2429,13 @@ class DatabaseGatewayImpl:
         plan: UUID,
     ) -> records.ProductiveConsumption:
         orm = models.ProductiveConsumption(
-            plan_id=str(plan),
-            transfer_of_productive_consumption=str(transfer_of_productive_consumption),
-            transfer_of_compensation=(
-                str(transfer_of_compensation) if transfer_of_compensation else None
-            ),
+            plan_id=plan,
+            transfer_of_productive_consumption=transfer_of_productive_consumption,
+            transfer_of_compensation=transfer_of_compensation,
             amount=amount,
         )
         self.db.session.add(orm)
+        self._increase_consumed_amount(plan, amount)
         self.db.session.flush()
         return self.productive_consumption_from_orm(orm)
 
@@ -2192,19 +2451,38 @@ class DatabaseGatewayImpl:
         cls, orm: models.ProductiveConsumption
     ) -> records.ProductiveConsumption:
         return records.ProductiveConsumption(
-            id=UUID(orm.id),
-            plan_id=UUID(orm.plan_id),
-            transfer_of_productive_consumption=UUID(
-                orm.transfer_of_productive_consumption
-            ),
-            transfer_of_compensation=(
-                UUID(orm.transfer_of_compensation)
-                if orm.transfer_of_compensation
-                else None
-            ),
+            id=orm.id,
+            plan_id=orm.plan_id,
+            transfer_of_productive_consumption=orm.transfer_of_productive_consumption,
+            transfer_of_compensation=orm.transfer_of_compensation,
             amount=orm.amount,
         )
 
+    @classmethod
+    def productive_consumption_projection(
+        cls, consumption: Any = models.ProductiveConsumption
+    ) -> Projection[records.ProductiveConsumption]:
+        def build(row: Sequence[Any]) -> records.ProductiveConsumption:
+            id_, plan_id, transfer, transfer_of_compensation, amount = row
+            return records.ProductiveConsumption(
+                id=id_,
+                plan_id=plan_id,
+                transfer_of_productive_consumption=transfer,
+                transfer_of_compensation=transfer_of_compensation,
+                amount=amount,
+            )
+
+        return Projection(
+            columns=(
+                consumption.id,
+                consumption.plan_id,
+                consumption.transfer_of_productive_consumption,
+                consumption.transfer_of_compensation,
+                consumption.amount,
+            ),
+            build=build,
+        )
+
     def create_private_consumption(
         self,
         transfer_of_private_consumption: UUID,
@@ -2213,18 +2491,25 @@ class DatabaseGatewayImpl:
         plan: UUID,
     ) -> records.PrivateConsumption:
         orm = models.PrivateConsumption(
-            id=str(uuid4()),
-            plan_id=str(plan),
-            transfer_of_private_consumption=str(transfer_of_private_consumption),
-            transfer_of_compensation=(
-                str(transfer_of_compensation) if transfer_of_compensation else None
-            ),
+            id=uuid4(),
+            plan_id=plan,
+            transfer_of_private_consumption=transfer_of_private_consumption,
+            transfer_of_compensation=transfer_of_compensation,
             amount=amount,
         )
         self.db.session.add(orm)
+        self._increase_consumed_amount(plan, amount)
         self.db.session.flush()
         return self.private_consumption_from_orm(orm)
 
+    def _increase_consumed_amount(self, plan: UUID, amount: int) -> None:
+        self.db.session.execute(
+            update(models.Plan)
+            .where(models.Plan.id == plan)
+            .values(consumed_amount=models.Plan.consumed_amount + amount)
+            .execution_options(synchronize_session=False)
+        )
+
     def get_private_consumptions(self) -> PrivateConsumptionResult:
         return PrivateConsumptionResult(
             db=self.db,
@@ -2237,17 +2522,38 @@ class DatabaseGatewayImpl:
         cls, orm: models.PrivateConsumption
     ) -> records.PrivateConsumption:
         return records.PrivateConsumption(
-            id=UUID(orm.id),
-            plan_id=UUID(orm.plan_id),
-            transfer_of_private_consumption=UUID(orm.transfer_of_private_consumption),
-            transfer_of_compensation=(
-                UUID(orm.transfer_of_compensation)
-                if orm.transfer_of_compensation
-                else None
-            ),
+            id=orm.id,
+            plan_id=orm.plan_id,
+            transfer_of_private_consumption=orm.transfer_of_private_consumption,
+            transfer_of_compensation=orm.transfer_of_compensation,
             amount=orm.amount,
         )
 
+    @classmethod
+    def private_consumption_projection(
+        cls, consumption: Any = models.PrivateConsumption
+    ) -> Projection[records.PrivateConsumption]:
+        def build(row: Sequence[Any]) -> records.PrivateConsumption:
+            id_, plan_id, transfer, transfer_of_compensation, amount = row
+            return records.PrivateConsumption(
+                id=id_,
+                plan_id=plan_id,
+                transfer_of_private_consumption=transfer,
+                transfer_of_compensation=transfer_of_compensation,
+                amount=amount,
+            )
+
+        return Projection(
+            columns=(
+                consumption.id,
+                consumption.plan_id,
+                consumption.transfer_of_private_consumption,
+                consumption.transfer_of_compensation,
+                consumption.amount,
+            ),
+            build=build,
+        )
+
     def get_plans(self) -> PlanQueryResult:
         return PlanQueryResult(
             query=self.db.session.query(models.Plan),
@@ -2268,9 +2574,9 @@ class DatabaseGatewayImpl:
         is_public_service: bool,
     ) -> records.Plan:
         plan = models.Plan(
-            id=str(uuid4()),
+            id=uuid4(),
             plan_creation_date=creation_timestamp,
-            planner=str(planner),
+            planner=planner,
             costs_p=production_costs.means_cost,
             costs_r=production_costs.resource_cost,
             costs_a=production_costs.labour_cost,
@@ -2295,9 +2601,9 @@ class DatabaseGatewayImpl:
             means_cost=plan.costs_p,
         )
         return records.Plan(
-            id=UUID(plan.id),
+            id=plan.id,
             plan_creation_date=plan.plan_creation_date,
-            planner=UUID(plan.planner),
+            planner=plan.planner,
             production_costs=production_costs,
             prd_name=plan.prd_name,
             prd_unit=plan.prd_unit,
@@ -2307,12 +2613,89 @@ class DatabaseGatewayImpl:
             is_public_service=plan.is_public_service,
             approval_date=plan.approval.date if plan.approval else None,
             rejection_date=plan.review.rejection_date if plan.review else None,
-            requested_cooperation=(
-                UUID(plan.requested_cooperation) if plan.requested_cooperation else None
-            ),
+            requested_cooperation=plan.requested_cooperation,
             hidden_by_user=plan.hidden_by_user,
         )
 
+    @classmethod
+    def plan_projection(cls, plan: Any = models.Plan) -> Projection[records.Plan]:
+        """The approval and rejection dates are selected with correlated
+        subqueries instead of being loaded through the relationships of
+        the plan.
+        """
+        approval_date = (
+            select(models.PlanApproval.date)
+            .where(models.PlanApproval.plan_id == plan.id)
+            .scalar_subquery()
+        )
+        rejection_date = (
+            select(models.PlanReview.rejection_date)
+            .where(models.PlanReview.plan_id == plan.id)
+            .scalar_subquery()
+        )
+
+        def build(row: Sequence[Any]) -> records.Plan:
+            (
+                id_,
+                plan_creation_date,
+                planner,
+                costs_a,
+                costs_r,
+                costs_p,
+                prd_name,
+                prd_unit,
+                prd_amount,
+                description,
+                timeframe,
+                is_public_service,
+                approval_date,
+                rejection_date,
+                requested_cooperation,
+                hidden_by_user,
+            ) = row
+            return records.Plan(
+                id=id_,
+                plan_creation_date=plan_creation_date,
+                planner=planner,
+                production_costs=records.ProductionCosts(
+                    labour_cost=costs_a,
+                    resource_cost=costs_r,
+                    means_cost=costs_p,
+                ),
+                prd_name=prd_name,
+                prd_unit=prd_unit,
+                prd_amount=prd_amount,
+                description=description,
+                timeframe=int(timeframe),
+                is_public_service=is_public_service,
+                approval_date=approval_date,
+                rejection_date=rejection_date,
+                requested_cooperation=requested_cooperation,
+                hidden_by_user=hidden_by_user,
+            )
+
+        return Projection(
+            columns=(
+                plan.id,
+                plan.plan_creation_date,
+                plan.planner,
+                plan.costs_a,
+                plan.costs_r,
+                plan.costs_p,
+                plan.prd_name,
+                plan.prd_unit,
+                plan.prd_amount,
+                plan.description,
+                plan.timeframe,
+                plan.is_public_service,
+                approval_date,
+                rejection_date,
+                plan.requested_cooperation,
+                plan.hidden_by_user,
+            ),
+            build=build,
+        )
+
     def create_cooperation(
         self,
         creation_timestamp: datetime,
@@ -2321,12 +2704,18 @@ class DatabaseGatewayImpl:
         account: UUID,
     ) -> records.Cooperation:
         cooperation = models.Cooperation(
+            id=uuid4(),
             creation_date=creation_timestamp,
             name=name,
             definition=definition,
-            account=str(account),
+            account=account,
         )
         self.db.session.add(cooperation)
+        self.add_account_owners(
+            models.AccountOwnerType.cooperation,
+            cooperation.id,
+            {records.AccountTypes.cooperation: cooperation.account},
+        )
         self.db.session.flush()
         return self.cooperation_from_orm(cooperation)
 
@@ -2340,18 +2729,39 @@ class DatabaseGatewayImpl:
     @classmethod
     def cooperation_from_orm(cls, orm: models.Cooperation) -> records.Cooperation:
         return records.Cooperation(
-            id=UUID(orm.id),
+            id=orm.id,
             creation_date=orm.creation_date,
             name=orm.name,
             definition=orm.definition,
-            account=UUID(orm.account),
+            account=orm.account,
+        )
+
+    @classmethod
+    def cooperation_projection(
+        cls, cooperation: Any = models.Cooperation
+    ) -> Projection[records.Cooperation]:
+        return Projection(
+            columns=(
+                cooperation.id,
+                cooperation.creation_date,
+                cooperation.name,
+                cooperation.definition,
+                cooperation.account,
+            ),
+            build=lambda row: records.Cooperation(
+                id=row[0],
+                creation_date=row[1],
+                name=row[2],
+                definition=row[3],
+                account=row[4],
+            ),
         )
 
     def create_coordination_tenure(
         self, company: UUID, cooperation: UUID, start_date: datetime
     ) -> records.CoordinationTenure:
         coordination = models.CoordinationTenure(
-            company=str(company), cooperation=str(cooperation), start_date=start_date
+            company=company, cooperation=cooperation, start_date=start_date
         )
         self.db.session.add(coordination)
         self.db.session.flush()
@@ -2369,9 +2779,9 @@ class DatabaseGatewayImpl:
         cls, orm: models.CoordinationTenure
     ) -> records.CoordinationTenure:
         return records.CoordinationTenure(
-            id=UUID(orm.id),
-            company=UUID(orm.company),
-            cooperation=UUID(orm.cooperation),
+            id=orm.id,
+            company=orm.company,
+            cooperation=orm.cooperation,
             start_date=orm.start_date,
         )
 
@@ -2382,9 +2792,9 @@ class DatabaseGatewayImpl:
         request_date: datetime,
     ) -> records.CoordinationTransferRequest:
         orm = models.CoordinationTransferRequest(
-            id=str(uuid4()),
-            requesting_coordination_tenure=str(requesting_coordination_tenure),
-            candidate=str(candidate),
+            id=uuid4(),
+            requesting_coordination_tenure=requesting_coordination_tenure,
+            candidate=candidate,
             request_date=request_date,
         )
         self.db.session.add(orm)
@@ -2403,25 +2813,62 @@ class DatabaseGatewayImpl:
         cls, coordination_transfer_request: models.CoordinationTransferRequest
     ) -> records.CoordinationTransferRequest:
         return records.CoordinationTransferRequest(
-            id=UUID(coordination_transfer_request.id),
-            requesting_coordination_tenure=UUID(
-                coordination_transfer_request.requesting_coordination_tenure
-            ),
-            candidate=UUID(coordination_transfer_request.candidate),
+            id=coordination_transfer_request.id,
+            requesting_coordination_tenure=coordination_transfer_request.requesting_coordination_tenure,
+            candidate=coordination_transfer_request.candidate,
             request_date=coordination_transfer_request.request_date,
         )
 
     @classmethod
     def transfer_from_orm(cls, transfer: models.Transfer) -> records.Transfer:
         return records.Transfer(
-            id=UUID(transfer.id),
+            id=transfer.id,
             date=transfer.date,
-            debit_account=UUID(transfer.debit_account),
-            credit_account=UUID(transfer.credit_account),
+            debit_account=transfer.debit_account,
+            credit_account=transfer.credit_account,
             value=Decimal(transfer.value),
             type=transfer.type,
         )
 
+    @classmethod
+    def transfer_projection(
+        cls, transfer: Any = models.Transfer
+    ) -> Projection[records.Transfer]:
+        return Projection(
+            columns=(
+                transfer.id,
+                transfer.date,
+                transfer.debit_account,
+                transfer.credit_account,
+                transfer.value,
+                transfer.type,
+            ),
+            build=lambda row: records.Transfer(
+                id=row[0],
+                date=row[1],
+                debit_account=row[2],
+                credit_account=row[3],
+                value=Decimal(row[4]),
+                type=row[5],
+            ),
+        )
+
+    KNOWN_TRANSFER_TYPES = [
+        "credit_p",
+        "credit_r",
+        "credit_a",
+        "credit_public_p",
+        "credit_public_r",
+        "credit_public_a",
+        "private_consumption",
+        "productive_consumption_p",
+        "productive_consumption_r",
+        "compensation_for_coop",
+        "compensation_for_company",
+        "work_certificates",
+        "taxes",
+    ]
+
     def create_transfer(
         self,
         date: datetime,
@@ -2430,42 +2877,84 @@ class DatabaseGatewayImpl:
         value: Decimal,
         type: TransferType,
     ) -> records.Transfer:
-        KNOWN_TRANSFER_TYPES = [
-            "credit_p",
-            "credit_r",
-            "credit_a",
-            "credit_public_p",
-            "credit_public_r",
-            "credit_public_a",
-            "private_consumption",
-            "productive_consumption_p",
-            "productive_consumption_r",
-            "compensation_for_coop",
-            "compensation_for_company",
-            "work_certificates",
-            "taxes",
+        [transfer] = self.create_transfers(
+            [
+                NewTransfer(
+                    date=date,
+                    debit_account=debit_account,
+                    credit_account=credit_account,
+                    value=value,
+                    type=type,
+                )
+            ]
+        )
+        return transfer
+
+    def create_transfers(
+        self, transfers: Sequence[NewTransfer]
+    ) -> List[records.Transfer]:
+        for new_transfer in transfers:
+            if new_transfer.type.value not in self.KNOWN_TRANSFER_TYPES:
+                raise ValueError(
+                    f"Invalid transfer type: {new_transfer.type}. Check if you need to create a db migration for {new_transfer.type.value}. Then add it to the whitelist."
+                )
+        if not transfers:
+            return []
+        created = [
+            records.Transfer(
+                id=uuid4(),
+                date=new_transfer.date,
+                debit_account=new_transfer.debit_account,
+                credit_account=new_transfer.credit_account,
+                value=new_transfer.value,
+                type=new_transfer.type,
+            )
+            for new_transfer in transfers
         ]
-        if type.value not in KNOWN_TRANSFER_TYPES:
-            raise ValueError(
-                f"Invalid transfer type: {type}. Check if you need to create a db migration for {type.value}. Then add it to the whitelist."
+        self.db.session.execute(
+            insert(models.Transfer),
+            [
+                dict(
+                    id=transfer.id,
+                    date=transfer.date,
+                    debit_account=transfer.debit_account,
+                    credit_account=transfer.credit_account,
+                    value=transfer.value,
+                    type=transfer.type,
+                )
+                for transfer in created
+            ],
+        )
+        balance_changes: Dict[UUID, Decimal] = dict()
+        for transfer in created:
+            debit_account = transfer.debit_account
+            credit_account = transfer.credit_account
+            balance_changes[debit_account] = (
+                balance_changes.get(debit_account, Decimal(0)) - transfer.value
             )
-        transfer = models.Transfer(
-            id=str(uuid4()),
-            date=date,
-            debit_account=str(debit_account),
-            credit_account=str(credit_account),
-            value=value,
-            type=type,
+            balance_changes[credit_account] = (
+                balance_changes.get(credit_account, Decimal(0)) + transfer.value
+            )
+        self._add_to_account_balances(balance_changes)
+        return created
+
+    def _add_to_account_balances(self, changes: Dict[UUID, Decimal]) -> None:
+        self.db.session.execute(
+            update(models.AccountBalance)
+            .where(models.AccountBalance.account.in_(changes))
+            .values(
+                balance=models.AccountBalance.balance
+                + case(changes, value=models.AccountBalance.account)
+            )
+            .execution_options(synchronize_session=False)
         )
-        self.db.session.add(transfer)
-        self.db.session.flush()
-        return self.transfer_from_orm(transfer)
 
     def get_transfers(self) -> TransferQueryResult:
+        projection = self.transfer_projection()
         return TransferQueryResult(
-            query=self.db.session.query(models.Transfer),
+            query=self.db.session.query(*projection.columns),
             db=self.db,
-            mapper=self.transfer_from_orm,
+            mapper=projection.build,
         )
 
     def get_company_work_invites(self) -> CompanyWorkInviteResult:
@@ -2479,9 +2968,9 @@ class DatabaseGatewayImpl:
         self, company: UUID, member: UUID
     ) -> records.CompanyWorkInvite:
         orm = models.CompanyWorkInvite(
-            id=str(uuid4()),
-            company=str(company),
-            member=str(member),
+            id=uuid4(),
+            company=company,
+            member=member,
         )
         self.db.session.add(orm)
         self.db.session.flush()
@@ -2492,20 +2981,29 @@ class DatabaseGatewayImpl:
         cls, orm: models.CompanyWorkInvite
     ) -> records.CompanyWorkInvite:
         return records.CompanyWorkInvite(
-            id=UUID(orm.id),
-            member=UUID(orm.member),
-            company=UUID(orm.company),
+            id=orm.id,
+            member=orm.member,
+            company=orm.company,
         )
 
     @classmethod
     def member_from_orm(cls, orm_object: Member) -> records.Member:
         return records.Member(
-            id=UUID(orm_object.id),
+            id=orm_object.id,
             name=orm_object.name,
-            account=UUID(orm_object.account),
+            account=orm_object.account,
             registered_on=orm_object.registered_on,
         )
 
+    @classmethod
+    def member_projection(cls, member: Any = Member) -> Projection[records.Member]:
+        return Projection(
+            columns=(member.id, member.name, member.account, member.registered_on),
+            build=lambda row: records.Member(
+                id=row[0], name=row[1], account=row[2], registered_on=row[3]
+            ),
+        )
+
     def create_member(
         self,
         *,
@@ -2515,16 +3013,37 @@ class DatabaseGatewayImpl:
         registered_on: datetime,
     ) -> records.Member:
         orm_member = Member(
-            id=str(uuid4()),
-            user_id=str(account_credentials),
+            id=uuid4(),
+            user_id=account_credentials,
             name=name,
-            account=str(account.id),
+            account=account.id,
             registered_on=registered_on,
         )
         self.db.session.add(orm_member)
+        self.add_account_owners(
+            models.AccountOwnerType.member,
+            orm_member.id,
+            {records.AccountTypes.member: orm_member.account},
+        )
         self.db.session.flush()
         return self.member_from_orm(orm_member)
 
+    def add_account_owners(
+        self,
+        owner_type: models.AccountOwnerType,
+        owner_id: UUID,
+        accounts: Dict[records.AccountTypes, UUID],
+    ) -> None:
+        self.db.session.add_all(
+            models.AccountOwner(
+                account=account,
+                owner_type=owner_type,
+                owner_id=owner_id,
+                account_role=account_role,
+            )
+            for account_role, account in accounts.items()
+        )
+
     def get_members(self) -> MemberQueryResult:
         return MemberQueryResult(
             mapper=self.member_from_orm,
@@ -2535,15 +3054,38 @@ class DatabaseGatewayImpl:
     @classmethod
     def company_from_orm(cls, company_orm: Company) -> records.Company:
         return records.Company(
-            id=UUID(company_orm.id),
+            id=company_orm.id,
             name=company_orm.name,
-            means_account=UUID(company_orm.p_account),
-            raw_material_account=UUID(company_orm.r_account),
-            work_account=UUID(company_orm.a_account),
-            product_account=UUID(company_orm.prd_account),
+            means_account=company_orm.p_account,
+            raw_material_account=company_orm.r_account,
+            work_account=company_orm.a_account,
+            product_account=company_orm.prd_account,
             registered_on=company_orm.registered_on,
         )
 
+    @classmethod
+    def company_projection(cls, company: Any = Company) -> Projection[records.Company]:
+        return Projection(
+            columns=(
+                company.id,
+                company.name,
+                company.p_account,
+                company.r_account,
+                company.a_account,
+                company.prd_account,
+                company.registered_on,
+            ),
+            build=lambda row: records.Company(
+                id=row[0],
+                name=row[1],
+                means_account=row[2],
+                raw_material_account=row[3],
+                work_account=row[4],
+                product_account=row[5],
+                registered_on=row[6],
+            ),
+        )
+
     def create_company(
         self,
         account_credentials: UUID,
@@ -2555,16 +3097,26 @@ class DatabaseGatewayImpl:
         registered_on: datetime,
     ) -> records.Company:
         company = models.Company(
-            id=str(uuid4()),
+            id=uuid4(),
             name=name,
             registered_on=registered_on,
-            user_id=str(account_credentials),
-            p_account=str(means_account.id),
-            r_account=str(resource_account.id),
-            a_account=str(labour_account.id),
-            prd_account=str(products_account.id),
+            user_id=account_credentials,
+            p_account=means_account.id,
+            r_account=resource_account.id,
+            a_account=labour_account.id,
+            prd_account=products_account.id,
         )
         self.db.session.add(company)
+        self.add_account_owners(
+            models.AccountOwnerType.company,
+            company.id,
+            {
+                records.AccountTypes.p: company.p_account,
+                records.AccountTypes.r: company.r_account,
+                records.AccountTypes.a: company.a_account,
+                records.AccountTypes.prd: company.prd_account,
+            },
+        )
         self.db.session.flush()
         return self.company_from_orm(company)
 
@@ -2579,9 +3131,9 @@ class DatabaseGatewayImpl:
         self, account_credentials: UUID, name: str
     ) -> records.Accountant:
         accountant = models.Accountant(
-            id=str(uuid4()),
+            id=uuid4(),
             name=name,
-            user_id=str(account_credentials),
+            user_id=account_credentials,
         )
         self.db.session.add(accountant)
         self.db.session.flush()
@@ -2598,7 +3150,7 @@ class DatabaseGatewayImpl:
     def accountant_from_orm(cls, orm: models.Accountant) -> records.Accountant:
         return records.Accountant(
             name=orm.name,
-            id=UUID(orm.id),
+            id=orm.id,
         )
 
     @classmethod
@@ -2642,9 +3194,9 @@ class DatabaseGatewayImpl:
         creation_timestamp: datetime,
     ) -> records.PlanDraft:
         orm = PlanDraft(
-            id=str(uuid4()),
+            id=uuid4(),
             plan_creation_date=creation_timestamp,
-            planner=str(planner),
+            planner=planner,
             costs_p=costs.means_cost,
             costs_r=costs.resource_cost,
             costs_a=costs.labour_cost,
@@ -2669,9 +3221,9 @@ class DatabaseGatewayImpl:
     @classmethod
     def plan_draft_from_orm(cls, orm: models.PlanDraft) -> records.PlanDraft:
         return records.PlanDraft(
-            id=UUID(orm.id),
+            id=orm.id,
             creation_date=orm.plan_creation_date,
-            planner=UUID(orm.planner),
+            planner=orm.planner,
             production_costs=records.ProductionCosts(
                 labour_cost=orm.costs_a,
                 resource_cost=orm.costs_r,
@@ -2688,12 +3240,15 @@ class DatabaseGatewayImpl:
     @classmethod
     def account_from_orm(cls, account_orm: Account) -> records.Account:
         return records.Account(
-            id=UUID(account_orm.id),
+            id=account_orm.id,
         )
 
     def create_account(self) -> records.Account:
-        account = Account(id=str(uuid4()))
+        account = Account(id=uuid4())
         self.db.session.add(account)
+        self.db.session.add(
+            models.AccountBalance(account=account.id, balance=Decimal(0))
+        )
         self.db.session.flush()
         return self.account_from_orm(account)
 
@@ -2708,7 +3263,7 @@ class DatabaseGatewayImpl:
         self, email_address: str, password_hash: str
     ) -> records.AccountCredentials:
         orm = models.User(
-            id=str(uuid4()),
+            id=uuid4(),
             password=password_hash,
             email_address=email_address,
         )
@@ -2726,7 +3281,7 @@ class DatabaseGatewayImpl:
     @classmethod
     def account_credentials_from_orm(cls, orm: Any) -> records.AccountCredentials:
         return records.AccountCredentials(
-            id=UUID(orm.id),
+            id=orm.id,
             email_address=orm.email_address,
             password_hash=orm.password,
         )
@@ -2736,7 +3291,7 @@ class DatabaseGatewayImpl:
         cls, password_reset_request_orm: models.PasswordResetRequest
     ) -> records.PasswordResetRequest:
         return records.PasswordResetRequest(
-            id=UUID(password_reset_request_orm.id),
+            id=password_reset_request_orm.id,
             email_address=password_reset_request_orm.email_address,
             reset_token=password_reset_request_orm.reset_token,
             created_at=password_reset_request_orm.created_at,
@@ -2768,10 +3323,10 @@ class DatabaseGatewayImpl:
         registered_on: datetime,
     ) -> records.RegisteredHoursWorked:
         db_record = models.RegisteredHoursWorked(
-            company=str(company),
-            worker=str(member),
-            transfer_of_work_certificates=str(transfer_of_work_certificates),
-            transfer_of_taxes=str(transfer_of_taxes),
+            company=company,
+            worker=member,
+            transfer_of_work_certificates=transfer_of_work_certificates,
+            transfer_of_taxes=transfer_of_taxes,
             registered_on=registered_on,
         )
         self.db.session.add(db_record)
@@ -2790,11 +3345,11 @@ class DatabaseGatewayImpl:
         cls, db_record: models.RegisteredHoursWorked
     ) -> records.RegisteredHoursWorked:
         return records.RegisteredHoursWorked(
-            id=UUID(db_record.id),
-            company=UUID(db_record.company),
-            member=UUID(db_record.worker),
-            transfer_of_work_certificates=UUID(db_record.transfer_of_work_certificates),
-            transfer_of_taxes=UUID(db_record.transfer_of_taxes),
+            id=db_record.id,
+            company=db_record.company,
+            member=db_record.worker,
+            transfer_of_work_certificates=db_record.transfer_of_work_certificates,
+            transfer_of_taxes=db_record.transfer_of_taxes,
             registered_on=db_record.registered_on,
         )
 
@@ -2806,16 +3361,17 @@ class DatabaseGatewayImpl:
         transfer_of_credit_r: UUID,
         transfer_of_credit_a: UUID,
     ) -> records.PlanApproval:
+        plan_orm = self.db.session.query(models.Plan).filter_by(id=plan_id).first()
+        assert plan_orm
         approval_orm = models.PlanApproval(
-            id=str(uuid4()),
-            plan_id=str(plan_id),
+            id=uuid4(),
+            plan_id=plan_id,
             date=date,
-            transfer_of_credit_p=str(transfer_of_credit_p),
-            transfer_of_credit_r=str(transfer_of_credit_r),
-            transfer_of_credit_a=str(transfer_of_credit_a),
+            expiration_date=date + timedelta(days=int(plan_orm.timeframe)),
+            transfer_of_credit_p=transfer_of_credit_p,
+            transfer_of_credit_r=transfer_of_credit_r,
+            transfer_of_credit_a=transfer_of_credit_a,
         )
-        plan_orm = self.db.session.query(models.Plan).filter_by(id=str(plan_id)).first()
-        assert plan_orm
         plan_orm.approval = approval_orm
         self.db.session.add(approval_orm)
         self.db.session.flush()
@@ -2824,12 +3380,12 @@ class DatabaseGatewayImpl:
     @classmethod
     def plan_approval_from_orm(cls, orm: models.PlanApproval) -> records.PlanApproval:
         return records.PlanApproval(
-            id=UUID(orm.id),
-            plan_id=UUID(orm.plan_id),
+            id=orm.id,
+            plan_id=orm.plan_id,
             date=orm.date,
-            transfer_of_credit_p=UUID(orm.transfer_of_credit_p),
-            transfer_of_credit_r=UUID(orm.transfer_of_credit_r),
-            transfer_of_credit_a=UUID(orm.transfer_of_credit_a),
+            transfer_of_credit_p=orm.transfer_of_credit_p,
+            transfer_of_credit_r=orm.transfer_of_credit_r,
+            transfer_of_credit_a=orm.transfer_of_credit_a,
         )
 
     def get_plan_approvals(self) -> PlanApprovalResult:
@@ -2838,3 +3394,92 @@ class DatabaseGatewayImpl:
             query=self.db.session.query(models.PlanApproval),
             mapper=self.plan_approval_from_orm,
         )
+
+    def get_payout_factor_cache(self) -> records.PayoutFactorCache:
+        orm = self.db.session.get(
+            models.PayoutFactorCache,
+            models.PAYOUT_FACTOR_CACHE_ID,
+            populate_existing=True,
+        )
+        if orm is None:
+            return records.PayoutFactorCache(
+                version=0, payout_factor=None, computed_at=None, valid_until=None
+            )
+        return records.PayoutFactorCache(
+            version=orm.version,
+            payout_factor=(
+                Decimal(orm.payout_factor) if orm.payout_factor is not None else None
+            ),
+            computed_at=orm.computed_at,
+            valid_until=orm.valid_until,
+        )
+
+    def store_payout_factor(
+        self,
+        *,
+        version: int,
+        payout_factor: Decimal,
+        computed_at: datetime,
+        valid_until: Optional[datetime],
+    ) -> bool:
+        sql_statement = (
+            update(models.PayoutFactorCache)
+            .where(
+                models.PayoutFactorCache.id == models.PAYOUT_FACTOR_CACHE_ID,
+                models.PayoutFactorCache.version == version,
+            )
+            .values(
+                payout_factor=payout_factor,
+                computed_at=computed_at,
+                valid_until=valid_until,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if self.db.session.info.get(HAS_WRITTEN):
+            # The session may hold locks that a separate transaction
+            # would wait for. Its changes are committed by the caller.
+            result = self.db.session.execute(sql_statement)
+            return cast(CursorResult, result).rowcount > 0
+        with self.db.separate_transaction() as connection:
+            result = connection.execute(sql_statement)
+            return cast(CursorResult, result).rowcount > 0
+
+    def invalidate_payout_factor_cache(self) -> None:
+        sql_statement = (
+            update(models.PayoutFactorCache)
+            .where(models.PayoutFactorCache.id == models.PAYOUT_FACTOR_CACHE_ID)
+            .values(
+                version=models.PayoutFactorCache.version + 1,
+                payout_factor=None,
+                computed_at=None,
+                valid_until=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.session.execute(sql_statement)
+
+    def get_payout_factor_changes(self) -> PayoutFactorChangeResult:
+        return PayoutFactorChangeResult(
+            db=self.db,
+            query=self.db.session.query(models.PayoutFactorChange),
+            mapper=self.payout_factor_change_from_orm,
+        )
+
+    @classmethod
+    def payout_factor_change_from_orm(
+        cls, orm: models.PayoutFactorChange
+    ) -> records.PayoutFactorChange:
+        return records.PayoutFactorChange(
+            timestamp=orm.timestamp,
+            payout_factor=Decimal(orm.payout_factor),
+        )
+
+    def create_payout_factor_changes(
+        self, changes: Iterable[records.PayoutFactorChange]
+    ) -> None:
+        rows = [
+            dict(timestamp=change.timestamp, payout_factor=change.payout_factor)
+            for change in changes
+        ]
+        if rows:
+            self.db.session.execute(insert(models.PayoutFactorChange), rows)
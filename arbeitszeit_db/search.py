@@ -0,0 +1,141 @@
+"""Substring search on the product names of plans and on the names
+and email addresses of companies.
+
+On PostgreSQL the searched columns are covered by trigram GIN indexes
+(pg_trgm) which serve ``ILIKE '%query%'`` directly. Results are ranked
+by trigram similarity.
+
+SQLite has no index type for infix matches. Every searchable column is
+therefore mirrored into an FTS5 table using the trigram tokenizer. The
+FTS5 tables are kept up to date by triggers on the base tables, which
+match rows by their key rather than by their rowid, since VACUUM may
+renumber the rowids of tables without an INTEGER PRIMARY KEY. Results
+are ranked by bm25. Migrations that recreate one of the base tables on
+SQLite (e.g. batch operations) have to recreate the triggers as well.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, List, Protocol
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, func, select
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.query import Query
+from sqlalchemy.sql import column, table
+
+FTS_MINIMUM_QUERY_LENGTH = 3
+"""The trigram tokenizer cannot match queries shorter than this."""
+
+
+@dataclass(eq=False)
+class SearchIndex:
+    key: InstrumentedAttribute[UUID]
+    column: InstrumentedAttribute[str]
+
+    @property
+    def table_name(self) -> str:
+        return self.column.expression.table.name
+
+    @property
+    def fts_table_name(self) -> str:
+        return f"{self.table_name}_{self.column.key}_search"
+
+    @property
+    def trigram_index_name(self) -> str:
+        return f"ix_{self.table_name}_{self.column.key}_trgm"
+
+    def create_fts_table_statements(self) -> List[str]:
+        base = f'"{self.table_name}"'
+        fts = f'"{self.fts_table_name}"'
+        key = f'"{self.key.key}"'
+        searched = f'"{self.column.key}"'
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} "
+            "USING fts5(item_id UNINDEXED, search_text, tokenize='trigram')",
+            f'CREATE TRIGGER IF NOT EXISTS "{self.fts_table_name}_insert" '
+            f"AFTER INSERT ON {base} BEGIN "
+            f"INSERT INTO {fts} (item_id, search_text) "
+            f"VALUES (new.{key}, new.{searched}); END",
+            f'CREATE TRIGGER IF NOT EXISTS "{self.fts_table_name}_update" '
+            f"AFTER UPDATE OF {searched} ON {base} BEGIN "
+            f"UPDATE {fts} SET search_text = new.{searched} "
+            f"WHERE item_id = old.{key}; END",
+            f'CREATE TRIGGER IF NOT EXISTS "{self.fts_table_name}_delete" '
+            f"AFTER DELETE ON {base} BEGIN "
+            f"DELETE FROM {fts} WHERE item_id = old.{key}; END",
+        ]
+
+    def drop_fts_table_statements(self) -> List[str]:
+        return [
+            f'DROP TRIGGER IF EXISTS "{self.fts_table_name}_insert"',
+            f'DROP TRIGGER IF EXISTS "{self.fts_table_name}_update"',
+            f'DROP TRIGGER IF EXISTS "{self.fts_table_name}_delete"',
+            f'DROP TABLE IF EXISTS "{self.fts_table_name}"',
+        ]
+
+
+class SearchBackend(Protocol):
+    def matching(self, index: SearchIndex, query: str) -> ColumnElement[bool]: ...
+
+    def ordered_by_relevance(
+        self, db_query: Query, index: SearchIndex, query: str
+    ) -> Query:
+        """Order the query so that the best matches come first."""
+
+
+class PostgresSearchBackend:
+    def matching(self, index: SearchIndex, query: str) -> ColumnElement[bool]:
+        return index.column.ilike(f"%{query}%")
+
+    def ordered_by_relevance(
+        self, db_query: Query, index: SearchIndex, query: str
+    ) -> Query:
+        return db_query.order_by(func.similarity(index.column, query).desc())
+
+
+class SqliteSearchBackend:
+    def matching(self, index: SearchIndex, query: str) -> ColumnElement[bool]:
+        if len(query) < FTS_MINIMUM_QUERY_LENGTH:
+            return index.column.ilike(f"%{query}%")
+        fts = self._fts_table(index)
+        return index.key.in_(
+            select(fts.c.item_id).where(fts.c.search_text.match(_phrase(query)))
+        )
+
+    def ordered_by_relevance(
+        self, db_query: Query, index: SearchIndex, query: str
+    ) -> Query:
+        if len(query) < FTS_MINIMUM_QUERY_LENGTH:
+            return db_query.order_by(
+                func.instr(func.lower(index.column), query.lower()).asc(),
+                func.length(index.column).asc(),
+            )
+        fts = self._fts_table(index)
+        ranks = (
+            select(fts.c.item_id, fts.c.rank)
+            .where(fts.c.search_text.match(_phrase(query)))
+            .subquery()
+        )
+        return db_query.outerjoin(ranks, ranks.c.item_id == index.key).order_by(
+            ranks.c.rank.asc().nulls_last()
+        )
+
+    def _fts_table(self, index: SearchIndex) -> Any:
+        return table(
+            index.fts_table_name,
+            column("item_id"),
+            column("search_text"),
+            column("rank"),
+        )
+
+
+def get_search_backend(dialect_name: str) -> SearchBackend:
+    if dialect_name == "postgresql":
+        return PostgresSearchBackend()
+    return SqliteSearchBackend()
+
+
+def _phrase(query: str) -> str:
+    return '"' + query.replace('"', '""') + '"'
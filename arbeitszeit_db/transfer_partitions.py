@@ -0,0 +1,135 @@
+"""Monthly partitions of the transfer table on PostgreSQL.
+
+On PostgreSQL the transfer table can optionally be partitioned by the
+month of the transfer date, see the "partition transfer table"
+migration. A transfer is stored in the partition of its month or, if
+that partition does not exist yet, in the default partition.
+TransferPartitionManager creates the partitions of the coming months
+ahead of time, e.g. via the ``create-transfer-partitions`` command,
+and moves transfers that ended up in the default partition into their
+new partition.
+
+On SQLite and on unpartitioned tables the manager does nothing.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from typing import Iterator, List, Set
+
+from sqlalchemy import Connection, text
+
+from arbeitszeit_db.db import Database
+
+DEFAULT_PARTITION = "transfer_default"
+
+
+@dataclass(frozen=True)
+class MonthlyPartition:
+    start: date
+
+    @classmethod
+    def of(cls, day: date) -> MonthlyPartition:
+        return cls(start=day.replace(day=1))
+
+    @property
+    def name(self) -> str:
+        return f"transfer_{self.start:%Y_%m}"
+
+    @property
+    def end(self) -> date:
+        return self.next().start
+
+    def next(self) -> MonthlyPartition:
+        if self.start.month == 12:
+            return MonthlyPartition(start=date(self.start.year + 1, 1, 1))
+        return MonthlyPartition(start=self.start.replace(month=self.start.month + 1))
+
+
+def monthly_partitions(first: date, months: int) -> Iterator[MonthlyPartition]:
+    """The partitions of `months` consecutive months, starting with the
+    month of `first`.
+    """
+    partition = MonthlyPartition.of(first)
+    for _ in range(months):
+        yield partition
+        partition = partition.next()
+
+
+def is_transfer_table_partitioned(connection: Connection) -> bool:
+    if connection.dialect.name != "postgresql":
+        return False
+    return bool(
+        connection.scalar(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = 'transfer'::regclass)"
+            )
+        )
+    )
+
+
+def get_partition_names(connection: Connection) -> Set[str]:
+    return set(
+        connection.scalars(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = 'transfer'::regclass"
+            )
+        )
+    )
+
+
+def create_partition(connection: Connection, partition: MonthlyPartition) -> None:
+    """Create the partition and attach it to the transfer table.
+
+    PostgreSQL refuses to attach a partition while the default partition
+    holds rows of its range, so these rows are moved into the new
+    partition first.
+    """
+    bounds = dict(start=partition.start, end=partition.end)
+    connection.execute(
+        text(
+            f'CREATE TABLE "{partition.name}" '
+            "(LIKE transfer INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+    )
+    connection.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            "WHERE date >= :start AND date < :end RETURNING *) "
+            f'INSERT INTO "{partition.name}" SELECT * FROM moved'
+        ),
+        bounds,
+    )
+    connection.execute(
+        text(
+            f'ALTER TABLE transfer ATTACH PARTITION "{partition.name}" '
+            f"FOR VALUES FROM ('{partition.start.isoformat()}') "
+            f"TO ('{partition.end.isoformat()}')"
+        )
+    )
+
+
+@dataclass
+class TransferPartitionManager:
+    db: Database
+
+    def create_future_partitions(self, now: datetime, months_ahead: int) -> List[str]:
+        """Create the missing partitions from the current month up to
+        `months_ahead` months after it and return their names.
+        """
+        connection = self.db.session.connection()
+        if not is_transfer_table_partitioned(connection):
+            return []
+        existing = get_partition_names(connection)
+        created: List[str] = []
+        for partition in monthly_partitions(
+            now.astimezone(UTC).date(), months_ahead + 1
+        ):
+            if partition.name not in existing:
+                create_partition(connection, partition)
+                created.append(partition.name)
+        return created
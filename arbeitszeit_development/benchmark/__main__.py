@@ -7,6 +7,10 @@ from typing import Dict, Optional, Self
 
 from .get_company_summary_benchmark import GetCompanySummaryBenchmark
 from .get_statistics import GetStatisticsBenchmark
+from .map_transfers_benchmark import (
+    MapTransfersFromOrmBenchmark,
+    MapTransfersFromProjectionBenchmark,
+)
 from .query_plans_sorted_by_activation_date_benchmark import (
     QueryPlansSortedByActivationDateBenchmark,
 )
@@ -27,6 +31,10 @@ def build_benchmark_catalog() -> BenchmarkCatalog:
         "query_plans_sorted_by_activation_date",
         QueryPlansSortedByActivationDateBenchmark,
     )
+    catalog.register_benchmark("map_transfers_from_orm", MapTransfersFromOrmBenchmark)
+    catalog.register_benchmark(
+        "map_transfers_from_projection", MapTransfersFromProjectionBenchmark
+    )
     return catalog
 
 
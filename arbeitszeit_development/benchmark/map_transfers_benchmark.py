@@ -0,0 +1,67 @@
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from arbeitszeit.injector import Injector
+from arbeitszeit.transfers import NewTransfer, TransferType
+from arbeitszeit_db import models
+from arbeitszeit_db.db import Database
+from arbeitszeit_db.repositories import DatabaseGatewayImpl
+from tests.db.base_test_case import reset_test_db
+from tests.db.dependency_injection import DatabaseModule
+from tests.dependency_injection import TestingModule
+
+TRANSFER_COUNT = 100000
+BATCH_SIZE = 5000
+
+
+class _TransfersBenchmark:
+    def __init__(self) -> None:
+        self.injector = Injector([TestingModule(), DatabaseModule()])
+        reset_test_db()
+        self.db = self.injector.get(Database)
+        self.db.engine.dispose()
+
+        self.database_gateway = self.injector.get(DatabaseGatewayImpl)
+        debit_account = self.database_gateway.create_account()
+        credit_account = self.database_gateway.create_account()
+        start = datetime(2020, 1, 1, tzinfo=UTC)
+        for batch_start in range(0, TRANSFER_COUNT, BATCH_SIZE):
+            self.database_gateway.create_transfers(
+                [
+                    NewTransfer(
+                        date=start + timedelta(minutes=n),
+                        debit_account=debit_account.id,
+                        credit_account=credit_account.id,
+                        value=Decimal(1),
+                        type=TransferType.productive_consumption_p,
+                    )
+                    for n in range(batch_start, batch_start + BATCH_SIZE)
+                ]
+            )
+        self.db.session.flush()
+
+    def tear_down(self) -> None:
+        self.db.session.remove()
+
+
+class MapTransfersFromOrmBenchmark(_TransfersBenchmark):
+    """This benchmark measures how long it takes to load 100000
+    transfers as ORM entities and to map them to records. It serves as
+    the baseline for MapTransfersFromProjectionBenchmark.
+    """
+
+    def run(self) -> None:
+        self.db.session.expunge_all()
+        for transfer in self.db.session.query(models.Transfer):
+            DatabaseGatewayImpl.transfer_from_orm(transfer)
+
+
+class MapTransfersFromProjectionBenchmark(_TransfersBenchmark):
+    """This benchmark measures how long it takes to load 100000
+    transfers through the column projection of the database gateway.
+    """
+
+    def run(self) -> None:
+        self.db.session.expunge_all()
+        for _ in self.database_gateway.get_transfers():
+            pass
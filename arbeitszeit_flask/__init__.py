@@ -1,4 +1,5 @@
 from typing import Any
+from uuid import UUID
 
 from flask import Flask, session
 from flask_talisman import Talisman
@@ -9,12 +10,13 @@ from arbeitszeit_flask.babel import initialize_babel
 from arbeitszeit_flask.config.checks import ConfigValidator
 from arbeitszeit_flask.config.loader import load_configuration
 from arbeitszeit_flask.config.options import CONFIG_OPTIONS
-from arbeitszeit_flask.database import run_db_migrations
+from arbeitszeit_flask.database import get_pool_configuration, run_db_migrations
 from arbeitszeit_flask.extensions import csrf_protect, login_manager
 from arbeitszeit_flask.filters import icon_filter
 from arbeitszeit_flask.flask_session import FlaskLoginUser
 from arbeitszeit_flask.mail_service import load_email_plugin
 from arbeitszeit_flask.profiling import initialize_flask_profiler  # type: ignore
+from arbeitszeit_flask.query_statistics import initialize_query_statistics
 
 
 def create_app(
@@ -38,7 +40,10 @@ def create_app(
     db.configure(
         uri=app.config.get(
             "SQLALCHEMY_DATABASE_URI", "sqlite:////tmp/arbeitszeitapp.db"
-        )
+        ),
+        replica_uri=app.config["SQLALCHEMY_DATABASE_REPLICA_URI"],
+        pin_reads_to_primary_after_write=app.config["PIN_READS_TO_PRIMARY_AFTER_WRITE"],
+        pool_configuration=get_pool_configuration(app.config),
     )
     run_db_migrations(app.config, db)
 
@@ -62,6 +67,7 @@ def create_app(
     csrf_protect.init_app(app)
     login_manager.init_app(app)
     initialize_babel(app)
+    initialize_query_statistics(app, db)
 
     @app.teardown_appcontext
     def shutdown_session(exception: BaseException | None = None) -> None:
@@ -70,9 +76,21 @@ def create_app(
     app.template_filter("icon")(icon_filter)
 
     with app.app_context():
-        from arbeitszeit_flask.commands import invite_accountant
+        from arbeitszeit_flask.commands import (
+            check_account_balances,
+            check_consumed_amounts,
+            create_transfer_partitions,
+            invite_accountant,
+            update_balance_checkpoints,
+            update_payout_factor_history,
+        )
 
         app.cli.command("invite-accountant")(invite_accountant)
+        app.cli.command("check-account-balances")(check_account_balances)
+        app.cli.command("check-consumed-amounts")(check_consumed_amounts)
+        app.cli.command("update-balance-checkpoints")(update_balance_checkpoints)
+        app.cli.command("create-transfer-partitions")(create_transfer_partitions)
+        app.cli.command("update-payout-factor-history")(update_payout_factor_history)
 
         from arbeitszeit_db.models import Accountant, Company, Member
 
@@ -84,16 +102,20 @@ def create_app(
             This callback is used to reload the user object from the user ID
             stored in the session.
             """
+            try:
+                id_ = UUID(user_id)
+            except ValueError:
+                return None
             if "user_type" in session:
                 user_type = session["user_type"]
                 if user_type == "member":
-                    member_orm = db.session.query(Member).get(user_id)
+                    member_orm = db.session.query(Member).get(id_)
                     return FlaskLoginUser(member_orm) if member_orm else None
                 elif user_type == "company":
-                    company_orm = db.session.query(Company).get(user_id)
+                    company_orm = db.session.query(Company).get(id_)
                     return FlaskLoginUser(company_orm) if company_orm else None
                 elif user_type == "accountant":
-                    accountant_orm = db.session.query(Accountant).get(user_id)
+                    accountant_orm = db.session.query(Accountant).get(id_)
                     return FlaskLoginUser(accountant_orm) if accountant_orm else None
             return None
 
@@ -7,6 +7,7 @@ from .auth import namespace as auth_ns
 from .companies import namespace as companies_ns
 from .consumptions import namespace as consumptions_ns
 from .plans import namespace as plans_ns
+from .statistics import namespace as statistics_ns
 
 blueprint = Blueprint("api", __name__, url_prefix="/api/v1")
 
@@ -34,3 +35,4 @@ api_extension.add_namespace(auth_ns)
 api_extension.add_namespace(companies_ns)
 api_extension.add_namespace(plans_ns)
 api_extension.add_namespace(consumptions_ns)
+api_extension.add_namespace(statistics_ns)
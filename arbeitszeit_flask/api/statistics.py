@@ -0,0 +1,37 @@
+from flask_restx import Namespace, Resource
+
+from arbeitszeit.interactors.get_payout_factor_history import (
+    GetPayoutFactorHistoryInteractor,
+)
+from arbeitszeit_flask.api.authentication import authentication_check
+from arbeitszeit_flask.api.response_handling import error_response_handling
+from arbeitszeit_flask.api.schema_converter import SchemaConverter
+from arbeitszeit_flask.dependency_injection import with_injection
+from arbeitszeit_web.api.presenters.payout_factor_history_api_presenter import (
+    PayoutFactorHistoryApiPresenter,
+)
+from arbeitszeit_web.api.response_errors import Unauthorized
+
+namespace = Namespace("statistics", "Statistics of the economy.")
+
+
+payout_factor_history_get_model = SchemaConverter(namespace).json_schema_to_flaskx(
+    schema=PayoutFactorHistoryApiPresenter().get_schema()
+)
+
+
+@namespace.route("/payout_factor_history")
+class PayoutFactorHistory(Resource):
+    @namespace.marshal_with(payout_factor_history_get_model, skip_none=True)
+    @error_response_handling(error_responses=[Unauthorized], namespace=namespace)
+    @authentication_check
+    @with_injection()
+    def get(
+        self,
+        interactor: GetPayoutFactorHistoryInteractor,
+        presenter: PayoutFactorHistoryApiPresenter,
+    ):
+        "List the changes of the payout factor."
+        response = interactor.get_payout_factor_history()
+        view_model = presenter.create_view_model(response)
+        return view_model
@@ -1,10 +1,16 @@
 import click
 from flask_babel import force_locale
 
+from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.interactors.send_accountant_registration_token import (
     SendAccountantRegistrationTokenInteractor,
 )
+from arbeitszeit.services.payout_factor_history import PayoutFactorHistoryService
 from arbeitszeit_db import commit_changes
+from arbeitszeit_db.account_balances import AccountBalanceChecker
+from arbeitszeit_db.balance_checkpoints import BalanceCheckpointUpdater
+from arbeitszeit_db.consumed_amounts import ConsumedAmountChecker
+from arbeitszeit_db.transfer_partitions import TransferPartitionManager
 from arbeitszeit_flask.dependency_injection import with_injection
 
 
@@ -19,3 +25,101 @@ def invite_accountant(
         interactor.send_accountant_registration_token(
             SendAccountantRegistrationTokenInteractor.Request(email=email_address)
         )
+
+
+@click.option(
+    "--repair",
+    is_flag=True,
+    default=False,
+    help="Overwrite inconsistent balances with the values calculated from all transfers.",
+)
+@commit_changes
+@with_injection()
+def check_account_balances(repair: bool, checker: AccountBalanceChecker) -> None:
+    """Verify the stored account balances against the transfer history."""
+    inconsistencies = checker.get_inconsistencies()
+    for inconsistency in inconsistencies:
+        click.echo(
+            f"Account {inconsistency.account}: stored balance "
+            f"{inconsistency.stored_balance}, calculated balance "
+            f"{inconsistency.calculated_balance}"
+        )
+    if not inconsistencies:
+        click.echo("All account balances are consistent.")
+    elif repair:
+        checker.repair(inconsistencies)
+        click.echo(f"Repaired {len(inconsistencies)} account balance(s).")
+    else:
+        raise click.ClickException(
+            f"Found {len(inconsistencies)} inconsistent account balance(s)."
+        )
+
+
+@click.option(
+    "--repair",
+    is_flag=True,
+    default=False,
+    help="Overwrite inconsistent amounts with the values calculated from all consumptions.",
+)
+@commit_changes
+@with_injection()
+def check_consumed_amounts(repair: bool, checker: ConsumedAmountChecker) -> None:
+    """Verify the stored consumed amounts of plans against the consumptions."""
+    inconsistencies = checker.get_inconsistencies()
+    for inconsistency in inconsistencies:
+        click.echo(
+            f"Plan {inconsistency.plan}: stored consumed amount "
+            f"{inconsistency.stored_amount}, calculated consumed amount "
+            f"{inconsistency.calculated_amount}"
+        )
+    if not inconsistencies:
+        click.echo("All consumed amounts are consistent.")
+    elif repair:
+        checker.repair(inconsistencies)
+        click.echo(f"Repaired {len(inconsistencies)} consumed amount(s).")
+    else:
+        raise click.ClickException(
+            f"Found {len(inconsistencies)} inconsistent consumed amount(s)."
+        )
+
+
+@commit_changes
+@with_injection()
+def update_balance_checkpoints(
+    updater: BalanceCheckpointUpdater, datetime_service: DatetimeService
+) -> None:
+    """Store the account balances at the end of all completed days."""
+    checkpointed_until = updater.update(datetime_service.now())
+    click.echo(f"Account balances are checkpointed until {checkpointed_until}.")
+
+
+@commit_changes
+@with_injection()
+def update_payout_factor_history(
+    service: PayoutFactorHistoryService, datetime_service: DatetimeService
+) -> None:
+    """Store the changes of the payout factor since the last run."""
+    changes = service.extend_history(datetime_service.now())
+    click.echo(f"Stored {len(changes)} change(s) of the payout factor.")
+
+
+@click.option(
+    "--months-ahead",
+    type=int,
+    default=3,
+    show_default=True,
+    help="Number of months after the current one to create partitions for.",
+)
+@commit_changes
+@with_injection()
+def create_transfer_partitions(
+    months_ahead: int,
+    manager: TransferPartitionManager,
+    datetime_service: DatetimeService,
+) -> None:
+    """Create the monthly partitions of the transfer table for the coming months."""
+    created = manager.create_future_partitions(datetime_service.now(), months_ahead)
+    for name in created:
+        click.echo(f"Created partition {name}.")
+    if not created:
+        click.echo("No partitions had to be created.")
@@ -12,6 +12,15 @@ MAIL_USE_SSL = False
 MAIL_PORT = 587
 FORCE_HTTPS = True
 AUTO_MIGRATE = os.getenv("AUTO_MIGRATE", False)
+SQLALCHEMY_DATABASE_REPLICA_URI = None
+PIN_READS_TO_PRIMARY_AFTER_WRITE = True
+SQLALCHEMY_POOL_SIZE = 5
+SQLALCHEMY_MAX_OVERFLOW = 10
+SQLALCHEMY_POOL_TIMEOUT = 30
+SQLALCHEMY_POOL_RECYCLE = -1
+SQLALCHEMY_POOL_PRE_PING = False
+LOG_QUERY_STATISTICS = False
+REPEATED_QUERY_THRESHOLD = 3
 PREFERRED_URL_SCHEME = "https"
 
 # control thresholds
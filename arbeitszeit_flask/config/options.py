@@ -153,6 +153,87 @@ CONFIG_OPTIONS = [
         default='"sqlite:////tmp/arbeitszeitapp.db"',
         example='SQLALCHEMY_DATABASE_URI = "postgresql:///my_data"',
     ),
+    ConfigOption(
+        name="SQLALCHEMY_DATABASE_REPLICA_URI",
+        converts_to_types=(str,),
+        description_paragraphs=[
+            "The address of a read-only replica of the database. If it is set, read-only interactors like searches, statistics and account details read from the replica instead of the primary database.",
+        ],
+        default="None",
+        example='SQLALCHEMY_DATABASE_REPLICA_URI = "postgresql://replica.example.org/my_data"',
+    ),
+    ConfigOption(
+        name="PIN_READS_TO_PRIMARY_AFTER_WRITE",
+        converts_to_types=(bool,),
+        description_paragraphs=[
+            "If a request has written to the database, all of its further reads go to the primary database so that they see the changes. Only relevant if ``SQLALCHEMY_DATABASE_REPLICA_URI`` is set.",
+        ],
+        example="PIN_READS_TO_PRIMARY_AFTER_WRITE = True",
+        default="True",
+    ),
+    ConfigOption(
+        name="SQLALCHEMY_POOL_SIZE",
+        converts_to_types=(int,),
+        description_paragraphs=[
+            "The number of connections that each application process keeps open to the database.",
+        ],
+        example="SQLALCHEMY_POOL_SIZE = 5",
+        default="5",
+    ),
+    ConfigOption(
+        name="SQLALCHEMY_MAX_OVERFLOW",
+        converts_to_types=(int,),
+        description_paragraphs=[
+            "The number of connections that each application process may open in addition to ``SQLALCHEMY_POOL_SIZE`` when all pooled connections are in use. These connections are closed again when they are returned.",
+        ],
+        example="SQLALCHEMY_MAX_OVERFLOW = 10",
+        default="10",
+    ),
+    ConfigOption(
+        name="SQLALCHEMY_POOL_TIMEOUT",
+        converts_to_types=(int,),
+        description_paragraphs=[
+            "The number of seconds to wait for a free connection before giving up with an error.",
+        ],
+        example="SQLALCHEMY_POOL_TIMEOUT = 30",
+        default="30",
+    ),
+    ConfigOption(
+        name="SQLALCHEMY_POOL_RECYCLE",
+        converts_to_types=(int,),
+        description_paragraphs=[
+            "Connections older than this number of seconds are replaced by new ones when they are checked out. Set this below the idle timeout of the database server or of a connection proxy in between. ``-1`` disables recycling.",
+        ],
+        example="SQLALCHEMY_POOL_RECYCLE = 3600",
+        default="-1",
+    ),
+    ConfigOption(
+        name="SQLALCHEMY_POOL_PRE_PING",
+        converts_to_types=(bool,),
+        description_paragraphs=[
+            "Test every connection for liveness when it is checked out of the pool and replace it if the database has closed it.",
+        ],
+        example="SQLALCHEMY_POOL_PRE_PING = True",
+        default="False",
+    ),
+    ConfigOption(
+        name="LOG_QUERY_STATISTICS",
+        converts_to_types=(bool,),
+        description_paragraphs=[
+            "Write the number of database statements of every request, the time the database spent on them and the statements that were repeated to the log, as one JSON line per request. In debug mode these numbers are also sent as the ``X-Query-Count``, ``X-Query-Time-Ms`` and ``X-Repeated-Queries`` response headers.",
+        ],
+        example="LOG_QUERY_STATISTICS = True",
+        default="False",
+    ),
+    ConfigOption(
+        name="REPEATED_QUERY_THRESHOLD",
+        converts_to_types=(int,),
+        description_paragraphs=[
+            "A statement that is sent this many times during one request with only its parameters changed is reported as repeated. Repeated statements usually mean that rows are loaded one by one in a loop.",
+        ],
+        example="REPEATED_QUERY_THRESHOLD = 3",
+        default="3",
+    ),
     ConfigOption(
         name="ALLOWED_OVERDRAW_MEMBER",
         converts_to_types=(int, str),
@@ -4,7 +4,7 @@ from alembic import command as alembic_command
 from alembic.config import Config as AlembicConfig
 from flask import Config as FlaskConfig
 
-from arbeitszeit_db.db import Database
+from arbeitszeit_db.db import Database, PoolConfiguration
 
 
 def _get_alembic_config(flask_config: FlaskConfig) -> AlembicConfig:
@@ -38,3 +38,19 @@ def run_db_migrations(flask_config: FlaskConfig, db: Database) -> None:
             _upgrade_to_head(alembic_config)
         else:
             _upgrade_to_head_if_database_is_fresh(alembic_config)
+
+
+def get_pool_configuration(flask_config: FlaskConfig) -> PoolConfiguration:
+    return PoolConfiguration(
+        size=int(flask_config["SQLALCHEMY_POOL_SIZE"]),
+        max_overflow=int(flask_config["SQLALCHEMY_MAX_OVERFLOW"]),
+        timeout=int(flask_config["SQLALCHEMY_POOL_TIMEOUT"]),
+        recycle=int(flask_config["SQLALCHEMY_POOL_RECYCLE"]),
+        pre_ping=to_bool(flask_config["SQLALCHEMY_POOL_PRE_PING"]),
+    )
+
+
+def to_bool(value: bool | int | str) -> bool:
+    if isinstance(value, str):
+        return value.lower() in ("true", "1")
+    return bool(value)
@@ -34,6 +34,7 @@ from arbeitszeit_flask.language_repository import LanguageRepositoryImpl
 from arbeitszeit_flask.mail_service import get_mail_service
 from arbeitszeit_flask.notifications import FlaskFlashNotifier
 from arbeitszeit_flask.password_hasher import provide_password_hasher
+from arbeitszeit_flask.read_replica import ReadReplicaModule
 from arbeitszeit_flask.text_renderer import TextRendererImpl
 from arbeitszeit_flask.token import FlaskTokenService
 from arbeitszeit_flask.translator import FlaskTranslator
@@ -146,5 +147,6 @@ def create_dependency_injector(
     additional_modules: Optional[List[Module]] = None,
 ) -> Injector:
     return Injector(
-        [FlaskModule()] + (additional_modules if additional_modules else [])
+        [FlaskModule(), ReadReplicaModule()]
+        + (additional_modules if additional_modules else [])
     )
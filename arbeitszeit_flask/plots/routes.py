@@ -109,10 +109,10 @@ def line_plot_of_company_prd_account(
 ):
     company_id = UUID(request.args["company_id"])
     interactor_request = controller.create_request(company_id)
-    interactor_response = interactor.show_details(interactor_request)
+    plot = interactor.show_plot(interactor_request)
     png = plotter.create_line_plot(
-        x=interactor_response.plot.timestamps,
-        y=interactor_response.plot.accumulated_volumes,
+        x=plot.timestamps,
+        y=plot.accumulated_volumes,
     )
     return Response(png, mimetype="image/png", direct_passthrough=True)
 
@@ -127,10 +127,10 @@ def line_plot_of_company_r_account(
     interactor_request = show_r_account_details.Request(
         company=UUID(request.args["company_id"])
     )
-    interactor_response = interactor.show_details(request=interactor_request)
+    plot = interactor.show_plot(request=interactor_request)
     png = plotter.create_line_plot(
-        x=interactor_response.plot.timestamps,
-        y=interactor_response.plot.accumulated_volumes,
+        x=plot.timestamps,
+        y=plot.accumulated_volumes,
     )
     return Response(png, mimetype="image/png", direct_passthrough=True)
 
@@ -145,10 +145,10 @@ def line_plot_of_company_p_account(
     interactor_request = ShowPAccountDetailsInteractor.Request(
         company=UUID(request.args["company_id"])
     )
-    interactor_response = interactor.show_details(request=interactor_request)
+    plot = interactor.show_plot(request=interactor_request)
     png = plotter.create_line_plot(
-        x=interactor_response.plot.timestamps,
-        y=interactor_response.plot.accumulated_volumes,
+        x=plot.timestamps,
+        y=plot.accumulated_volumes,
     )
     return Response(png, mimetype="image/png", direct_passthrough=True)
 
@@ -163,9 +163,9 @@ def line_plot_of_company_a_account(
 ):
     company_id = UUID(request.args["company_id"])
     interactor_request = controller.create_request(company_id)
-    interactor_response = interactor.show_details(request=interactor_request)
+    plot = interactor.show_plot(request=interactor_request)
     png = plotter.create_line_plot(
-        x=interactor_response.plot.timestamps,
-        y=interactor_response.plot.accumulated_volumes,
+        x=plot.timestamps,
+        y=plot.accumulated_volumes,
     )
     return Response(png, mimetype="image/png", direct_passthrough=True)
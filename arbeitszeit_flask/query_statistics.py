@@ -0,0 +1,74 @@
+"""Report the database statements of every request.
+
+In debug mode the number of statements, the time the database spent
+on them and the number of repeated statement fingerprints are added to
+the response headers. With LOG_QUERY_STATISTICS they are written to
+the log as one JSON line per request, at warning level if a statement
+was repeated at least REPEATED_QUERY_THRESHOLD times.
+"""
+
+import json
+import logging
+from contextlib import ExitStack
+
+from flask import Flask, Response, g, request
+
+from arbeitszeit_db.db import Database
+from arbeitszeit_flask.database import to_bool
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-Query-Count"
+QUERY_TIME_HEADER = "X-Query-Time-Ms"
+REPEATED_QUERIES_HEADER = "X-Repeated-Queries"
+
+
+def initialize_query_statistics(app: Flask, db: Database) -> None:
+    send_headers = bool(app.config["DEBUG"])
+    write_log = to_bool(app.config["LOG_QUERY_STATISTICS"])
+    threshold = int(app.config["REPEATED_QUERY_THRESHOLD"])
+    if not send_headers and not write_log:
+        return
+    # Running the database migrations configures logging through
+    # alembic, which disables all loggers that exist at that time.
+    logger.disabled = False
+
+    @app.before_request
+    def start_recording_queries() -> None:
+        g.query_recording = ExitStack()
+        g.query_statistics = g.query_recording.enter_context(db.recording_queries())
+
+    @app.after_request
+    def report_query_statistics(response: Response) -> Response:
+        statistics = g.get("query_statistics")
+        if statistics is None:
+            return response
+        query_time_ms = round(statistics.total_seconds * 1000, 1)
+        repeated_statements = statistics.repeated_statements(threshold)
+        if send_headers:
+            response.headers[QUERY_COUNT_HEADER] = str(statistics.query_count)
+            response.headers[QUERY_TIME_HEADER] = str(query_time_ms)
+            response.headers[REPEATED_QUERIES_HEADER] = str(len(repeated_statements))
+        if write_log:
+            line = json.dumps(
+                dict(
+                    method=request.method,
+                    path=request.path,
+                    endpoint=request.endpoint,
+                    status=response.status_code,
+                    query_count=statistics.query_count,
+                    query_time_ms=query_time_ms,
+                    repeated_statements=[
+                        dict(fingerprint=statement, count=count)
+                        for statement, count in repeated_statements.items()
+                    ],
+                )
+            )
+            logger.log(logging.WARNING if repeated_statements else logging.INFO, line)
+        return response
+
+    @app.teardown_request
+    def stop_recording_queries(exception: BaseException | None = None) -> None:
+        recording = g.pop("query_recording", None)
+        if recording is not None:
+            recording.close()
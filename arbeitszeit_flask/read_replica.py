@@ -0,0 +1,164 @@
+"""Route read-only interactors to the read replica of the database.
+
+Every interactor listed in READ_ONLY_INTERACTORS is provided wrapped
+in a proxy that enables reads from the replica while one of its methods
+runs. The list has to contain the interactors of all get_, list_,
+query_ and show_ modules. Interactors that write keep reading from the
+primary database so that their checks are never based on stale data.
+"""
+
+from __future__ import annotations
+
+from functools import wraps
+from typing import Any, Generic, Type, TypeVar, cast
+
+from arbeitszeit.injector import Binder, ClassProvider, Module
+from arbeitszeit.interactors.get_accountant_dashboard import (
+    GetAccountantDashboardInteractor,
+)
+from arbeitszeit.interactors.get_company_dashboard import GetCompanyDashboardInteractor
+from arbeitszeit.interactors.get_company_summary import GetCompanySummaryInteractor
+from arbeitszeit.interactors.get_coop_summary import GetCoopSummaryInteractor
+from arbeitszeit.interactors.get_coordination_transfer_request_details import (
+    GetCoordinationTransferRequestDetailsInteractor,
+)
+from arbeitszeit.interactors.get_draft_details import GetDraftDetailsInteractor
+from arbeitszeit.interactors.get_member_account import GetMemberAccountInteractor
+from arbeitszeit.interactors.get_member_dashboard import GetMemberDashboardInteractor
+from arbeitszeit.interactors.get_payout_factor_history import (
+    GetPayoutFactorHistoryInteractor,
+)
+from arbeitszeit.interactors.get_plan_details import GetPlanDetailsInteractor
+from arbeitszeit.interactors.get_statistics import GetStatisticsInteractor
+from arbeitszeit.interactors.get_user_account_details import (
+    GetUserAccountDetailsInteractor,
+)
+from arbeitszeit.interactors.list_active_plans_of_company import (
+    ListActivePlansOfCompanyInteractor,
+)
+from arbeitszeit.interactors.list_all_cooperations import ListAllCooperationsInteractor
+from arbeitszeit.interactors.list_available_languages import (
+    ListAvailableLanguagesInteractor,
+)
+from arbeitszeit.interactors.list_coordinations_of_company import (
+    ListCoordinationsOfCompanyInteractor,
+)
+from arbeitszeit.interactors.list_coordinations_of_cooperation import (
+    ListCoordinationsOfCooperationInteractor,
+)
+from arbeitszeit.interactors.list_my_cooperating_plans import (
+    ListMyCooperatingPlansInteractor,
+)
+from arbeitszeit.interactors.list_pending_work_invites import (
+    ListPendingWorkInvitesInteractor,
+)
+from arbeitszeit.interactors.list_plans_with_pending_review import (
+    ListPlansWithPendingReviewInteractor,
+)
+from arbeitszeit.interactors.list_registered_hours_worked import (
+    ListRegisteredHoursWorkedInteractor,
+)
+from arbeitszeit.interactors.list_transfers import ListTransfersInteractor
+from arbeitszeit.interactors.list_workers import ListWorkersInteractor
+from arbeitszeit.interactors.query_companies import QueryCompaniesInteractor
+from arbeitszeit.interactors.query_company_consumptions import (
+    QueryCompanyConsumptionsInteractor,
+)
+from arbeitszeit.interactors.query_plans import QueryPlansInteractor
+from arbeitszeit.interactors.query_private_consumptions import QueryPrivateConsumptions
+from arbeitszeit.interactors.show_a_account_details import ShowAAccountDetailsInteractor
+from arbeitszeit.interactors.show_company_accounts import ShowCompanyAccountsInteractor
+from arbeitszeit.interactors.show_company_cooperations import (
+    ShowCompanyCooperationsInteractor,
+)
+from arbeitszeit.interactors.show_company_work_invite_details import (
+    ShowCompanyWorkInviteDetailsInteractor,
+)
+from arbeitszeit.interactors.show_my_plans import ShowMyPlansInteractor
+from arbeitszeit.interactors.show_p_account_details import ShowPAccountDetailsInteractor
+from arbeitszeit.interactors.show_prd_account_details import (
+    ShowPRDAccountDetailsInteractor,
+)
+from arbeitszeit.interactors.show_r_account_details import ShowRAccountDetailsInteractor
+from arbeitszeit_db.db import Database
+
+T = TypeVar("T")
+
+READ_ONLY_INTERACTORS: list[type] = [
+    GetAccountantDashboardInteractor,
+    GetCompanyDashboardInteractor,
+    GetCompanySummaryInteractor,
+    GetCoopSummaryInteractor,
+    GetCoordinationTransferRequestDetailsInteractor,
+    GetDraftDetailsInteractor,
+    GetMemberAccountInteractor,
+    GetMemberDashboardInteractor,
+    GetPayoutFactorHistoryInteractor,
+    GetPlanDetailsInteractor,
+    GetStatisticsInteractor,
+    GetUserAccountDetailsInteractor,
+    ListActivePlansOfCompanyInteractor,
+    ListAllCooperationsInteractor,
+    ListAvailableLanguagesInteractor,
+    ListCoordinationsOfCompanyInteractor,
+    ListCoordinationsOfCooperationInteractor,
+    ListMyCooperatingPlansInteractor,
+    ListPendingWorkInvitesInteractor,
+    ListPlansWithPendingReviewInteractor,
+    ListRegisteredHoursWorkedInteractor,
+    ListTransfersInteractor,
+    ListWorkersInteractor,
+    QueryCompaniesInteractor,
+    QueryCompanyConsumptionsInteractor,
+    QueryPlansInteractor,
+    QueryPrivateConsumptions,
+    ShowAAccountDetailsInteractor,
+    ShowCompanyAccountsInteractor,
+    ShowCompanyCooperationsInteractor,
+    ShowCompanyWorkInviteDetailsInteractor,
+    ShowMyPlansInteractor,
+    ShowPAccountDetailsInteractor,
+    ShowPRDAccountDetailsInteractor,
+    ShowRAccountDetailsInteractor,
+]
+
+
+class ReadReplicaModule(Module):
+    def configure(self, binder: Binder) -> None:
+        super().configure(binder)
+        if Database().replica_engine is None:
+            return
+        for interactor in READ_ONLY_INTERACTORS:
+            binder.bind(interactor, to=ReadingFromReplicaProvider(interactor))
+
+
+class ReadingFromReplicaProvider(Generic[T]):
+    def __init__(self, cls: Type[T]) -> None:
+        self.cls = cls
+
+    def provide(self, binder: Binder) -> T:
+        interactor = ClassProvider(self.cls).provide(binder)
+        database = binder.get(Database).provide(binder)
+        return cast(T, ReadingFromReplica(interactor, database))
+
+
+class ReadingFromReplica:
+    """Proxy for an interactor whose method calls read from the
+    replica.
+    """
+
+    def __init__(self, interactor: Any, database: Database) -> None:
+        self._interactor = interactor
+        self._database = database
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._interactor, name)
+        if not callable(attribute):
+            return attribute
+
+        @wraps(attribute)
+        def call_reading_from_replica(*args: Any, **kwargs: Any) -> Any:
+            with self._database.reading_from_replica():
+                return attribute(*args, **kwargs)
+
+        return call_reading_from_replica
@@ -15,6 +15,7 @@ from arbeitszeit.interactors.reject_plan import RejectPlanInteractor
 from arbeitszeit_db import commit_changes
 from arbeitszeit_flask.flask_session import FlaskSession
 from arbeitszeit_flask.types import Response
+from arbeitszeit_flask.views.database_pool_view import DatabasePoolView
 from arbeitszeit_flask.views.http_error_view import http_404
 from arbeitszeit_web.www.controllers.approve_plan_controller import (
     ApprovePlanController,
@@ -110,3 +111,8 @@ def plan_details(
         )
     else:
         return http_404()
+
+
+@AccountantRoute("/accountant/database-pool")
+def database_pool(view: DatabasePoolView) -> Response:
+    return view.GET()
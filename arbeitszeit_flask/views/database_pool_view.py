@@ -0,0 +1,18 @@
+from dataclasses import asdict, dataclass
+
+import flask
+
+from arbeitszeit_db.db import Database
+
+
+@dataclass
+class DatabasePoolView:
+    database: Database
+
+    def GET(self) -> flask.Response:
+        return flask.jsonify(
+            {
+                name: asdict(statistics)
+                for name, statistics in self.database.pool_statistics().items()
+            }
+        )
@@ -4,6 +4,9 @@ from flask import render_template
 
 from arbeitszeit.interactors.list_all_cooperations import ListAllCooperationsInteractor
 from arbeitszeit_flask.types import Response
+from arbeitszeit_web.www.controllers.list_all_cooperations_controller import (
+    ListAllCooperationsController,
+)
 from arbeitszeit_web.www.presenters.list_all_cooperations_presenter import (
     ListAllCooperationsPresenter,
 )
@@ -11,10 +14,12 @@ from arbeitszeit_web.www.presenters.list_all_cooperations_presenter import (
 
 @dataclass
 class ListAllCooperationsView:
+    controller: ListAllCooperationsController
     interactor: ListAllCooperationsInteractor
     presenter: ListAllCooperationsPresenter
 
     def GET(self) -> Response:
-        response = self.interactor.execute()
+        request = self.controller.create_interactor_request()
+        response = self.interactor.execute(request)
         view_model = self.presenter.present(response)
         return render_template("user/list_all_cooperations.html", view_model=view_model)
@@ -1,8 +1,16 @@
 from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
 
-from arbeitszeit.interactors.query_companies import CompanyFilter, QueryCompaniesRequest
+from arbeitszeit.interactors.query_companies import (
+    CompanyCursor,
+    CompanyFilter,
+    QueryCompaniesRequest,
+)
 from arbeitszeit_web.api.controllers import query_parser
 from arbeitszeit_web.api.controllers.parameters import QueryParameter
+from arbeitszeit_web.api.response_errors import BadRequest
+from arbeitszeit_web.pagination import CURSOR_PARAMETER_NAME, decode_cursor
 from arbeitszeit_web.request import Request
 
 DEFAULT_OFFSET: int = 0
@@ -22,21 +30,42 @@ query_companies_expected_inputs = [
         description="The query limit.",
         default=DEFAULT_LIMIT,
     ),
+    QueryParameter(
+        name=CURSOR_PARAMETER_NAME,
+        type=str,
+        description="Continue after the last result of a previous query. Takes precedence over the offset.",
+        default=None,
+    ),
 ]
 
 
 @dataclass
 class QueryCompaniesApiController:
     def create_request(self, request: Request) -> QueryCompaniesRequest:
-        offset = self._parse_offset(request)
+        cursor = self._parse_cursor(request)
+        offset = None if cursor else self._parse_offset(request)
         limit = self._parse_limit(request)
         return QueryCompaniesRequest(
             query_string=None,
             filter_category=CompanyFilter.by_name,
             offset=offset,
             limit=limit,
+            after=cursor,
         )
 
+    def _parse_cursor(self, request: Request) -> Optional[CompanyCursor]:
+        token = request.query_string().get_last_value(CURSOR_PARAMETER_NAME)
+        if not token:
+            return None
+        values = decode_cursor(token)
+        if values is None or len(values) != 2:
+            raise BadRequest(f"Invalid cursor {token}.")
+        name, company_id = values
+        try:
+            return name, UUID(company_id)
+        except ValueError:
+            raise BadRequest(f"Invalid cursor {token}.")
+
     def _parse_offset(self, request: Request) -> int:
         offset_string = request.query_string().get_last_value("offset")
         if not offset_string:
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from typing import List
+
+from arbeitszeit.interactors.get_payout_factor_history import (
+    GetPayoutFactorHistoryInteractor,
+)
+from arbeitszeit_web.api.presenters.interfaces import (
+    JsonDatetime,
+    JsonDecimal,
+    JsonList,
+    JsonObject,
+    JsonValue,
+)
+
+
+class PayoutFactorHistoryApiPresenter:
+    @dataclass
+    class ViewModel:
+        changes: List[GetPayoutFactorHistoryInteractor.PayoutFactorChange]
+
+    @classmethod
+    def get_schema(cls) -> JsonValue:
+        return JsonObject(
+            members=dict(
+                changes=JsonList(
+                    elements=JsonObject(
+                        members=dict(
+                            timestamp=JsonDatetime(),
+                            payout_factor=JsonDecimal(),
+                        ),
+                        name="PayoutFactorChange",
+                    )
+                ),
+            ),
+            name="PayoutFactorHistory",
+        )
+
+    def create_view_model(
+        self, interactor_response: GetPayoutFactorHistoryInteractor.Response
+    ) -> ViewModel:
+        return self.ViewModel(changes=interactor_response.changes)
@@ -9,6 +9,7 @@ from arbeitszeit_web.api.presenters.interfaces import (
     JsonString,
     JsonValue,
 )
+from arbeitszeit_web.pagination import encode_cursor
 
 
 class QueryCompaniesApiPresenter:
@@ -18,6 +19,7 @@ class QueryCompaniesApiPresenter:
         total_results: int
         offset: Optional[int]
         limit: Optional[int]
+        next_cursor: Optional[str]
 
     @classmethod
     def get_schema(cls) -> JsonValue:
@@ -36,6 +38,7 @@ class QueryCompaniesApiPresenter:
                 total_results=JsonInteger(),
                 offset=JsonInteger(),
                 limit=JsonInteger(),
+                next_cursor=JsonString(required=False),
             ),
             name="CompanyList",
         )
@@ -46,4 +49,13 @@ class QueryCompaniesApiPresenter:
             total_results=interactor_response.total_results,
             offset=interactor_response.request.offset,
             limit=interactor_response.request.limit,
+            next_cursor=self._encode_next_cursor(interactor_response),
         )
+
+    def _encode_next_cursor(
+        self, interactor_response: CompanyQueryResponse
+    ) -> Optional[str]:
+        if interactor_response.next_cursor is None:
+            return None
+        name, company_id = interactor_response.next_cursor
+        return encode_cursor([name, str(company_id)])
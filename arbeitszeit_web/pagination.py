@@ -1,5 +1,7 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from dataclasses import dataclass
-from typing import List
+from typing import Iterable, List, Optional
 from urllib.parse import urlencode, urlparse, urlunparse
 
 from arbeitszeit_web.request import Request
@@ -7,6 +9,9 @@ from arbeitszeit_web.request import Request
 PAGE_PARAMETER_NAME = "page"
 """The name of the request query parameter used for pagination."""
 
+CURSOR_PARAMETER_NAME = "cursor"
+"""The name of the request query parameter used for keyset pagination."""
+
 DEFAULT_PAGE_SIZE = 15
 
 
@@ -21,6 +26,7 @@ class PageLink:
 class Pagination:
     is_visible: bool
     pages: List[PageLink]
+    next_page: Optional[str] = None
 
 
 class Paginator:
@@ -29,18 +35,32 @@ class Paginator:
         request: Request,
         total_results: int,
         page_size: int = DEFAULT_PAGE_SIZE,
+        next_cursor: Optional[str] = None,
     ) -> None:
         self.parsed_url = urlparse(request.get_request_target())
         self.query_arguments: dict[str, str] = dict(request.query_string().items())
         self.page_size = page_size
         self.total_results = total_results
+        self.next_cursor = next_cursor
+        self.is_cursor_request = CURSOR_PARAMETER_NAME in self.query_arguments
         self.current_offset = calculate_current_offset(request, self.page_size)
 
     def get_page_link(self, page: int) -> str:
         query = dict(self.query_arguments)
+        query.pop(CURSOR_PARAMETER_NAME, None)
         query[PAGE_PARAMETER_NAME] = str(page)
-        modified_parsed = self.parsed_url._replace(query=urlencode(query))
-        return urlunparse(modified_parsed)
+        return self._create_link(query)
+
+    def get_next_page_link(self) -> Optional[str]:
+        """Link to the page following the current one, addressed by
+        the opaque cursor token instead of a page number.
+        """
+        if self.next_cursor is None:
+            return None
+        query = dict(self.query_arguments)
+        query.pop(PAGE_PARAMETER_NAME, None)
+        query[CURSOR_PARAMETER_NAME] = self.next_cursor
+        return self._create_link(query)
 
     def get_pages(self) -> List[PageLink]:
         current_page_number = 1 + self.current_offset // self.page_size
@@ -48,11 +68,15 @@ class Paginator:
             PageLink(
                 label=str(n),
                 href=self.get_page_link(page=n),
-                is_current=current_page_number == n,
+                is_current=not self.is_cursor_request and current_page_number == n,
             )
             for n in range(1, self.number_of_pages + 1)
         ]
 
+    def _create_link(self, query: dict[str, str]) -> str:
+        modified_parsed = self.parsed_url._replace(query=urlencode(query))
+        return urlunparse(modified_parsed)
+
     @property
     def number_of_pages(self) -> int:
         return 1 + (self.total_results - 1) // self.page_size
@@ -67,3 +91,30 @@ def calculate_current_offset(request: Request, limit: int) -> int:
     except ValueError:
         return 0
     return (page_number - 1) * limit
+
+
+def get_cursor(request: Request) -> Optional[List[str]]:
+    """Decode the cursor token of the request. Return None if there is
+    no cursor or if it is malformed.
+    """
+    token = request.query_string().get_last_value(CURSOR_PARAMETER_NAME)
+    if token is None:
+        return None
+    return decode_cursor(token)
+
+
+def encode_cursor(values: Iterable[str]) -> str:
+    payload = json.dumps(list(values)).encode("utf-8")
+    return urlsafe_b64encode(payload).decode("ascii")
+
+
+def decode_cursor(token: str) -> Optional[List[str]]:
+    try:
+        values = json.loads(urlsafe_b64decode(token.encode("ascii")))
+    except ValueError:
+        return None
+    if not isinstance(values, list):
+        return None
+    if not all(isinstance(value, str) for value in values):
+        return None
+    return values
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from arbeitszeit.interactors.list_all_cooperations import ListAllCooperationsRequest
+from arbeitszeit_web.pagination import DEFAULT_PAGE_SIZE, calculate_current_offset
+from arbeitszeit_web.request import Request
+
+
+@dataclass
+class ListAllCooperationsController:
+    request: Request
+
+    def create_interactor_request(self) -> ListAllCooperationsRequest:
+        offset = calculate_current_offset(request=self.request, limit=DEFAULT_PAGE_SIZE)
+        return ListAllCooperationsRequest(offset=offset, limit=DEFAULT_PAGE_SIZE)
@@ -1,9 +1,14 @@
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
 
 from arbeitszeit.interactors.list_transfers import Request as InteractorRequest
+from arbeitszeit.interactors.list_transfers import TransferCursor
 from arbeitszeit_web.pagination import (
     DEFAULT_PAGE_SIZE,
     calculate_current_offset,
+    get_cursor,
 )
 from arbeitszeit_web.request import Request
 
@@ -13,8 +18,25 @@ class ListTransfersController:
     request: Request
 
     def create_interactor_request(self) -> InteractorRequest:
+        cursor = self._parse_cursor()
+        if cursor is not None:
+            return InteractorRequest(
+                offset=None,
+                limit=DEFAULT_PAGE_SIZE,
+                after=cursor,
+            )
         offset = calculate_current_offset(request=self.request, limit=DEFAULT_PAGE_SIZE)
         return InteractorRequest(
             offset=offset,
             limit=DEFAULT_PAGE_SIZE,
         )
+
+    def _parse_cursor(self) -> Optional[TransferCursor]:
+        values = get_cursor(self.request)
+        if values is None or len(values) != 2:
+            return None
+        date, transfer_id = values
+        try:
+            return datetime.fromisoformat(date), UUID(transfer_id)
+        except ValueError:
+            return None
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import List
 
 from arbeitszeit.interactors.list_all_cooperations import ListAllCooperationsResponse
+from arbeitszeit_web.pagination import Pagination, Paginator
+from arbeitszeit_web.request import Request
 from arbeitszeit_web.url_index import UrlIndex
 
 
@@ -17,11 +19,14 @@ class ListedCooperation:
 class ListAllCooperationsViewModel:
     cooperations: List[ListedCooperation]
     show_results: bool
+    total_results: int
+    pagination: Pagination
 
 
 @dataclass
 class ListAllCooperationsPresenter:
     url_index: UrlIndex
+    web_request: Request
 
     def present(
         self, response: ListAllCooperationsResponse
@@ -36,5 +41,18 @@ class ListAllCooperationsPresenter:
             for coop in response.cooperations
         ]
         return ListAllCooperationsViewModel(
-            cooperations=cooperations, show_results=bool(cooperations)
+            cooperations=cooperations,
+            show_results=bool(cooperations),
+            total_results=response.total_results,
+            pagination=self._create_pagination(response),
+        )
+
+    def _create_pagination(self, response: ListAllCooperationsResponse) -> Pagination:
+        paginator = Paginator(
+            request=self.web_request,
+            total_results=response.total_results,
+        )
+        return Pagination(
+            is_visible=paginator.number_of_pages > 1,
+            pages=paginator.get_pages(),
         )
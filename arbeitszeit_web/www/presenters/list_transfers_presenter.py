@@ -6,7 +6,7 @@ from uuid import UUID
 from arbeitszeit.interactors.list_transfers import AccountOwnerType
 from arbeitszeit.interactors.list_transfers import Response as InteractorResponse
 from arbeitszeit_web.formatters.datetime_formatter import DatetimeFormatter
-from arbeitszeit_web.pagination import Pagination, Paginator
+from arbeitszeit_web.pagination import Pagination, Paginator, encode_cursor
 from arbeitszeit_web.request import Request
 from arbeitszeit_web.translator import Translator
 from arbeitszeit_web.url_index import UrlIndex
@@ -89,13 +89,19 @@ class ListTransfersPresenter:
         return ResultsTable(rows=rows)
 
     def _create_pagination(self, response: InteractorResponse) -> Pagination:
+        next_cursor = None
+        if response.next_cursor is not None:
+            date, transfer_id = response.next_cursor
+            next_cursor = encode_cursor([date.isoformat(), str(transfer_id)])
         paginator = Paginator(
             request=self.web_request,
             total_results=response.total_results,
+            next_cursor=next_cursor,
         )
         pagination = Pagination(
             is_visible=paginator.number_of_pages > 1,
             pages=paginator.get_pages(),
+            next_page=paginator.get_next_page_link(),
         )
         return pagination
 
@@ -1,3 +1,5 @@
+from uuid import uuid4
+
 from parameterized import parameterized
 
 from arbeitszeit.interactors.query_companies import CompanyFilter
@@ -7,6 +9,7 @@ from arbeitszeit_web.api.controllers.query_companies_api_controller import (
     query_companies_expected_inputs,
 )
 from arbeitszeit_web.api.response_errors import BadRequest
+from arbeitszeit_web.pagination import encode_cursor
 from tests.request import FakeRequest
 from tests.www.base_test_case import BaseTestCase
 
@@ -64,14 +67,52 @@ class ControllerTests(BaseTestCase):
         assert err.exception.message == expected_error_message
 
 
+class CursorTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.controller = self.injector.get(QueryCompaniesApiController)
+
+    def test_that_request_has_no_cursor_by_default(self) -> None:
+        interactor_request = self.controller.create_request(FakeRequest())
+        assert interactor_request.after is None
+
+    def test_that_cursor_is_decoded_into_company_name_and_id(self) -> None:
+        company_id = uuid4()
+        token = encode_cursor(["Company name", str(company_id)])
+        request = FakeRequest(query_string=[("cursor", token)])
+        interactor_request = self.controller.create_request(request)
+        assert interactor_request.after == ("Company name", company_id)
+
+    def test_that_offset_is_ignored_if_cursor_is_given(self) -> None:
+        token = encode_cursor(["Company name", str(uuid4())])
+        request = FakeRequest(query_string=[("cursor", token), ("offset", "8")])
+        interactor_request = self.controller.create_request(request)
+        assert interactor_request.offset is None
+
+    @parameterized.expand(
+        [
+            ("abc",),
+            (encode_cursor(["Company name"]),),
+            (encode_cursor(["Company name", "no uuid"]),),
+        ]
+    )
+    def test_controller_raises_bad_request_if_cursor_is_invalid(
+        self, token: str
+    ) -> None:
+        request = FakeRequest(query_string=[("cursor", token)])
+        with self.assertRaises(BadRequest) as err:
+            self.controller.create_request(request)
+        assert err.exception.message == f"Invalid cursor {token}."
+
+
 class ExpectedInputsTests(BaseTestCase):
     def setUp(self) -> None:
         super().setUp()
         self.controller = self.injector.get(QueryCompaniesApiController)
         self.inputs = query_companies_expected_inputs
 
-    def test_controller_has_two_expected_inputs(self) -> None:
-        self.assertEqual(len(self.inputs), 2)
+    def test_controller_has_three_expected_inputs(self) -> None:
+        self.assertEqual(len(self.inputs), 3)
 
     def test_first_expected_input_is_offset(self) -> None:
         input = self.inputs[0]
@@ -97,6 +138,14 @@ class ExpectedInputsTests(BaseTestCase):
         input = self.inputs[1]
         self.assertIsInstance(input, QueryParameter)
 
+    def test_third_expected_input_is_cursor(self) -> None:
+        input = self.inputs[2]
+        self.assertEqual(input.name, "cursor")
+        self.assertIsInstance(input, QueryParameter)
+        self.assertEqual(input.type, str)
+        self.assertIsNone(input.default)
+        self.assertEqual(input.required, False)
+
     def test_input_limit_has_correct_parameters(self) -> None:
         input = self.inputs[1]
         self.assertEqual(input.name, "limit")
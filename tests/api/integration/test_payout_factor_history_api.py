@@ -0,0 +1,47 @@
+from decimal import Decimal
+
+from parameterized import parameterized
+
+from arbeitszeit.records import PayoutFactorChange
+from tests.api.integration.base_test_case import ApiTestCase, LogInUser
+from tests.datetime_service import datetime_utc
+
+
+class AuthenticationTests(ApiTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.url = self.url_prefix + "/statistics/payout_factor_history"
+
+    @parameterized.expand(
+        [
+            (None, 401),
+            (LogInUser.member, 200),
+            (LogInUser.company, 200),
+        ]
+    )
+    def test_only_authenticated_users_can_access_the_endpoint(
+        self, user: LogInUser | None, expected_status_code: int
+    ) -> None:
+        if user:
+            self.login_user(user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, expected_status_code)
+
+
+class AuthenticatedMemberTests(ApiTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.url = self.url_prefix + "/statistics/payout_factor_history"
+        self.login_member()
+
+    def test_stored_change_is_returned(self) -> None:
+        self.database_gateway.create_payout_factor_changes(
+            [
+                PayoutFactorChange(
+                    timestamp=datetime_utc(2000, 1, 1), payout_factor=Decimal("0.5")
+                )
+            ]
+        )
+        response = self.client.get(self.url)
+        (change,) = response.json["changes"]
+        assert Decimal(str(change["payout_factor"])) == Decimal("0.5")
@@ -0,0 +1,59 @@
+from decimal import Decimal
+
+from arbeitszeit.interactors.get_payout_factor_history import (
+    GetPayoutFactorHistoryInteractor,
+)
+from arbeitszeit_web.api.presenters.interfaces import (
+    JsonDatetime,
+    JsonDecimal,
+    JsonList,
+    JsonObject,
+)
+from arbeitszeit_web.api.presenters.payout_factor_history_api_presenter import (
+    PayoutFactorHistoryApiPresenter,
+)
+from tests.api.presenters.base_test_case import BaseTestCase
+from tests.datetime_service import datetime_utc
+
+
+class TestViewModelCreation(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.presenter = self.injector.get(PayoutFactorHistoryApiPresenter)
+
+    def test_changes_of_response_are_shown(self) -> None:
+        changes = [
+            GetPayoutFactorHistoryInteractor.PayoutFactorChange(
+                timestamp=datetime_utc(2000, 1, 1), payout_factor=Decimal("0.5")
+            )
+        ]
+        view_model = self.presenter.create_view_model(
+            GetPayoutFactorHistoryInteractor.Response(changes=changes)
+        )
+        assert view_model.changes == changes
+
+
+class TestSchema(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.schema = self.injector.get(PayoutFactorHistoryApiPresenter).get_schema()
+
+    def test_schema_top_level(self) -> None:
+        assert isinstance(self.schema, JsonObject)
+        assert self.schema.name == "PayoutFactorHistory"
+
+    def test_changes_are_a_list_of_objects(self) -> None:
+        assert isinstance(self.schema, JsonObject)
+        changes = self.schema.members["changes"]
+        assert isinstance(changes, JsonList)
+        assert isinstance(changes.elements, JsonObject)
+        assert changes.elements.name == "PayoutFactorChange"
+
+    def test_change_members_field_types_are_correct(self) -> None:
+        assert isinstance(self.schema, JsonObject)
+        changes = self.schema.members["changes"]
+        assert isinstance(changes, JsonList)
+        assert isinstance(changes.elements, JsonObject)
+        members = changes.elements.members
+        assert isinstance(members["timestamp"], JsonDatetime)
+        assert isinstance(members["payout_factor"], JsonDecimal)
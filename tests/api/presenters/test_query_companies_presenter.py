@@ -1,7 +1,10 @@
+from uuid import uuid4
+
 from arbeitszeit_web.api.presenters.interfaces import JsonObject
 from arbeitszeit_web.api.presenters.query_companies_api_presenter import (
     QueryCompaniesApiPresenter,
 )
+from arbeitszeit_web.pagination import decode_cursor
 from tests.api.presenters.base_test_case import BaseTestCase
 from tests.www.presenters.data_generators import QueriedCompanyGenerator
 
@@ -73,6 +76,28 @@ class TestSchema(BaseTestCase):
         self.queried_company_generator = self.injector.get(QueriedCompanyGenerator)
         self.presenter = self.injector.get(QueryCompaniesApiPresenter)
 
+    def test_view_model_has_no_next_cursor_if_interactor_response_has_none(
+        self,
+    ) -> None:
+        interactor_response = self.queried_company_generator.get_response(
+            next_cursor=None
+        )
+        view_model = self.presenter.create_view_model(interactor_response)
+        self.assertIsNone(view_model.next_cursor)
+
+    def test_next_cursor_of_view_model_can_be_decoded_to_company_name_and_id(
+        self,
+    ) -> None:
+        company_id = uuid4()
+        interactor_response = self.queried_company_generator.get_response(
+            next_cursor=("Company name", company_id)
+        )
+        view_model = self.presenter.create_view_model(interactor_response)
+        assert view_model.next_cursor
+        self.assertEqual(
+            decode_cursor(view_model.next_cursor), ["Company name", str(company_id)]
+        )
+
     def test_schema_top_level(self) -> None:
         schema = self.presenter.get_schema()
         assert isinstance(schema, JsonObject)
@@ -1,12 +1,15 @@
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 from unittest import TestCase
+from unittest.mock import patch
 
-from sqlalchemy import create_engine, event, text
+from sqlalchemy import Connection, create_engine, event, text
 from sqlalchemy.orm import Session, SessionTransaction, scoped_session, sessionmaker
 
 from arbeitszeit.injector import Injector
-from arbeitszeit_db.db import Base, Database
+from arbeitszeit_db.db import Base, Database, RoutingSession
+from arbeitszeit_db.query_statistics import QueryStatistics
 from arbeitszeit_db.repositories import DatabaseGatewayImpl
 from tests import data_generators
 from tests.datetime_service import FakeDatetimeService
@@ -50,7 +53,9 @@ class DatabaseTestCase(TestCaseWithResettedDatabase):
         self.transaction = self.connection.begin()
 
         # expire_on_commit=False prevents objects from expiring after flush
-        session_factory = sessionmaker(bind=self.connection, expire_on_commit=False)
+        session_factory = sessionmaker(
+            bind=self.connection, class_=RoutingSession, expire_on_commit=False
+        )
         self.test_session = scoped_session(session_factory)
 
         # This allows code that calls commit() to work properly in tests
@@ -66,6 +71,14 @@ class DatabaseTestCase(TestCaseWithResettedDatabase):
         self.test_session.begin_nested()
         self.db._session = self.test_session
 
+        # Separate transactions become savepoints of the test transaction
+        # so that they are rolled back after the test as well.
+        separate_transaction = patch.object(
+            Database, "separate_transaction", self._separate_transaction
+        )
+        separate_transaction.start()
+        self.addCleanup(separate_transaction.stop)
+
     def tearDown(self) -> None:
         self._lazy_property_cache = dict()
         self.test_session.remove()
@@ -73,6 +86,32 @@ class DatabaseTestCase(TestCaseWithResettedDatabase):
         self.connection.close()
         super().tearDown()
 
+    @contextmanager
+    def _separate_transaction(self) -> Iterator[Connection]:
+        with self.connection.begin_nested():
+            yield self.connection
+
+    @contextmanager
+    def assert_query_budget(self, max_queries: int) -> Iterator[QueryStatistics]:
+        """Fail if more than `max_queries` statements are sent to the
+        database while the context is active.
+        """
+        with self.db.recording_queries() as statistics:
+            yield statistics
+        if statistics.query_count > max_queries:
+            self.fail(
+                "\n".join(
+                    [
+                        f"Sent {statistics.query_count} statements to the "
+                        f"database, the budget is {max_queries}:",
+                    ]
+                    + [
+                        f"{count}x {statement}"
+                        for statement, count in statistics.fingerprints.most_common()
+                    ]
+                )
+            )
+
     accountant_generator = _lazy_property(data_generators.AccountantGenerator)
     company_generator = _lazy_property(data_generators.CompanyGenerator)
     consumption_generator = _lazy_property(data_generators.ConsumptionGenerator)
@@ -0,0 +1,87 @@
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import delete, update
+
+from arbeitszeit_db import models
+from arbeitszeit_db.account_balances import AccountBalanceChecker
+from tests.db.base_test_case import DatabaseTestCase
+
+
+class AccountBalanceCheckerTests(DatabaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.checker = self.injector.get(AccountBalanceChecker)
+
+    def test_no_inconsistencies_are_found_without_transfers(self) -> None:
+        self.database_gateway.create_account()
+        assert not self.checker.get_inconsistencies()
+
+    def test_no_inconsistencies_are_found_after_transfers_were_created(self) -> None:
+        account = self.database_gateway.create_account()
+        self.transfer_generator.create_transfer(
+            credit_account=account.id, value=Decimal(5)
+        )
+        self.transfer_generator.create_transfer(
+            debit_account=account.id, value=Decimal(2)
+        )
+        assert not self.checker.get_inconsistencies()
+
+    def test_manipulated_balance_is_reported_as_inconsistent(self) -> None:
+        account = self.database_gateway.create_account()
+        self.transfer_generator.create_transfer(
+            credit_account=account.id, value=Decimal(5)
+        )
+        self.set_stored_balance(account.id, Decimal(3))
+        inconsistencies = self.checker.get_inconsistencies()
+        assert len(inconsistencies) == 1
+        assert inconsistencies[0].account == account.id
+        assert inconsistencies[0].stored_balance == Decimal(3)
+        assert inconsistencies[0].calculated_balance == Decimal(5)
+
+    def test_missing_balance_is_reported_as_inconsistent(self) -> None:
+        account = self.database_gateway.create_account()
+        self.db.session.execute(
+            delete(models.AccountBalance).where(
+                models.AccountBalance.account == account.id
+            )
+        )
+        inconsistencies = self.checker.get_inconsistencies()
+        assert len(inconsistencies) == 1
+        assert inconsistencies[0].stored_balance is None
+
+    def test_that_repaired_balances_are_consistent(self) -> None:
+        account = self.database_gateway.create_account()
+        self.transfer_generator.create_transfer(
+            debit_account=account.id, value=Decimal(5)
+        )
+        self.set_stored_balance(account.id, Decimal(3))
+        self.checker.repair(self.checker.get_inconsistencies())
+        assert not self.checker.get_inconsistencies()
+
+    def test_that_missing_balances_are_created_on_repair(self) -> None:
+        account = self.database_gateway.create_account()
+        self.transfer_generator.create_transfer(
+            credit_account=account.id, value=Decimal(5)
+        )
+        self.db.session.execute(
+            delete(models.AccountBalance).where(
+                models.AccountBalance.account == account.id
+            )
+        )
+        self.checker.repair(self.checker.get_inconsistencies())
+        result = (
+            self.database_gateway.get_accounts()
+            .with_id(account.id)
+            .joined_with_balance()
+            .first()
+        )
+        assert result
+        assert result[1] == Decimal(5)
+
+    def set_stored_balance(self, account: UUID, balance: Decimal) -> None:
+        self.db.session.execute(
+            update(models.AccountBalance)
+            .where(models.AccountBalance.account == account)
+            .values(balance=balance)
+        )
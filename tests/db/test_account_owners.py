@@ -0,0 +1,77 @@
+from typing import List, Tuple
+
+from sqlalchemy import select
+
+from arbeitszeit.records import AccountTypes, SocialAccounting
+from arbeitszeit_db import models
+from tests.db.base_test_case import DatabaseTestCase
+
+
+class AccountOwnerTests(DatabaseTestCase):
+    def test_account_of_member_is_mapped_to_member(self) -> None:
+        member = (
+            self.database_gateway.get_members()
+            .with_id(self.member_generator.create_member())
+            .first()
+        )
+        assert member
+        assert self.get_account_owners(member.account) == [
+            (models.AccountOwnerType.member, member.id, AccountTypes.member)
+        ]
+
+    def test_accounts_of_company_are_mapped_to_company_with_their_roles(
+        self,
+    ) -> None:
+        company = self.company_generator.create_company_record()
+        for account, role in [
+            (company.means_account, AccountTypes.p),
+            (company.raw_material_account, AccountTypes.r),
+            (company.work_account, AccountTypes.a),
+            (company.product_account, AccountTypes.prd),
+        ]:
+            assert self.get_account_owners(account) == [
+                (models.AccountOwnerType.company, company.id, role)
+            ]
+
+    def test_account_of_cooperation_is_mapped_to_cooperation(self) -> None:
+        cooperation = (
+            self.database_gateway.get_cooperations()
+            .with_id(self.cooperation_generator.create_cooperation())
+            .first()
+        )
+        assert cooperation
+        assert self.get_account_owners(cooperation.account) == [
+            (
+                models.AccountOwnerType.cooperation,
+                cooperation.id,
+                AccountTypes.cooperation,
+            )
+        ]
+
+    def test_psf_account_of_social_accounting_is_mapped_to_social_accounting(
+        self,
+    ) -> None:
+        social_accounting = self.injector.get(SocialAccounting)
+        assert self.get_account_owners(social_accounting.account_psf) == [
+            (
+                models.AccountOwnerType.social_accounting,
+                social_accounting.id,
+                AccountTypes.psf,
+            )
+        ]
+
+    def test_accounts_without_owner_are_not_mapped(self) -> None:
+        account = self.database_gateway.create_account()
+        assert not self.get_account_owners(account.id)
+
+    def get_account_owners(
+        self, account: object
+    ) -> List[Tuple[models.AccountOwnerType, str, AccountTypes]]:
+        rows = self.db.session.execute(
+            select(
+                models.AccountOwner.owner_type,
+                models.AccountOwner.owner_id,
+                models.AccountOwner.account_role,
+            ).where(models.AccountOwner.account == account)
+        )
+        return [(row.owner_type, row.owner_id, row.account_role) for row in rows]
@@ -0,0 +1,139 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Tuple
+
+from sqlalchemy import select, update
+
+from arbeitszeit_db import models
+from arbeitszeit_db.balance_checkpoints import (
+    BalanceCheckpointUpdater,
+    get_checkpointed_until,
+)
+from tests.datetime_service import datetime_utc
+from tests.db.base_test_case import DatabaseTestCase
+
+
+class BalanceCheckpointUpdaterTests(DatabaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.updater = self.injector.get(BalanceCheckpointUpdater)
+        self.account = self.database_gateway.create_account().id
+
+    def test_that_nothing_is_checkpointed_initially(self) -> None:
+        assert get_checkpointed_until(self.db) is None
+
+    def test_that_days_up_to_yesterday_are_checkpointed(self) -> None:
+        checkpointed_until = self.updater.update(datetime_utc(2020, 1, 10, 12))
+        assert checkpointed_until == datetime_utc(2020, 1, 9).date()
+        assert get_checkpointed_until(self.db) == checkpointed_until
+
+    def test_that_end_of_day_balances_are_stored_for_completed_days(self) -> None:
+        self.credit(datetime_utc(2020, 1, 1, 10), Decimal(5))
+        self.credit(datetime_utc(2020, 1, 1, 11), Decimal(2))
+        self.debit(datetime_utc(2020, 1, 3, 9), Decimal(10))
+        self.credit(datetime_utc(2020, 1, 5, 9), Decimal(1))
+        self.updater.update(datetime_utc(2020, 1, 5, 12))
+        assert self.stored_balances() == [
+            (datetime_utc(2020, 1, 1).date(), Decimal(7)),
+            (datetime_utc(2020, 1, 3).date(), Decimal(-3)),
+        ]
+
+    def test_that_later_updates_continue_from_the_last_checkpoint(self) -> None:
+        self.credit(datetime_utc(2020, 1, 1, 10), Decimal(5))
+        self.updater.update(datetime_utc(2020, 1, 2, 12))
+        self.credit(datetime_utc(2020, 1, 3, 10), Decimal(3))
+        self.updater.update(datetime_utc(2020, 1, 4, 12))
+        assert self.stored_balances() == [
+            (datetime_utc(2020, 1, 1).date(), Decimal(5)),
+            (datetime_utc(2020, 1, 3).date(), Decimal(8)),
+        ]
+
+    def test_that_repeated_updates_on_the_same_day_store_nothing_new(self) -> None:
+        self.credit(datetime_utc(2020, 1, 1, 10), Decimal(5))
+        self.updater.update(datetime_utc(2020, 1, 2, 12))
+        self.updater.update(datetime_utc(2020, 1, 2, 13))
+        assert self.stored_balances() == [
+            (datetime_utc(2020, 1, 1).date(), Decimal(5)),
+        ]
+
+    def credit(self, date: datetime, value: Decimal) -> None:
+        self.transfer_generator.create_transfer(
+            date=date, credit_account=self.account, value=value
+        )
+
+    def debit(self, date: datetime, value: Decimal) -> None:
+        self.transfer_generator.create_transfer(
+            date=date, debit_account=self.account, value=value
+        )
+
+    def stored_balances(self) -> List[Tuple[date, Decimal]]:
+        return [
+            (row.day, row.balance)
+            for row in self.db.session.execute(
+                select(models.DailyAccountBalance)
+                .where(models.DailyAccountBalance.account == self.account)
+                .order_by(models.DailyAccountBalance.day)
+            ).scalars()
+        ]
+
+
+class CheckpointedRunningBalancesTests(DatabaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.updater = self.injector.get(BalanceCheckpointUpdater)
+        self.account = self.database_gateway.create_account().id
+        self.transfer_generator.create_transfer(
+            date=datetime_utc(2020, 1, 1, 10),
+            credit_account=self.account,
+            value=Decimal(5),
+        )
+        self.transfer_generator.create_transfer(
+            date=datetime_utc(2020, 1, 3, 9),
+            debit_account=self.account,
+            value=Decimal(2),
+        )
+        self.transfer_generator.create_transfer(
+            date=datetime_utc(2020, 1, 6, 9),
+            credit_account=self.account,
+            value=Decimal(4),
+        )
+
+    def test_that_every_transfer_date_is_yielded_without_checkpoints(self) -> None:
+        assert self.running_balances() == [
+            (datetime_utc(2020, 1, 1, 10), Decimal(5)),
+            (datetime_utc(2020, 1, 3, 9), Decimal(3)),
+            (datetime_utc(2020, 1, 6, 9), Decimal(7)),
+        ]
+
+    def test_that_checkpointed_days_are_yielded_at_the_start_of_the_next_day(
+        self,
+    ) -> None:
+        self.updater.update(datetime_utc(2020, 1, 5, 12))
+        assert self.running_balances() == [
+            (datetime_utc(2020, 1, 2), Decimal(5)),
+            (datetime_utc(2020, 1, 4), Decimal(3)),
+            (datetime_utc(2020, 1, 6, 9), Decimal(7)),
+        ]
+
+    def test_that_later_balances_continue_from_the_latest_checkpoint(self) -> None:
+        self.updater.update(datetime_utc(2020, 1, 5, 12))
+        self.db.session.execute(
+            update(models.DailyAccountBalance)
+            .where(models.DailyAccountBalance.account == self.account)
+            .where(models.DailyAccountBalance.day == datetime_utc(2020, 1, 3).date())
+            .values(balance=Decimal(100))
+        )
+        *_, (_, final_balance) = self.running_balances()
+        assert final_balance == Decimal(104)
+
+    def test_that_balances_of_later_transfers_are_unchanged_by_checkpoints(
+        self,
+    ) -> None:
+        expected = self.running_balances()[-1]
+        self.updater.update(datetime_utc(2020, 1, 5, 12))
+        assert self.running_balances()[-1] == expected
+
+    def running_balances(self) -> List[Tuple[datetime, Decimal]]:
+        return list(
+            self.database_gateway.get_transfers().running_balances_of(self.account)
+        )
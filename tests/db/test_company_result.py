@@ -1,7 +1,10 @@
 from typing import List
 from uuid import UUID, uuid4
 
+from parameterized import parameterized
+
 from arbeitszeit import records
+from arbeitszeit_db import models
 from tests.db.base_test_case import DatabaseTestCase
 
 from .utility import Utility
@@ -221,6 +224,57 @@ class WithNameContainingTests(DatabaseTestCase):
         assert returned_company
         assert returned_company[0].id == expected_company_id
 
+    def test_that_renamed_company_is_found_by_its_new_name_only(self) -> None:
+        company = self.company_generator.create_company(name="abc123")
+        self.db.session.query(models.Company).filter(
+            models.Company.id == company
+        ).update({models.Company.name: "xyz789"})
+        companies = self.database_gateway.get_companies()
+        assert [c.id for c in companies.with_name_containing("xyz789")] == [company]
+        assert not companies.with_name_containing("abc123")
+
+    def test_that_renaming_one_company_keeps_others_searchable(self) -> None:
+        other = self.company_generator.create_company(name="abc123")
+        company = self.company_generator.create_company(name="def456")
+        self.db.session.query(models.Company).filter(
+            models.Company.id == company
+        ).update({models.Company.name: "xyz789"})
+        companies = self.database_gateway.get_companies()
+        assert [c.id for c in companies.with_name_containing("abc123")] == [other]
+
+
+class OrderedByNameTests(DatabaseTestCase):
+    def test_that_companies_are_ordered_by_name(self) -> None:
+        self.company_generator.create_company(name="b")
+        self.company_generator.create_company(name="c")
+        self.company_generator.create_company(name="a")
+        companies = self.database_gateway.get_companies().ordered_by_name()
+        assert [company.name for company in companies] == ["a", "b", "c"]
+
+    def test_that_companies_can_be_ordered_by_name_descending(self) -> None:
+        self.company_generator.create_company(name="b")
+        self.company_generator.create_company(name="a")
+        companies = self.database_gateway.get_companies().ordered_by_name(
+            ascending=False
+        )
+        assert [company.name for company in companies] == ["b", "a"]
+
+    def test_that_companies_with_same_name_are_ordered_by_id(self) -> None:
+        company_ids = [
+            self.company_generator.create_company(name="a") for _ in range(3)
+        ]
+        companies = self.database_gateway.get_companies().ordered_by_name()
+        assert [company.id for company in companies] == sorted(company_ids)
+
+    def test_that_only_companies_after_cursor_are_returned(self) -> None:
+        self.company_generator.create_company(name="a")
+        company_b = self.company_generator.create_company(name="b")
+        company_c = self.company_generator.create_company(name="c")
+        companies = self.database_gateway.get_companies().ordered_by_name()
+        assert [company.id for company in companies.after(("b", company_b))] == [
+            company_c
+        ]
+
 
 class WithEmailContainingTests(DatabaseTestCase):
     def test_that_companies_can_be_filtered_by_email(self):
@@ -264,6 +318,59 @@ class WithEmailContainingTests(DatabaseTestCase):
         assert returned_company
         assert returned_company[0].id == expected_company_id
 
+    def test_that_companies_can_be_found_by_changed_email_address(self) -> None:
+        company = self.company_generator.create_company(email="old.mail@cp.org")
+        self.database_gateway.create_email_address(
+            address="new.mail@cp.org", confirmed_on=None
+        )
+        self.database_gateway.get_account_credentials().update().change_email_address(
+            "new.mail@cp.org"
+        ).perform()
+        assert not self.database_gateway.get_companies().with_email_containing(
+            "old.mail"
+        )
+        returned_companies = list(
+            self.database_gateway.get_companies().with_email_containing("new.mail")
+        )
+        assert [company.id for company in returned_companies] == [company]
+
+
+class OrderedByNameRelevanceTests(DatabaseTestCase):
+    @parameterized.expand(
+        [
+            ("bakery",),
+            ("ba",),
+        ]
+    )
+    def test_that_exact_match_is_ranked_before_longer_names(self, query: str) -> None:
+        longer_name = self.company_generator.create_company(
+            name="bakery and bakery supplies"
+        )
+        exact_match = self.company_generator.create_company(name="bakery")
+        returned_companies = list(
+            self.database_gateway.get_companies()
+            .with_name_containing(query)
+            .ordered_by_name_relevance(query)
+        )
+        assert [company.id for company in returned_companies] == [
+            exact_match,
+            longer_name,
+        ]
+
+    def test_that_companies_can_be_ordered_by_name_after_ranking(self) -> None:
+        company_b = self.company_generator.create_company(name="bakery b")
+        company_a = self.company_generator.create_company(name="bakery a")
+        returned_companies = list(
+            self.database_gateway.get_companies()
+            .with_name_containing("bakery")
+            .ordered_by_name_relevance("bakery")
+            .ordered_by_name()
+        )
+        assert [company.id for company in returned_companies] == [
+            company_a,
+            company_b,
+        ]
+
 
 class JoinedWithEmailTests(DatabaseTestCase):
     def setUp(self) -> None:
@@ -0,0 +1,64 @@
+from uuid import UUID
+
+from sqlalchemy import update
+
+from arbeitszeit_db import models
+from arbeitszeit_db.consumed_amounts import ConsumedAmountChecker
+from tests.db.base_test_case import DatabaseTestCase
+
+
+class ConsumedAmountCheckerTests(DatabaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.checker = self.injector.get(ConsumedAmountChecker)
+
+    def test_no_inconsistencies_are_found_without_consumptions(self) -> None:
+        self.plan_generator.create_plan()
+        assert not self.checker.get_inconsistencies()
+
+    def test_no_inconsistencies_are_found_after_consumptions_were_created(
+        self,
+    ) -> None:
+        plan = self.plan_generator.create_plan()
+        self.consumption_generator.create_private_consumption(plan=plan, amount=2)
+        self.consumption_generator.create_fixed_means_consumption(plan=plan, amount=3)
+        assert not self.checker.get_inconsistencies()
+
+    def test_manipulated_amount_is_reported_as_inconsistent(self) -> None:
+        plan = self.plan_generator.create_plan()
+        self.consumption_generator.create_private_consumption(plan=plan, amount=2)
+        self.consumption_generator.create_fixed_means_consumption(plan=plan, amount=3)
+        self.set_stored_amount(plan, 1)
+        inconsistencies = self.checker.get_inconsistencies()
+        assert len(inconsistencies) == 1
+        assert inconsistencies[0].plan == plan
+        assert inconsistencies[0].stored_amount == 1
+        assert inconsistencies[0].calculated_amount == 5
+
+    def test_that_repaired_amounts_are_consistent(self) -> None:
+        plan = self.plan_generator.create_plan()
+        self.consumption_generator.create_private_consumption(plan=plan, amount=2)
+        self.set_stored_amount(plan, 7)
+        self.checker.repair(self.checker.get_inconsistencies())
+        assert not self.checker.get_inconsistencies()
+
+    def test_that_repaired_amount_is_used_as_provided_product_amount(self) -> None:
+        plan = self.plan_generator.create_plan()
+        self.consumption_generator.create_private_consumption(plan=plan, amount=4)
+        self.set_stored_amount(plan, 0)
+        self.checker.repair(self.checker.get_inconsistencies())
+        result = (
+            self.database_gateway.get_plans()
+            .with_id(plan)
+            .joined_with_provided_product_amount()
+            .first()
+        )
+        assert result
+        assert result[1] == 4
+
+    def set_stored_amount(self, plan: UUID, amount: int) -> None:
+        self.db.session.execute(
+            update(models.Plan)
+            .where(models.Plan.id == plan)
+            .values(consumed_amount=amount)
+        )
@@ -209,3 +209,75 @@ class JoinedWithCurrentCoordinatorTests(DatabaseTestCase):
             )
             == 1
         )
+
+
+class OrderedByNameTests(DatabaseTestCase):
+    def test_that_cooperations_are_ordered_alphabetically_by_default(self) -> None:
+        self.cooperation_generator.create_cooperation(name="b coop")
+        self.cooperation_generator.create_cooperation(name="a coop")
+        cooperations = self.database_gateway.get_cooperations().ordered_by_name()
+        assert [coop.name for coop in cooperations] == ["a coop", "b coop"]
+
+    def test_that_cooperations_can_be_ordered_descending(self) -> None:
+        self.cooperation_generator.create_cooperation(name="a coop")
+        self.cooperation_generator.create_cooperation(name="b coop")
+        cooperations = self.database_gateway.get_cooperations().ordered_by_name(
+            ascending=False
+        )
+        assert [coop.name for coop in cooperations] == ["b coop", "a coop"]
+
+
+class JoinedWithActivePlanCountTests(DatabaseTestCase):
+    def test_that_cooperation_without_plans_has_count_of_zero(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        result = self.database_gateway.get_cooperations().joined_with_active_plan_count(
+            self.datetime_service.now()
+        )
+        assert [(coop.id, count) for coop, count in result] == [(cooperation, 0)]
+
+    def test_that_all_active_plans_of_a_cooperation_are_counted(self) -> None:
+        plans = [self.plan_generator.create_plan() for _ in range(3)]
+        self.cooperation_generator.create_cooperation(plans=plans)
+        result = self.database_gateway.get_cooperations().joined_with_active_plan_count(
+            self.datetime_service.now()
+        )
+        assert [count for _, count in result] == [3]
+
+    def test_that_expired_plans_are_not_counted(self) -> None:
+        self.datetime_service.freeze_time(datetime_utc(2000, 1, 1))
+        plan = self.plan_generator.create_plan(timeframe=1)
+        self.cooperation_generator.create_cooperation(plans=[plan])
+        result = self.database_gateway.get_cooperations().joined_with_active_plan_count(
+            datetime_utc(2000, 1, 3)
+        )
+        assert [count for _, count in result] == [0]
+
+    def test_that_plans_are_counted_for_their_own_cooperation_only(self) -> None:
+        first = self.cooperation_generator.create_cooperation(
+            name="a coop", plans=[self.plan_generator.create_plan()]
+        )
+        second = self.cooperation_generator.create_cooperation(
+            name="b coop",
+            plans=[
+                self.plan_generator.create_plan(),
+                self.plan_generator.create_plan(),
+            ],
+        )
+        result = (
+            self.database_gateway.get_cooperations()
+            .ordered_by_name()
+            .joined_with_active_plan_count(self.datetime_service.now())
+        )
+        assert [(coop.id, count) for coop, count in result] == [(first, 1), (second, 2)]
+
+    def test_that_page_counts_all_cooperations(self) -> None:
+        for _ in range(3):
+            self.cooperation_generator.create_cooperation()
+        page = (
+            self.database_gateway.get_cooperations()
+            .ordered_by_name()
+            .joined_with_active_plan_count(self.datetime_service.now())
+            .page(offset=0, limit=2)
+        )
+        assert len(list(page.items)) == 2
+        assert page.total == 3
@@ -0,0 +1,65 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from sqlalchemy import create_engine
+
+from arbeitszeit_db.db import InstrumentedQueuePool
+from tests.db.base_test_case import DatabaseTestCase
+
+
+class InstrumentedQueuePoolTests(TestCase):
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.engine = create_engine(
+            f"sqlite:///{Path(self.directory.name) / 'pool'}.db",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=1,
+        )
+        assert isinstance(self.engine.pool, InstrumentedQueuePool)
+        self.pool = self.engine.pool
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+        self.directory.cleanup()
+
+    def test_that_fresh_pool_has_no_checkouts(self) -> None:
+        statistics = self.pool.statistics()
+        assert statistics.checkouts == 0
+        assert statistics.checked_out == 0
+        assert statistics.overflow == 0
+
+    def test_that_checked_out_connections_are_counted(self) -> None:
+        with self.engine.connect():
+            statistics = self.pool.statistics()
+        assert statistics.checked_out == 1
+        assert statistics.checkouts == 1
+
+    def test_that_returned_connections_are_not_counted_as_checked_out(
+        self,
+    ) -> None:
+        with self.engine.connect():
+            pass
+        assert self.pool.statistics().checked_out == 0
+
+    def test_that_overflow_is_reported_when_pool_size_is_exceeded(self) -> None:
+        with self.engine.connect(), self.engine.connect():
+            statistics = self.pool.statistics()
+        assert statistics.size == 1
+        assert statistics.overflow == 1
+
+    def test_that_wait_time_is_recorded(self) -> None:
+        with self.engine.connect():
+            pass
+        statistics = self.pool.statistics()
+        assert statistics.total_wait_seconds >= 0
+        assert statistics.max_wait_seconds <= statistics.total_wait_seconds
+
+
+class DatabasePoolStatisticsTests(DatabaseTestCase):
+    def test_that_statistics_of_primary_pool_are_available(self) -> None:
+        assert "primary" in self.db.pool_statistics()
+
+    def test_that_no_statistics_are_reported_without_replica(self) -> None:
+        assert "replica" not in self.db.pool_statistics()
@@ -0,0 +1,113 @@
+from typing import Callable
+from uuid import UUID
+
+from arbeitszeit.interactors.get_coop_summary import (
+    GetCoopSummaryInteractor,
+    GetCoopSummaryRequest,
+)
+from arbeitszeit.interactors.list_all_cooperations import (
+    ListAllCooperationsInteractor,
+)
+from arbeitszeit.interactors.show_company_cooperations import (
+    Request,
+    ShowCompanyCooperationsInteractor,
+)
+from tests.db.base_test_case import DatabaseTestCase
+
+
+class QueryCountTestCase(DatabaseTestCase):
+    """The number of queries an interactor sends to the database must
+    not grow with the number of rows it shows.
+    """
+
+    def count_queries(self, action: Callable[[], object]) -> int:
+        with self.db.recording_queries() as statistics:
+            action()
+        return statistics.query_count
+
+
+class ShowCompanyCooperationsQueryCountTests(QueryCountTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.interactor = self.injector.get(ShowCompanyCooperationsInteractor)
+        self.company = self.company_generator.create_company()
+
+    def test_query_count_does_not_depend_on_number_of_inbound_requests(
+        self,
+    ) -> None:
+        cooperation = self.cooperation_generator.create_cooperation(
+            coordinator=self.company
+        )
+        self.plan_generator.create_plan(requested_cooperation=cooperation)
+        queries_for_one_request = self.count_queries(self.show_cooperations)
+        for _ in range(3):
+            self.plan_generator.create_plan(requested_cooperation=cooperation)
+        assert self.count_queries(self.show_cooperations) == queries_for_one_request
+
+    def test_query_count_does_not_depend_on_number_of_outbound_requests(
+        self,
+    ) -> None:
+        self.plan_generator.create_plan(
+            planner=self.company,
+            requested_cooperation=self.cooperation_generator.create_cooperation(),
+        )
+        queries_for_one_request = self.count_queries(self.show_cooperations)
+        for _ in range(3):
+            self.plan_generator.create_plan(
+                planner=self.company,
+                requested_cooperation=self.cooperation_generator.create_cooperation(),
+            )
+        assert self.count_queries(self.show_cooperations) == queries_for_one_request
+
+    def show_cooperations(self) -> None:
+        self.interactor.show_company_cooperations(Request(company=self.company))
+
+
+class GetCoopSummaryQueryCountTests(QueryCountTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.interactor = self.injector.get(GetCoopSummaryInteractor)
+        self.cooperation = self.cooperation_generator.create_cooperation()
+
+    def test_query_count_does_not_depend_on_number_of_associated_plans(
+        self,
+    ) -> None:
+        self.plan_generator.create_plan(cooperation=self.cooperation)
+        queries_for_one_plan = self.count_queries(self.get_summary)
+        for _ in range(3):
+            self.plan_generator.create_plan(cooperation=self.cooperation)
+        assert self.count_queries(self.get_summary) == queries_for_one_plan
+
+    def get_summary(self) -> None:
+        response = self.interactor.execute(
+            GetCoopSummaryRequest(requester_id=UUID(int=0), coop_id=self.cooperation)
+        )
+        assert response
+
+
+class ListAllCooperationsQueryCountTests(QueryCountTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.interactor = self.injector.get(ListAllCooperationsInteractor)
+
+    def test_query_count_does_not_depend_on_number_of_cooperations(self) -> None:
+        self.cooperation_generator.create_cooperation(
+            plans=[self.plan_generator.create_plan()]
+        )
+        queries_for_one_cooperation = self.count_queries(self.interactor.execute)
+        for _ in range(3):
+            self.cooperation_generator.create_cooperation(
+                plans=[self.plan_generator.create_plan()]
+            )
+        assert (
+            self.count_queries(self.interactor.execute) == queries_for_one_cooperation
+        )
+
+    def test_cooperations_are_listed_within_one_query(self) -> None:
+        for _ in range(3):
+            self.cooperation_generator.create_cooperation(
+                plans=[self.plan_generator.create_plan()]
+            )
+        self.db.session.flush()
+        with self.assert_query_budget(1):
+            self.interactor.execute()
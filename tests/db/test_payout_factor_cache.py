@@ -0,0 +1,56 @@
+from decimal import Decimal
+
+from tests.datetime_service import datetime_utc
+from tests.db.base_test_case import DatabaseTestCase
+
+
+class PayoutFactorCacheTests(DatabaseTestCase):
+    def test_that_cache_is_empty_initially(self) -> None:
+        cache = self.database_gateway.get_payout_factor_cache()
+        assert cache.payout_factor is None
+
+    def test_that_stored_payout_factor_is_cached(self) -> None:
+        self.store(Decimal("0.25"))
+        cache = self.database_gateway.get_payout_factor_cache()
+        assert cache.payout_factor == Decimal("0.25")
+
+    def test_that_validity_of_stored_payout_factor_is_cached(self) -> None:
+        self.store(Decimal("0.25"))
+        cache = self.database_gateway.get_payout_factor_cache()
+        assert cache.computed_at == datetime_utc(2000, 1, 1)
+        assert cache.valid_until == datetime_utc(2000, 1, 5)
+
+    def test_that_invalidation_removes_cached_payout_factor(self) -> None:
+        self.store(Decimal("0.25"))
+        self.database_gateway.invalidate_payout_factor_cache()
+        cache = self.database_gateway.get_payout_factor_cache()
+        assert cache.payout_factor is None
+
+    def test_that_invalidation_increments_version(self) -> None:
+        version = self.database_gateway.get_payout_factor_cache().version
+        self.database_gateway.invalidate_payout_factor_cache()
+        cache = self.database_gateway.get_payout_factor_cache()
+        assert cache.version == version + 1
+
+    def test_that_payout_factor_of_current_version_is_stored(self) -> None:
+        assert self.store(Decimal("0.25"))
+
+    def test_that_payout_factor_of_outdated_version_is_not_stored(self) -> None:
+        version = self.database_gateway.get_payout_factor_cache().version
+        self.database_gateway.invalidate_payout_factor_cache()
+        assert not self.database_gateway.store_payout_factor(
+            version=version,
+            payout_factor=Decimal("0.25"),
+            computed_at=datetime_utc(2000, 1, 1),
+            valid_until=None,
+        )
+        assert self.database_gateway.get_payout_factor_cache().payout_factor is None
+
+    def store(self, payout_factor: Decimal) -> bool:
+        cache = self.database_gateway.get_payout_factor_cache()
+        return self.database_gateway.store_payout_factor(
+            version=cache.version,
+            payout_factor=payout_factor,
+            computed_at=datetime_utc(2000, 1, 1),
+            valid_until=datetime_utc(2000, 1, 5),
+        )
@@ -0,0 +1,45 @@
+from decimal import Decimal
+
+from arbeitszeit.records import PayoutFactorChange
+from tests.datetime_service import datetime_utc
+from tests.db.base_test_case import DatabaseTestCase
+
+
+class PayoutFactorChangeResultTests(DatabaseTestCase):
+    def test_that_there_are_no_changes_initially(self) -> None:
+        assert not self.database_gateway.get_payout_factor_changes()
+
+    def test_that_created_changes_can_be_retrieved(self) -> None:
+        change = PayoutFactorChange(
+            timestamp=datetime_utc(2000, 1, 1), payout_factor=Decimal("0.5")
+        )
+        self.database_gateway.create_payout_factor_changes([change])
+        assert list(self.database_gateway.get_payout_factor_changes()) == [change]
+
+    def test_that_changes_can_be_ordered_by_timestamp(self) -> None:
+        self.create_changes_at_days(3, 1, 2)
+        changes = self.database_gateway.get_payout_factor_changes()
+        assert [
+            change.timestamp.day
+            for change in changes.ordered_by_timestamp(ascending=False)
+        ] == [3, 2, 1]
+
+    def test_that_changes_after_a_timestamp_can_be_filtered(self) -> None:
+        self.create_changes_at_days(1, 2, 3)
+        changes = self.database_gateway.get_payout_factor_changes()
+        assert [
+            change.timestamp.day
+            for change in changes.that_occurred_after(
+                datetime_utc(2000, 1, 2)
+            ).ordered_by_timestamp()
+        ] == [3]
+
+    def create_changes_at_days(self, *days: int) -> None:
+        self.database_gateway.create_payout_factor_changes(
+            [
+                PayoutFactorChange(
+                    timestamp=datetime_utc(2000, 1, day), payout_factor=Decimal(1)
+                )
+                for day in days
+            ]
+        )
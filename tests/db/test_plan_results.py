@@ -1,5 +1,6 @@
 from datetime import UTC, timedelta
 from decimal import Decimal
+from random import Random
 from typing import List
 from uuid import UUID, uuid4
 
@@ -7,7 +8,11 @@ from parameterized import parameterized
 
 from arbeitszeit.interactors.approve_plan import ApprovePlanInteractor
 from arbeitszeit.interactors.reject_plan import RejectPlanInteractor
-from arbeitszeit.records import Plan, ProductionCosts
+from arbeitszeit.records import PayoutFactorCosts, Plan, ProductionCosts
+from arbeitszeit.services.payout_factor import (
+    calculate_payout_factor,
+    payout_factor_from_costs,
+)
 from arbeitszeit_db import models
 from tests.control_thresholds import ControlThresholdsTestImpl
 from tests.datetime_service import datetime_utc
@@ -216,6 +221,17 @@ class GetActivePlansTests(DatabaseTestCase):
         assert returned_plan
         assert returned_plan[0].id == expected_plan
 
+    def test_that_query_plans_by_substring_of_plan_id_with_dashes_returns_plan(
+        self,
+    ) -> None:
+        expected_plan = self.plan_generator.create_plan()
+        query = str(expected_plan)[5:15].upper()
+        returned_plan = list(
+            self.database_gateway.get_plans().with_id_containing(query)
+        )
+        assert returned_plan
+        assert returned_plan[0].id == expected_plan
+
     def test_that_plans_that_ordering_by_creation_date_works_even_when_plan_activation_was_in_reverse_order(
         self,
     ) -> None:
@@ -240,6 +256,51 @@ class GetActivePlansTests(DatabaseTestCase):
         assert plans[1].id == second_plan
 
 
+class ProductNameSearchTests(DatabaseTestCase):
+    def test_that_plans_can_be_filtered_by_query_shorter_than_three_characters(
+        self,
+    ) -> None:
+        expected_plan = self.plan_generator.create_plan(product_name="Tea")
+        self.plan_generator.create_plan(product_name="Coffee")
+        returned_plans = list(
+            self.database_gateway.get_plans().with_product_name_containing("eA")
+        )
+        assert [plan.id for plan in returned_plans] == [expected_plan]
+
+    def test_that_plans_not_containing_the_query_are_filtered_out(self) -> None:
+        self.plan_generator.create_plan(product_name="Delivery of goods")
+        assert not self.database_gateway.get_plans().with_product_name_containing(
+            "services"
+        )
+
+    def test_that_query_with_quotes_matches_product_name_with_quotes(self) -> None:
+        expected_plan = self.plan_generator.create_plan(product_name='The "Best" Tea')
+        returned_plans = list(
+            self.database_gateway.get_plans().with_product_name_containing('"Best"')
+        )
+        assert [plan.id for plan in returned_plans] == [expected_plan]
+
+    @parameterized.expand(
+        [
+            ("beer",),
+            ("be",),
+        ]
+    )
+    def test_that_exact_match_is_ranked_before_longer_product_names(
+        self, query: str
+    ) -> None:
+        longer_name = self.plan_generator.create_plan(
+            product_name="beer mugs and beer glasses"
+        )
+        exact_match = self.plan_generator.create_plan(product_name="beer")
+        returned_plans = list(
+            self.database_gateway.get_plans()
+            .with_product_name_containing(query)
+            .ordered_by_product_name_relevance(query)
+        )
+        assert [plan.id for plan in returned_plans] == [exact_match, longer_name]
+
+
 class GetAllPlans(DatabaseTestCase):
     def test_that_without_any_plans_nothing_is_returned(self) -> None:
         assert not list(self.database_gateway.get_plans())
@@ -581,6 +642,162 @@ class GetStatisticsTests(DatabaseTestCase):
         )
 
 
+class GetPayoutFactorCostsTests(DatabaseTestCase):
+    def test_with_no_plans_that_all_costs_are_0(self) -> None:
+        costs = self.database_gateway.get_plans().get_payout_factor_costs()
+        assert costs == PayoutFactorCosts(
+            productive_labour=Decimal(0),
+            public_labour=Decimal(0),
+            public_means_and_resources=Decimal(0),
+        )
+
+    def test_that_labour_of_productive_plans_is_summed_up(self) -> None:
+        self.plan_generator.create_plan(
+            is_public_service=False,
+            costs=ProductionCosts(Decimal(2), Decimal(3), Decimal(4)),
+        )
+        self.plan_generator.create_plan(
+            is_public_service=False,
+            costs=ProductionCosts(Decimal(5), Decimal(6), Decimal(7)),
+        )
+        costs = self.database_gateway.get_plans().get_payout_factor_costs()
+        assert costs.productive_labour == Decimal(7)
+
+    def test_that_means_and_resources_of_productive_plans_are_ignored(self) -> None:
+        self.plan_generator.create_plan(
+            is_public_service=False,
+            costs=ProductionCosts(Decimal(2), Decimal(3), Decimal(4)),
+        )
+        costs = self.database_gateway.get_plans().get_payout_factor_costs()
+        assert costs.public_means_and_resources == Decimal(0)
+
+    def test_that_labour_of_public_plans_is_summed_up(self) -> None:
+        self.plan_generator.create_plan(
+            is_public_service=True,
+            costs=ProductionCosts(Decimal(2), Decimal(3), Decimal(4)),
+        )
+        self.plan_generator.create_plan(
+            is_public_service=True,
+            costs=ProductionCosts(Decimal(5), Decimal(6), Decimal(7)),
+        )
+        costs = self.database_gateway.get_plans().get_payout_factor_costs()
+        assert costs.public_labour == Decimal(7)
+
+    def test_that_means_and_resources_of_public_plans_are_summed_up(self) -> None:
+        self.plan_generator.create_plan(
+            is_public_service=True,
+            costs=ProductionCosts(Decimal(2), Decimal(3), Decimal(4)),
+        )
+        self.plan_generator.create_plan(
+            is_public_service=True,
+            costs=ProductionCosts(Decimal(5), Decimal(6), Decimal(7)),
+        )
+        costs = self.database_gateway.get_plans().get_payout_factor_costs()
+        assert costs.public_means_and_resources == Decimal(20)
+
+    def test_that_only_plans_in_result_are_considered(self) -> None:
+        planner = self.company_generator.create_company()
+        self.plan_generator.create_plan(
+            planner=planner,
+            is_public_service=False,
+            costs=ProductionCosts(Decimal(2), Decimal(3), Decimal(4)),
+        )
+        self.plan_generator.create_plan(
+            is_public_service=False,
+            costs=ProductionCosts(Decimal(5), Decimal(6), Decimal(7)),
+        )
+        costs = (
+            self.database_gateway.get_plans()
+            .planned_by(planner)
+            .get_payout_factor_costs()
+        )
+        assert costs.productive_labour == Decimal(2)
+
+    def test_that_ordered_results_can_be_aggregated(self) -> None:
+        self.plan_generator.create_plan(
+            is_public_service=False,
+            costs=ProductionCosts(Decimal(2), Decimal(3), Decimal(4)),
+        )
+        costs = (
+            self.database_gateway.get_plans()
+            .ordered_by_creation_date()
+            .get_payout_factor_costs()
+        )
+        assert costs.productive_labour == Decimal(2)
+
+    @parameterized.expand([(seed,) for seed in range(10)])
+    def test_that_payout_factor_from_aggregated_costs_agrees_with_plan_by_plan(
+        self, seed: int
+    ) -> None:
+        random = Random(seed)
+        self.datetime_service.freeze_time(datetime_utc(2000, 1, 1))
+        for _ in range(random.randint(0, 6)):
+            self.plan_generator.create_plan(
+                is_public_service=random.choice([True, False]),
+                costs=ProductionCosts(
+                    labour_cost=Decimal(random.randint(0, 50)),
+                    resource_cost=Decimal(random.randint(0, 50)),
+                    means_cost=Decimal(random.randint(0, 50)),
+                ),
+                timeframe=random.randint(1, 10),
+            )
+            self.datetime_service.advance_time(timedelta(days=random.randint(1, 3)))
+        now = self.datetime_service.now()
+        active_plans = (
+            self.database_gateway.get_plans()
+            .that_will_expire_after(now)
+            .that_were_approved_before(now)
+        )
+        assert payout_factor_from_costs(
+            active_plans.get_payout_factor_costs()
+        ) == calculate_payout_factor(active_plans)
+
+
+class GetEarliestExpirationDateTests(DatabaseTestCase):
+    def test_that_there_is_no_expiration_date_without_plans(self) -> None:
+        assert self.database_gateway.get_plans().get_earliest_expiration_date() is None
+
+    def test_that_unapproved_plans_have_no_expiration_date(self) -> None:
+        self.plan_generator.create_plan(approved=False)
+        assert self.database_gateway.get_plans().get_earliest_expiration_date() is None
+
+    def test_that_earliest_expiration_date_of_approved_plans_is_returned(
+        self,
+    ) -> None:
+        self.datetime_service.freeze_time(datetime_utc(2000, 1, 1))
+        self.plan_generator.create_plan(timeframe=10)
+        self.plan_generator.create_plan(timeframe=3)
+        assert self.database_gateway.get_plans().get_earliest_expiration_date() == (
+            datetime_utc(2000, 1, 4)
+        )
+
+
+class ThatWereApprovedAfterTests(DatabaseTestCase):
+    def test_plan_approved_after_a_specified_timestamp_is_included_in_the_result(
+        self,
+    ) -> None:
+        self.datetime_service.freeze_time(datetime_utc(2000, 1, 2))
+        self.plan_generator.create_plan()
+        assert self.database_gateway.get_plans().that_were_approved_after(
+            datetime_utc(2000, 1, 1)
+        )
+
+    def test_plan_approved_exactly_at_a_specified_timestamp_is_excluded_from_result(
+        self,
+    ) -> None:
+        self.datetime_service.freeze_time(datetime_utc(2000, 1, 1))
+        self.plan_generator.create_plan()
+        assert not self.database_gateway.get_plans().that_were_approved_after(
+            datetime_utc(2000, 1, 1)
+        )
+
+    def test_unapproved_plan_is_excluded_from_result(self) -> None:
+        self.plan_generator.create_plan(approved=False)
+        assert not self.database_gateway.get_plans().that_were_approved_after(
+            datetime_utc(2000, 1, 1)
+        )
+
+
 class ThatWereApprovedBeforeTests(DatabaseTestCase):
     def test_plan_activated_before_a_specified_timestamp_are_included_in_the_result(
         self,
@@ -638,6 +855,17 @@ class ThatWillExpireAfterTests(DatabaseTestCase):
             datetime_utc(2000, 1, 3)
         )
 
+    def test_that_fractions_of_seconds_of_approval_date_are_considered(
+        self,
+    ) -> None:
+        self.datetime_service.freeze_time(
+            datetime_utc(2000, 1, 1).replace(microsecond=500000)
+        )
+        self.plan_generator.create_plan(timeframe=1)
+        assert self.database_gateway.get_plans().that_will_expire_after(
+            datetime_utc(2000, 1, 2).replace(microsecond=400000)
+        )
+
     def test_that_a_plan_without_approval_is_not_included_in_results(self) -> None:
         self.datetime_service.freeze_time(datetime_utc(2000, 1, 1))
         self.plan_generator.create_plan(approved=False, timeframe=1)
@@ -788,6 +1016,24 @@ class JoinedWithPlannerAndCooperationTests(DatabaseTestCase):
         )
         results.first()
 
+    def test_that_joined_approved_plan_equals_plan_queried_without_join(
+        self,
+    ) -> None:
+        plan = self.plan_generator.create_plan(approved=True)
+        result = self.database_gateway.get_plans().joined_with_planner_and_cooperation()
+        joined_plan, _, _ = list(result)[0]
+        assert joined_plan.approval_date
+        assert joined_plan == self.database_gateway.get_plans().with_id(plan).first()
+
+    def test_that_joined_rejected_plan_equals_plan_queried_without_join(
+        self,
+    ) -> None:
+        plan = self.plan_generator.create_plan(approved=False, rejected=True)
+        result = self.database_gateway.get_plans().joined_with_planner_and_cooperation()
+        joined_plan, _, _ = list(result)[0]
+        assert joined_plan.rejection_date
+        assert joined_plan == self.database_gateway.get_plans().with_id(plan).first()
+
 
 class JoinedWithCooperationTests(DatabaseTestCase):
     def test_that_no_results_are_returned_if_no_plans_exist(self) -> None:
@@ -322,3 +322,63 @@ class FilterWhereProviderIsCompanyTests(DatabaseTestCase):
             provider
         )
         assert len(result) == 1
+
+
+class GroupedByProviderTests(DatabaseTestCase):
+    def test_that_nothing_is_yielded_without_consumptions(self) -> None:
+        assert not list(
+            self.database_gateway.get_productive_consumptions().grouped_by_provider()
+        )
+
+    def test_that_provider_is_yielded_once_for_several_consumptions(self) -> None:
+        provider = self.company_generator.create_company()
+        plan = self.plan_generator.create_plan(planner=provider)
+        self.consumption_generator.create_resource_consumption_by_company(plan=plan)
+        self.consumption_generator.create_fixed_means_consumption(plan=plan)
+        result = (
+            self.database_gateway.get_productive_consumptions().grouped_by_provider()
+        )
+        assert [company.id for company, _ in result] == [provider]
+
+    def test_that_volume_is_the_sum_of_the_transfers_of_the_consumptions(
+        self,
+    ) -> None:
+        provider = self.company_generator.create_company()
+        plan = self.plan_generator.create_plan(planner=provider)
+        self.consumption_generator.create_resource_consumption_by_company(plan=plan)
+        self.consumption_generator.create_fixed_means_consumption(plan=plan, amount=2)
+        expected_volume = sum(
+            transfer.value
+            for _, transfer in self.database_gateway.get_productive_consumptions().joined_with_transfer()
+        )
+        ((_, volume),) = (
+            self.database_gateway.get_productive_consumptions().grouped_by_provider()
+        )
+        assert volume == expected_volume
+
+    def test_that_volumes_are_grouped_per_provider(self) -> None:
+        provider_1 = self.company_generator.create_company()
+        provider_2 = self.company_generator.create_company()
+        plan_1 = self.plan_generator.create_plan(planner=provider_1)
+        plan_2 = self.plan_generator.create_plan(planner=provider_2)
+        self.consumption_generator.create_resource_consumption_by_company(plan=plan_1)
+        self.consumption_generator.create_resource_consumption_by_company(plan=plan_2)
+        result = (
+            self.database_gateway.get_productive_consumptions().grouped_by_provider()
+        )
+        assert {company.id for company, _ in result} == {provider_1, provider_2}
+
+    def test_that_only_consumptions_of_filtered_consumer_are_summed(self) -> None:
+        consumer = self.company_generator.create_company()
+        provider = self.company_generator.create_company()
+        plan = self.plan_generator.create_plan(planner=provider)
+        self.consumption_generator.create_resource_consumption_by_company(
+            plan=plan, consumer=consumer
+        )
+        self.consumption_generator.create_resource_consumption_by_company(plan=plan)
+        consumptions = self.database_gateway.get_productive_consumptions().where_consumer_is_company(
+            consumer
+        )
+        ((_, transfer),) = consumptions.joined_with_transfer()
+        ((_, volume),) = consumptions.grouped_by_provider()
+        assert volume == transfer.value
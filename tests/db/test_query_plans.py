@@ -0,0 +1,196 @@
+from datetime import timedelta
+from typing import Any
+from uuid import UUID
+
+from arbeitszeit_db import models
+from arbeitszeit_db.query_plans import QueryPlan, explain
+from arbeitszeit_db.repositories import SqlQueryResult
+from tests.db.base_test_case import DatabaseTestCase
+
+
+class ExplainTests(DatabaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.plan = self.plan_generator.create_plan()
+
+    def test_filter_on_unindexed_column_is_reported_as_full_scan(self) -> None:
+        query = self.db.session.query(models.Plan).filter(models.Plan.prd_unit == "kg")
+        plan = explain(self.db, query)
+        assert plan.full_scans == {"plan"}
+
+    def test_unindexed_column_of_full_scan_is_reported_as_missing_index(
+        self,
+    ) -> None:
+        query = self.db.session.query(models.Plan).filter(models.Plan.prd_unit == "kg")
+        plan = explain(self.db, query)
+        (missing_index,) = plan.missing_indexes
+        assert str(missing_index) == "plan(prd_unit)"
+
+    def test_filter_on_primary_key_does_not_scan_table(self) -> None:
+        query = self.database_gateway.get_plans().with_id(self.plan).query
+        plan = explain(self.db, query)
+        assert not plan.full_scans
+
+
+class RepositoryQueryPlanTests(DatabaseTestCase):
+    """Every query of the repositories that selects a few rows out of
+    a table that grows with the usage of the app must be answered
+    through indexes. A failing test lists the missing indexes.
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.member = self.member_generator.create_member()
+        self.company = self.company_generator.create_company(workers=[self.member])
+        self.plan = self.plan_generator.create_plan(planner=self.company)
+        self.cooperation = self.cooperation_generator.create_cooperation(
+            plans=[self.plan]
+        )
+        self.consumption_generator.create_private_consumption(
+            consumer=self.member, plan=self.plan
+        )
+        self.consumption_generator.create_fixed_means_consumption(
+            consumer=self.company_generator.create_company(), plan=self.plan
+        )
+        self.tenure = self.coordination_tenure_generator.create_coordination_tenure(
+            cooperation=self.cooperation
+        )
+
+    def test_plans_with_id(self) -> None:
+        self.assert_uses_indexes(self.database_gateway.get_plans().with_id(self.plan))
+
+    def test_plans_planned_by_company(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_plans().planned_by(self.company)
+        )
+
+    def test_plans_that_will_expire_after_timestamp(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_plans().that_will_expire_after(
+                self.datetime_service.now() + timedelta(days=1000)
+            )
+        )
+
+    def test_plans_that_are_part_of_cooperation(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_plans().that_are_part_of_cooperation(
+                self.cooperation
+            )
+        )
+
+    def test_plans_with_open_cooperation_request(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_plans().with_open_cooperation_request(
+                cooperation=self.cooperation
+            )
+        )
+
+    def test_plan_with_planner_and_cooperation(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_plans()
+            .with_id(self.plan)
+            .joined_with_planner_and_cooperation()
+        )
+
+    def test_productive_consumptions_of_consumer(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_productive_consumptions().where_consumer_is_company(
+                self.company
+            )
+        )
+
+    def test_productive_consumptions_of_provider(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_productive_consumptions().where_provider_is_company(
+                self.company
+            )
+        )
+
+    def test_private_consumptions_of_consumer(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_private_consumptions().where_consumer_is_member(
+                self.member
+            )
+        )
+
+    def test_private_consumptions_of_provider(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_private_consumptions().where_provider_is_company(
+                self.company
+            )
+        )
+
+    def test_transfers_of_account(self) -> None:
+        account = self.get_p_account()
+        self.assert_uses_indexes(
+            self.database_gateway.get_transfers().where_account_is_debtor_or_creditor(
+                account
+            )
+        )
+
+    def test_running_balances_of_account(self) -> None:
+        account = self.get_p_account()
+        self.assert_uses_indexes(
+            self.database_gateway.get_transfers().running_balances_of(account)
+        )
+
+    def test_accounts_of_company_with_balance(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_accounts()
+            .owned_by_company(self.company)
+            .joined_with_balance()
+        )
+
+    def test_cooperation_of_plan(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_cooperations().of_plan(self.plan)
+        )
+
+    def test_coordination_tenures_of_cooperation(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_coordination_tenures().of_cooperation(
+                self.cooperation
+            )
+        )
+
+    def test_coordination_transfer_requests_of_tenure(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_coordination_transfer_requests().requested_by(
+                self.tenure
+            )
+        )
+
+    def test_company_work_invites_issued_by_company(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_company_work_invites().issued_by(self.company)
+        )
+
+    def test_company_work_invites_addressing_member(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_company_work_invites().addressing(self.member)
+        )
+
+    def test_registered_hours_worked_at_company(self) -> None:
+        self.assert_uses_indexes(
+            self.database_gateway.get_registered_hours_worked().at_company(self.company)
+        )
+
+    def get_p_account(self) -> UUID:
+        company = self.database_gateway.get_companies().with_id(self.company).first()
+        assert company
+        return company.means_account
+
+    def assert_uses_indexes(self, result: SqlQueryResult[Any]) -> None:
+        plan = explain(self.db, result.query)
+        assert not plan.full_scans, self.report(plan)
+
+    def report(self, plan: QueryPlan) -> str:
+        return "\n".join(
+            [
+                "Full table scans: " + ", ".join(sorted(plan.full_scans)),
+                "Missing indexes: "
+                + ", ".join(str(index) for index in plan.missing_indexes),
+                "Query plan:",
+                str(plan),
+            ]
+        )
@@ -0,0 +1,113 @@
+from unittest import TestCase
+from uuid import UUID
+
+from sqlalchemy import select
+
+from arbeitszeit_db import models
+from arbeitszeit_db.query_statistics import fingerprint
+from tests.db.base_test_case import DatabaseTestCase
+
+
+class QueryStatisticsTestCase(DatabaseTestCase):
+    def select_plan_id(self, plan: UUID) -> None:
+        # Selecting a column sends exactly one statement, unlike loading
+        # records that may load related rows lazily.
+        self.db.session.execute(
+            select(models.Plan.id).where(models.Plan.id == plan)
+        ).all()
+
+
+class FingerprintTests(TestCase):
+    def test_that_bound_parameters_are_blanked_out(self) -> None:
+        assert fingerprint("SELECT * FROM plan WHERE id = %(id_1)s") == fingerprint(
+            "SELECT * FROM plan WHERE id = ?"
+        )
+
+    def test_that_string_and_number_literals_are_blanked_out(self) -> None:
+        assert fingerprint("SELECT * FROM plan WHERE name = 'a' LIMIT 1") == (
+            fingerprint("SELECT * FROM plan WHERE name = 'it''s' LIMIT 10")
+        )
+
+    def test_that_in_lists_of_different_length_have_same_fingerprint(self) -> None:
+        assert fingerprint("SELECT * FROM plan WHERE id IN (?)") == fingerprint(
+            "SELECT * FROM plan WHERE id IN (?, ?, ?)"
+        )
+
+    def test_that_whitespace_is_normalized(self) -> None:
+        assert fingerprint("SELECT *\n  FROM plan") == "SELECT * FROM plan"
+
+    def test_that_numbered_identifiers_are_kept(self) -> None:
+        assert fingerprint("SELECT plan_1.id FROM plan AS plan_1") == (
+            "SELECT plan_1.id FROM plan AS plan_1"
+        )
+
+    def test_that_type_casts_are_kept(self) -> None:
+        assert fingerprint("SELECT %(id)s::UUID") == "SELECT ?::UUID"
+
+    def test_that_different_tables_have_different_fingerprints(self) -> None:
+        assert fingerprint("SELECT * FROM plan") != fingerprint("SELECT * FROM company")
+
+
+class RecordingQueriesTests(QueryStatisticsTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.plan = self.plan_generator.create_plan()
+        self.db.session.flush()
+
+    def test_that_no_statements_are_counted_without_queries(self) -> None:
+        with self.db.recording_queries() as statistics:
+            pass
+        assert statistics.query_count == 0
+        assert statistics.total_seconds == 0
+
+    def test_that_every_statement_is_counted(self) -> None:
+        with self.db.recording_queries() as statistics:
+            for _ in range(3):
+                self.select_plan_id(self.plan)
+        assert statistics.query_count == 3
+        assert statistics.total_seconds > 0
+
+    def test_that_statements_after_the_recording_are_not_counted(self) -> None:
+        with self.db.recording_queries() as statistics:
+            self.select_plan_id(self.plan)
+        self.select_plan_id(self.plan)
+        assert statistics.query_count == 1
+
+    def test_that_nested_recordings_both_count_statements(self) -> None:
+        with self.db.recording_queries() as outer:
+            self.select_plan_id(self.plan)
+            with self.db.recording_queries() as inner:
+                self.select_plan_id(self.plan)
+        assert outer.query_count == 2
+        assert inner.query_count == 1
+
+    def test_that_statement_repeated_with_other_parameters_is_reported(self) -> None:
+        plans = [self.plan_generator.create_plan() for _ in range(3)]
+        self.db.session.flush()
+        with self.db.recording_queries() as statistics:
+            for plan in plans:
+                self.select_plan_id(plan)
+        (count,) = statistics.repeated_statements(threshold=3).values()
+        assert count == 3
+
+    def test_that_statements_below_threshold_are_not_reported(self) -> None:
+        with self.db.recording_queries() as statistics:
+            self.select_plan_id(self.plan)
+            self.db.session.execute(select(models.Company.id)).all()
+        assert not statistics.repeated_statements(threshold=2)
+
+
+class QueryBudgetTests(QueryStatisticsTestCase):
+    def test_that_budget_is_not_exceeded_by_fewer_statements(self) -> None:
+        plan = self.plan_generator.create_plan()
+        self.db.session.flush()
+        with self.assert_query_budget(1):
+            self.select_plan_id(plan)
+
+    def test_that_exceeding_the_budget_fails(self) -> None:
+        plan = self.plan_generator.create_plan()
+        self.db.session.flush()
+        with self.assertRaises(AssertionError):
+            with self.assert_query_budget(1):
+                self.select_plan_id(plan)
+                self.select_plan_id(plan)
@@ -0,0 +1,87 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from sqlalchemy import (
+    Column,
+    Engine,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    insert,
+    select,
+)
+
+from arbeitszeit_db.db import READS_FROM_REPLICA, RoutingSession
+
+metadata = MetaData()
+origin = Table("origin", metadata, Column("name", String, primary_key=True))
+
+
+class RoutingSessionTests(TestCase):
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.primary = self.create_database("primary")
+        self.replica = self.create_database("replica")
+
+    def tearDown(self) -> None:
+        self.primary.dispose()
+        self.replica.dispose()
+        self.directory.cleanup()
+
+    def test_that_reads_go_to_primary_by_default(self) -> None:
+        session = self.create_session()
+        assert self.read_origins(session) == ["primary"]
+
+    def test_that_reads_go_to_replica_when_enabled(self) -> None:
+        session = self.create_session()
+        session.info[READS_FROM_REPLICA] = True
+        assert self.read_origins(session) == ["replica"]
+
+    def test_that_reads_go_to_primary_without_configured_replica(self) -> None:
+        session = RoutingSession(bind=self.primary)
+        session.info[READS_FROM_REPLICA] = True
+        assert self.read_origins(session) == ["primary"]
+
+    def test_that_writes_go_to_primary_while_reads_from_replica_are_enabled(
+        self,
+    ) -> None:
+        session = self.create_session()
+        session.info[READS_FROM_REPLICA] = True
+        session.execute(insert(origin).values(name="written"))
+        session.info[READS_FROM_REPLICA] = False
+        assert self.read_origins(session) == ["primary", "written"]
+
+    def test_that_reads_are_pinned_to_primary_after_a_write(self) -> None:
+        session = self.create_session()
+        session.info[READS_FROM_REPLICA] = True
+        session.execute(insert(origin).values(name="written"))
+        assert self.read_origins(session) == ["primary", "written"]
+
+    def test_that_reads_are_not_pinned_to_primary_if_pinning_is_disabled(
+        self,
+    ) -> None:
+        session = self.create_session(pin_reads_to_primary_after_write=False)
+        session.info[READS_FROM_REPLICA] = True
+        session.execute(insert(origin).values(name="written"))
+        assert self.read_origins(session) == ["replica"]
+
+    def create_database(self, name: str) -> Engine:
+        engine = create_engine(f"sqlite:///{Path(self.directory.name) / name}.db")
+        with engine.begin() as connection:
+            metadata.create_all(connection)
+            connection.execute(insert(origin).values(name=name))
+        return engine
+
+    def create_session(
+        self, pin_reads_to_primary_after_write: bool = True
+    ) -> RoutingSession:
+        return RoutingSession(
+            bind=self.primary,
+            replica=self.replica,
+            pin_reads_to_primary_after_write=pin_reads_to_primary_after_write,
+        )
+
+    def read_origins(self, session: RoutingSession) -> list[str]:
+        return list(session.scalars(select(origin.c.name).order_by(origin.c.name)))
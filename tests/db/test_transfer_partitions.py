@@ -0,0 +1,138 @@
+import os
+from datetime import date
+from typing import Any, List
+from unittest import TestCase
+from unittest.mock import patch
+
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+
+from arbeitszeit_db.transfer_partitions import (
+    DEFAULT_PARTITION,
+    MonthlyPartition,
+    TransferPartitionManager,
+    is_transfer_table_partitioned,
+    monthly_partitions,
+)
+from tests.datetime_service import datetime_utc
+from tests.db.base_test_case import DatabaseTestCase
+from tests.markers import postgresql_required
+
+PARTITION_MIGRATION = "f41b7c2e9a63"
+
+
+class MonthlyPartitionTests(TestCase):
+    def test_partition_of_a_day_starts_at_the_first_of_its_month(self) -> None:
+        partition = MonthlyPartition.of(date(2024, 2, 17))
+        assert partition.start == date(2024, 2, 1)
+
+    def test_partition_ends_at_the_first_of_the_next_month(self) -> None:
+        partition = MonthlyPartition.of(date(2024, 2, 17))
+        assert partition.end == date(2024, 3, 1)
+
+    def test_partition_of_december_ends_in_the_next_year(self) -> None:
+        partition = MonthlyPartition.of(date(2024, 12, 31))
+        assert partition.end == date(2025, 1, 1)
+
+    def test_partition_name_contains_year_and_month(self) -> None:
+        partition = MonthlyPartition.of(date(2024, 2, 17))
+        assert partition.name == "transfer_2024_02"
+
+    def test_consecutive_months_are_generated(self) -> None:
+        partitions = list(monthly_partitions(date(2024, 11, 5), 3))
+        assert [partition.name for partition in partitions] == [
+            "transfer_2024_11",
+            "transfer_2024_12",
+            "transfer_2025_01",
+        ]
+
+
+class TransferPartitionManagerTests(DatabaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = self.injector.get(TransferPartitionManager)
+
+    def test_tables_created_from_the_models_are_not_partitioned(self) -> None:
+        assert not is_transfer_table_partitioned(self.db.session.connection())
+
+    def test_no_partitions_are_created_for_an_unpartitioned_table(self) -> None:
+        assert not self.manager.create_future_partitions(
+            datetime_utc(2024, 2, 17), months_ahead=3
+        )
+
+
+@postgresql_required
+class PartitionedTransferTableTests(DatabaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = self.injector.get(TransferPartitionManager)
+        self.debtor = self.company_generator.create_company_record().means_account
+        self.creditor = self.company_generator.create_company_record().product_account
+        for transfer_date in [
+            datetime_utc(2024, 1, 15),
+            datetime_utc(2024, 3, 2),
+            datetime_utc(2100, 1, 10),
+        ]:
+            self.transfer_generator.create_transfer(
+                date=transfer_date,
+                debit_account=self.debtor,
+                credit_account=self.creditor,
+            )
+        self.db.session.flush()
+
+    def test_partitioning_creates_a_partitioned_table(self) -> None:
+        self.partition_transfer_table()
+        assert is_transfer_table_partitioned(self.db.session.connection())
+
+    def test_partitions_of_future_months_are_created(self) -> None:
+        self.partition_transfer_table()
+        assert self.manager.create_future_partitions(
+            datetime_utc(2100, 1, 1), months_ahead=1
+        ) == ["transfer_2100_01", "transfer_2100_02"]
+
+    def test_existing_partitions_are_not_created_again(self) -> None:
+        self.partition_transfer_table()
+        self.manager.create_future_partitions(datetime_utc(2100, 1, 1), months_ahead=1)
+        assert not self.manager.create_future_partitions(
+            datetime_utc(2100, 1, 1), months_ahead=1
+        )
+
+    def test_transfers_are_moved_out_of_the_default_partition(self) -> None:
+        self.partition_transfer_table()
+        self.manager.create_future_partitions(datetime_utc(2100, 1, 1), months_ahead=1)
+        assert not self.db.session.scalar(
+            text(f"SELECT count(*) FROM {DEFAULT_PARTITION}")
+        )
+
+    def test_transfer_query_results_are_unchanged_by_partitioning(self) -> None:
+        expected_results = self.query_transfers()
+        self.partition_transfer_table()
+        self.manager.create_future_partitions(datetime_utc(2100, 1, 1), months_ahead=1)
+        assert self.query_transfers() == expected_results
+
+    def query_transfers(self) -> List[List[Any]]:
+        transfers = self.database_gateway.get_transfers()
+        return [
+            list(transfers.ordered_by_date()),
+            list(transfers.where_account_is_debtor(self.debtor).ordered_by_date()),
+            list(transfers.where_account_is_creditor(self.creditor).ordered_by_date()),
+            list(
+                transfers.where_account_is_debtor_or_creditor(self.debtor)
+                .ordered_by_date(ascending=False)
+                .joined_with_debtor_and_creditor()
+            ),
+            list(transfers.running_balances_of(self.creditor)),
+        ]
+
+    def partition_transfer_table(self) -> None:
+        script = ScriptDirectory.from_config(
+            Config("tests/flask_integration/alembic.ini")
+        )
+        migration = script.get_revision(PARTITION_MIGRATION).module
+        context = MigrationContext.configure(self.db.session.connection())
+        with patch.dict(os.environ, {migration.OPT_IN_VARIABLE: "true"}):
+            with Operations.context(context):
+                migration.upgrade()
@@ -1,11 +1,19 @@
-from uuid import uuid4
+from dataclasses import replace
+from decimal import Decimal
+from typing import Optional
+from unittest.mock import Mock, patch
+from uuid import UUID, uuid4
 
 from parameterized import parameterized
+from sqlalchemy import text
 
+from arbeitszeit.interactors.list_transfers import ListTransfersInteractor
+from arbeitszeit.interactors.list_transfers import Request as ListTransfersRequest
 from arbeitszeit.records import AccountTypes, SocialAccounting
-from arbeitszeit.transfers import TransferType
+from arbeitszeit.transfers import NewTransfer, TransferType
 from tests.datetime_service import datetime_utc
 from tests.db.base_test_case import DatabaseTestCase
+from tests.markers import postgresql_required
 
 
 class TransferResultTests(DatabaseTestCase):
@@ -16,6 +24,10 @@ class TransferResultTests(DatabaseTestCase):
         self.transfer_generator.create_transfer()
         assert len(self.database_gateway.get_transfers()) == 1
 
+    def test_that_queried_transfer_equals_created_transfer(self) -> None:
+        transfer = self.transfer_generator.create_transfer(value=Decimal("12.5"))
+        assert self.database_gateway.get_transfers().first() == transfer
+
     @parameterized.expand(
         [
             (TransferType.private_consumption,),
@@ -39,6 +51,233 @@ class TransferResultTests(DatabaseTestCase):
             assert transfer.type == type_
 
 
+class CreateTransfersTests(DatabaseTestCase):
+    def test_that_no_transfers_are_created_for_empty_list(self) -> None:
+        assert self.database_gateway.create_transfers([]) == []
+        assert not self.database_gateway.get_transfers()
+
+    def test_that_all_transfers_are_created(self) -> None:
+        self.database_gateway.create_transfers(
+            [self.new_transfer(), self.new_transfer(), self.new_transfer()]
+        )
+        assert len(self.database_gateway.get_transfers()) == 3
+
+    def test_that_created_transfers_are_returned_in_given_order(self) -> None:
+        new_transfers = [
+            self.new_transfer(value=Decimal(1)),
+            self.new_transfer(value=Decimal(2)),
+        ]
+        created = self.database_gateway.create_transfers(new_transfers)
+        assert [transfer.value for transfer in created] == [Decimal(1), Decimal(2)]
+        for transfer in created:
+            assert transfer in self.database_gateway.get_transfers()
+
+    def test_that_balances_of_all_involved_accounts_are_updated(self) -> None:
+        a = self.database_gateway.create_account()
+        b = self.database_gateway.create_account()
+        c = self.database_gateway.create_account()
+        self.database_gateway.create_transfers(
+            [
+                self.new_transfer(
+                    debit_account=a.id, credit_account=b.id, value=Decimal(3)
+                ),
+                self.new_transfer(
+                    debit_account=a.id, credit_account=c.id, value=Decimal(2)
+                ),
+                self.new_transfer(
+                    debit_account=b.id, credit_account=c.id, value=Decimal(1)
+                ),
+            ]
+        )
+        balances = dict(
+            (account.id, balance)
+            for account, balance in self.database_gateway.get_accounts()
+            .with_id(a.id, b.id, c.id)
+            .joined_with_balance()
+        )
+        assert balances == {a.id: Decimal(-5), b.id: Decimal(2), c.id: Decimal(3)}
+
+    def test_that_invalid_transfer_types_are_rejected(self) -> None:
+        new_transfer = self.new_transfer()
+        with self.assertRaises(ValueError):
+            self.database_gateway.create_transfers(
+                [new_transfer, replace(new_transfer, type=Mock(value="invalid"))]
+            )
+        assert not self.database_gateway.get_transfers()
+
+    def new_transfer(
+        self,
+        debit_account: Optional[UUID] = None,
+        credit_account: Optional[UUID] = None,
+        value: Decimal = Decimal(1),
+    ) -> NewTransfer:
+        if debit_account is None:
+            debit_account = self.database_gateway.create_account().id
+        if credit_account is None:
+            credit_account = self.database_gateway.create_account().id
+        return NewTransfer(
+            date=datetime_utc(2020, 1, 1),
+            debit_account=debit_account,
+            credit_account=credit_account,
+            value=value,
+            type=TransferType.credit_p,
+        )
+
+
+class PageTests(DatabaseTestCase):
+    def test_that_page_of_empty_result_has_no_items_and_zero_total(self) -> None:
+        page = self.database_gateway.get_transfers().page(offset=0, limit=10)
+        assert not page.items
+        assert page.total == 0
+
+    def test_that_page_contains_limited_items_and_total_of_all_rows(self) -> None:
+        for _ in range(5):
+            self.transfer_generator.create_transfer()
+        page = self.database_gateway.get_transfers().page(offset=1, limit=2)
+        assert len(page.items) == 2
+        assert page.total == 5
+
+    def test_that_page_items_follow_the_ordering_of_the_result(self) -> None:
+        transfers = [
+            self.transfer_generator.create_transfer(date=datetime_utc(2020, 1, day))
+            for day in range(1, 5)
+        ]
+        page = (
+            self.database_gateway.get_transfers()
+            .ordered_by_date(ascending=False)
+            .page(offset=1, limit=2)
+        )
+        assert list(page.items) == [transfers[2], transfers[1]]
+
+    def test_that_total_is_known_for_page_behind_the_last_row(self) -> None:
+        for _ in range(3):
+            self.transfer_generator.create_transfer()
+        page = self.database_gateway.get_transfers().page(offset=10, limit=2)
+        assert not page.items
+        assert page.total == 3
+
+    def test_that_total_respects_filters(self) -> None:
+        account = self.database_gateway.create_account()
+        self.transfer_generator.create_transfer(debit_account=account.id)
+        self.transfer_generator.create_transfer()
+        page = (
+            self.database_gateway.get_transfers()
+            .where_account_is_debtor(account.id)
+            .page(limit=10)
+        )
+        assert page.total == 1
+
+    def test_that_joined_results_can_be_paged(self) -> None:
+        member = self.member_generator.create_member()
+        member_account = (
+            self.database_gateway.get_accounts().owned_by_member(member).first()
+        )
+        assert member_account
+        transfer = self.transfer_generator.create_transfer(
+            debit_account=member_account.id
+        )
+        page = self.database_gateway.get_transfers().joined_with_debtor().page()
+        assert page.total == 1
+        [(paged_transfer, debtor)] = page.items
+        assert paged_transfer == transfer
+        assert debtor.id == member
+
+    def test_that_small_tables_are_counted_exactly_when_estimate_is_requested(
+        self,
+    ) -> None:
+        for _ in range(3):
+            self.transfer_generator.create_transfer()
+        page = self.database_gateway.get_transfers().page(limit=1, estimate_total=True)
+        assert page.total == 3
+        assert not page.is_total_estimated
+
+
+class EstimatedLenTests(DatabaseTestCase):
+    def test_that_small_tables_are_counted_exactly(self) -> None:
+        for _ in range(3):
+            self.transfer_generator.create_transfer()
+        assert self.database_gateway.get_transfers().estimated_len() == 3
+
+    def test_that_filtered_results_are_counted_exactly(self) -> None:
+        account = self.database_gateway.create_account()
+        self.transfer_generator.create_transfer(debit_account=account.id)
+        self.transfer_generator.create_transfer()
+        transfers = self.database_gateway.get_transfers().where_account_is_debtor(
+            account.id
+        )
+        assert transfers.estimated_len() == 1
+
+
+@postgresql_required
+class EstimatedTotalOfCursorPagesTests(DatabaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        for day in range(1, 6):
+            self.transfer_generator.create_transfer(date=datetime_utc(2020, 1, day))
+        self.db.session.execute(text("ANALYZE transfer"))
+        threshold_patch = patch(
+            "arbeitszeit_db.repositories.ESTIMATED_COUNT_THRESHOLD", 1
+        )
+        threshold_patch.start()
+        self.addCleanup(threshold_patch.stop)
+        self.interactor = self.injector.get(ListTransfersInteractor)
+
+    def test_that_unfiltered_transfer_table_is_estimated(self) -> None:
+        assert self.database_gateway.get_transfers().estimated_len() == 5
+
+    def test_that_cursor_page_of_unfiltered_transfer_list_issues_no_count(
+        self,
+    ) -> None:
+        first_page = self.interactor.list_transfers(
+            ListTransfersRequest(limit=2, offset=None)
+        )
+        with self.db.recording_queries() as statistics:
+            self.interactor.list_transfers(
+                ListTransfersRequest(limit=2, offset=None, after=first_page.next_cursor)
+            )
+        assert not [
+            statement
+            for statement in statistics.fingerprints
+            if "count(" in statement.lower()
+        ]
+
+    def test_that_cursor_page_shows_same_total_as_first_page(self) -> None:
+        first_page = self.interactor.list_transfers(
+            ListTransfersRequest(limit=2, offset=None)
+        )
+        second_page = self.interactor.list_transfers(
+            ListTransfersRequest(limit=2, offset=None, after=first_page.next_cursor)
+        )
+        assert second_page.total_results == first_page.total_results
+
+
+class StreamTests(DatabaseTestCase):
+    def test_that_streaming_empty_result_yields_nothing(self) -> None:
+        assert not list(self.database_gateway.get_transfers().stream())
+
+    def test_that_all_transfers_are_streamed_in_order_with_small_chunks(
+        self,
+    ) -> None:
+        transfers = [
+            self.transfer_generator.create_transfer(date=datetime_utc(2020, 1, day))
+            for day in range(1, 6)
+        ]
+        streamed = list(
+            self.database_gateway.get_transfers().ordered_by_date().stream(chunk_size=2)
+        )
+        assert streamed == transfers
+
+    def test_that_joined_results_can_be_streamed(self) -> None:
+        self.transfer_generator.create_transfer()
+        self.transfer_generator.create_transfer()
+        streamed = list(
+            self.database_gateway.get_transfers()
+            .joined_with_debtor_and_creditor()
+            .stream(chunk_size=1)
+        )
+        assert len(streamed) == 2
+
+
 class WhereAccountIsDebtorTests(DatabaseTestCase):
     def test_that_where_account_is_debtor_yields_none_if_debit_account_is_not_in_db(
         self,
@@ -322,6 +561,80 @@ class OrderedByDateTests(DatabaseTestCase):
         expected_dates = [date1, date2] if ascending else [date2, date1]
         assert actual_dates == expected_dates
 
+    @parameterized.expand(
+        [
+            (True,),
+            (False,),
+        ]
+    )
+    def test_that_transfers_with_same_date_are_ordered_by_id(
+        self, ascending: bool
+    ) -> None:
+        date = datetime_utc(2021, 1, 1)
+        transfer_ids = [
+            self.transfer_generator.create_transfer(date=date).id for _ in range(3)
+        ]
+        transfers = self.database_gateway.get_transfers().ordered_by_date(
+            ascending=ascending
+        )
+        assert [transfer.id for transfer in transfers] == sorted(
+            transfer_ids, reverse=not ascending
+        )
+
+
+class AfterTests(DatabaseTestCase):
+    @parameterized.expand(
+        [
+            (True,),
+            (False,),
+        ]
+    )
+    def test_that_pages_fetched_with_cursor_cover_all_transfers_exactly_once(
+        self, ascending: bool
+    ) -> None:
+        for day in [1, 1, 2, 2, 2, 3]:
+            self.transfer_generator.create_transfer(date=datetime_utc(2021, 1, day))
+        transfers = self.database_gateway.get_transfers().ordered_by_date(
+            ascending=ascending
+        )
+        expected_ids = [transfer.id for transfer in transfers]
+        page = list(transfers.limit(4))
+        fetched_ids = [transfer.id for transfer in page]
+        while page:
+            last_transfer = page[-1]
+            page = list(
+                transfers.after((last_transfer.date, last_transfer.id)).limit(4)
+            )
+            fetched_ids += [transfer.id for transfer in page]
+        assert fetched_ids == expected_ids
+
+    def test_that_no_transfers_are_returned_after_the_last_transfer(self) -> None:
+        transfer = self.transfer_generator.create_transfer()
+        transfers = self.database_gateway.get_transfers().ordered_by_date()
+        assert not transfers.after((transfer.date, transfer.id))
+
+    def test_that_transfers_later_than_cursor_are_returned_in_ascending_order(
+        self,
+    ) -> None:
+        first = self.transfer_generator.create_transfer(date=datetime_utc(2021, 1, 1))
+        second = self.transfer_generator.create_transfer(date=datetime_utc(2021, 1, 2))
+        transfers = self.database_gateway.get_transfers().ordered_by_date()
+        assert [
+            transfer.id for transfer in transfers.after((first.date, first.id))
+        ] == [second.id]
+
+    def test_that_unordered_results_cannot_be_paginated_by_cursor(self) -> None:
+        transfer = self.transfer_generator.create_transfer()
+        with self.assertRaises(ValueError):
+            self.database_gateway.get_transfers().after((transfer.date, transfer.id))
+
+    def test_that_cursor_must_match_the_ordering_columns(self) -> None:
+        transfer = self.transfer_generator.create_transfer()
+        with self.assertRaises(ValueError):
+            self.database_gateway.get_transfers().ordered_by_date().after(
+                (transfer.date,)
+            )
+
 
 class JoinedWithDebtorAndCreditorTests(DatabaseTestCase):
     def test_that_join_yields_member_and_same_member(self) -> None:
@@ -545,3 +858,164 @@ class JoinedWithDebtorAndCreditorTests(DatabaseTestCase):
         assert transfer_with_debtor_and_creditor
         assert transfer_with_debtor_and_creditor[1] == cooperation
         assert transfer_with_debtor_and_creditor[2] == different_cooperation
+
+
+class RunningBalancesOfTests(DatabaseTestCase):
+    def test_that_no_balances_are_yielded_for_account_without_transfers(
+        self,
+    ) -> None:
+        self.transfer_generator.create_transfer()
+        account = self.database_gateway.create_account()
+        assert not list(
+            self.database_gateway.get_transfers().running_balances_of(account.id)
+        )
+
+    def test_that_credited_and_debited_values_are_accumulated(self) -> None:
+        account = self.database_gateway.create_account()
+        self.transfer_generator.create_transfer(
+            date=datetime_utc(2021, 1, 1), credit_account=account.id, value=Decimal(5)
+        )
+        self.transfer_generator.create_transfer(
+            date=datetime_utc(2021, 1, 2), debit_account=account.id, value=Decimal(2)
+        )
+        balances = self.database_gateway.get_transfers().running_balances_of(account.id)
+        assert list(balances) == [
+            (datetime_utc(2021, 1, 1), Decimal(5)),
+            (datetime_utc(2021, 1, 2), Decimal(3)),
+        ]
+
+    def test_that_balances_are_ordered_by_date_regardless_of_creation_order(
+        self,
+    ) -> None:
+        account = self.database_gateway.create_account()
+        self.transfer_generator.create_transfer(
+            date=datetime_utc(2021, 1, 2), credit_account=account.id, value=Decimal(1)
+        )
+        self.transfer_generator.create_transfer(
+            date=datetime_utc(2021, 1, 1), debit_account=account.id, value=Decimal(4)
+        )
+        balances = self.database_gateway.get_transfers().running_balances_of(account.id)
+        assert [balance for _, balance in balances] == [Decimal(-4), Decimal(-3)]
+
+    def test_that_transfers_with_the_same_date_yield_a_single_balance(
+        self,
+    ) -> None:
+        account = self.database_gateway.create_account()
+        date = datetime_utc(2021, 1, 1)
+        for _ in range(3):
+            self.transfer_generator.create_transfer(
+                date=date, credit_account=account.id, value=Decimal(1)
+            )
+        balances = self.database_gateway.get_transfers().running_balances_of(account.id)
+        assert list(balances) == [(date, Decimal(3))]
+
+    def test_that_transfer_from_account_to_itself_counts_as_debit(self) -> None:
+        account = self.database_gateway.create_account()
+        self.transfer_generator.create_transfer(
+            debit_account=account.id, credit_account=account.id, value=Decimal(3)
+        )
+        balances = self.database_gateway.get_transfers().running_balances_of(account.id)
+        assert [balance for _, balance in balances] == [Decimal(-3)]
+
+    def test_that_final_balance_equals_account_balance(self) -> None:
+        account = self.database_gateway.create_account()
+        self.transfer_generator.create_transfer(
+            credit_account=account.id, value=Decimal("10.5")
+        )
+        self.transfer_generator.create_transfer(
+            debit_account=account.id, value=Decimal("2.25")
+        )
+        balances = self.database_gateway.get_transfers().running_balances_of(account.id)
+        *_, (_, final_balance) = balances
+        account_with_balance = (
+            self.database_gateway.get_accounts()
+            .with_id(account.id)
+            .joined_with_balance()
+            .first()
+        )
+        assert account_with_balance
+        assert final_balance == account_with_balance[1]
+
+
+class SummedByCreditorAndTypeTests(DatabaseTestCase):
+    def test_that_nothing_is_yielded_without_transfers(self) -> None:
+        assert not list(
+            self.database_gateway.get_transfers().summed_by_creditor_and_type()
+        )
+
+    def test_that_values_with_same_creditor_and_type_are_summed(self) -> None:
+        account = self.database_gateway.create_account()
+        for value in [Decimal(1), Decimal("2.5")]:
+            self.transfer_generator.create_transfer(
+                credit_account=account.id, value=value, type=TransferType.credit_p
+            )
+        result = self.database_gateway.get_transfers().summed_by_creditor_and_type()
+        assert list(result) == [(account.id, TransferType.credit_p, Decimal("3.5"))]
+
+    def test_that_values_of_different_types_are_summed_separately(self) -> None:
+        account = self.database_gateway.create_account()
+        self.transfer_generator.create_transfer(
+            credit_account=account.id, value=Decimal(1), type=TransferType.credit_p
+        )
+        self.transfer_generator.create_transfer(
+            credit_account=account.id, value=Decimal(2), type=TransferType.credit_r
+        )
+        result = self.database_gateway.get_transfers().summed_by_creditor_and_type()
+        assert set(result) == {
+            (account.id, TransferType.credit_p, Decimal(1)),
+            (account.id, TransferType.credit_r, Decimal(2)),
+        }
+
+    def test_that_values_of_different_creditors_are_summed_separately(
+        self,
+    ) -> None:
+        account_1 = self.database_gateway.create_account()
+        account_2 = self.database_gateway.create_account()
+        self.transfer_generator.create_transfer(
+            credit_account=account_1.id, value=Decimal(1)
+        )
+        self.transfer_generator.create_transfer(
+            credit_account=account_2.id, value=Decimal(2)
+        )
+        result = (
+            self.database_gateway.get_transfers()
+            .where_account_is_creditor(account_1.id, account_2.id)
+            .summed_by_creditor_and_type()
+        )
+        assert {(account, value) for account, _, value in result} == {
+            (account_1.id, Decimal(1)),
+            (account_2.id, Decimal(2)),
+        }
+
+
+class SummedByDebtorAndTypeTests(DatabaseTestCase):
+    def test_that_values_with_same_debtor_and_type_are_summed(self) -> None:
+        account = self.database_gateway.create_account()
+        for value in [Decimal(1), Decimal(2)]:
+            self.transfer_generator.create_transfer(
+                debit_account=account.id, value=value, type=TransferType.credit_a
+            )
+        result = (
+            self.database_gateway.get_transfers()
+            .where_account_is_debtor(account.id)
+            .summed_by_debtor_and_type()
+        )
+        assert list(result) == [(account.id, TransferType.credit_a, Decimal(3))]
+
+    def test_that_values_of_different_types_are_summed_separately(self) -> None:
+        account = self.database_gateway.create_account()
+        self.transfer_generator.create_transfer(
+            debit_account=account.id, value=Decimal(1), type=TransferType.credit_p
+        )
+        self.transfer_generator.create_transfer(
+            debit_account=account.id, value=Decimal(2), type=TransferType.credit_a
+        )
+        result = (
+            self.database_gateway.get_transfers()
+            .where_account_is_debtor(account.id)
+            .summed_by_debtor_and_type()
+        )
+        assert set(result) == {
+            (account.id, TransferType.credit_p, Decimal(1)),
+            (account.id, TransferType.credit_a, Decimal(2)),
+        }
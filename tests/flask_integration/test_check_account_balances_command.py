@@ -0,0 +1,42 @@
+from decimal import Decimal
+
+from sqlalchemy import update
+
+from arbeitszeit_db import models
+
+from .base_test_case import FlaskTestCase
+
+
+class CheckAccountBalancesCommandTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.runner = self.app.test_cli_runner()
+
+    def test_command_succeeds_when_balances_are_consistent(self) -> None:
+        self.transfer_generator.create_transfer()
+        result = self.runner.invoke(args=["check-account-balances"])
+        assert result.exit_code == 0
+
+    def test_command_fails_when_balances_are_inconsistent(self) -> None:
+        self.corrupt_balance_of_new_account()
+        result = self.runner.invoke(args=["check-account-balances"])
+        assert result.exit_code != 0
+
+    def test_command_succeeds_when_inconsistent_balances_are_repaired(self) -> None:
+        self.corrupt_balance_of_new_account()
+        result = self.runner.invoke(args=["check-account-balances", "--repair"])
+        assert result.exit_code == 0
+
+    def test_repaired_balances_are_consistent_on_subsequent_check(self) -> None:
+        self.corrupt_balance_of_new_account()
+        self.runner.invoke(args=["check-account-balances", "--repair"])
+        result = self.runner.invoke(args=["check-account-balances"])
+        assert result.exit_code == 0
+
+    def corrupt_balance_of_new_account(self) -> None:
+        account = self.database_gateway.create_account()
+        self.db.session.execute(
+            update(models.AccountBalance)
+            .where(models.AccountBalance.account == account.id)
+            .values(balance=Decimal(10))
+        )
@@ -0,0 +1,38 @@
+from sqlalchemy import update
+
+from arbeitszeit_db import models
+
+from .base_test_case import FlaskTestCase
+
+
+class CheckConsumedAmountsCommandTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.runner = self.app.test_cli_runner()
+
+    def test_command_succeeds_when_amounts_are_consistent(self) -> None:
+        self.consumption_generator.create_private_consumption()
+        result = self.runner.invoke(args=["check-consumed-amounts"])
+        assert result.exit_code == 0
+
+    def test_command_fails_when_amounts_are_inconsistent(self) -> None:
+        self.corrupt_consumed_amount_of_new_plan()
+        result = self.runner.invoke(args=["check-consumed-amounts"])
+        assert result.exit_code != 0
+
+    def test_command_succeeds_when_inconsistent_amounts_are_repaired(self) -> None:
+        self.corrupt_consumed_amount_of_new_plan()
+        result = self.runner.invoke(args=["check-consumed-amounts", "--repair"])
+        assert result.exit_code == 0
+
+    def test_repaired_amounts_are_consistent_on_subsequent_check(self) -> None:
+        self.corrupt_consumed_amount_of_new_plan()
+        self.runner.invoke(args=["check-consumed-amounts", "--repair"])
+        result = self.runner.invoke(args=["check-consumed-amounts"])
+        assert result.exit_code == 0
+
+    def corrupt_consumed_amount_of_new_plan(self) -> None:
+        plan = self.plan_generator.create_plan()
+        self.db.session.execute(
+            update(models.Plan).where(models.Plan.id == plan).values(consumed_amount=10)
+        )
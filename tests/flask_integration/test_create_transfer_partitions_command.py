@@ -0,0 +1,23 @@
+from .base_test_case import FlaskTestCase
+
+
+class CreateTransferPartitionsCommandTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.runner = self.app.test_cli_runner()
+
+    def test_command_succeeds(self) -> None:
+        result = self.runner.invoke(args=["create-transfer-partitions"])
+        assert result.exit_code == 0
+
+    def test_command_accepts_number_of_months_ahead(self) -> None:
+        result = self.runner.invoke(
+            args=["create-transfer-partitions", "--months-ahead", "6"]
+        )
+        assert result.exit_code == 0
+
+    def test_command_reports_that_no_partitions_were_created_without_partitioning(
+        self,
+    ) -> None:
+        result = self.runner.invoke(args=["create-transfer-partitions"])
+        assert "No partitions had to be created." in result.output
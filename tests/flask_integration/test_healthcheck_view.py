@@ -6,3 +6,36 @@ class HealthcheckViewTests(ViewTestCase):
         URL = "/health"
         response = self.client.get(URL)
         assert response.status_code == 200
+
+
+class DatabasePoolViewTests(ViewTestCase):
+    URL = "/accountant/database-pool"
+
+    def test_pool_statistics_of_primary_database_are_returned_to_accountants(
+        self,
+    ) -> None:
+        self.login_accountant()
+        response = self.client.get(self.URL)
+        assert response.status_code == 200
+        assert response.json
+        assert set(response.json["primary"]) == {
+            "size",
+            "checked_out",
+            "overflow",
+            "checkouts",
+            "total_wait_seconds",
+            "max_wait_seconds",
+        }
+
+    def test_anonymous_users_are_redirected(self) -> None:
+        response = self.client.get(self.URL)
+        assert response.status_code == 302
+
+    def test_members_are_redirected(self) -> None:
+        self.login_member()
+        response = self.client.get(self.URL)
+        assert response.status_code == 302
+
+    def test_pool_statistics_are_not_available_under_health(self) -> None:
+        response = self.client.get("/health/database-pool")
+        assert response.status_code == 404
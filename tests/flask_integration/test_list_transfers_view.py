@@ -1,3 +1,8 @@
+import html
+import re
+
+from arbeitszeit_web.pagination import DEFAULT_PAGE_SIZE
+
 from .base_test_case import ViewTestCase
 
 
@@ -16,3 +21,13 @@ class ListTransfersTests(ViewTestCase):
         self.plan_generator.create_plan(approved=True)
         response = self.client.get(self.url)
         assert response.status_code == 200
+
+    def test_that_next_page_can_be_requested_by_cursor(self) -> None:
+        self.login_member()
+        for _ in range(DEFAULT_PAGE_SIZE + 1):
+            self.transfer_generator.create_transfer()
+        response = self.client.get(self.url)
+        next_page = re.search(r'class="pagination-next" href="([^"]+)"', response.text)
+        assert next_page
+        response = self.client.get(html.unescape(next_page.group(1)))
+        assert response.status_code == 200
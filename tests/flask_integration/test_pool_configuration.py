@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from flask import Config
+
+from arbeitszeit_db.db import PoolConfiguration
+from arbeitszeit_flask.database import get_pool_configuration
+
+
+class GetPoolConfigurationTests(TestCase):
+    def test_that_options_are_converted_from_strings(self) -> None:
+        config = Config(".")
+        config.update(
+            SQLALCHEMY_POOL_SIZE="3",
+            SQLALCHEMY_MAX_OVERFLOW="4",
+            SQLALCHEMY_POOL_TIMEOUT="5",
+            SQLALCHEMY_POOL_RECYCLE="600",
+            SQLALCHEMY_POOL_PRE_PING="true",
+        )
+        assert get_pool_configuration(config) == PoolConfiguration(
+            size=3, max_overflow=4, timeout=5, recycle=600, pre_ping=True
+        )
+
+    def test_that_pre_ping_can_be_disabled_with_string(self) -> None:
+        config = Config(".")
+        config.update(
+            SQLALCHEMY_POOL_SIZE=5,
+            SQLALCHEMY_MAX_OVERFLOW=10,
+            SQLALCHEMY_POOL_TIMEOUT=30,
+            SQLALCHEMY_POOL_RECYCLE=-1,
+            SQLALCHEMY_POOL_PRE_PING="False",
+        )
+        assert not get_pool_configuration(config).pre_ping
@@ -0,0 +1,112 @@
+import json
+from typing import Any, Dict, List
+
+from arbeitszeit.injector import Binder, CallableProvider, Module
+from arbeitszeit_flask.query_statistics import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    REPEATED_QUERIES_HEADER,
+)
+
+from .base_test_case import ViewTestCase
+from .dependency_injection import FlaskConfiguration
+
+LOGGER_NAME = "arbeitszeit_flask.query_statistics"
+URL = "/user/list_all_cooperations"
+
+
+class QueryStatisticsTestCase(ViewTestCase):
+    @property
+    def configuration_overrides(self) -> Dict[str, Any]:
+        return dict()
+
+    def get_injection_modules(self) -> List[Module]:
+        overrides = self.configuration_overrides
+
+        class _Module(Module):
+            def configure(self, binder: Binder) -> None:
+                super().configure(binder)
+                binder[FlaskConfiguration] = CallableProvider(
+                    _Module.provide_flask_configuration
+                )
+
+            @staticmethod
+            def provide_flask_configuration() -> FlaskConfiguration:
+                configuration = FlaskConfiguration.default()
+                for key, value in overrides.items():
+                    configuration[key] = value
+                return configuration
+
+        modules = super().get_injection_modules()
+        modules.append(_Module())
+        return modules
+
+
+class DebugModeTests(QueryStatisticsTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.login_member()
+
+    def test_that_number_of_queries_is_sent_as_header(self) -> None:
+        response = self.client.get(URL)
+        assert int(response.headers[QUERY_COUNT_HEADER]) > 0
+
+    def test_that_query_time_is_sent_as_header(self) -> None:
+        response = self.client.get(URL)
+        assert float(response.headers[QUERY_TIME_HEADER]) >= 0
+
+    def test_that_listing_cooperations_does_not_repeat_statements(self) -> None:
+        for _ in range(5):
+            self.cooperation_generator.create_cooperation(
+                plans=[self.plan_generator.create_plan()]
+            )
+        response = self.client.get(URL)
+        assert response.headers[REPEATED_QUERIES_HEADER] == "0"
+
+    def test_that_statistics_are_not_logged_by_default(self) -> None:
+        with self.assertNoLogs(LOGGER_NAME):
+            self.client.get(URL)
+
+
+class ProductionModeTests(QueryStatisticsTestCase):
+    @property
+    def configuration_overrides(self) -> Dict[str, Any]:
+        return dict(DEBUG=False, FORCE_HTTPS=False, LOG_QUERY_STATISTICS=True)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.login_member()
+
+    def test_that_no_headers_are_sent(self) -> None:
+        response = self.client.get(URL)
+        assert QUERY_COUNT_HEADER not in response.headers
+
+    def test_that_one_json_line_is_logged_per_request(self) -> None:
+        with self.assertLogs(LOGGER_NAME, level="INFO") as logs:
+            response = self.client.get(URL)
+        (line,) = logs.records
+        entry = json.loads(line.getMessage())
+        assert entry["path"] == URL
+        assert entry["status"] == response.status_code
+        assert entry["query_count"] > 0
+
+
+class RepeatedStatementTests(QueryStatisticsTestCase):
+    @property
+    def configuration_overrides(self) -> Dict[str, Any]:
+        return dict(LOG_QUERY_STATISTICS=True, REPEATED_QUERY_THRESHOLD=1)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.login_member()
+
+    def test_that_repeated_statements_are_logged_as_warning(self) -> None:
+        with self.assertLogs(LOGGER_NAME, level="WARNING") as logs:
+            self.client.get(URL)
+        (line,) = logs.records
+        entry = json.loads(line.getMessage())
+        assert entry["repeated_statements"]
+
+    def test_that_repeated_statements_are_counted_in_header(self) -> None:
+        response = self.client.get(URL)
+        assert int(response.headers[REPEATED_QUERIES_HEADER]) > 0
@@ -0,0 +1,71 @@
+import pkgutil
+from contextlib import contextmanager
+from typing import Iterator, List, cast
+from unittest import TestCase
+
+from parameterized import parameterized
+
+import arbeitszeit.interactors
+from arbeitszeit_db.db import Database
+from arbeitszeit_flask.read_replica import READ_ONLY_INTERACTORS, ReadingFromReplica
+
+
+class FakeDatabase:
+    def __init__(self) -> None:
+        self.reads_from_replica = False
+
+    @contextmanager
+    def reading_from_replica(self) -> Iterator[None]:
+        self.reads_from_replica = True
+        try:
+            yield
+        finally:
+            self.reads_from_replica = False
+
+
+class FakeInteractor:
+    def __init__(self, database: FakeDatabase) -> None:
+        self.database = database
+        self.observed: List[bool] = []
+
+    def execute(self, value: int) -> int:
+        self.observed.append(self.database.reads_from_replica)
+        return value * 2
+
+
+class ReadingFromReplicaTests(TestCase):
+    def setUp(self) -> None:
+        self.database = FakeDatabase()
+        self.interactor = FakeInteractor(self.database)
+        self.proxy = ReadingFromReplica(self.interactor, cast(Database, self.database))
+
+    def test_that_method_calls_are_forwarded_to_interactor(self) -> None:
+        assert self.proxy.execute(3) == 6
+
+    def test_that_methods_read_from_replica_while_they_run(self) -> None:
+        self.proxy.execute(1)
+        assert self.interactor.observed == [True]
+
+    def test_that_reads_from_replica_end_with_the_method_call(self) -> None:
+        self.proxy.execute(1)
+        assert not self.database.reads_from_replica
+
+    def test_that_attributes_are_forwarded_to_interactor(self) -> None:
+        assert self.proxy.observed is self.interactor.observed
+
+
+READING_INTERACTOR_MODULES = [
+    module.name
+    for module in pkgutil.iter_modules(
+        arbeitszeit.interactors.__path__, arbeitszeit.interactors.__name__ + "."
+    )
+    if module.name.rsplit(".", 1)[-1].startswith(("get_", "list_", "query_", "show_"))
+]
+
+
+class ReadOnlyInteractorsTests(TestCase):
+    @parameterized.expand([(module,) for module in READING_INTERACTOR_MODULES])
+    def test_that_interactor_of_reading_module_is_listed(self, module: str) -> None:
+        assert any(
+            interactor.__module__ == module for interactor in READ_ONLY_INTERACTORS
+        )
@@ -2,6 +2,8 @@ from typing import Optional
 
 from parameterized import parameterized
 
+from arbeitszeit.records import SocialAccounting
+from arbeitszeit_db.db import HAS_WRITTEN
 from tests.flask_integration.base_test_case import LogInUser, ViewTestCase
 
 
@@ -34,3 +36,18 @@ class UserAccessTests(ViewTestCase):
             login=None,
             expected_code=302,
         )
+
+
+class PayoutFactorCacheTests(ViewTestCase):
+    def test_that_payout_factor_is_cached_without_changes_left_to_commit(
+        self,
+    ) -> None:
+        self.login_member()
+        self.injector.get(SocialAccounting)
+        self.database_gateway.invalidate_payout_factor_cache()
+        # Every request starts with a fresh session.
+        self.db.session.remove()
+        response = self.client.get("/user/statistics")
+        assert response.status_code == 200
+        assert not self.db.session.info.get(HAS_WRITTEN)
+        assert self.database_gateway.get_payout_factor_cache().payout_factor is not None
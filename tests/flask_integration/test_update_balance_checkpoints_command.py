@@ -0,0 +1,16 @@
+from .base_test_case import FlaskTestCase
+
+
+class UpdateBalanceCheckpointsCommandTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.runner = self.app.test_cli_runner()
+
+    def test_command_succeeds(self) -> None:
+        self.transfer_generator.create_transfer()
+        result = self.runner.invoke(args=["update-balance-checkpoints"])
+        assert result.exit_code == 0
+
+    def test_command_reports_the_last_checkpointed_day(self) -> None:
+        result = self.runner.invoke(args=["update-balance-checkpoints"])
+        assert "checkpointed until" in result.output
@@ -0,0 +1,16 @@
+from .base_test_case import FlaskTestCase
+
+
+class UpdatePayoutFactorHistoryCommandTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.runner = self.app.test_cli_runner()
+
+    def test_command_succeeds(self) -> None:
+        self.plan_generator.create_plan()
+        result = self.runner.invoke(args=["update-payout-factor-history"])
+        assert result.exit_code == 0
+
+    def test_command_reports_the_stored_changes(self) -> None:
+        result = self.runner.invoke(args=["update-payout-factor-history"])
+        assert "Stored 0 change(s) of the payout factor." in result.output
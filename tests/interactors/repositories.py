@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from itertools import islice
 from typing import (
+    Any,
     Callable,
     Dict,
     Generator,
@@ -17,6 +18,7 @@ from typing import (
     Optional,
     Protocol,
     Self,
+    Sequence,
     Set,
     Tuple,
     TypeVar,
@@ -41,7 +43,8 @@ from arbeitszeit.records import (
     SocialAccounting,
     Transfer,
 )
-from arbeitszeit.transfers import TransferType
+from arbeitszeit.repositories import Page
+from arbeitszeit.transfers import NewTransfer, TransferType
 
 Many = TypeVar("Many", bound=Hashable)
 One = TypeVar("One", bound=Hashable)
@@ -61,6 +64,8 @@ class Sortable(Protocol):
 class QueryResultImpl(Generic[T]):
     items: Callable[[], Iterable[T]]
     database: MockDatabase
+    sort_key: Optional[Callable[[T], Any]] = None
+    is_sorted_descending: bool = False
 
     def limit(self, n: int) -> Self:
         return replace(
@@ -74,6 +79,14 @@ class QueryResultImpl(Generic[T]):
             items=lambda: islice(self.items(), n, None),
         )
 
+    def after(self, cursor: Sequence[Any]) -> Self:
+        sort_key = self.sort_key
+        if sort_key is None:
+            raise ValueError("Keyset pagination requires an ordered query.")
+        if self.is_sorted_descending:
+            return self._filter_elements(lambda item: sort_key(item) < tuple(cursor))
+        return self._filter_elements(lambda item: sort_key(item) > tuple(cursor))
+
     def first(self) -> Optional[T]:
         try:
             item = next(iter(self))
@@ -81,9 +94,27 @@ class QueryResultImpl(Generic[T]):
             return None
         return item
 
+    def page(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        *,
+        estimate_total: bool = False,
+    ) -> Page[T]:
+        items = list(self.items())
+        start = offset or 0
+        end = None if limit is None else start + limit
+        return Page(items=items[start:end], total=len(items))
+
+    def estimated_len(self) -> int:
+        return len(self)
+
     def __iter__(self) -> Iterator[T]:
         return iter(self.items())
 
+    def stream(self, chunk_size: int = 1000) -> Iterator[T]:
+        return iter(self.items())
+
     def __len__(self) -> int:
         return len(list(self.items()))
 
@@ -94,9 +125,28 @@ class QueryResultImpl(Generic[T]):
         )
 
     def sorted_by(self, key: Callable[[T], Sortable], reverse: bool = False) -> Self:
+        # Like ORDER BY in SQL, an earlier ordering takes precedence
+        # and later orderings only decide between equal elements.
+        previous_key = self.sort_key
+        previous_reverse = self.is_sorted_descending
+
+        def items() -> List[T]:
+            result = sorted(list(self.items()), key=key, reverse=reverse)
+            if previous_key is not None:
+                result.sort(key=previous_key, reverse=previous_reverse)
+            return result
+
+        sort_key: Optional[Callable[[T], Any]] = key
+        if previous_key is not None:
+            if previous_reverse == reverse:
+                sort_key = _combine_sort_keys(previous_key, key)
+            else:
+                sort_key = None
         return replace(
             self,
-            items=lambda: sorted(list(self.items()), key=key, reverse=reverse),
+            items=items,
+            sort_key=sort_key,
+            is_sorted_descending=reverse,
         )
 
     def from_iterable(self, items: Callable[[], Iterable[T]]) -> Self:
@@ -106,6 +156,15 @@ class QueryResultImpl(Generic[T]):
         )
 
 
+def _combine_sort_keys(
+    first: Callable[[T], Any], second: Callable[[T], Any]
+) -> Callable[[T], Tuple[Any, ...]]:
+    def as_tuple(value: Any) -> Tuple[Any, ...]:
+        return value if isinstance(value, tuple) else (value,)
+
+    return lambda item: as_tuple(first(item)) + as_tuple(second(item))
+
+
 class PlanResult(QueryResultImpl[Plan]):
     def ordered_by_creation_date(self, ascending: bool = True) -> Self:
         return self.sorted_by(
@@ -148,6 +207,9 @@ class PlanResult(QueryResultImpl[Plan]):
             lambda plan: query.lower() in plan.prd_name.lower()
         )
 
+    def ordered_by_product_name_relevance(self, query: str) -> Self:
+        return self.sorted_by(key=lambda plan: _relevance_key(plan.prd_name, query))
+
     def that_are_approved(self) -> Self:
         return self._filter_elements(
             lambda plan: plan.approval_date is not None and plan.rejection_date is None
@@ -164,6 +226,12 @@ class PlanResult(QueryResultImpl[Plan]):
             and plan.approval_date <= timestamp
         )
 
+    def that_were_approved_after(self, timestamp: datetime) -> Self:
+        return self._filter_elements(
+            lambda plan: plan.approval_date is not None
+            and plan.approval_date > timestamp
+        )
+
     def that_will_expire_after(self, timestamp: datetime) -> Self:
         return self._filter_elements(
             lambda plan: plan.approval_date is not None
@@ -280,6 +348,33 @@ class PlanResult(QueryResultImpl[Plan]):
             total_planned_costs=production_costs,
         )
 
+    def get_payout_factor_costs(self) -> records.PayoutFactorCosts:
+        costs = records.PayoutFactorCosts(
+            productive_labour=Decimal(0),
+            public_labour=Decimal(0),
+            public_means_and_resources=Decimal(0),
+        )
+        for plan in self.items():
+            if plan.is_public_service:
+                costs.public_labour += plan.production_costs.labour_cost
+                costs.public_means_and_resources += (
+                    plan.production_costs.means_cost
+                    + plan.production_costs.resource_cost
+                )
+            else:
+                costs.productive_labour += plan.production_costs.labour_cost
+        return costs
+
+    def get_earliest_expiration_date(self) -> Optional[datetime]:
+        return min(
+            (
+                plan.expiration_date
+                for plan in self.items()
+                if plan.expiration_date is not None
+            ),
+            default=None,
+        )
+
     def that_are_not_hidden(self) -> Self:
         return self._filter_elements(lambda plan: not plan.hidden_by_user)
 
@@ -333,6 +428,26 @@ class PlanResult(QueryResultImpl[Plan]):
             database=self.database,
         )
 
+    def joined_with_requested_cooperation_and_planner(
+        self,
+    ) -> QueryResultImpl[Tuple[records.Plan, records.Cooperation, records.Company]]:
+        def items() -> (
+            Iterable[Tuple[records.Plan, records.Cooperation, records.Company]]
+        ):
+            for plan in self.items():
+                if plan.requested_cooperation is None:
+                    continue
+                yield (
+                    plan,
+                    self.database.cooperations[plan.requested_cooperation],
+                    self.database.companies[plan.planner],
+                )
+
+        return QueryResultImpl(
+            items=items,
+            database=self.database,
+        )
+
     def joined_with_provided_product_amount(
         self,
     ) -> QueryResultImpl[Tuple[records.Plan, int]]:
@@ -582,6 +697,16 @@ class PlanDraftUpdate:
 class PlanApprovalResult(QueryResultImpl[PlanApproval]): ...
 
 
+class PayoutFactorChangeResult(QueryResultImpl[records.PayoutFactorChange]):
+    def ordered_by_timestamp(self, *, ascending: bool = True) -> Self:
+        return self.sorted_by(
+            key=lambda change: change.timestamp, reverse=not ascending
+        )
+
+    def that_occurred_after(self, timestamp: datetime) -> Self:
+        return self._filter_elements(lambda change: change.timestamp > timestamp)
+
+
 class CooperationResult(QueryResultImpl[Cooperation]):
     def with_id(self, id_: UUID) -> Self:
         return self._filter_elements(lambda coop: coop.id == id_)
@@ -613,6 +738,12 @@ class CooperationResult(QueryResultImpl[Cooperation]):
 
         return self._filter_elements(lambda coop: coop.id == cooperation_of(plan_id))
 
+    def ordered_by_name(self, *, ascending: bool = True) -> Self:
+        def cooperation_sorting_key(cooperation: Cooperation) -> Tuple[str, UUID]:
+            return cooperation.name, cooperation.id
+
+        return self.sorted_by(key=cooperation_sorting_key, reverse=not ascending)
+
     def joined_with_current_coordinator(
         self,
     ) -> QueryResultImpl[Tuple[Cooperation, Company]]:
@@ -633,6 +764,23 @@ class CooperationResult(QueryResultImpl[Cooperation]):
             database=self.database,
         )
 
+    def joined_with_active_plan_count(
+        self, timestamp: datetime
+    ) -> QueryResultImpl[Tuple[Cooperation, int]]:
+        def items() -> Iterable[Tuple[Cooperation, int]]:
+            for cooperation in self.items():
+                plans = (
+                    self.database.get_plans()
+                    .that_are_part_of_cooperation(cooperation.id)
+                    .that_will_expire_after(timestamp)
+                )
+                yield cooperation, len(plans)
+
+        return QueryResultImpl(
+            items=items,
+            database=self.database,
+        )
+
 
 class CoordinationTenureResult(QueryResultImpl[CoordinationTenure]):
     def with_id(self, id_: UUID) -> Self:
@@ -801,6 +949,9 @@ class CompanyResult(QueryResultImpl[Company]):
             lambda company: query.lower() in company.name.lower()
         )
 
+    def ordered_by_name_relevance(self, query: str) -> Self:
+        return self.sorted_by(key=lambda company: _relevance_key(company.name, query))
+
     def with_email_containing(self, query: str) -> Self:
         def items() -> Iterable[records.Company]:
             for company in self.items():
@@ -814,6 +965,12 @@ class CompanyResult(QueryResultImpl[Company]):
 
         return self.from_iterable(items=items)
 
+    def ordered_by_name(self, *, ascending: bool = True) -> Self:
+        def company_sorting_key(company: records.Company) -> Tuple[str, UUID]:
+            return company.name, company.id
+
+        return self.sorted_by(key=company_sorting_key, reverse=not ascending)
+
     def joined_with_email_address(
         self,
     ) -> QueryResultImpl[Tuple[records.Company, records.EmailAddress]]:
@@ -970,11 +1127,58 @@ class TransferResult(QueryResultImpl[records.Transfer]):
         )
 
     def ordered_by_date(self, *, ascending: bool = True) -> Self:
-        def transfer_sorting_key(transfer: records.Transfer) -> datetime:
-            return transfer.date
+        def transfer_sorting_key(transfer: records.Transfer) -> Tuple[datetime, UUID]:
+            return transfer.date, transfer.id
 
         return self.sorted_by(key=transfer_sorting_key, reverse=not ascending)
 
+    def running_balances_of(
+        self, account: UUID
+    ) -> QueryResultImpl[Tuple[datetime, Decimal]]:
+        def items() -> Iterable[Tuple[datetime, Decimal]]:
+            transfers = self.where_account_is_debtor_or_creditor(account)
+            balances: Dict[datetime, Decimal] = dict()
+            balance = Decimal(0)
+            for transfer in transfers.ordered_by_date():
+                if transfer.debit_account == account:
+                    balance -= transfer.value
+                else:
+                    balance += transfer.value
+                balances[transfer.date] = balance
+            yield from balances.items()
+
+        return QueryResultImpl(
+            items=items,
+            database=self.database,
+        )
+
+    def summed_by_creditor_and_type(
+        self,
+    ) -> QueryResultImpl[Tuple[UUID, TransferType, Decimal]]:
+        return self._summed_by_account_and_type(
+            lambda transfer: transfer.credit_account
+        )
+
+    def summed_by_debtor_and_type(
+        self,
+    ) -> QueryResultImpl[Tuple[UUID, TransferType, Decimal]]:
+        return self._summed_by_account_and_type(lambda transfer: transfer.debit_account)
+
+    def _summed_by_account_and_type(
+        self, get_account: Callable[[records.Transfer], UUID]
+    ) -> QueryResultImpl[Tuple[UUID, TransferType, Decimal]]:
+        def items() -> Iterable[Tuple[UUID, TransferType, Decimal]]:
+            sums: Dict[Tuple[UUID, TransferType], Decimal] = defaultdict(Decimal)
+            for transfer in self.items():
+                sums[(get_account(transfer), transfer.type)] += transfer.value
+            for (account, transfer_type), value in sums.items():
+                yield account, transfer_type, value
+
+        return QueryResultImpl(
+            items=items,
+            database=self.database,
+        )
+
 
 class PrivateConsumptionResult(QueryResultImpl[records.PrivateConsumption]):
     def ordered_by_creation_date(self, *, ascending: bool = True) -> Self:
@@ -1198,6 +1402,19 @@ class ProductiveConsumptionResult(QueryResultImpl[records.ProductiveConsumption]
             database=self.database,
         )
 
+    def grouped_by_provider(self) -> QueryResultImpl[Tuple[Company, Decimal]]:
+        def grouped_items() -> Iterator[Tuple[Company, Decimal]]:
+            volumes: Dict[UUID, Decimal] = defaultdict(Decimal)
+            for _, transfer, provider in self.joined_with_transfer_and_provider():
+                volumes[provider.id] += transfer.value
+            for provider_id, volume in volumes.items():
+                yield self.database.companies[provider_id], volume
+
+        return QueryResultImpl(
+            items=grouped_items,
+            database=self.database,
+        )
+
 
 class AccountResult(QueryResultImpl[Account]):
     def with_id(self, *id_: UUID) -> Self:
@@ -1718,6 +1935,10 @@ class MockDatabase:
         self.reset_password_requests: List[records.PasswordResetRequest] = list()
         self.registered_hours_worked: list[records.RegisteredHoursWorked] = list()
         self.plan_approvals: List[records.PlanApproval] = list()
+        self.payout_factor_cache = records.PayoutFactorCache(
+            version=0, payout_factor=None, computed_at=None, valid_until=None
+        )
+        self.payout_factor_changes: List[records.PayoutFactorChange] = list()
         self.indices = Indices()
         self.relationships = Relationships()
 
@@ -1911,6 +2132,18 @@ class MockDatabase:
         self.transfers[transfer.id] = transfer
         return transfer
 
+    def create_transfers(self, transfers: Sequence[NewTransfer]) -> List[Transfer]:
+        return [
+            self.create_transfer(
+                date=transfer.date,
+                debit_account=transfer.debit_account,
+                credit_account=transfer.credit_account,
+                value=transfer.value,
+                type=transfer.type,
+            )
+            for transfer in transfers
+        ]
+
     def get_transfers(self) -> TransferResult:
         return TransferResult(
             items=lambda: self.transfers.values(),
@@ -2170,6 +2403,46 @@ class MockDatabase:
             items=lambda: self.plan_approvals,
         )
 
+    def get_payout_factor_cache(self) -> records.PayoutFactorCache:
+        return replace(self.payout_factor_cache)
+
+    def store_payout_factor(
+        self,
+        *,
+        version: int,
+        payout_factor: Decimal,
+        computed_at: datetime,
+        valid_until: Optional[datetime],
+    ) -> bool:
+        if self.payout_factor_cache.version != version:
+            return False
+        self.payout_factor_cache = records.PayoutFactorCache(
+            version=version,
+            payout_factor=payout_factor,
+            computed_at=computed_at,
+            valid_until=valid_until,
+        )
+        return True
+
+    def invalidate_payout_factor_cache(self) -> None:
+        self.payout_factor_cache = records.PayoutFactorCache(
+            version=self.payout_factor_cache.version + 1,
+            payout_factor=None,
+            computed_at=None,
+            valid_until=None,
+        )
+
+    def get_payout_factor_changes(self) -> PayoutFactorChangeResult:
+        return PayoutFactorChangeResult(
+            database=self,
+            items=lambda: self.payout_factor_changes,
+        )
+
+    def create_payout_factor_changes(
+        self, changes: Iterable[records.PayoutFactorChange]
+    ) -> None:
+        self.payout_factor_changes.extend(changes)
+
 
 class Index(Generic[Key, Value]):
     def __init__(self) -> None:
@@ -2278,3 +2551,11 @@ class Indices:
     account_credentials_by_email_address_lowercased: Index[str, UUID] = field(
         default_factory=Index
     )
+
+
+def _relevance_key(text: str, query: str) -> Tuple[bool, int, int]:
+    """Texts containing the query come first, the earlier and the
+    shorter the better.
+    """
+    position = text.lower().find(query.lower())
+    return position < 0, position, len(text)
@@ -48,6 +48,12 @@ class InteractorTests(BaseTestCase):
         approval_response = self.interactor.approve_plan(request)
         assert not approval_response.is_plan_approved
 
+    def test_that_approval_invalidates_cached_payout_factor(self) -> None:
+        plan = self.plan_generator.create_plan(approved=False)
+        version = self.database_gateway.get_payout_factor_cache().version
+        self.interactor.approve_plan(self.create_request(plan=plan))
+        assert self.database_gateway.get_payout_factor_cache().version > version
+
     def test_that_plan_shows_up_in_activated_plans_after_approval(self) -> None:
         plan = self.plan_generator.create_plan(approved=False)
         self.interactor.approve_plan(self.create_request(plan=plan))
@@ -0,0 +1,48 @@
+from decimal import Decimal
+
+from arbeitszeit.interactors.get_payout_factor_history import (
+    GetPayoutFactorHistoryInteractor,
+)
+from arbeitszeit.records import PayoutFactorChange
+from tests.datetime_service import datetime_utc
+from tests.interactors.base_test_case import BaseTestCase
+
+
+class GetPayoutFactorHistoryTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.interactor = self.injector.get(GetPayoutFactorHistoryInteractor)
+
+    def test_that_history_is_empty_without_stored_changes(self) -> None:
+        response = self.interactor.get_payout_factor_history()
+        assert not response.changes
+
+    def test_that_stored_change_is_returned(self) -> None:
+        self.database_gateway.create_payout_factor_changes(
+            [
+                PayoutFactorChange(
+                    timestamp=datetime_utc(2000, 1, 1), payout_factor=Decimal("0.5")
+                )
+            ]
+        )
+        response = self.interactor.get_payout_factor_history()
+        (change,) = response.changes
+        assert change.timestamp == datetime_utc(2000, 1, 1)
+        assert change.payout_factor == Decimal("0.5")
+
+    def test_that_changes_are_ordered_by_timestamp(self) -> None:
+        self.database_gateway.create_payout_factor_changes(
+            [
+                PayoutFactorChange(
+                    timestamp=datetime_utc(2000, 1, 2), payout_factor=Decimal("0.5")
+                ),
+                PayoutFactorChange(
+                    timestamp=datetime_utc(2000, 1, 1), payout_factor=Decimal("0.7")
+                ),
+            ]
+        )
+        response = self.interactor.get_payout_factor_history()
+        assert [change.timestamp for change in response.changes] == [
+            datetime_utc(2000, 1, 1),
+            datetime_utc(2000, 1, 2),
+        ]
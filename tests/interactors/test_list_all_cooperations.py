@@ -3,6 +3,7 @@ from uuid import UUID
 
 from arbeitszeit.interactors.list_all_cooperations import (
     ListAllCooperationsInteractor,
+    ListAllCooperationsRequest,
     ListAllCooperationsResponse,
 )
 from tests.data_generators import CooperationGenerator, PlanGenerator
@@ -81,3 +82,55 @@ def test_that_expired_plans_are_not_included_in_plan_count(
     datetime_service.advance_time(timedelta(days=2))
     response = interactor.execute()
     assert response.cooperations[0].plan_count == 0
+
+
+@injection_test
+def test_that_cooperations_are_ordered_by_name(
+    interactor: ListAllCooperationsInteractor,
+    cooperation_generator: CooperationGenerator,
+) -> None:
+    cooperation_generator.create_cooperation(name="b coop")
+    cooperation_generator.create_cooperation(name="a coop")
+    response = interactor.execute()
+    assert [coop.name for coop in response.cooperations] == ["a coop", "b coop"]
+
+
+@injection_test
+def test_that_total_results_count_all_cooperations_when_page_is_limited(
+    interactor: ListAllCooperationsInteractor,
+    cooperation_generator: CooperationGenerator,
+) -> None:
+    for _ in range(3):
+        cooperation_generator.create_cooperation()
+    response = interactor.execute(ListAllCooperationsRequest(offset=0, limit=2))
+    assert len(response.cooperations) == 2
+    assert response.total_results == 3
+
+
+@injection_test
+def test_that_offset_skips_cooperations_of_previous_pages(
+    interactor: ListAllCooperationsInteractor,
+    cooperation_generator: CooperationGenerator,
+) -> None:
+    cooperation_generator.create_cooperation(name="a coop")
+    cooperation_generator.create_cooperation(name="b coop")
+    cooperation_generator.create_cooperation(name="c coop")
+    response = interactor.execute(ListAllCooperationsRequest(offset=2, limit=2))
+    assert [coop.name for coop in response.cooperations] == ["c coop"]
+
+
+@injection_test
+def test_that_plan_counts_are_reported_per_cooperation(
+    interactor: ListAllCooperationsInteractor,
+    cooperation_generator: CooperationGenerator,
+    plan_generator: PlanGenerator,
+) -> None:
+    cooperation_generator.create_cooperation(
+        name="a coop", plans=[plan_generator.create_plan()]
+    )
+    cooperation_generator.create_cooperation(
+        name="b coop",
+        plans=[plan_generator.create_plan(), plan_generator.create_plan()],
+    )
+    response = interactor.execute()
+    assert [coop.plan_count for coop in response.cooperations] == [1, 2]
@@ -135,6 +135,43 @@ class LimitAndOffsetTests(TransferTestBase):
         assert len(response.transfers) == expected_results
 
 
+class CursorTests(TransferTestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        for day in [1, 2, 3]:
+            self.transfer_generator.create_transfer(date=datetime_utc(2024, 1, day))
+
+    def test_that_no_next_cursor_is_returned_without_limit(self) -> None:
+        response = self.list_transfers()
+        assert response.next_cursor is None
+
+    def test_that_no_next_cursor_is_returned_if_page_is_not_full(self) -> None:
+        response = self.interactor.list_transfers(self.create_request(limit=4))
+        assert response.next_cursor is None
+
+    def test_that_next_cursor_points_to_last_transfer_of_full_page(self) -> None:
+        response = self.interactor.list_transfers(self.create_request(limit=2))
+        assert response.next_cursor
+        assert response.next_cursor[0] == datetime_utc(2024, 1, 2)
+
+    def test_that_next_page_contains_remaining_transfers(self) -> None:
+        response = self.interactor.list_transfers(self.create_request(limit=2))
+        response = self.interactor.list_transfers(
+            Request(limit=2, offset=None, after=response.next_cursor)
+        )
+        assert [transfer.date for transfer in response.transfers] == [
+            datetime_utc(2024, 1, 1)
+        ]
+        assert response.next_cursor is None
+
+    def test_that_total_results_include_transfers_before_cursor(self) -> None:
+        response = self.interactor.list_transfers(self.create_request(limit=2))
+        response = self.interactor.list_transfers(
+            Request(limit=2, offset=None, after=response.next_cursor)
+        )
+        assert response.total_results == 3
+
+
 class ListTransfersOfApprovedProductivePlanTests(TransferTestBase):
     def test_that_three_transfers_are_returned_after_approval_of_plan(self) -> None:
         self.plan_generator.create_plan()
@@ -1,6 +1,7 @@
 from typing import Optional
 
 from arbeitszeit.interactors.query_companies import (
+    CompanyCursor,
     CompanyFilter,
     CompanyQueryResponse,
     QueryCompaniesInteractor,
@@ -154,15 +155,97 @@ class TestPagination(BaseTestCase):
         assert len(response.results) == 5
 
 
+class RelevanceTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.query_companies = self.injector.get(QueryCompaniesInteractor)
+
+    def test_that_companies_searched_by_name_are_ranked_by_relevance(self) -> None:
+        self.company_generator.create_company(name="a bakery")
+        self.company_generator.create_company(name="bakery")
+        response = self.query_companies.execute(
+            make_request(query="bakery", category=CompanyFilter.by_name)
+        )
+        assert [company.company_name for company in response.results] == [
+            "bakery",
+            "a bakery",
+        ]
+
+    def test_that_companies_searched_by_email_are_ordered_by_name(self) -> None:
+        self.company_generator.create_company(name="b", email="b@bakery.org")
+        self.company_generator.create_company(name="a", email="a@bakery.org")
+        response = self.query_companies.execute(
+            make_request(query="bakery", category=CompanyFilter.by_email)
+        )
+        assert [company.company_name for company in response.results] == [
+            "a",
+            "b",
+        ]
+
+
+class CursorTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.query_companies = self.injector.get(QueryCompaniesInteractor)
+
+    def test_that_companies_are_ordered_by_name(self) -> None:
+        for name in ["b", "c", "a"]:
+            self.company_generator.create_company(name=name)
+        response = self.query_companies.execute(make_request())
+        assert [company.company_name for company in response.results] == [
+            "a",
+            "b",
+            "c",
+        ]
+
+    def test_that_no_next_cursor_is_returned_if_page_is_not_full(self) -> None:
+        self.company_generator.create_company()
+        response = self.query_companies.execute(make_request(limit=2))
+        assert response.next_cursor is None
+
+    def test_that_next_cursor_holds_name_and_id_of_last_company(self) -> None:
+        self.company_generator.create_company(name="a")
+        company = self.company_generator.create_company(name="b")
+        self.company_generator.create_company(name="c")
+        response = self.query_companies.execute(make_request(limit=2))
+        assert response.next_cursor == ("b", company)
+
+    def test_that_next_page_contains_remaining_companies(self) -> None:
+        for name in ["a", "b", "c"]:
+            self.company_generator.create_company(name=name)
+        response = self.query_companies.execute(make_request(limit=2))
+        response = self.query_companies.execute(
+            make_request(limit=2, after=response.next_cursor)
+        )
+        assert [company.company_name for company in response.results] == ["c"]
+        assert response.total_results == 3
+
+    def test_that_no_next_cursor_is_returned_for_ranked_name_search(self) -> None:
+        for name in ["xa", "xb", "xc"]:
+            self.company_generator.create_company(name=name)
+        response = self.query_companies.execute(make_request(query="x", limit=2))
+        assert response.next_cursor is None
+
+    def test_that_next_cursor_is_returned_for_email_search(self) -> None:
+        for _ in range(3):
+            self.company_generator.create_company()
+        response = self.query_companies.execute(
+            make_request(query="@", category=CompanyFilter.by_email, limit=2)
+        )
+        assert response.next_cursor is not None
+
+
 def make_request(
     query: Optional[str] = None,
     category: Optional[CompanyFilter] = None,
     offset: Optional[int] = None,
     limit: Optional[int] = None,
+    after: Optional[CompanyCursor] = None,
 ) -> QueryCompaniesRequest:
     return QueryCompaniesRequest(
         query_string=query or "",
         filter_category=category or CompanyFilter.by_name,
         offset=offset,
         limit=limit,
+        after=after,
     )
@@ -274,6 +274,31 @@ class InteractorTests(BaseTestCase):
         assert response.results[0].plan_id == expected_first
         assert response.results[1].plan_id == expected_second
 
+    @parameterized.expand(
+        [
+            (SearchStrategy.by_name_sort_by_name_exclude_expired,),
+            (SearchStrategy.by_name_sort_by_name_include_expired,),
+        ]
+    )
+    def test_that_plans_of_same_planner_are_ranked_by_relevance_of_product_name(
+        self,
+        search_strategy: SearchStrategy,
+    ) -> None:
+        planner = self.company_generator.create_company()
+        longer_name = self.plan_generator.create_plan(
+            planner=planner, product_name="beer mugs and beer glasses"
+        )
+        exact_match = self.plan_generator.create_plan(
+            planner=planner, product_name="beer"
+        )
+        response = self.interactor.execute(
+            self.make_request(search_strategy=search_strategy, query="beer")
+        )
+        assert [result.plan_id for result in response.results] == [
+            exact_match,
+            longer_name,
+        ]
+
     def test_that_correct_price_per_unit_of_zero_is_displayed_for_a_public_plan(
         self,
     ) -> None:
@@ -287,18 +287,24 @@ class InteractorTester(BaseTestCase):
         response = self.interactor.show_details(
             self.create_interactor_request(company_id=planner)
         )
-        assert len(response.plot.timestamps) == 5
-        assert len(response.plot.accumulated_volumes) == 5
+        assert len(response.plot.timestamps) == 3
+        assert len(response.plot.accumulated_volumes) == 3
         assert transfer_1_timestamp in response.plot.timestamps
         assert transfer_2_timestamp in response.plot.timestamps
         assert response.plot.accumulated_volumes == [
-            Decimal(0),  # credit for p
-            Decimal(0),  # credit for r
-            Decimal(-1),  # credit for a (-1)
+            Decimal(-1),  # credits for p, r and a (-1) at plan approval
             Decimal(0),  # consumption (+1)
             Decimal(2),  # consumption (+2)
         ]
 
+    def test_that_plot_shows_the_same_data_as_the_account_details(self) -> None:
+        planner = self.company_generator.create_company()
+        plan = self.plan_generator.create_plan(planner=planner)
+        self.consumption_generator.create_private_consumption(plan=plan)
+        request = self.create_interactor_request(company_id=planner)
+        plot = self.interactor.show_plot(request)
+        assert plot == self.interactor.show_details(request).plot
+
     def test_that_party_type_for_credit_transfers_is_company_and_that_debtor_equals_creditor(
         self,
     ) -> None:
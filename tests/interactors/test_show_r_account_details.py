@@ -163,3 +163,12 @@ class WorkAccountPlottingTests(InteractorTestBase):
         )
         assert response.plot.timestamps
         assert response.plot.accumulated_volumes
+
+    def test_that_plot_shows_the_same_data_as_the_account_details(self) -> None:
+        self.transfer_generator.create_transfer(
+            credit_account=self.raw_material_account
+        )
+        self.transfer_generator.create_transfer(debit_account=self.raw_material_account)
+        request = self.create_interactor_request(self.company.id)
+        plot = self.interactor.show_plot(request)
+        assert plot == self.interactor.show_details(request).plot
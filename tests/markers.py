@@ -3,6 +3,8 @@ import os
 from typing import Set, TypeVar
 from unittest import TestCase
 
+from sqlalchemy import make_url
+
 _MARKERS: Set[str] = {
     marker.strip() for marker in os.getenv("DISABLED_TESTS", "").split(",")
 }
@@ -26,3 +28,14 @@ def database_required(cls: type[T]) -> type[T]:
             super().setUp()
 
     return DatabaseTests
+
+
+def postgresql_required(cls: type[T]) -> type[T]:
+    class PostgreSQLTests(cls):  # type: ignore
+        def setUp(self) -> None:
+            test_database = make_url(os.getenv("ARBEITSZEITAPP_TEST_DB", "sqlite://"))
+            if test_database.get_backend_name() != "postgresql":
+                self.skipTest("Tests that require PostgreSQL are disabled")
+            super().setUp()
+
+    return PostgreSQLTests
@@ -8,10 +8,7 @@ from arbeitszeit.anonymization import ANONYMIZED_STR, ANONYMIZED_UUID
 from arbeitszeit.records import SocialAccounting
 from arbeitszeit.services.account_details import (
     AccountDetailsService,
-    AccountTransfer,
-    TransferParty,
     TransferPartyType,
-    construct_plot_data,
 )
 from arbeitszeit.transfers import TransferType
 from tests.datetime_service import datetime_utc
@@ -45,28 +42,28 @@ class ServiceBase(BaseTestCase):
 
 class AccountTransfersTests(ServiceBase):
     def test_no_transfers_returned_when_account_does_not_exist(self) -> None:
-        assert not self.service.get_account_transfers(uuid4())
+        assert not list(self.service.get_account_transfers(uuid4()))
 
     def test_no_transfers_returned_when_no_transfers_took_place(self) -> None:
         account = self.company_generator.create_company_record().product_account
-        assert not self.service.get_account_transfers(account)
+        assert not list(self.service.get_account_transfers(account))
 
     def test_no_transfers_returned_when_no_transfers_to_or_from_specified_account_took_place(
         self,
     ) -> None:
         self.transfer_generator.create_transfer()
         account = self.company_generator.create_company_record().product_account
-        assert not self.service.get_account_transfers(account)
+        assert not list(self.service.get_account_transfers(account))
 
     def test_that_transfers_to_account_are_returned(self) -> None:
         account = self.create_company_product_account()
         self.transfer_generator.create_transfer(credit_account=account)
-        assert self.service.get_account_transfers(account)
+        assert list(self.service.get_account_transfers(account))
 
     def test_that_transfers_from_account_are_returned(self) -> None:
         account = self.create_company_product_account()
         self.transfer_generator.create_transfer(debit_account=account)
-        assert self.service.get_account_transfers(account)
+        assert list(self.service.get_account_transfers(account))
 
     @parameterized.expand([(0,), (1,), (3,)])
     def test_that_correct_amount_of_transfers_from_account_are_returned(
@@ -75,7 +72,9 @@ class AccountTransfersTests(ServiceBase):
         account = self.create_company_product_account()
         for _ in range(num_of_transfers):
             self.transfer_generator.create_transfer(debit_account=account)
-        assert len(self.service.get_account_transfers(account)) == num_of_transfers
+        assert (
+            len(list(self.service.get_account_transfers(account))) == num_of_transfers
+        )
 
     @parameterized.expand([(0,), (1,), (3,)])
     def test_that_correct_amount_of_transfers_to_account_are_returned(
@@ -84,7 +83,22 @@ class AccountTransfersTests(ServiceBase):
         account = self.create_company_product_account()
         for _ in range(num_of_transfers):
             self.transfer_generator.create_transfer(credit_account=account)
-        assert len(self.service.get_account_transfers(account)) == num_of_transfers
+        assert (
+            len(list(self.service.get_account_transfers(account))) == num_of_transfers
+        )
+
+    def test_that_newest_transfers_are_returned_first(self) -> None:
+        account = self.create_company_product_account()
+        for day in [2, 3, 1]:
+            self.transfer_generator.create_transfer(
+                credit_account=account, date=datetime_utc(2000, 1, day)
+            )
+        transfers = self.service.get_account_transfers(account)
+        assert [transfer.date for transfer in transfers] == [
+            datetime_utc(2000, 1, 3),
+            datetime_utc(2000, 1, 2),
+            datetime_utc(2000, 1, 1),
+        ]
 
     @parameterized.expand([(True,), (False,)])
     def test_debit_transfers_are_shown_as_such(
@@ -96,7 +110,7 @@ class AccountTransfersTests(ServiceBase):
             self.transfer_generator.create_transfer(debit_account=account)
         else:
             self.transfer_generator.create_transfer(credit_account=account)
-        transfers = self.service.get_account_transfers(account)
+        transfers = list(self.service.get_account_transfers(account))
         assert transfers[0].is_debit_transfer == is_debit
 
     @parameterized.expand(
@@ -113,7 +127,7 @@ class AccountTransfersTests(ServiceBase):
         self.transfer_generator.create_transfer(
             type=expected_transfer_type, credit_account=account
         )
-        transfers = self.service.get_account_transfers(account)
+        transfers = list(self.service.get_account_transfers(account))
         assert transfers[0].type == expected_transfer_type
 
     @parameterized.expand(
@@ -127,7 +141,7 @@ class AccountTransfersTests(ServiceBase):
         self.transfer_generator.create_transfer(
             date=expected_date, credit_account=account
         )
-        transfers = self.service.get_account_transfers(account)
+        transfers = list(self.service.get_account_transfers(account))
         assert transfers[0].date == expected_date
 
     @parameterized.expand(
@@ -140,7 +154,7 @@ class AccountTransfersTests(ServiceBase):
         self.transfer_generator.create_transfer(
             value=expected_volume, credit_account=account
         )
-        transfers = self.service.get_account_transfers(account)
+        transfers = list(self.service.get_account_transfers(account))
         assert transfers[0].volume == expected_volume
 
     @parameterized.expand(
@@ -151,7 +165,7 @@ class AccountTransfersTests(ServiceBase):
     ) -> None:
         account = self.create_company_product_account()
         self.transfer_generator.create_transfer(value=volume, debit_account=account)
-        transfers = self.service.get_account_transfers(account)
+        transfers = list(self.service.get_account_transfers(account))
         assert transfers[0].volume == -volume
 
 
@@ -170,7 +184,7 @@ class TransferPartyTests(ServiceBase):
             self.transfer_generator.create_transfer(
                 debit_account=other_party_account, credit_account=requesting_account
             )
-        transfers = self.service.get_account_transfers(requesting_account)
+        transfers = list(self.service.get_account_transfers(requesting_account))
         assert transfers[0].transfer_party.type == TransferPartyType.company
 
     @parameterized.expand([(True,), (False,)])
@@ -187,7 +201,7 @@ class TransferPartyTests(ServiceBase):
             self.transfer_generator.create_transfer(
                 debit_account=other_party_account, credit_account=requesting_account
             )
-        transfers = self.service.get_account_transfers(requesting_account)
+        transfers = list(self.service.get_account_transfers(requesting_account))
         assert transfers[0].transfer_party.type == TransferPartyType.member
 
     @parameterized.expand([(True,), (False,)])
@@ -204,7 +218,7 @@ class TransferPartyTests(ServiceBase):
             self.transfer_generator.create_transfer(
                 debit_account=other_party_account, credit_account=requesting_account
             )
-        transfers = self.service.get_account_transfers(requesting_account)
+        transfers = list(self.service.get_account_transfers(requesting_account))
         assert transfers[0].transfer_party.type == TransferPartyType.social_accounting
 
     @parameterized.expand([(True,), (False,)])
@@ -221,7 +235,7 @@ class TransferPartyTests(ServiceBase):
             self.transfer_generator.create_transfer(
                 debit_account=other_party_account, credit_account=requesting_account
             )
-        transfers = self.service.get_account_transfers(requesting_account)
+        transfers = list(self.service.get_account_transfers(requesting_account))
         assert transfers[0].transfer_party.type == TransferPartyType.cooperation
 
     @parameterized.expand([(True,), (False,)])
@@ -238,7 +252,7 @@ class TransferPartyTests(ServiceBase):
             self.transfer_generator.create_transfer(
                 debit_account=other_party_account, credit_account=requesting_account
             )
-        transfers = self.service.get_account_transfers(requesting_account)
+        transfers = list(self.service.get_account_transfers(requesting_account))
         assert transfers[0].transfer_party.id is ANONYMIZED_UUID
 
     @parameterized.expand([(True,), (False,)])
@@ -255,7 +269,7 @@ class TransferPartyTests(ServiceBase):
             self.transfer_generator.create_transfer(
                 debit_account=other_party_account, credit_account=requesting_account
             )
-        transfers = self.service.get_account_transfers(requesting_account)
+        transfers = list(self.service.get_account_transfers(requesting_account))
         assert transfers[0].transfer_party.name == ANONYMIZED_STR
 
     @parameterized.expand(
@@ -284,7 +298,7 @@ class TransferPartyTests(ServiceBase):
             self.transfer_generator.create_transfer(
                 debit_account=requesting_account, credit_account=other_party_account
             )
-        transfers = self.service.get_account_transfers(requesting_account)
+        transfers = list(self.service.get_account_transfers(requesting_account))
         assert transfers[0].transfer_party.id is not ANONYMIZED_UUID
 
     @parameterized.expand(
@@ -313,7 +327,7 @@ class TransferPartyTests(ServiceBase):
             self.transfer_generator.create_transfer(
                 debit_account=requesting_account, credit_account=other_party_account
             )
-        transfers = self.service.get_account_transfers(requesting_account)
+        transfers = list(self.service.get_account_transfers(requesting_account))
         assert transfers[0].transfer_party.name is not ANONYMIZED_STR
 
     def test_that_transfer_party_name_equals_company_name(self) -> None:
@@ -324,7 +338,7 @@ class TransferPartyTests(ServiceBase):
         self.transfer_generator.create_transfer(
             debit_account=requesting_account, credit_account=company.means_account
         )
-        transfers = self.service.get_account_transfers(requesting_account)
+        transfers = list(self.service.get_account_transfers(requesting_account))
         assert transfers[0].transfer_party.name == "Some Company Name"
 
     def test_that_transfer_party_id_equals_company_id(self) -> None:
@@ -335,7 +349,7 @@ class TransferPartyTests(ServiceBase):
         self.transfer_generator.create_transfer(
             debit_account=requesting_account, credit_account=company.means_account
         )
-        transfers = self.service.get_account_transfers(requesting_account)
+        transfers = list(self.service.get_account_transfers(requesting_account))
         assert transfers[0].transfer_party.id == company.id
 
     def test_that_transfer_party_name_equals_cooperation_name(self) -> None:
@@ -346,7 +360,7 @@ class TransferPartyTests(ServiceBase):
         self.transfer_generator.create_transfer(
             debit_account=requesting_account, credit_account=cooperation.account
         )
-        transfers = self.service.get_account_transfers(requesting_account)
+        transfers = list(self.service.get_account_transfers(requesting_account))
         assert transfers[0].transfer_party.name == "Some Cooperation Name"
 
     def test_that_transfer_party_id_equals_cooperation_id(self) -> None:
@@ -357,7 +371,7 @@ class TransferPartyTests(ServiceBase):
         self.transfer_generator.create_transfer(
             debit_account=requesting_account, credit_account=cooperation.account
         )
-        transfers = self.service.get_account_transfers(requesting_account)
+        transfers = list(self.service.get_account_transfers(requesting_account))
         assert transfers[0].transfer_party.id == cooperation.id
 
     def test_that_transfer_party_name_equals_social_accounting_name(self) -> None:
@@ -367,7 +381,7 @@ class TransferPartyTests(ServiceBase):
             debit_account=requesting_account,
             credit_account=social_accounting.account_psf,
         )
-        transfers = self.service.get_account_transfers(requesting_account)
+        transfers = list(self.service.get_account_transfers(requesting_account))
         assert transfers[0].transfer_party.name == social_accounting.get_name()
 
     def test_that_transfer_party_id_equals_social_accounting_id(self) -> None:
@@ -377,7 +391,7 @@ class TransferPartyTests(ServiceBase):
             debit_account=requesting_account,
             credit_account=social_accounting.account_psf,
         )
-        transfers = self.service.get_account_transfers(requesting_account)
+        transfers = list(self.service.get_account_transfers(requesting_account))
         assert transfers[0].transfer_party.id == social_accounting.id
 
 
@@ -411,59 +425,79 @@ class AccountBalanceTests(ServiceBase):
         assert self.service.get_account_balance(account) == Decimal(expected_balance)
 
 
-class PlotDataTests(ServiceBase):
-    def test_that_plotting_info_is_empty_when_empty_list_is_passed_in(self) -> None:
-        plot_data = construct_plot_data([])
+class PlotDetailsTests(ServiceBase):
+    def test_that_plotting_info_is_empty_when_no_transfers_took_place(self) -> None:
+        account = self.create_company_product_account()
+        plot_data = self.service.get_plot_details(account)
         assert not plot_data.accumulated_volumes
         assert not plot_data.timestamps
 
-    def test_that_timestamps_are_extracted_from_list_of_transfers_and_sorted_ascending(
-        self,
-    ) -> None:
+    def test_that_timestamps_of_transfers_are_sorted_ascending(self) -> None:
+        account = self.create_company_product_account()
         timestamps = [
             datetime_utc(2000, 1, 1),
             datetime_utc(1999, 1, 1),
             datetime_utc(2001, 1, 1),
         ]
-        transfers = [self.create_account_transfer(date=date) for date in timestamps]
-        plot_data = construct_plot_data(transfers)
+        for date in timestamps:
+            self.transfer_generator.create_transfer(date=date, credit_account=account)
+        plot_data = self.service.get_plot_details(account)
         assert plot_data.timestamps == sorted(timestamps)
 
-    def test_that_volumes_are_extracted_from_list_of_transfers_and_accumulated(
-        self,
-    ) -> None:
-        transfers = [self.create_account_transfer(volume=Decimal(1)) for _ in range(3)]
-        plot_data = construct_plot_data(transfers)
+    def test_that_volumes_of_transfers_are_accumulated(self) -> None:
+        account = self.create_company_product_account()
+        for day in range(1, 4):
+            self.transfer_generator.create_transfer(
+                date=datetime_utc(2000, 1, day),
+                credit_account=account,
+                value=Decimal(1),
+            )
+        plot_data = self.service.get_plot_details(account)
         assert plot_data.accumulated_volumes == [Decimal(1), Decimal(2), Decimal(3)]
 
-    def test_that_volumes_are_extracted_from_list_of_transfers_in_ascending_order_by_date(
-        self,
-    ) -> None:
-        transfer1 = self.create_account_transfer(
-            date=datetime_utc(2000, 1, 1), volume=Decimal(10)
+    def test_that_volumes_are_accumulated_in_ascending_order_by_date(self) -> None:
+        account = self.create_company_product_account()
+        self.transfer_generator.create_transfer(
+            date=datetime_utc(2000, 1, 1), credit_account=account, value=Decimal(10)
         )
-        transfer2 = self.create_account_transfer(
-            date=datetime_utc(1999, 1, 1), volume=Decimal(-10)
+        self.transfer_generator.create_transfer(
+            date=datetime_utc(1999, 1, 1), debit_account=account, value=Decimal(10)
         )
-        transfer3 = self.create_account_transfer(
-            date=datetime_utc(2001, 1, 1), volume=Decimal(10)
+        self.transfer_generator.create_transfer(
+            date=datetime_utc(2001, 1, 1), credit_account=account, value=Decimal(10)
         )
-        transfers = [transfer1, transfer2, transfer3]
-        plot_data = construct_plot_data(transfers)
+        plot_data = self.service.get_plot_details(account)
         assert plot_data.accumulated_volumes == [Decimal(-10), Decimal(0), Decimal(10)]
 
-    def create_account_transfer(
-        self, date: datetime = datetime(2025, 5, 1), volume: Decimal = Decimal(10)
-    ) -> AccountTransfer:
-        return AccountTransfer(
-            type=TransferType.credit_p,
-            date=date,
-            is_debit_transfer=False,
-            volume=volume,
-            transfer_party=TransferParty(
-                type=TransferPartyType.company,
-                id=uuid4(),
-                name="Some counter party name",
-            ),
-            debtor_equals_creditor=False,
+    def test_that_transfers_of_other_accounts_are_ignored(self) -> None:
+        account = self.create_company_product_account()
+        self.transfer_generator.create_transfer(date=datetime_utc(2000, 1, 1))
+        self.transfer_generator.create_transfer(
+            date=datetime_utc(2000, 1, 2), credit_account=account, value=Decimal(5)
+        )
+        plot_data = self.service.get_plot_details(account)
+        assert plot_data.accumulated_volumes == [Decimal(5)]
+
+    def test_that_transfers_at_the_same_time_yield_a_single_point(self) -> None:
+        account = self.create_company_product_account()
+        timestamp = datetime_utc(2000, 1, 1)
+        self.transfer_generator.create_transfer(
+            date=timestamp, credit_account=account, value=Decimal(3)
+        )
+        self.transfer_generator.create_transfer(
+            date=timestamp, debit_account=account, value=Decimal(1)
+        )
+        plot_data = self.service.get_plot_details(account)
+        assert plot_data.timestamps == [timestamp]
+        assert plot_data.accumulated_volumes == [Decimal(2)]
+
+    def test_that_plot_ends_with_account_balance(self) -> None:
+        account = self.create_company_product_account()
+        self.transfer_generator.create_transfer(
+            credit_account=account, value=Decimal(7)
+        )
+        self.transfer_generator.create_transfer(debit_account=account, value=Decimal(3))
+        plot_data = self.service.get_plot_details(account)
+        assert plot_data.accumulated_volumes[-1] == self.service.get_account_balance(
+            account
         )
@@ -0,0 +1,105 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from arbeitszeit.records import ProductionCosts
+from arbeitszeit.services.payout_factor import PayoutFactorService
+from arbeitszeit.services.payout_factor_history import PayoutFactorHistoryService
+from tests.datetime_service import datetime_utc
+from tests.interactors.base_test_case import BaseTestCase
+
+
+class PayoutFactorHistoryServiceTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.service = self.injector.get(PayoutFactorHistoryService)
+        self.payout_factor_service = self.injector.get(PayoutFactorService)
+        self.datetime_service.freeze_time(datetime_utc(2000, 1, 1))
+
+    def test_that_no_changes_are_stored_without_plans(self) -> None:
+        assert not self.service.extend_history(self.datetime_service.now())
+
+    def test_that_approval_of_plan_is_stored_as_change(self) -> None:
+        self.create_public_plan(timeframe=10)
+        (change,) = self.service.extend_history(self.datetime_service.now())
+        assert change.timestamp == datetime_utc(2000, 1, 1)
+        assert change.payout_factor == Decimal(0)
+
+    def test_that_expiration_of_plan_is_stored_as_change(self) -> None:
+        self.create_public_plan(timeframe=10)
+        changes = self.service.extend_history(datetime_utc(2000, 1, 20))
+        assert changes[-1].timestamp == datetime_utc(2000, 1, 11)
+        assert changes[-1].payout_factor == Decimal(1)
+
+    def test_that_expirations_after_the_given_timestamp_are_not_stored(
+        self,
+    ) -> None:
+        self.create_public_plan(timeframe=10)
+        changes = self.service.extend_history(datetime_utc(2000, 1, 5))
+        assert len(changes) == 1
+
+    def test_that_events_which_do_not_change_the_payout_factor_are_skipped(
+        self,
+    ) -> None:
+        self.create_public_plan(timeframe=10)
+        self.datetime_service.advance_time(timedelta(days=1))
+        self.create_public_plan(timeframe=10)
+        changes = self.service.extend_history(self.datetime_service.now())
+        assert len(changes) == 1
+
+    def test_that_stored_changes_are_not_stored_again(self) -> None:
+        self.create_public_plan(timeframe=10)
+        self.service.extend_history(self.datetime_service.now())
+        assert not self.service.extend_history(self.datetime_service.now())
+
+    def test_that_history_is_extended_from_latest_stored_change(self) -> None:
+        self.create_public_plan(timeframe=10)
+        self.service.extend_history(self.datetime_service.now())
+        self.datetime_service.advance_time(timedelta(days=2))
+        self.create_productive_plan(timeframe=20)
+        (change,) = self.service.extend_history(self.datetime_service.now())
+        assert change.timestamp == datetime_utc(2000, 1, 3)
+
+    def test_that_history_is_stored(self) -> None:
+        self.create_public_plan(timeframe=10)
+        changes = self.service.extend_history(datetime_utc(2000, 1, 20))
+        stored_changes = list(
+            self.database_gateway.get_payout_factor_changes().ordered_by_timestamp()
+        )
+        assert stored_changes == changes
+
+    def test_that_stored_payout_factors_match_calculation_at_their_timestamps(
+        self,
+    ) -> None:
+        self.create_public_plan(timeframe=10)
+        self.datetime_service.advance_time(timedelta(days=2))
+        self.create_productive_plan(timeframe=3)
+        self.datetime_service.advance_time(timedelta(days=1))
+        self.create_productive_plan(timeframe=20)
+        changes = self.service.extend_history(datetime_utc(2000, 2, 1))
+        assert changes
+        for change in changes:
+            assert change.payout_factor == (
+                self.payout_factor_service.calculate_payout_factor(change.timestamp)
+            )
+
+    def create_public_plan(self, timeframe: int) -> None:
+        self.plan_generator.create_plan(
+            is_public_service=True,
+            costs=ProductionCosts(
+                labour_cost=Decimal(5),
+                means_cost=Decimal(10),
+                resource_cost=Decimal(0),
+            ),
+            timeframe=timeframe,
+        )
+
+    def create_productive_plan(self, timeframe: int) -> None:
+        self.plan_generator.create_plan(
+            is_public_service=False,
+            costs=ProductionCosts(
+                labour_cost=Decimal(30),
+                means_cost=Decimal(0),
+                resource_cost=Decimal(0),
+            ),
+            timeframe=timeframe,
+        )
@@ -1,10 +1,14 @@
 from datetime import timedelta
 from decimal import Decimal
+from random import Random
 
 from parameterized import parameterized
 
 from arbeitszeit.records import ProductionCosts
-from arbeitszeit.services.payout_factor import PayoutFactorService
+from arbeitszeit.services.payout_factor import (
+    PayoutFactorService,
+    calculate_payout_factor,
+)
 from tests.datetime_service import datetime_utc
 from tests.interactors.base_test_case import BaseTestCase
 
@@ -150,3 +154,111 @@ class PayoutFactorServiceCalculationTests(BaseTestCase):
         assert self.service.calculate_payout_factor(
             datetime_utc(2000, 1, 6)
         ) == Decimal(0)
+
+
+class PayoutFactorServiceEquivalenceTests(BaseTestCase):
+    """The service aggregates the costs of the active plans in the
+    database. Its results must not differ from calculate_payout_factor,
+    which goes through the plans one by one.
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.service = self.injector.get(PayoutFactorService)
+        self.datetime_service.freeze_time(datetime_utc(2000, 1, 1))
+
+    @parameterized.expand([(seed,) for seed in range(10)])
+    def test_that_service_agrees_with_calculation_over_active_plans(
+        self, seed: int
+    ) -> None:
+        random = Random(seed)
+        for _ in range(random.randint(0, 6)):
+            self.plan_generator.create_plan(
+                is_public_service=random.choice([True, False]),
+                costs=ProductionCosts(
+                    labour_cost=Decimal(random.randint(0, 50)),
+                    resource_cost=Decimal(random.randint(0, 50)),
+                    means_cost=Decimal(random.randint(0, 50)),
+                ),
+                timeframe=random.randint(1, 10),
+            )
+            self.datetime_service.advance_time(timedelta(days=random.randint(1, 3)))
+        now = self.datetime_service.now()
+        active_plans = (
+            self.database_gateway.get_plans()
+            .that_will_expire_after(now)
+            .that_were_approved_before(now)
+        )
+        assert self.service.calculate_payout_factor(now) == calculate_payout_factor(
+            active_plans
+        )
+
+
+class CurrentPayoutFactorCacheTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.service = self.injector.get(PayoutFactorService)
+
+    def test_that_current_payout_factor_is_cached(self) -> None:
+        self.create_public_plan_with_means_costs(timeframe=10)
+        payout_factor = self.service.get_current_payout_factor()
+        cache = self.database_gateway.get_payout_factor_cache()
+        assert cache.payout_factor == payout_factor
+
+    def test_that_cache_is_valid_until_earliest_expiration_of_active_plans(
+        self,
+    ) -> None:
+        self.datetime_service.freeze_time(datetime_utc(2000, 1, 1))
+        self.create_public_plan_with_means_costs(timeframe=10)
+        self.create_public_plan_with_means_costs(timeframe=5)
+        self.service.get_current_payout_factor()
+        cache = self.database_gateway.get_payout_factor_cache()
+        assert cache.valid_until == datetime_utc(2000, 1, 6)
+
+    def test_that_cached_payout_factor_is_returned_while_cache_is_valid(
+        self,
+    ) -> None:
+        self.service.get_current_payout_factor()
+        cache = self.database_gateway.get_payout_factor_cache()
+        assert self.database_gateway.store_payout_factor(
+            version=cache.version,
+            payout_factor=Decimal("0.5"),
+            computed_at=self.datetime_service.now(),
+            valid_until=None,
+        )
+        assert self.service.get_current_payout_factor() == Decimal("0.5")
+
+    def test_that_approving_a_plan_changes_current_payout_factor(self) -> None:
+        assert self.service.get_current_payout_factor() == Decimal(1)
+        self.create_public_plan_with_means_costs(timeframe=10)
+        assert self.service.get_current_payout_factor() == Decimal(0)
+
+    def test_that_expiration_of_a_plan_changes_current_payout_factor(self) -> None:
+        self.datetime_service.freeze_time(datetime_utc(2000, 1, 1))
+        self.create_public_plan_with_means_costs(timeframe=10)
+        assert self.service.get_current_payout_factor() == Decimal(0)
+        self.datetime_service.freeze_time(datetime_utc(2000, 1, 11))
+        assert self.service.get_current_payout_factor() == Decimal(1)
+
+    def test_that_payout_factor_computed_before_invalidation_is_not_stored(
+        self,
+    ) -> None:
+        cache = self.database_gateway.get_payout_factor_cache()
+        self.database_gateway.invalidate_payout_factor_cache()
+        assert not self.database_gateway.store_payout_factor(
+            version=cache.version,
+            payout_factor=Decimal("0.5"),
+            computed_at=self.datetime_service.now(),
+            valid_until=None,
+        )
+
+    def create_public_plan_with_means_costs(self, timeframe: int) -> None:
+        self.plan_generator.create_plan(
+            is_public_service=True,
+            costs=ProductionCosts(
+                labour_cost=Decimal(0),
+                means_cost=Decimal(10),
+                resource_cost=Decimal(0),
+            ),
+            timeframe=timeframe,
+        )
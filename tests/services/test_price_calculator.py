@@ -146,9 +146,9 @@ class PriceCalculatorTests(BaseTestCase):
         self.cooperation_generator.create_cooperation(
             plans=[plan_1, plan_2, plan_3],
         )
-        price1 = self.service._calculate_cooperative_price(plan_1)
-        price2 = self.service._calculate_cooperative_price(plan_2)
-        price3 = self.service._calculate_cooperative_price(plan_3)
+        price1 = self.service.calculate_price(plan_1)
+        price2 = self.service.calculate_price(plan_2)
+        price3 = self.service.calculate_price(plan_3)
         assert price1 == price2 == price3 == expected_price
 
     @parameterized.expand(
@@ -179,6 +179,73 @@ class PriceCalculatorTests(BaseTestCase):
         self.cooperation_generator.create_cooperation(
             plans=[plan_1, plan_2],
         )
-        price1 = self.service._calculate_cooperative_price(plan_1)
-        price2 = self.service._calculate_cooperative_price(plan_2)
+        price1 = self.service.calculate_price(plan_1)
+        price2 = self.service.calculate_price(plan_2)
         assert price1 == price2 == expected_price
+
+
+class CalculatePricesTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.service = self.injector.get(PriceCalculator)
+
+    def test_that_no_prices_are_returned_when_no_plans_are_requested(self) -> None:
+        assert self.service.calculate_prices([]) == dict()
+
+    def test_that_price_is_zero_for_nonexisting_plan(self) -> None:
+        plan = uuid4()
+        assert self.service.calculate_prices([plan]) == {plan: Decimal(0)}
+
+    def test_that_prices_of_public_and_productive_plans_are_calculated(
+        self,
+    ) -> None:
+        public_plan = self.plan_generator.create_plan(
+            is_public_service=True,
+            costs=ProductionCosts(Decimal(1), Decimal(1), Decimal(1)),
+        )
+        productive_plan = self.plan_generator.create_plan(
+            is_public_service=False,
+            costs=ProductionCosts(Decimal(4), Decimal(3), Decimal(3)),
+            amount=5,
+        )
+        prices = self.service.calculate_prices([public_plan, productive_plan])
+        assert prices == {public_plan: Decimal(0), productive_plan: Decimal(2)}
+
+    def test_that_prices_of_plans_in_different_cooperations_are_averaged_per_cooperation(
+        self,
+    ) -> None:
+        plan_1 = self.plan_generator.create_plan(
+            costs=ProductionCosts(Decimal(10), Decimal(0), Decimal(0)), amount=1
+        )
+        plan_2 = self.plan_generator.create_plan(
+            costs=ProductionCosts(Decimal(20), Decimal(0), Decimal(0)), amount=1
+        )
+        plan_3 = self.plan_generator.create_plan(
+            costs=ProductionCosts(Decimal(30), Decimal(0), Decimal(0)), amount=1
+        )
+        plan_4 = self.plan_generator.create_plan(
+            costs=ProductionCosts(Decimal(50), Decimal(0), Decimal(0)), amount=1
+        )
+        self.cooperation_generator.create_cooperation(plans=[plan_1, plan_2])
+        self.cooperation_generator.create_cooperation(plans=[plan_3, plan_4])
+        prices = self.service.calculate_prices([plan_1, plan_3])
+        assert prices == {plan_1: Decimal(15), plan_3: Decimal(40)}
+
+    def test_that_batched_prices_equal_individually_calculated_prices(
+        self,
+    ) -> None:
+        cooperating_plans = [
+            self.plan_generator.create_plan(
+                costs=ProductionCosts(Decimal(costs), Decimal(1), Decimal(0)),
+                amount=3,
+            )
+            for costs in [5, 7, 11]
+        ]
+        self.cooperation_generator.create_cooperation(plans=cooperating_plans)
+        single_plan = self.plan_generator.create_plan(
+            costs=ProductionCosts(Decimal(2), Decimal(2), Decimal(2)), amount=4
+        )
+        plans = cooperating_plans + [single_plan]
+        prices = self.service.calculate_prices(plans)
+        for plan in plans:
+            assert prices[plan] == self.service.calculate_price(plan)
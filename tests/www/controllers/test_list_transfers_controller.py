@@ -1,9 +1,17 @@
+from uuid import uuid4
+
 from parameterized import parameterized
 
-from arbeitszeit_web.pagination import DEFAULT_PAGE_SIZE, PAGE_PARAMETER_NAME
+from arbeitszeit_web.pagination import (
+    CURSOR_PARAMETER_NAME,
+    DEFAULT_PAGE_SIZE,
+    PAGE_PARAMETER_NAME,
+    encode_cursor,
+)
 from arbeitszeit_web.www.controllers.list_transfers_controller import (
     ListTransfersController,
 )
+from tests.datetime_service import datetime_utc
 from tests.www.base_test_case import BaseTestCase
 
 
@@ -31,3 +39,25 @@ class ListTransfersControllerTests(BaseTestCase):
         expected_offset = (page - 1) * DEFAULT_PAGE_SIZE
         interactor_request = self.controller.create_interactor_request()
         assert interactor_request.offset == expected_offset
+
+    def test_that_interactor_request_has_no_cursor_by_default(self) -> None:
+        interactor_request = self.controller.create_interactor_request()
+        assert interactor_request.after is None
+
+    def test_that_cursor_is_decoded_into_date_and_transfer_id(self) -> None:
+        date = datetime_utc(2024, 1, 1, 12, 30)
+        transfer_id = uuid4()
+        self.request.set_arg(
+            CURSOR_PARAMETER_NAME, encode_cursor([date.isoformat(), str(transfer_id)])
+        )
+        interactor_request = self.controller.create_interactor_request()
+        assert interactor_request.after == (date, transfer_id)
+        assert interactor_request.offset is None
+        assert interactor_request.limit == DEFAULT_PAGE_SIZE
+
+    def test_that_invalid_cursor_falls_back_to_page_offset(self) -> None:
+        self.request.set_arg(CURSOR_PARAMETER_NAME, encode_cursor(["invalid"]))
+        self.request.set_arg(PAGE_PARAMETER_NAME, 2)
+        interactor_request = self.controller.create_interactor_request()
+        assert interactor_request.after is None
+        assert interactor_request.offset == DEFAULT_PAGE_SIZE
@@ -1,6 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from arbeitszeit.interactors.query_companies import (
@@ -99,6 +99,7 @@ class QueriedCompanyGenerator:
         requested_offset: int = 0,
         requested_limit: Optional[int] = None,
         requested_filter_category: CompanyFilter = CompanyFilter.by_name,
+        next_cursor: Optional[Tuple[str, UUID]] = None,
     ) -> CompanyQueryResponse:
         if queried_companies is None:
             queried_companies = [self.get_company() for _ in range(5)]
@@ -113,6 +114,7 @@ class QueriedCompanyGenerator:
                 query_string=query_string,
                 filter_category=requested_filter_category,
             ),
+            next_cursor=next_cursor,
         )
 
 
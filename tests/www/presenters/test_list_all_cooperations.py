@@ -5,6 +5,7 @@ from arbeitszeit.interactors.list_all_cooperations import (
     ListAllCooperationsResponse,
     ListedCooperation,
 )
+from arbeitszeit_web.pagination import DEFAULT_PAGE_SIZE
 from arbeitszeit_web.www.presenters.list_all_cooperations_presenter import (
     ListAllCooperationsPresenter,
 )
@@ -20,7 +21,7 @@ class ListMessagesPresenterTests(BaseTestCase):
     def test_view_model_contains_no_cooperation_and_does_not_show_result_when_non_were_provided(
         self,
     ) -> None:
-        response = ListAllCooperationsResponse(cooperations=[])
+        response = ListAllCooperationsResponse(cooperations=[], total_results=0)
         view_model = self.presenter.present(response)
         self.assertFalse(view_model.show_results)
         self.assertFalse(view_model.cooperations)
@@ -52,11 +53,33 @@ class ListMessagesPresenterTests(BaseTestCase):
         )
         self.assertEqual(expected_url, view_model.cooperations[0].coop_summary_url)
 
+    def test_total_results_are_propagated_to_view_model(self) -> None:
+        view_model = self.presenter.present(
+            self._create_response_with_one_cooperation(total_results=20)
+        )
+        self.assertEqual(view_model.total_results, 20)
+
+    def test_pagination_is_not_visible_when_results_fit_on_one_page(self) -> None:
+        view_model = self.presenter.present(
+            self._create_response_with_one_cooperation(total_results=1)
+        )
+        self.assertFalse(view_model.pagination.is_visible)
+
+    def test_pagination_is_visible_when_results_exceed_one_page(self) -> None:
+        view_model = self.presenter.present(
+            self._create_response_with_one_cooperation(
+                total_results=DEFAULT_PAGE_SIZE + 1
+            )
+        )
+        self.assertTrue(view_model.pagination.is_visible)
+        self.assertEqual(len(view_model.pagination.pages), 2)
+
     def _create_response_with_one_cooperation(
         self,
         coop_id: Optional[UUID] = None,
         name: str = "coop name",
         plan_count: int = 3,
+        total_results: int = 1,
     ) -> ListAllCooperationsResponse:
         if coop_id is None:
             coop_id = uuid4()
@@ -67,5 +90,6 @@ class ListMessagesPresenterTests(BaseTestCase):
                     name=name,
                     plan_count=plan_count,
                 )
-            ]
+            ],
+            total_results=total_results,
         )
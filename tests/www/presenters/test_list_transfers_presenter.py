@@ -1,12 +1,19 @@
 from datetime import datetime
 from decimal import Decimal
+from urllib.parse import parse_qs, urlparse
 from uuid import UUID, uuid4
 
 from parameterized import parameterized
 
 from arbeitszeit.interactors import list_transfers
 from arbeitszeit.transfers import TransferType
-from arbeitszeit_web.pagination import DEFAULT_PAGE_SIZE
+from arbeitszeit_web.pagination import (
+    CURSOR_PARAMETER_NAME,
+    DEFAULT_PAGE_SIZE,
+    PAGE_PARAMETER_NAME,
+    decode_cursor,
+    encode_cursor,
+)
 from arbeitszeit_web.www.presenters.list_transfers_presenter import (
     ListTransfersPresenter,
 )
@@ -51,12 +58,14 @@ class ListTransfersPresenterBase(BaseTestCase):
         self,
         transfers: list[list_transfers.TransferEntry] | None = None,
         total_results: int = 10,
+        next_cursor: list_transfers.TransferCursor | None = None,
     ) -> list_transfers.Response:
         if transfers is None:
             transfers = []
         return list_transfers.Response(
             transfers=transfers,
             total_results=total_results,
+            next_cursor=next_cursor,
         )
 
 
@@ -89,6 +98,44 @@ class PaginationTests(ListTransfersPresenterBase):
         view_model = self.presenter.present(uc_response)
         assert len(view_model.pagination.pages) == num_of_pages
 
+    def test_that_there_is_no_next_page_link_without_next_cursor(self) -> None:
+        uc_response = self.create_interactor_response(next_cursor=None)
+        view_model = self.presenter.present(uc_response)
+        assert view_model.pagination.next_page is None
+
+    def test_that_next_page_link_contains_encoded_cursor(self) -> None:
+        date = datetime_utc(2024, 1, 1, 12, 0)
+        transfer_id = uuid4()
+        uc_response = self.create_interactor_response(next_cursor=(date, transfer_id))
+        view_model = self.presenter.present(uc_response)
+        assert view_model.pagination.next_page
+        query = parse_qs(urlparse(view_model.pagination.next_page).query)
+        assert decode_cursor(query[CURSOR_PARAMETER_NAME][0]) == [
+            date.isoformat(),
+            str(transfer_id),
+        ]
+
+    def test_that_next_page_link_does_not_contain_page_number(self) -> None:
+        self.request.set_arg(PAGE_PARAMETER_NAME, 2)
+        uc_response = self.create_interactor_response(
+            next_cursor=(datetime_utc(2024, 1, 1), uuid4())
+        )
+        view_model = self.presenter.present(uc_response)
+        assert view_model.pagination.next_page
+        query = parse_qs(urlparse(view_model.pagination.next_page).query)
+        assert PAGE_PARAMETER_NAME not in query
+
+    def test_that_no_page_is_current_when_paginating_by_cursor(self) -> None:
+        self.request.set_arg(
+            CURSOR_PARAMETER_NAME,
+            encode_cursor([datetime_utc(2024, 1, 1).isoformat(), str(uuid4())]),
+        )
+        uc_response = self.create_interactor_response(
+            total_results=DEFAULT_PAGE_SIZE + 1
+        )
+        view_model = self.presenter.present(uc_response)
+        assert not any(page.is_current for page in view_model.pagination.pages)
+
 
 class ShosResultsTests(ListTransfersPresenterBase):
     def test_show_results_is_false_if_no_transfers(self) -> None: